@@ -5,16 +5,23 @@ Cyclic Linked List Module
 This module defines a cyclic linked list, which is a variation of a linked list
 where the tail node is connected to the head node, creating a closed loop.
 
+Since the loop has no ends, `rotate` only moves the head pointer, which
+makes a round-robin step over the list O(1), and a `CyclicCursor` moves
+from the tail on to the head.
+
 Classes
 -------
 CyclicLinkedList
     Represents a cyclic linked list and provides additional
     methods and behavior specific to cyclic linked lists.
+
+CyclicCursor
+    A position inside a CyclicLinkedList going around the loop.
 """
 
 
 from Algorithms_Python.DoubleNode import DoubleNode
-from Algorithms_Python.LinkedList import LinkedList
+from Algorithms_Python.LinkedList import Cursor, LinkedList
 
 
 class CyclicLinkedList(LinkedList):
@@ -44,6 +51,12 @@ class CyclicLinkedList(LinkedList):
     __init__(self, head=None, tail=None) -> None
         Initializes empty cyclic linked list.
 
+    head(self, head) -> None
+        Property setter. Sets the head, closing the loop.
+
+    append(self, x) -> None
+        Appends an element after the tail, keeping the loop closed.
+
     list_all(self) -> List[Unknown]
         Returns a list containing all the elements in the cyclic linked list.
 
@@ -63,6 +76,12 @@ class CyclicLinkedList(LinkedList):
         Updates the element at the specified index i in
         the cyclic linked list with x.
 
+    cursor(self, i=0) -> CyclicCursor
+        Return a cursor standing at a specific index.
+
+    rotate(self, k=1) -> None
+        Move the head k positions forward.
+
     """
 
     def __init__(self, head=None, tail=None):
@@ -83,7 +102,45 @@ class CyclicLinkedList(LinkedList):
         """
         super().__init__(head, tail)
         if self._tail is not None:
-            self._tail.next_node = self._head
+            # a given chain may only have the forward links
+            node = self._head
+            while node is not self._tail:
+                node._next_node._prev_node = node
+                node = node._next_node
+            self._link(self._tail, self._head)
+
+    @LinkedList.head.setter
+    def head(self, head):
+        """
+        Sets the head of the cyclic linked list and closes the loop.
+
+        Parameters
+        ----------
+        head: DoubleNode or None
+            The new head of the cyclic linked list.
+
+        Returns
+        -------
+        None
+        """
+        LinkedList.head.fset(self, head)
+        if head is not None:
+            self._link(self._tail, self._head)
+
+    def append(self, x):
+        """
+        Appends an element after the tail, keeping the loop closed.
+
+        Parameters
+        ----------
+        x: Unknown
+            The element to append.
+
+        Returns
+        -------
+        None
+        """
+        self.insert(self._size, x)
 
     def list_all(self):
         """
@@ -120,11 +177,11 @@ class CyclicLinkedList(LinkedList):
             A tuple containing the previous and current nodes if they exist.
         """
         previous = self._head
-        current = previous.next_node
+        current = previous._next_node
         index_of_current_element = 1
         while index_of_current_element < i:
             previous = current
-            current = previous.next_node
+            current = previous._next_node
             index_of_current_element += 1
         return (previous, current)
 
@@ -145,20 +202,22 @@ class CyclicLinkedList(LinkedList):
         -------
         None
         """
+        # positions of the nodes change
+        self._finger = None
         # for the first element
         if not isinstance(self._head, DoubleNode):
             newNode = DoubleNode(x, None, None)
             self._head = newNode
             self._tail = self._head
-            self._head.next_node = self._tail
-            self._head.prev_node = self._tail
-            self._tail.next_node = self._head
-            self._tail.prev_node = self._head
+            self._head._next_node = self._tail
+            self._head._prev_node = self._tail
+            self._tail._next_node = self._head
+            self._tail._prev_node = self._head
         # insert in the head or tail
         elif i == 0 or i == self._size:
             newNode = DoubleNode(x, self._tail, self._head)
-            self._head.prev_node = newNode
-            self._tail.next_node = newNode
+            self._head._prev_node = newNode
+            self._tail._next_node = newNode
             if i == self._size:
                 self._tail = newNode
             else:
@@ -175,8 +234,8 @@ class CyclicLinkedList(LinkedList):
 
             # insert i-th element
             newNode = DoubleNode(x, previous, current)
-            previous.next_node = newNode
-            newNode.next_node = current
+            previous._next_node = newNode
+            current._prev_node = newNode
         self._size += 1
 
     def erase(self, i):
@@ -193,6 +252,8 @@ class CyclicLinkedList(LinkedList):
         -------
         None
         """
+        # positions of the nodes change
+        self._finger = None
         if self._size != 0:
             if i / self._size > 1:
                 raise IndexError('CyclicLinkedList index out if range')
@@ -207,17 +268,17 @@ class CyclicLinkedList(LinkedList):
             self._size -= 1
         # if head is to erase
         elif i == 0:
-            cur = self._head.next_node
-            cur.prev_node = self._tail
-            cur.prev_node.next_node = cur
+            cur = self._head._next_node
+            cur._prev_node = self._tail
+            cur._prev_node._next_node = cur
             del self._head
             self._head = cur
             self._size -= 1
         # if tail is to erase
         elif i == self._size:
-            cur = self._tail.prev_node
-            cur.next_node = self._head
-            cur.next_node.prev_node = cur
+            cur = self._tail._prev_node
+            cur._next_node = self._head
+            cur._next_node._prev_node = cur
             del self._tail
             self._tail = cur
             self._size -= 1
@@ -228,11 +289,11 @@ class CyclicLinkedList(LinkedList):
             cur = self._head
             j = 0
             while j < i:
-                cur = cur.next_node
+                cur = cur._next_node
                 j += 1
             # and do erasing
-            cur.next_node.prev_node = cur.prev_node
-            cur.prev_node.next_node = cur.next_node
+            cur._next_node._prev_node = cur._prev_node
+            cur._prev_node._next_node = cur._next_node
             del cur
             self._size -= 1
 
@@ -255,3 +316,246 @@ class CyclicLinkedList(LinkedList):
         """
         previous, current = self.search(i)
         previous.data = x
+
+    def cursor(self, i=0):
+        """
+        Return a cursor standing at the specified index.
+
+        Parameters
+        ----------
+        i: int, optional
+            The index of the element the cursor stands at, size is
+            the same position as 0. Default is 0.
+
+        Returns
+        -------
+        CyclicCursor
+            The cursor.
+        """
+        return CyclicCursor(self, i)
+
+    def _link(self, previous, node):
+        """
+        Make node follow previous, in both directions.
+
+        Parameters
+        ----------
+        previous: DoubleNode
+            The node to link from.
+
+        node: DoubleNode
+            The node to link to.
+
+        Returns
+        -------
+        None
+        """
+        previous._next_node = node
+        node._prev_node = previous
+
+    def _set_chain(self, head, tail, size):
+        """
+        Make the list hold the chain of nodes from head to tail,
+        closing the loop.
+
+        Parameters
+        ----------
+        head: DoubleNode or None
+            The first node of the chain.
+
+        tail: DoubleNode or None
+            The last node of the chain.
+
+        size: int
+            The number of nodes in the chain.
+
+        Returns
+        -------
+        None
+        """
+        self._head = head
+        self._tail = tail
+        self._size = size
+        self._finger = None
+        if tail is not None:
+            self._link(tail, head)
+
+    def rotate(self, k=1):
+        """
+        Move the head k positions forward, so the element at index k
+        becomes the first one.
+
+        Negative k moves the head backward. Only the head pointer
+        moves, in at most min(k, size - k) steps (k taken modulo size),
+        so rotating by one, as a round-robin step, takes O(1).
+
+        Parameters
+        ----------
+        k: int, optional
+            The number of positions. Default is 1.
+
+        Returns
+        -------
+        None
+        """
+        if self._size < 2:
+            return
+        k %= self._size
+        if k == 0:
+            return
+        node = self._head
+        if k <= self._size // 2:
+            for _ in range(k):
+                node = node._next_node
+        else:
+            for _ in range(self._size - k):
+                node = node._prev_node
+        self._set_chain(node, node._prev_node, self._size)
+
+
+class CyclicCursor(Cursor):
+    """
+    A position inside a CyclicLinkedList.
+
+    Unlike the cursor of LinkedList it never gets to the end: moving from
+    the tail gets it to the head, so the index starts from 0 again. It
+    is at the end only while the list is empty. Editing the list by other
+    means while the cursor is in use leaves the cursor in an undefined
+    state.
+
+    Attributes
+    ----------
+    index: int
+        The index of the current element.
+
+    Methods
+    -------
+    __init__(self, linked_list, i=0) -> None
+        Place the cursor at a specific index of the list.
+
+    move_next(self) -> None
+        Move to the next element, from the tail to the head.
+
+    insert(self, x) -> None
+        Insert an element before the current one.
+
+    erase(self) -> Any
+        Remove the current element and move to the next one.
+
+    """
+
+    def __init__(self, linked_list, i=0):
+        """
+        Place the cursor at a specific index of the list.
+
+        Parameters
+        ----------
+        linked_list: CyclicLinkedList
+            The list to move through.
+
+        i: int, optional
+            The index of the element the cursor stands at, size is
+            the same position as 0. Default is 0.
+
+        Raises
+        ------
+        IndexError
+            If the index is negative or greater than the size.
+
+        Returns
+        -------
+        None
+        """
+        if i < 0 or i > linked_list._size:
+            raise IndexError('CyclicLinkedList index out of range')
+        self._list = linked_list
+        if linked_list._size == 0:
+            self.index = 0
+            self._current = None
+        else:
+            self.index = i % linked_list._size
+            self._current = linked_list._node_at(self.index)
+
+    def move_next(self):
+        """
+        Move to the next element, the one after the tail is the head.
+
+        Raises
+        ------
+        IndexError
+            If the list is empty.
+
+        Returns
+        -------
+        None
+        """
+        if self._current is None:
+            raise IndexError('cursor is at the end of the list')
+        self._current = self._current._next_node
+        self.index = (self.index + 1) % self._list._size
+
+    def insert(self, x):
+        """
+        Insert an element before the current one.
+
+        The cursor keeps standing at the same element, so its index
+        grows by one. In an empty list it stands at the new element.
+
+        Parameters
+        ----------
+        x: any
+            The element to insert.
+
+        Returns
+        -------
+        None
+        """
+        ll = self._list
+        if self._current is None:
+            ll.insert(0, x)
+            self._current = ll._head
+            return
+        # positions of the nodes change
+        ll._finger = None
+        newNode = DoubleNode(x, self._current._prev_node, self._current)
+        ll._link(self._current._prev_node, newNode)
+        ll._link(newNode, self._current)
+        if self._current is ll._head:
+            ll._head = newNode
+        ll._size += 1
+        self.index += 1
+
+    def erase(self):
+        """
+        Remove the current element and move to the next one,
+        the one after the tail is the head.
+
+        Raises
+        ------
+        IndexError
+            If the list is empty.
+
+        Returns
+        -------
+        any
+            The removed element.
+        """
+        if self._current is None:
+            raise IndexError('nothing to erase in an empty list')
+        ll = self._list
+        removed = self._current
+        if ll._size == 1:
+            ll._set_chain(None, None, 0)
+            self._current = None
+            return removed._data
+        # positions of the nodes change
+        ll._finger = None
+        self._current = removed._next_node
+        ll._link(removed._prev_node, self._current)
+        if removed is ll._head:
+            ll._head = self._current
+        if removed is ll._tail:
+            ll._tail = removed._prev_node
+            self.index = 0
+        ll._size -= 1
+        return removed._data
@@ -110,6 +110,6 @@ class Deque(Queue, Stack):  # <(out)-(in)> Deck <(out)-(in)>
         # for other elements
         else:
             newNode = DoubleNode(value, None, self.head)
-            self.head.prev_node = newNode
-            self.head = self.head.prev_node
+            self.head._prev_node = newNode
+            self.head = self.head._prev_node
             self.size += 1
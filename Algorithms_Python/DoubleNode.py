@@ -61,6 +61,8 @@ class DoubleNode(Node):
     access the previous node stored into the added attribute
     using the prev() method.
 
+    Like Node, the class is slotted and adds only the `_prev_node` slot.
+
     Methods
     -------
     __init__(self, data=None, prev_node=None, next_node=None)
@@ -71,6 +73,8 @@ class DoubleNode(Node):
 
     """
 
+    __slots__ = ('_prev_node',)
+
     def __init__(self, data=None, prev_node=None, next_node=None):
         """
         Initialize a DoubleNode object with optional data,
@@ -98,14 +102,14 @@ class DoubleNode(Node):
         self._data = data
 
         # DoubleNodes can only be connected with DoubleNodes or Nones
-        if next_node.__class__.__name__ == \
-                self.__class__.__name__ or next_node is None:
+        if next_node is None or \
+                next_node.__class__.__name__ == self.__class__.__name__:
             self._next_node = next_node
         else:
             raise TypeError('Wrong type of next_node')
 
-        if (prev_node.__class__.__name__ == self.__class__.__name__)\
-           or (prev_node is None):
+        if (prev_node is None) or \
+           (prev_node.__class__.__name__ == self.__class__.__name__):
             self._prev_node = prev_node
         else:
             raise TypeError('Wrong type of prev node')
@@ -139,8 +143,8 @@ class DoubleNode(Node):
             If the provided prev_node is of the wrong type.
 
         """
-        if prev_node.__class__.__name__ == \
-                self.__class__.__name__ or prev_node is None:
+        if prev_node is None or \
+                prev_node.__class__.__name__ == self.__class__.__name__:
             self._prev_node = prev_node
         else:
             raise TypeError('Wrong type of next_node')
@@ -162,4 +166,4 @@ class DoubleNode(Node):
             If the provided prev_node is of the wrong type.
 
         """
-        return self.prev_node
+        return self._prev_node
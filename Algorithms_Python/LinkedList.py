@@ -8,11 +8,24 @@ linked list data structure. The LinkedList class allows for the creation
 and manipulation of a linked list, including appending, inserting, erasing,
 and searching for elements.
 
+Positional access remembers the last visited (index, node) pair - the
+finger - and walks from the finger instead of the head whenever it lies
+before the index asked for, while the last element is reached through the
+tail at once. So accessing or editing the list at increasing indexes
+takes O(n) in total instead of O(n^2). For sequential edits there is
+also an explicit `Cursor`.
+
+Whole lists are joined and cut by relinking nodes: `extend_from_list`
+takes O(1), `splice` and `split_at` only walk to the index.
+
 Classes
 -------
 LinkedList
     A one-way linked list data structure.
 
+Cursor
+    A position inside a LinkedList for sequential reading and editing.
+
 """
 from Algorithms_Python.Node import Node
 
@@ -53,6 +66,24 @@ class LinkedList:
     erase(self, i) -> None
         Remove the element at a specific index.
 
+    update(self, i, x) -> None
+        Replace the element at a specific index.
+
+    __getitem__(self, i) -> Any
+        Return the element at a specific index.
+
+    cursor(self, i=0) -> Cursor
+        Return a cursor standing at a specific index.
+
+    extend_from_list(self, other) -> None
+        Move all nodes of another list to the end.
+
+    splice(self, i, other) -> None
+        Move all nodes of another list before a specific index.
+
+    split_at(self, i) -> tuple(LinkedList, LinkedList)
+        Move the nodes before and after a specific index to two new lists.
+
     __contains__(self, x) -> bool
         Check if an element exists in the linked list.
 
@@ -93,6 +124,9 @@ class LinkedList:
         # save the head if exists
         self._head = head
 
+        # the last visited (index, node) pair
+        self._finger = None
+
         # check a connection between head and tail
         # if they both are mentioned
 
@@ -155,6 +189,7 @@ class LinkedList:
         None
         '''
         self._head = head
+        self._finger = None
         if self._size == 0:
             self._size += 1
             self._tail = self._head
@@ -256,13 +291,13 @@ class LinkedList:
 
             # protection from Attr error
             if cur is not None:
-                yield cur.data
+                yield cur._data
             else:
                 break
 
             # protection from Type error
-            if isinstance(cur.next_node, Node):
-                cur = next(cur)
+            if isinstance(cur._next_node, Node):
+                cur = cur._next_node
 
             # if the end is reached
             else:
@@ -326,10 +361,47 @@ class LinkedList:
         # for other elements
         else:
             newNode = Node(x, None)
-            self._tail.next_node = newNode
+            self._tail._next_node = newNode
             self._tail = newNode
             self._size += 1
 
+    def _node_at(self, i):
+        '''
+        Return the node at a given index and remember it as the finger.
+
+        The walk starts from the finger if it is not after the index,
+        otherwise from the head. The tail is returned at once.
+
+        Parameters
+        ----------
+        i: int
+            The index of the node, from 0 to size - 1.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        Returns
+        -------
+        Node
+            The node at the index.
+        '''
+        if i < 0 or i >= self._size:
+            raise IndexError('LinkedList index out of range')
+        if i == self._size - 1:
+            node = self._tail
+        else:
+            if self._finger is not None and self._finger[0] <= i:
+                j, node = self._finger
+            else:
+                j, node = 0, self._head
+            while j < i:
+                node = node._next_node
+                j += 1
+        self._finger = (i, node)
+        return node
+
     def search(self, i):
         '''
         Search for nodes at a given index in the linked list.
@@ -344,14 +416,8 @@ class LinkedList:
         tuple
             A tuple containing the previous and current nodes.
         '''
-        previous = self._head
-        current = previous.next_node
-        index_of_current_element = 1
-        while index_of_current_element < i:
-            previous = current
-            current = previous.next_node
-            index_of_current_element += 1
-        return (previous, current)
+        previous = self._node_at(max(i, 1) - 1)
+        return (previous, previous._next_node)
 
     def insert(self, i, x):
         '''
@@ -383,8 +449,11 @@ class LinkedList:
         # insert in the head
         elif i == 0:
             newNode = Node(x, None)
-            newNode.next_node = self._head
+            newNode._next_node = self._head
             self._head = newNode
+            # all nodes moved one position further
+            if self._finger is not None:
+                self._finger = (self._finger[0] + 1, self._finger[1])
         # append using insert
         elif i == self._size + 1:
             self.append(x)
@@ -401,8 +470,10 @@ class LinkedList:
 
             # insert i-th element
             newNode = Node(x, None)
-            previous.next_node = newNode
-            newNode.next_node = current
+            previous._next_node = newNode
+            newNode._next_node = current
+            if current is None:
+                self._tail = newNode
         self._size += 1
 
     def erase(self, i):
@@ -433,9 +504,15 @@ class LinkedList:
                 del self._tail
                 self._tail = None
             else:
-                buff = self._head.next_node
+                buff = self._head._next_node
                 del self._head
                 self._head = buff
+            # all nodes moved one position back
+            if self._finger is not None:
+                if self._finger[0] == 0:
+                    self._finger = None
+                else:
+                    self._finger = (self._finger[0] - 1, self._finger[1])
 
         # if index is negative and
         # to get to i one does not
@@ -455,9 +532,9 @@ class LinkedList:
             previous, current = self.search(i)
 
             # delete i-th element
-            buff = current.next_node
+            buff = current._next_node
             del current
-            previous.next_node = buff
+            previous._next_node = buff
 
             # if i-th element is tail - reassign tail
             if i == self._size - 1:
@@ -478,7 +555,7 @@ class LinkedList:
         Raises
         ------
         IndexError
-            If the index is negative.
+            If the index is negative or out of bounds.
 
         Returns
         -------
@@ -488,5 +565,448 @@ class LinkedList:
             raise IndexError('Indexing is' +
                              ' only possible with non-negative' +
                              ' numbers')
-        previous, current = self.search(i)
-        current.data = x
+        self._node_at(i)._data = x
+
+    def __getitem__(self, i):
+        '''
+        Return the element at the specified index in the linked list.
+
+        Parameters
+        ----------
+        i: int
+            The index of the element, negative indexes count from the end.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        Returns
+        -------
+        any
+            The element at the index.
+        '''
+        if i < 0:
+            i += self._size
+        return self._node_at(i)._data
+
+    def cursor(self, i=0):
+        '''
+        Return a cursor standing at the specified index.
+
+        Parameters
+        ----------
+        i: int, optional
+            The index of the element the cursor stands at, size for
+            the position after the last element. Default is 0.
+
+        Returns
+        -------
+        Cursor
+            The cursor.
+        '''
+        return Cursor(self, i)
+
+    def _link(self, previous, node):
+        '''
+        Make node follow previous.
+
+        Parameters
+        ----------
+        previous: Node
+            The node to link from.
+
+        node: Node
+            The node to link to.
+
+        Returns
+        -------
+        None
+        '''
+        previous._next_node = node
+
+    def _set_chain(self, head, tail, size):
+        '''
+        Make the list hold the chain of nodes from head to tail.
+
+        Parameters
+        ----------
+        head: Node or None
+            The first node of the chain.
+
+        tail: Node or None
+            The last node of the chain.
+
+        size: int
+            The number of nodes in the chain.
+
+        Returns
+        -------
+        None
+        '''
+        self._head = head
+        self._tail = tail
+        self._size = size
+        self._finger = None
+        if tail is not None:
+            tail._next_node = None
+
+    def _check_other(self, other):
+        '''
+        Check that the nodes of another list can be moved to this one.
+
+        Parameters
+        ----------
+        other: LinkedList
+            The list the nodes are taken from.
+
+        Raises
+        ------
+        TypeError
+            If the other list is of another class, its nodes would not
+            fit.
+
+        ValueError
+            If the other list is this list.
+
+        Returns
+        -------
+        None
+        '''
+        if type(other) is not type(self):
+            raise TypeError(f'can not move nodes of {type(other).__name__}'
+                            + f' to {type(self).__name__}')
+        if other is self:
+            raise ValueError('can not move nodes of the list to itself')
+
+    def extend_from_list(self, other):
+        '''
+        Move all nodes of another list to the end of this one in O(1).
+
+        The nodes are relinked, not copied, so the other list
+        becomes empty.
+
+        Parameters
+        ----------
+        other: LinkedList
+            The list of the same class to take the nodes from.
+
+        Raises
+        ------
+        TypeError
+            If the other list is of another class.
+
+        ValueError
+            If the other list is this list.
+
+        Returns
+        -------
+        None
+        '''
+        self._check_other(other)
+        if other._size == 0:
+            return
+        if self._size == 0:
+            self._set_chain(other._head, other._tail, other._size)
+        else:
+            finger = self._finger
+            self._link(self._tail, other._head)
+            self._set_chain(self._head, other._tail,
+                            self._size + other._size)
+            # the nodes before the moved ones keep their positions
+            self._finger = finger
+        other._set_chain(None, None, 0)
+
+    def splice(self, i, other):
+        '''
+        Move all nodes of another list before the specified index.
+
+        Only the walk to the index takes time, the nodes are relinked
+        in O(1) and the other list becomes empty.
+
+        Parameters
+        ----------
+        i: int
+            The index the first moved element gets, from 0 to size.
+
+        other: LinkedList
+            The list of the same class to take the nodes from.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        TypeError
+            If the other list is of another class.
+
+        ValueError
+            If the other list is this list.
+
+        Returns
+        -------
+        None
+        '''
+        self._check_other(other)
+        if i < 0 or i > self._size:
+            raise IndexError('LinkedList index out of range')
+        if i == self._size:
+            self.extend_from_list(other)
+            return
+        if other._size == 0:
+            return
+        if i == 0:
+            self._link(other._tail, self._head)
+            self._set_chain(other._head, self._tail,
+                            self._size + other._size)
+        else:
+            # the finger stays at the node before the moved ones
+            previous = self._node_at(i - 1)
+            current = previous._next_node
+            self._link(previous, other._head)
+            self._link(other._tail, current)
+            self._size += other._size
+        other._set_chain(None, None, 0)
+
+    def split_at(self, i):
+        '''
+        Move the elements before and after the specified index
+        to two new lists.
+
+        Only the walk to the index takes time, the nodes are relinked
+        in O(1) and this list becomes empty.
+
+        Parameters
+        ----------
+        i: int
+            The index of the first element of the second list,
+            from 0 to size.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        Returns
+        -------
+        tuple(LinkedList, LinkedList)
+            The lists of the elements before the index and of the rest.
+        '''
+        if i < 0 or i > self._size:
+            raise IndexError('LinkedList index out of range')
+        left, right = type(self)(), type(self)()
+        if i == 0:
+            right._set_chain(self._head, self._tail, self._size)
+        elif i == self._size:
+            left._set_chain(self._head, self._tail, self._size)
+        else:
+            last = self._node_at(i - 1)
+            first = last._next_node
+            left._set_chain(self._head, last, i)
+            right._set_chain(first, self._tail, self._size - i)
+        self._set_chain(None, None, 0)
+        return left, right
+
+
+class Cursor:
+    '''
+    A position inside a LinkedList.
+
+    The cursor stands at an element (or after the last one) and keeps
+    the node before it, so reading, replacing, inserting before and
+    erasing the current element and moving to the next one are all O(1).
+    Editing the list by other means (including another cursor) while
+    the cursor is in use leaves the cursor in an undefined state, like
+    with iterators of the built-in containers.
+
+    Attributes
+    ----------
+    index: int
+        The index of the current element.
+
+    Methods
+    -------
+    __init__(self, linked_list, i=0) -> None
+        Place the cursor at a specific index of the list.
+
+    at_end(self) -> bool
+        Check if the cursor stands after the last element.
+
+    data(self) -> Any
+        The current element, can be assigned to.
+
+    move_next(self) -> None
+        Move to the next element.
+
+    insert(self, x) -> None
+        Insert an element before the current one.
+
+    erase(self) -> Any
+        Remove the current element and move to the next one.
+
+    '''
+
+    def __init__(self, linked_list, i=0):
+        '''
+        Place the cursor at a specific index of the list.
+
+        Parameters
+        ----------
+        linked_list: LinkedList
+            The list to move through.
+
+        i: int, optional
+            The index of the element the cursor stands at, size for
+            the position after the last element. Default is 0.
+
+        Raises
+        ------
+        IndexError
+            If the index is negative or greater than the size.
+
+        Returns
+        -------
+        None
+        '''
+        if i < 0 or i > linked_list._size:
+            raise IndexError('LinkedList index out of range')
+        self._list = linked_list
+        self.index = i
+        if i == 0:
+            self._previous = None
+            self._current = linked_list._head
+        else:
+            self._previous = linked_list._node_at(i - 1)
+            self._current = self._previous._next_node
+
+    @property
+    def at_end(self):
+        '''
+        Check if the cursor stands after the last element.
+
+        Returns
+        -------
+        bool
+            True if there is no current element.
+        '''
+        return self._current is None
+
+    @property
+    def data(self):
+        '''
+        Get the current element.
+
+        Raises
+        ------
+        IndexError
+            If the cursor stands after the last element.
+
+        Returns
+        -------
+        any
+            The current element.
+        '''
+        if self._current is None:
+            raise IndexError('cursor is at the end of the list')
+        return self._current._data
+
+    @data.setter
+    def data(self, x):
+        '''
+        Replace the current element.
+
+        Parameters
+        ----------
+        x: any
+            The new value of the element.
+
+        Raises
+        ------
+        IndexError
+            If the cursor stands after the last element.
+
+        Returns
+        -------
+        None
+        '''
+        if self._current is None:
+            raise IndexError('cursor is at the end of the list')
+        self._current._data = x
+
+    def move_next(self):
+        '''
+        Move to the next element.
+
+        Raises
+        ------
+        IndexError
+            If the cursor stands after the last element.
+
+        Returns
+        -------
+        None
+        '''
+        if self._current is None:
+            raise IndexError('cursor is at the end of the list')
+        self._previous = self._current
+        self._current = self._current._next_node
+        self.index += 1
+
+    def insert(self, x):
+        '''
+        Insert an element before the current one.
+
+        The cursor keeps standing at the same element,
+        so its index grows by one.
+
+        Parameters
+        ----------
+        x: any
+            The element to insert.
+
+        Returns
+        -------
+        None
+        '''
+        ll = self._list
+        newNode = Node(x, self._current)
+        if self._previous is None:
+            ll._head = newNode
+        else:
+            self._previous._next_node = newNode
+        if self._current is None:
+            ll._tail = newNode
+        ll._size += 1
+        self._previous = newNode
+        ll._finger = (self.index, newNode)
+        self.index += 1
+
+    def erase(self):
+        '''
+        Remove the current element and move to the next one.
+
+        Raises
+        ------
+        IndexError
+            If the cursor stands after the last element.
+
+        Returns
+        -------
+        any
+            The removed element.
+        '''
+        if self._current is None:
+            raise IndexError('nothing to erase at the end of the list')
+        ll = self._list
+        removed = self._current
+        self._current = removed._next_node
+        if self._previous is None:
+            ll._head = self._current
+            ll._finger = None
+        else:
+            self._previous._next_node = self._current
+            ll._finger = (self.index - 1, self._previous)
+        if removed is ll._tail:
+            ll._tail = self._previous
+        ll._size -= 1
+        return removed._data
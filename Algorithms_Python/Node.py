@@ -20,6 +20,10 @@ class Node:
     have a reference to the next node in a linked list. It supports basic
     operations like getting the next node and printing the data.
 
+    The node is slotted: it has no per-instance `__dict__`, which keeps
+    long chains of nodes compact. Subclasses have to declare `__slots__`
+    for their own fields as well.
+
     Attributes
     ----------
     _next_node: Node or None
@@ -47,6 +51,8 @@ class Node:
 
     """
 
+    __slots__ = ('_data', '_next_node')
+
     def __init__(self, data=None, next_node=None):
         """
         Initialize a Node object with optional data and next node.
@@ -72,8 +78,8 @@ class Node:
         self._data = data
 
         # Nodes can only be connected with nodes or Nones
-        if (next_node.__class__.__name__ == self.__class__.__name__)\
-           or (next_node is None):
+        if (next_node is None) or \
+           (next_node.__class__.__name__ == self.__class__.__name__):
             self._next_node = next_node
         else:
             raise TypeError('Wrong type of next node')
@@ -160,8 +166,8 @@ class Node:
             If the provided next_node is of the wrong type.
 
         """
-        if (next_node.__class__.__name__ == self.__class__.__name__)\
-           or (next_node is None):
+        if (next_node is None) or \
+           (next_node.__class__.__name__ == self.__class__.__name__):
             self._next_node = next_node
         else:
             raise TypeError('Wrong type of next node')
@@ -59,8 +59,8 @@ class Queue(Stack):  # (FIFO) -(in)> Queue -(out)>
         # for other elements
         else:
             newNode = DoubleNode(value, self.tail, None)
-            self.tail.next_node = newNode
-            self.tail = self.tail.next_node
+            self.tail._next_node = newNode
+            self.tail = self.tail._next_node
             self.size += 1
 
     def pop(self):
@@ -81,7 +81,7 @@ class Queue(Stack):  # (FIFO) -(in)> Queue -(out)>
         # for other elements
         else:
             _return = self.head.data
-            buff = self.head.next_node
+            buff = self.head._next_node
             del self.head
             self.head = buff
         self.size -= 1
@@ -95,8 +95,8 @@ class Stack:  # (LIFO)   <(out)-(in)> Stack |
         # for other elements
         else:
             newNode = DoubleNode(value, self.tail, None)
-            self.tail.next_node = newNode
-            self.tail = self.tail.next_node
+            self.tail._next_node = newNode
+            self.tail = self.tail._next_node
             self.size += 1
 
     def pop(self):
@@ -118,7 +118,7 @@ class Stack:  # (LIFO)   <(out)-(in)> Stack |
         # for other elements
         else:
             _return = self.tail.data
-            buff = self.tail.prev_node
+            buff = self.tail._prev_node
             del self.tail
             self.tail = buff
         self.size -= 1
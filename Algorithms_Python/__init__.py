@@ -71,17 +71,23 @@ Contents
 [source code](../vector.py),
 [tests](../tests/test_vector.py)
 
-    - Heap:
+    - Heap and BoundedHeap (top-k):
 [docs](./heap.md),
 [source code](../heap.py),
 [tests](../tests/test_heap.py),
 [performance]()
 
+    - Mergeable Heaps (pairing and leftist):
+[docs](./mergeable_heap.md),
+[source code](../mergeable_heap.py),
+[tests](../tests/test_mergeable_heap.py)
+
   - Nodes and Linked Lists
     - OneWayNode:
 [docs](./Node.md),
 [source code](../Node.py),
-[tests](../tests/test_Node.py)
+[tests](../tests/test_Node.py),
+[memory](../speed_tuning/node_memory.md)
 
     - TwoWayNode:
 [docs](./DoubleNode.md),
@@ -113,18 +119,78 @@ Contents
 [source code](../CyclicLinkedList.py),
 [tests](../tests/test_CyclicLinkedList.py)
 
+    - Unrolled Stack, Queue and Deque:
+[docs](./unrolled.md),
+[source code](../unrolled.py),
+[tests](../tests/test_unrolled.py),
+[performance](../speed_tuning/unrolled_containers.md)
+
+    - Ring buffer BoundedQueue and BoundedDeque:
+[docs](./ring_buffer.md),
+[source code](../ring_buffer.py),
+[tests](../tests/test_ring_buffer.py),
+[performance](../speed_tuning/ring_buffer.md)
+
+    - ConcurrentQueue, AsyncQueue and AsyncDeque:
+[docs](./concurrent_queue.md),
+[source code](../concurrent_queue.py),
+[tests](../tests/test_concurrent_queue.py),
+[performance](../speed_tuning/concurrent_queue.md)
+
+    - SharedRingQueue:
+[docs](./shm_queue.md),
+[source code](../shm_queue.py),
+[tests](../tests/test_shm_queue.py),
+[performance](../speed_tuning/shm_queue.md)
+
+    - Array-backed LinkedList and Deque:
+[docs](./array_storage.md),
+[source code](../array_storage.py),
+[tests](../tests/test_array_storage.py),
+[memory](../speed_tuning/node_memory.md)
+
+    - XorCyclicList and XorDeque:
+[docs](./xor_list.md),
+[source code](../xor_list.py),
+[tests](../tests/test_xor_list.py),
+[memory](../speed_tuning/node_memory.md)
+
   - Probabilistic
     - HashTables with different collision handling approaches:
 [docs](./hashtable.md),
 [source code](../hashtable.py),
 [tests](../tests/test_hashtable.py),
-[performance]()
-
-    - BloomFilter:
+[performance](../speed_tuning/hashtables.md)
+
+    - ConcurrentHashTable:
+[docs](./concurrent_hashtable.md),
+[source code](../concurrent_hashtable.py),
+[tests](../tests/test_concurrent_hashtable.py),
+[performance](../speed_tuning/concurrent_hashtable.md)
+
+    - LRUCache, LFUCache and TinyLFUCache:
+[docs](./cache.md),
+[source code](../cache.py),
+[tests](../tests/test_cache.py),
+[performance](../speed_tuning/caches.md)
+
+    - MmapHashTable:
+[docs](./mmap_hashtable.md),
+[source code](../mmap_hashtable.py),
+[tests](../tests/test_mmap_hashtable.py),
+[performance](../speed_tuning/mmap_hashtable.md)
+
+    - PerfectHash and StaticMap:
+[docs](./perfect_hash.md),
+[source code](../perfect_hash.py),
+[tests](../tests/test_perfect_hash.py),
+[performance](../speed_tuning/perfect_hash.md)
+
+    - BloomFilter and ScalableBloomFilter:
 [docs](./bloom_filter.md),
 [source code](../bloom_filter.py),
 [tests](../tests/test_bloom_filter.py),
-[performance]()
+[performance](../speed_tuning/bloom_filter.md)
 
     - HyperLogLog:
 [docs](./hyperloglog.md),
@@ -132,6 +198,18 @@ Contents
 [tests](../tests/test_hyperloglog.py),
 [performance]()
 
+    - CountMinSketch:
+[docs](./count_min_sketch.md),
+[source code](../count_min_sketch.py),
+[tests](../tests/test_count_min_sketch.py),
+[performance](../speed_tuning/caches.md)
+
+    - Hash functions:
+[docs](./hash_functions.md),
+[source code](../hash_functions.py),
+[tests](../tests/test_hash_functions.py),
+[performance](../speed_tuning/hash_functions.md)
+
   - Trees
     - BinarySearchTree:
 [docs](./bst.md),
@@ -151,6 +229,18 @@ Contents
 [tests](../tests/test_red_black_tree.py),
 [performance]()
 
+    - Array-backed BST, AVLTree and RedBlackTree:
+[docs](./array_trees.md),
+[source code](../array_trees.py),
+[tests](../tests/test_array_trees.py),
+[memory](../speed_tuning/node_memory.md)
+
+    - SkipList:
+[docs](./skip_list.md),
+[source code](../skip_list.py),
+[tests](../tests/test_skip_list.py),
+[performance](../speed_tuning/skip_list.md)
+
     - SegmentTree:
 [docs](./segment_tree.md),
 [source code](../segment_tree.py),
@@ -0,0 +1,935 @@
+"""
+Array-Backed Storage Engine
+===========================
+
+This module provides an alternative storage engine for the linked
+structures of the package. Instead of one Python object per node, nodes are
+integer indices into parallel `array.array` columns (struct of arrays):
+column `next` keeps the index of the next node of every node, column `prev`
+keeps the previous one and so on. Released indices are put into a free list
+threaded through the first column and are reused by later allocations.
+
+Compared to the slotted `Node` (56 bytes plus the data) a node of
+`ArrayLinkedList` takes 4 bytes for the link plus 8 bytes for the reference
+to the data (or the item size of the typecode if the data column is typed),
+and the garbage collector tracks a handful of arrays instead of millions
+of nodes.
+
+The containers keep the public API of the node-based ones, but nodes
+are referred to by indices: `search` returns indices instead of nodes.
+
+Constants
+---------
+NIL: int
+    Index of the null node. Index 0 is never given to a real node, so
+    0 in a link column means "no node".
+
+Classes
+-------
+NodeArena
+    Parallel array columns with a free list, the storage for the nodes.
+
+ArrayLinkedList
+    A one-way linked list with the API of LinkedList stored in a NodeArena.
+
+ArrayDeque
+    A double-ended queue with the API of Deque stored in a NodeArena.
+
+"""
+
+
+from array import array
+from typing import Any, Generator, Iterable
+
+
+NIL = 0
+
+
+class NodeArena:
+    """
+    Parallel array columns with a free list.
+
+    Every column is an `array.array` of the given typecode, the data column
+    is either a list (any objects) or an `array.array` of the given
+    typecode. Column values of the node with index i are stored at index i
+    of every column. Index 0 is reserved for NIL.
+    Columns grow in place by doubling, so references to them taken by
+    the containers stay valid.
+
+    Attributes
+    ----------
+    columns: dict[str, array]
+        The link (and any other numeric) columns by their names.
+
+    data: list or array
+        The column with the data of the nodes.
+
+    capacity: int
+        The number of node slots (including NIL) currently allocated.
+
+    size: int
+        The number of nodes in use.
+
+    Methods
+    -------
+    __init__(self, columns: dict[str, str], data_typecode: str | None = None,
+             capacity: int = 16) -> None
+        Create the columns.
+
+    __len__(self) -> int
+        Return the number of nodes in use.
+
+    allocate(self) -> int
+        Return the index of a fresh node with all columns zeroed.
+
+    release(self, i: int) -> None
+        Put the node back into the free list.
+
+    clear(self) -> None
+        Release all nodes at once.
+
+    memory_usage(self) -> int
+        Return the number of bytes taken by the column buffers.
+
+    """
+
+    def __init__(self, columns: dict[str, str],
+                 data_typecode: str | None = None,
+                 capacity: int = 16) -> None:
+        """
+        Create the columns.
+
+        Parameters
+        ----------
+        columns: dict[str, str]
+            Typecodes of the numeric columns by their names. The first
+            column threads the free list, so it has to be able to store
+            node indices.
+
+        data_typecode: str or None, optional
+            Typecode of the data column, None (default) to store any
+            Python objects in a list.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if no columns are given.
+
+        """
+        if len(columns) == 0:
+            raise ValueError('at least one (link) column is required')
+        capacity = max(capacity, 2)
+        self.columns = {name: array(typecode, bytes(
+                            array(typecode).itemsize * capacity))
+                        for name, typecode in columns.items()}
+        self._link = self.columns[next(iter(columns))]
+        self._data_typecode = data_typecode
+        self.data = self._empty_data(capacity)
+        self.capacity = capacity
+        self.size = 0
+        # the first never used index and the head of the free list
+        self._top = 1
+        self._free = NIL
+
+    def _empty_data(self, length: int) -> list | array:
+        """
+        Make a cleared piece of the data column.
+
+        Parameters
+        ----------
+        length: int
+            The length of the piece.
+
+        Returns
+        -------
+        list or array
+            The piece filled with None or zeros.
+
+        """
+        if self._data_typecode is None:
+            return [None] * length
+        return array(self._data_typecode,
+                     bytes(array(self._data_typecode).itemsize * length))
+
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in use.
+
+        Returns
+        -------
+        int
+            The number of nodes in use.
+
+        """
+        return self.size
+
+    def _grow(self) -> None:
+        """
+        Double the capacity of all columns in place.
+
+        Returns
+        -------
+        None
+
+        """
+        for column in self.columns.values():
+            column.frombytes(bytes(column.itemsize * self.capacity))
+        self.data.extend(self._empty_data(self.capacity))
+        self.capacity *= 2
+
+    def allocate(self) -> int:
+        """
+        Return the index of a fresh node.
+
+        The node is taken from the free list if it is not empty, otherwise
+        from the never used tail of the columns, which grow if needed.
+        All numeric columns of the node are zeroed.
+
+        Returns
+        -------
+        int
+            The index of the node.
+
+        """
+        if self._free != NIL:
+            i = self._free
+            self._free = self._link[i]
+            for column in self.columns.values():
+                column[i] = 0
+        else:
+            if self._top == self.capacity:
+                self._grow()
+            i = self._top
+            self._top += 1
+        self.size += 1
+        return i
+
+    def release(self, i: int) -> None:
+        """
+        Put the node back into the free list.
+
+        Parameters
+        ----------
+        i: int
+            The index of the node.
+
+        Returns
+        -------
+        None
+
+        """
+        # drop the reference so that the data can be collected
+        self.data[i] = None if self._data_typecode is None else 0
+        self._link[i] = self._free
+        self._free = i
+        self.size -= 1
+
+    def clear(self) -> None:
+        """
+        Release all nodes at once, keeping the allocated capacity.
+
+        Returns
+        -------
+        None
+
+        """
+        for column in self.columns.values():
+            column[:] = array(column.typecode,
+                              bytes(column.itemsize * self.capacity))
+        self.data[:] = self._empty_data(self.capacity)
+        self.size = 0
+        self._top = 1
+        self._free = NIL
+
+    def memory_usage(self) -> int:
+        """
+        Return the number of bytes taken by the column buffers.
+
+        For a list data column only the references are counted,
+        not the objects referred to.
+
+        Returns
+        -------
+        int
+            The number of bytes.
+
+        """
+        total = sum(column.itemsize * len(column)
+                    for column in self.columns.values())
+        if self._data_typecode is None:
+            return total + 8 * len(self.data)
+        return total + self.data.itemsize * len(self.data)
+
+
+class ArrayLinkedList:
+    '''
+    One-way linked list stored in a NodeArena.
+
+    It has the API of LinkedList, except that nodes are indices:
+    `head`, `tail` and the pair returned by `search` are indices
+    of the nodes, NIL (0) standing for None.
+
+    Attributes
+    ----------
+    head: int
+        The index of the first node, NIL if the list is empty.
+
+    tail: int
+        The index of the last node, NIL if the list is empty.
+
+    size: int
+        The number of elements in the linked list.
+
+    Methods
+    -------
+    __init__(self, elements: Iterable | None = None,
+             typecode: str | None = None, capacity: int = 16) -> None
+        Create the list, optionally appending the elements given.
+
+    __len__(self) -> int
+        Return the number of elements.
+
+    append(self, x) -> None
+        Add an element to the end of the linked list.
+
+    search(self, i) -> tuple[int, int]
+        Return the indices of the (i-1)-th and the i-th nodes.
+
+    insert(self, i, x) -> None
+        Insert an element at a specific index.
+
+    erase(self, i) -> None
+        Remove the element at a specific index.
+
+    update(self, i, x) -> None
+        Replace the element at a specific index.
+
+    __contains__(self, x) -> bool
+        Check if an element exists in the linked list.
+
+    __iter__(self) -> Generator
+        Iterate through the elements of the linked list.
+
+    list_all(self) -> list
+        Return a list of all elements in the linked list.
+
+    __str__(self) -> str
+        Return a string representation of the linked list.
+
+    __repr__(self) -> str
+        Print method for the linked list.
+
+    '''
+
+    def __init__(self, elements: Iterable | None = None,
+                 typecode: str | None = None, capacity: int = 16) -> None:
+        '''
+        Create the list.
+
+        Parameters
+        ----------
+        elements: Iterable or None, optional
+            Elements to be appended, by default None.
+
+        typecode: str or None, optional
+            Typecode of the data column, None (default) to store any
+            Python objects.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+        '''
+        self._arena = NodeArena({'next': 'i'}, typecode, capacity)
+        self._next = self._arena.columns['next']
+        self._data = self._arena.data
+        self._head = NIL
+        self._tail = NIL
+        if elements is not None:
+            for x in elements:
+                self.append(x)
+
+    @property
+    def head(self) -> int:
+        '''
+        Get the index of the head of the linked list.
+
+        Returns
+        -------
+        int
+            The index of the head, NIL if the list is empty.
+        '''
+        return self._head
+
+    @property
+    def tail(self) -> int:
+        '''
+        Get the index of the tail of the linked list.
+
+        Returns
+        -------
+        int
+            The index of the tail, NIL if the list is empty.
+        '''
+        return self._tail
+
+    @property
+    def size(self) -> int:
+        '''
+        Get the size of the linked list.
+
+        Returns
+        -------
+        int
+            The size of the linked list.
+        '''
+        return self._arena.size
+
+    @size.setter
+    def size(self, size: int) -> None:
+        '''
+        Raise NotImplementedError when trying to set the size.
+
+        Parameters
+        ----------
+        size: int
+            The new size of the linked list.
+
+        Raises
+        ------
+        NotImplementedError
+            When trying to set the size directly.
+        '''
+        raise NotImplementedError('can not set size, ' +
+                                  'it is calculated automatically')
+
+    def __len__(self) -> int:
+        '''
+        Return the number of elements in the linked list.
+
+        Returns
+        -------
+        int
+            The size of the linked list.
+        '''
+        return self._arena.size
+
+    def __contains__(self, x: Any) -> bool:
+        '''
+        Check if a given element is present in the linked list.
+
+        Parameters
+        ----------
+        x: any
+            The element to check for in the linked list.
+
+        Returns
+        -------
+        bool
+            True if the element is found, False otherwise.
+        '''
+        for i in self:
+            if i == x:
+                return True
+        return False
+
+    def __iter__(self) -> Generator:
+        '''
+        Iterate through the elements of the linked list.
+
+        Returns
+        -------
+        generator
+            A generator to iterate through the elements.
+        '''
+        nexts, data = self._next, self._data
+        cur = self._head
+        while cur != NIL:
+            yield data[cur]
+            cur = nexts[cur]
+
+    def list_all(self) -> list:
+        '''
+        Return a list of all elements in the linked list.
+
+        Returns
+        -------
+        list
+            A list containing all elements of the linked list.
+        '''
+        return list(self)
+
+    def __str__(self) -> str:
+        '''
+        Return a string representation of the linked list.
+
+        Returns
+        -------
+        str
+            A string representation of the linked list.
+        '''
+        return str(self.list_all())
+
+    def __repr__(self) -> str:
+        '''
+        Return a string representation of the linked list.
+
+        Returns
+        -------
+        str
+            A string representation of the linked list.
+        '''
+        return str(self)
+
+    def append(self, x: Any) -> None:
+        '''
+        Append an element to the end of the linked list.
+
+        Parameters
+        ----------
+        x: any
+            The element to append to the linked list.
+
+        Returns
+        -------
+        None
+        '''
+        new = self._arena.allocate()
+        self._data[new] = x
+        if self._tail == NIL:
+            self._head = new
+        else:
+            self._next[self._tail] = new
+        self._tail = new
+
+    def search(self, i: int) -> tuple[int, int]:
+        '''
+        Search for nodes at a given index in the linked list.
+
+        Parameters
+        ----------
+        i: int
+            The index at which to search for nodes, from 1 to size.
+
+        Returns
+        -------
+        tuple[int, int]
+            The indices of the previous and the current nodes,
+            the current one is NIL for i equal to size.
+        '''
+        nexts = self._next
+        previous = self._head
+        current = nexts[previous]
+        index_of_current_element = 1
+        while index_of_current_element < i:
+            previous = current
+            current = nexts[previous]
+            index_of_current_element += 1
+        return (previous, current)
+
+    def insert(self, i: int, x: Any) -> None:
+        '''
+        Insert an element at a given index in the linked list.
+
+        Parameters
+        ----------
+        i: int
+            The index at which to insert the element. Both size and
+            size + 1 append the element, as for LinkedList.
+
+        x: any
+            The element to insert into the linked list.
+
+        Raises
+        ------
+        IndexError
+            When the index is negative or exceeds size + 1.
+
+        Returns
+        -------
+        None
+        '''
+        if i < 0:
+            raise IndexError('Indexing is' +
+                             ' only possible with non-negative' +
+                             ' numbers')
+        if i > self.size + 1:
+            raise IndexError('ArrayLinkedList index out of range')
+        if i >= self.size:
+            self.append(x)
+            return
+        new = self._arena.allocate()
+        self._data[new] = x
+        if i == 0:
+            self._next[new] = self._head
+            self._head = new
+        else:
+            previous, current = self.search(i)
+            self._next[previous] = new
+            self._next[new] = current
+
+    def erase(self, i: int) -> None:
+        '''
+        Remove an element at the specified index in the linked list.
+
+        Parameters
+        ----------
+        i: int
+            The index at which to remove the element, negative
+            indexes count from the end.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        Returns
+        -------
+        None
+        '''
+        size = self.size
+        if i < 0:
+            i += size
+        if i < 0 or i >= size:
+            raise IndexError('ArrayLinkedList index out of range')
+        if i == 0:
+            removed = self._head
+            self._head = self._next[removed]
+            if self._head == NIL:
+                self._tail = NIL
+        else:
+            previous, removed = self.search(i)
+            self._next[previous] = self._next[removed]
+            if removed == self._tail:
+                self._tail = previous
+        self._arena.release(removed)
+
+    def update(self, i: int, x: Any) -> None:
+        '''
+        Update the element at the specified index in the linked list.
+
+        The head and the tail are updated in O(1).
+
+        Parameters
+        ----------
+        i: int
+            The index at which to update the element.
+
+        x: any
+            The new value to assign to the element.
+
+        Raises
+        ------
+        IndexError
+            If the index is negative or out of bounds.
+
+        Returns
+        -------
+        None
+        '''
+        if i < 0 or i >= self.size:
+            raise IndexError('ArrayLinkedList index out of range')
+        if i == 0:
+            self._data[self._head] = x
+        elif i == self.size - 1:
+            self._data[self._tail] = x
+        else:
+            self._data[self.search(i)[1]] = x
+
+
+class ArrayDeque:
+    """
+    Double-ended queue stored in a NodeArena.
+
+    It has the API of Deque: `push` and `push_back` add to the back,
+    `push_front` adds to the front, `pop` and `pop_front` remove from the
+    front, `pop_back` removes from the back, `front` and `back` peek.
+    Unlike in Deque, all pops return the removed element.
+
+    Attributes
+    ----------
+    head: int
+        The index of the front node, NIL if the deque is empty.
+
+    tail: int
+        The index of the back node, NIL if the deque is empty.
+
+    size: int
+        The number of elements in the deque.
+
+    Methods
+    -------
+    __init__(self, elements: Iterable | None = None,
+             typecode: str | None = None, capacity: int = 16) -> None
+        Create the deque, optionally pushing the elements given.
+
+    __len__(self) -> int
+        Return the number of elements.
+
+    __iter__(self) -> Generator
+        Iterate from the front to the back.
+
+    push(self, value) -> None
+        Alias for `push_back`.
+
+    push_back(self, value) -> None
+        Add an element to the back.
+
+    push_front(self, value) -> None
+        Add an element to the front.
+
+    pop(self) -> Any
+        Alias for `pop_front`.
+
+    pop_front(self) -> Any
+        Remove and return the front element.
+
+    pop_back(self) -> Any
+        Remove and return the back element.
+
+    front(self) -> Any | None
+        Return the front element.
+
+    back(self) -> Any | None
+        Return the back element.
+
+    """
+
+    def __init__(self, elements: Iterable | None = None,
+                 typecode: str | None = None, capacity: int = 16) -> None:
+        """
+        Create the deque.
+
+        Parameters
+        ----------
+        elements: Iterable or None, optional
+            Elements to be pushed to the back, by default None.
+
+        typecode: str or None, optional
+            Typecode of the data column, None (default) to store any
+            Python objects.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+
+        """
+        self._arena = NodeArena({'next': 'i', 'prev': 'i'}, typecode,
+                                capacity)
+        self._next = self._arena.columns['next']
+        self._prev = self._arena.columns['prev']
+        self._data = self._arena.data
+        self.head = NIL
+        self.tail = NIL
+        if elements is not None:
+            for x in elements:
+                self.push_back(x)
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of elements in the deque.
+
+        Returns
+        -------
+        int
+            The number of elements in the deque.
+
+        """
+        return self._arena.size
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the deque.
+
+        Returns
+        -------
+        int
+            The number of elements in the deque.
+
+        """
+        return self._arena.size
+
+    def __iter__(self) -> Generator:
+        """
+        Iterate through the elements from the front to the back.
+
+        Returns
+        -------
+        generator
+            A generator to iterate through the elements.
+
+        """
+        nexts, data = self._next, self._data
+        cur = self.head
+        while cur != NIL:
+            yield data[cur]
+            cur = nexts[cur]
+
+    def push_back(self, value: Any) -> None:
+        """
+        Add an element to the back of the deque.
+
+        Parameters
+        ----------
+        value: any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        new = self._arena.allocate()
+        self._data[new] = value
+        if self.tail == NIL:
+            self.head = new
+        else:
+            self._next[self.tail] = new
+            self._prev[new] = self.tail
+        self.tail = new
+
+    def push(self, value: Any) -> None:
+        """
+        Add an element to the back of the deque.
+
+        This method is an alias for `push_back`.
+
+        Parameters
+        ----------
+        value: any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        self.push_back(value)
+
+    def push_front(self, value: Any) -> None:
+        """
+        Add an element to the front of the deque.
+
+        Parameters
+        ----------
+        value: any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        new = self._arena.allocate()
+        self._data[new] = value
+        if self.head == NIL:
+            self.tail = new
+        else:
+            self._prev[self.head] = new
+            self._next[new] = self.head
+        self.head = new
+
+    def pop_front(self) -> Any:
+        """
+        Remove and return the element from the front of the deque.
+
+        Returns
+        -------
+        any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        removed = self.head
+        if removed == NIL:
+            raise ValueError('nothing to pop')
+        _return = self._data[removed]
+        self.head = self._next[removed]
+        if self.head == NIL:
+            self.tail = NIL
+        else:
+            self._prev[self.head] = NIL
+        self._arena.release(removed)
+        return _return
+
+    def pop(self) -> Any:
+        """
+        Remove and return the element from the front of the deque.
+
+        This method is an alias for `pop_front`.
+
+        Returns
+        -------
+        any
+            The removed element.
+
+        """
+        return self.pop_front()
+
+    def pop_back(self) -> Any:
+        """
+        Remove and return the element from the back of the deque.
+
+        Returns
+        -------
+        any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        removed = self.tail
+        if removed == NIL:
+            raise ValueError('nothing to pop')
+        _return = self._data[removed]
+        self.tail = self._prev[removed]
+        if self.tail == NIL:
+            self.head = NIL
+        else:
+            self._next[self.tail] = NIL
+        self._arena.release(removed)
+        return _return
+
+    def front(self) -> Any | None:
+        """
+        Retrieve the element at the front of the deque.
+
+        Returns
+        -------
+        Any | None
+            The front element, None if the deque is empty.
+
+        """
+        return self._data[self.head] if self.head != NIL else None
+
+    def back(self) -> Any | None:
+        """
+        Retrieve the element at the back of the deque.
+
+        Returns
+        -------
+        Any | None
+            The back element, None if the deque is empty.
+
+        """
+        return self._data[self.tail] if self.tail != NIL else None
@@ -0,0 +1,1014 @@
+"""
+Array-Backed Search Trees
+=========================
+
+This module implements the binary search tree family on top of the
+array-backed storage engine from `array_storage`. A node is an integer
+index into parallel `array.array` columns `left`, `right`, `parent`
+(plus `color` for the red-black tree and `height` for the AVL tree),
+the keys are kept in the data column of the NodeArena.
+
+The trees keep the API of BinarySearchTree, RedBlackTree and AVLTree
+(`insert`, `delete`, `search`, `in_order_traversal`, `find_min`,
+`find_max`, `find_successor`, `find_predecessor`, `is_empty`,
+`max_height`), except that `search` returns the index of the node
+instead of the node. All operations are iterative, so deep trees do not
+hit the recursion limit.
+
+With `typecode='d'` (or 'q') a node of `ArrayRedBlackTree` takes 21 bytes
+(8 for the key, 3 * 4 for the links and 1 for the color)
+against about 150 bytes of a slotted RBTreeNode.
+
+Classes
+-------
+ArrayBinarySearchTree
+    An unbalanced binary search tree stored in a NodeArena.
+
+ArrayRedBlackTree
+    A red-black tree stored in a NodeArena.
+
+ArrayAVLTree
+    An AVL tree stored in a NodeArena.
+
+"""
+
+
+from typing import Any, Generator
+
+from Algorithms_Python.array_storage import NIL, NodeArena
+
+
+RED = 1
+BLACK = 0
+
+
+class ArrayBinarySearchTree:
+    """
+    Binary search tree stored in a NodeArena.
+
+    Equal keys go to the right subtree, as in BinarySearchTree.
+
+    Attributes
+    ----------
+    root: int
+        The index of the root node, NIL if the tree is empty.
+
+    size: int
+        The number of keys in the tree.
+
+    Methods
+    -------
+    __init__(self, typecode: str | None = None, capacity: int = 16) -> None
+        Create an empty tree.
+
+    __len__(self) -> int
+        Return the number of keys in the tree.
+
+    __iter__(self) -> Generator
+        Iterate through the keys in ascending order.
+
+    key(self, node: int) -> Any
+        Return the key stored in the node.
+
+    insert(self, data: int | float) -> None
+        Insert a key into the tree.
+
+    delete(self, data: int | float) -> None
+        Delete one node with the key from the tree.
+
+    search(self, data: int | float) -> int | None
+        Return the index of a node with the key.
+
+    in_order_traversal(self) -> list[int | float]
+        Return the keys in ascending order.
+
+    find_min(self) -> int | float | None
+        Return the minimum key.
+
+    find_max(self) -> int | float | None
+        Return the maximum key.
+
+    find_successor(self, data: int | float) -> int | float | None
+        Return the smallest key greater than data.
+
+    find_predecessor(self, data: int | float) -> int | float | None
+        Return the largest key smaller than data.
+
+    is_empty(self) -> bool
+        Check if the tree is empty.
+
+    max_height(self) -> int
+        Return the height of the tree.
+
+    memory_usage(self) -> int
+        Return the number of bytes taken by the columns.
+
+    """
+
+    _columns = {'left': 'i', 'right': 'i', 'parent': 'i'}
+
+    def __init__(self, typecode: str | None = None,
+                 capacity: int = 16) -> None:
+        """
+        Create an empty tree.
+
+        Parameters
+        ----------
+        typecode: str or None, optional
+            Typecode of the key column ('d' for floats, 'q' for integers),
+            None (default) to store any comparable Python objects.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+
+        """
+        self._arena = NodeArena(self._columns, typecode, capacity)
+        self._left = self._arena.columns['left']
+        self._right = self._arena.columns['right']
+        self._parent = self._arena.columns['parent']
+        self._key = self._arena.data
+        self.root = NIL
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of keys in the tree.
+
+        Returns
+        -------
+        int
+            The number of keys in the tree.
+
+        """
+        return self._arena.size
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys in the tree.
+
+        Returns
+        -------
+        int
+            The number of keys in the tree.
+
+        """
+        return self._arena.size
+
+    def key(self, node: int) -> Any:
+        """
+        Return the key stored in the node.
+
+        Parameters
+        ----------
+        node: int
+            The index of the node.
+
+        Returns
+        -------
+        Any
+            The key of the node.
+
+        """
+        return self._key[node]
+
+    def insert(self, data: int | float) -> None:
+        """
+        Insert a key into the tree.
+
+        Parameters
+        ----------
+        data: int | float
+            The key to be inserted.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, keys = self._left, self._right, self._key
+        parent = NIL
+        current = self.root
+        while current != NIL:
+            parent = current
+            current = left[current] if data < keys[current] \
+                else right[current]
+
+        new_node = self._arena.allocate()
+        keys[new_node] = data
+        self._parent[new_node] = parent
+        if parent == NIL:
+            self.root = new_node
+        elif data < keys[parent]:
+            left[parent] = new_node
+        else:
+            right[parent] = new_node
+        self._after_insert(new_node)
+
+    def _after_insert(self, node: int) -> None:
+        """
+        Restore the balance after insertion, nothing to do for the BST.
+
+        Parameters
+        ----------
+        node: int
+            The inserted node.
+
+        Returns
+        -------
+        None
+
+        """
+
+    def search(self, data: int | float) -> int | None:
+        """
+        Search for a node with the key.
+
+        Parameters
+        ----------
+        data: int | float
+            The key to be searched.
+
+        Returns
+        -------
+        int | None
+            The index of a node with the key, None if there is no such node.
+
+        """
+        left, right, keys = self._left, self._right, self._key
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if data == key:
+                return current
+            current = left[current] if data < key else right[current]
+        return None
+
+    def delete(self, data: int | float) -> None:
+        """
+        Delete one node with the key from the tree.
+
+        Parameters
+        ----------
+        data: int | float
+            The key to be deleted.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IndexError
+            Raised if the tree is empty.
+
+        """
+        if self.root == NIL:
+            raise IndexError('Tree is empty')
+        node = self.search(data)
+        if node is not None:
+            self._delete(node)
+
+    def _transplant(self, old: int, new: int) -> None:
+        """
+        Put the subtree rooted at new in place of the subtree rooted at old.
+
+        The parent of new is set even if new is NIL, the red-black
+        deletion relies on it.
+
+        Parameters
+        ----------
+        old: int
+            The root of the subtree to be replaced.
+
+        new: int
+            The root of the subtree to be put instead.
+
+        Returns
+        -------
+        None
+
+        """
+        parent = self._parent[old]
+        if parent == NIL:
+            self.root = new
+        elif old == self._left[parent]:
+            self._left[parent] = new
+        else:
+            self._right[parent] = new
+        self._parent[new] = parent
+
+    def _min_node(self, node: int) -> int:
+        """
+        Return the node with the minimum key in the subtree.
+
+        Parameters
+        ----------
+        node: int
+            The root of the subtree.
+
+        Returns
+        -------
+        int
+            The index of the node with the minimum key.
+
+        """
+        left = self._left
+        while left[node] != NIL:
+            node = left[node]
+        return node
+
+    def _max_node(self, node: int) -> int:
+        """
+        Return the node with the maximum key in the subtree.
+
+        Parameters
+        ----------
+        node: int
+            The root of the subtree.
+
+        Returns
+        -------
+        int
+            The index of the node with the maximum key.
+
+        """
+        right = self._right
+        while right[node] != NIL:
+            node = right[node]
+        return node
+
+    def _delete(self, node: int) -> None:
+        """
+        Unlink the node from the tree and release it.
+
+        Parameters
+        ----------
+        node: int
+            The node to be deleted.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, parent = self._left, self._right, self._parent
+        # the lowest node whose subtree changed
+        lowest = parent[node]
+        if left[node] == NIL:
+            self._transplant(node, right[node])
+        elif right[node] == NIL:
+            self._transplant(node, left[node])
+        else:
+            successor = self._min_node(right[node])
+            if parent[successor] == node:
+                lowest = successor
+            else:
+                lowest = parent[successor]
+                self._transplant(successor, right[successor])
+                right[successor] = right[node]
+                parent[right[successor]] = successor
+            self._transplant(node, successor)
+            left[successor] = left[node]
+            parent[left[successor]] = successor
+        self._arena.release(node)
+        self._after_delete(lowest)
+
+    def _after_delete(self, node: int) -> None:
+        """
+        Restore the balance after deletion, nothing to do for the BST.
+
+        Parameters
+        ----------
+        node: int
+            The lowest node whose subtree changed.
+
+        Returns
+        -------
+        None
+
+        """
+
+    def _left_rotate(self, node: int) -> None:
+        """
+        Rotate left around the node and its right child.
+
+        Parameters
+        ----------
+        node: int
+            The node around which the rotation is performed.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, parent = self._left, self._right, self._parent
+        child = right[node]
+        right[node] = left[child]
+        if left[child] != NIL:
+            parent[left[child]] = node
+        parent[child] = parent[node]
+        if parent[node] == NIL:
+            self.root = child
+        elif node == left[parent[node]]:
+            left[parent[node]] = child
+        else:
+            right[parent[node]] = child
+        left[child] = node
+        parent[node] = child
+
+    def _right_rotate(self, node: int) -> None:
+        """
+        Rotate right around the node and its left child.
+
+        Parameters
+        ----------
+        node: int
+            The node around which the rotation is performed.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, parent = self._left, self._right, self._parent
+        child = left[node]
+        left[node] = right[child]
+        if right[child] != NIL:
+            parent[right[child]] = node
+        parent[child] = parent[node]
+        if parent[node] == NIL:
+            self.root = child
+        elif node == right[parent[node]]:
+            right[parent[node]] = child
+        else:
+            left[parent[node]] = child
+        right[child] = node
+        parent[node] = child
+
+    def _next_node(self, node: int) -> int:
+        """
+        Return the node following the given one in the in-order traversal.
+
+        Parameters
+        ----------
+        node: int
+            The current node.
+
+        Returns
+        -------
+        int
+            The next node, NIL if the node is the last one.
+
+        """
+        right, parent = self._right, self._parent
+        if right[node] != NIL:
+            return self._min_node(right[node])
+        up = parent[node]
+        while up != NIL and node == right[up]:
+            node, up = up, parent[up]
+        return up
+
+    def __iter__(self) -> Generator:
+        """
+        Iterate through the keys in ascending order.
+
+        Returns
+        -------
+        Generator
+            A generator of the keys.
+
+        """
+        if self.root == NIL:
+            return
+        keys = self._key
+        node = self._min_node(self.root)
+        while node != NIL:
+            yield keys[node]
+            node = self._next_node(node)
+
+    def in_order_traversal(self) -> list[int | float]:
+        """
+        Perform an in-order traversal of the tree.
+
+        Returns
+        -------
+        list[int | float]
+            The list of keys in increasing order.
+
+        """
+        return list(self)
+
+    def find_min(self) -> int | float | None:
+        """
+        Find the minimum key in the tree.
+
+        Returns
+        -------
+        int | float | None
+            The minimum key, None if the tree is empty.
+
+        """
+        if self.root == NIL:
+            return None
+        return self._key[self._min_node(self.root)]
+
+    def find_max(self) -> int | float | None:
+        """
+        Find the maximum key in the tree.
+
+        Returns
+        -------
+        int | float | None
+            The maximum key, None if the tree is empty.
+
+        """
+        if self.root == NIL:
+            return None
+        return self._key[self._max_node(self.root)]
+
+    def find_successor(self, data: int | float) -> int | float | None:
+        """
+        Find the smallest key greater than data.
+
+        Parameters
+        ----------
+        data: int | float
+            The key, successor to which is to be found. It does not have
+            to be present in the tree.
+
+        Returns
+        -------
+        int | float | None
+            The successor, None if there is no greater key.
+
+        """
+        left, right, keys = self._left, self._right, self._key
+        successor = None
+        current = self.root
+        while current != NIL:
+            if data < keys[current]:
+                successor = keys[current]
+                current = left[current]
+            else:
+                current = right[current]
+        return successor
+
+    def find_predecessor(self, data: int | float) -> int | float | None:
+        """
+        Find the largest key smaller than data.
+
+        Parameters
+        ----------
+        data: int | float
+            The key, predecessor to which is to be found. It does not have
+            to be present in the tree.
+
+        Returns
+        -------
+        int | float | None
+            The predecessor, None if there is no smaller key.
+
+        """
+        left, right, keys = self._left, self._right, self._key
+        predecessor = None
+        current = self.root
+        while current != NIL:
+            if data > keys[current]:
+                predecessor = keys[current]
+                current = right[current]
+            else:
+                current = left[current]
+        return predecessor
+
+    def is_empty(self) -> bool:
+        """
+        Check if the tree is empty.
+
+        Returns
+        -------
+        bool
+            True if the tree is empty, False otherwise.
+
+        """
+        return self.root == NIL
+
+    def max_height(self) -> int:
+        """
+        The maximum height of the tree.
+
+        Returns
+        -------
+        int
+            The height of the tree, 0 for the empty tree.
+
+        """
+        left, right = self._left, self._right
+        height = 0
+        level = [self.root] if self.root != NIL else []
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (left[node], right[node]) if child != NIL]
+        return height
+
+    def memory_usage(self) -> int:
+        """
+        Return the number of bytes taken by the columns.
+
+        Returns
+        -------
+        int
+            The number of bytes.
+
+        """
+        return self._arena.memory_usage()
+
+
+class ArrayRedBlackTree(ArrayBinarySearchTree):
+    """
+    Red-black tree stored in a NodeArena.
+
+    The NIL index doubles as the black sentinel leaf, the colors are kept
+    in a one-byte `color` column (1 for red, 0 for black).
+
+    Methods
+    -------
+    color(self, node: int) -> str
+        Return the color of the node, 'red' or 'black'.
+
+    """
+
+    _columns = {'left': 'i', 'right': 'i', 'parent': 'i', 'color': 'b'}
+
+    def __init__(self, typecode: str | None = None,
+                 capacity: int = 16) -> None:
+        """
+        Create an empty red-black tree.
+
+        Parameters
+        ----------
+        typecode: str or None, optional
+            Typecode of the key column, None (default) to store any
+            comparable Python objects.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+
+        """
+        super().__init__(typecode, capacity)
+        self._color = self._arena.columns['color']
+
+    def color(self, node: int) -> str:
+        """
+        Return the color of the node.
+
+        Parameters
+        ----------
+        node: int
+            The index of the node.
+
+        Returns
+        -------
+        str
+            'red' or 'black', NIL is black.
+
+        """
+        return 'red' if self._color[node] == RED else 'black'
+
+    def _after_insert(self, node: int) -> None:
+        """
+        Restore the red-black properties after insertion.
+
+        Parameters
+        ----------
+        node: int
+            The inserted node.
+
+        Returns
+        -------
+        None
+
+        """
+        left, parent, color = self._left, self._parent, self._color
+        color[node] = RED
+        while color[parent[node]] == RED:
+            father = parent[node]
+            grandfather = parent[father]
+            if father == left[grandfather]:
+                uncle = self._right[grandfather]
+                if color[uncle] == RED:
+                    color[father] = color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                    continue
+                if node == self._right[father]:
+                    node = father
+                    self._left_rotate(node)
+                    father = parent[node]
+                color[father] = BLACK
+                color[grandfather] = RED
+                self._right_rotate(grandfather)
+            else:
+                uncle = left[grandfather]
+                if color[uncle] == RED:
+                    color[father] = color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                    continue
+                if node == left[father]:
+                    node = father
+                    self._right_rotate(node)
+                    father = parent[node]
+                color[father] = BLACK
+                color[grandfather] = RED
+                self._left_rotate(grandfather)
+        color[self.root] = BLACK
+
+    def _delete(self, node: int) -> None:
+        """
+        Unlink the node from the tree, release it and restore
+        the red-black properties.
+
+        Parameters
+        ----------
+        node: int
+            The node to be deleted.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, parent = self._left, self._right, self._parent
+        color = self._color
+        removed_color = color[node]
+        if left[node] == NIL:
+            child = right[node]
+            self._transplant(node, child)
+        elif right[node] == NIL:
+            child = left[node]
+            self._transplant(node, child)
+        else:
+            successor = self._min_node(right[node])
+            removed_color = color[successor]
+            child = right[successor]
+            if parent[successor] == node:
+                parent[child] = successor
+            else:
+                self._transplant(successor, child)
+                right[successor] = right[node]
+                parent[right[successor]] = successor
+            self._transplant(node, successor)
+            left[successor] = left[node]
+            parent[left[successor]] = successor
+            color[successor] = color[node]
+        self._arena.release(node)
+        if removed_color == BLACK:
+            self._fix_double_black(child)
+        # the sentinel has to stay black and detached
+        color[NIL] = BLACK
+        parent[NIL] = NIL
+
+    def _fix_double_black(self, node: int) -> None:
+        """
+        Restore the red-black properties after a black node was removed.
+
+        Parameters
+        ----------
+        node: int
+            The node which took the place of the removed one.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, parent = self._left, self._right, self._parent
+        color = self._color
+        while node != self.root and color[node] == BLACK:
+            father = parent[node]
+            if node == left[father]:
+                sibling = right[father]
+                if color[sibling] == RED:
+                    color[sibling] = BLACK
+                    color[father] = RED
+                    self._left_rotate(father)
+                    sibling = right[father]
+                if color[left[sibling]] == BLACK and \
+                        color[right[sibling]] == BLACK:
+                    color[sibling] = RED
+                    node = father
+                    continue
+                if color[right[sibling]] == BLACK:
+                    color[left[sibling]] = BLACK
+                    color[sibling] = RED
+                    self._right_rotate(sibling)
+                    sibling = right[father]
+                color[sibling] = color[father]
+                color[father] = BLACK
+                color[right[sibling]] = BLACK
+                self._left_rotate(father)
+            else:
+                sibling = left[father]
+                if color[sibling] == RED:
+                    color[sibling] = BLACK
+                    color[father] = RED
+                    self._right_rotate(father)
+                    sibling = left[father]
+                if color[left[sibling]] == BLACK and \
+                        color[right[sibling]] == BLACK:
+                    color[sibling] = RED
+                    node = father
+                    continue
+                if color[left[sibling]] == BLACK:
+                    color[right[sibling]] = BLACK
+                    color[sibling] = RED
+                    self._left_rotate(sibling)
+                    sibling = left[father]
+                color[sibling] = color[father]
+                color[father] = BLACK
+                color[left[sibling]] = BLACK
+                self._right_rotate(father)
+            node = self.root
+        color[node] = BLACK
+
+
+class ArrayAVLTree(ArrayBinarySearchTree):
+    """
+    AVL tree stored in a NodeArena.
+
+    Heights are kept in a one-byte `height` column (NIL has height 0),
+    so the balance factor of a node is computed in O(1) and the tree is
+    rebalanced on the way from the changed node up to the root.
+
+    Methods
+    -------
+    height(self, node: int) -> int
+        Return the height of the node.
+
+    balance_factor(self, node: int) -> int
+        Return the balance factor of the node.
+
+    """
+
+    _columns = {'left': 'i', 'right': 'i', 'parent': 'i', 'height': 'b'}
+
+    def __init__(self, typecode: str | None = None,
+                 capacity: int = 16) -> None:
+        """
+        Create an empty AVL tree.
+
+        Parameters
+        ----------
+        typecode: str or None, optional
+            Typecode of the key column, None (default) to store any
+            comparable Python objects.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+
+        """
+        super().__init__(typecode, capacity)
+        self._height = self._arena.columns['height']
+
+    def height(self, node: int) -> int:
+        """
+        Return the height of the node.
+
+        Parameters
+        ----------
+        node: int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The height, 1 for a leaf and 0 for NIL.
+
+        """
+        return self._height[node]
+
+    def balance_factor(self, node: int) -> int:
+        """
+        Return the balance factor of the node.
+
+        Parameters
+        ----------
+        node: int
+            The index of the node.
+
+        Returns
+        -------
+        int
+            The height of the left subtree minus the height of the right.
+
+        """
+        return self._height[self._left[node]] - \
+            self._height[self._right[node]]
+
+    def _update_height(self, node: int) -> None:
+        """
+        Recalculate the height of the node from its children.
+
+        Parameters
+        ----------
+        node: int
+            The index of the node.
+
+        Returns
+        -------
+        None
+
+        """
+        height = self._height
+        height[node] = 1 + max(height[self._left[node]],
+                               height[self._right[node]])
+
+    def _rebalance(self, node: int) -> None:
+        """
+        Update heights and rotate from the node up to the root.
+
+        Parameters
+        ----------
+        node: int
+            The lowest node whose subtree changed.
+
+        Returns
+        -------
+        None
+
+        """
+        left, right, parent = self._left, self._right, self._parent
+        while node != NIL:
+            self._update_height(node)
+            balance = self.balance_factor(node)
+            # Left heavy
+            if balance > 1:
+                # Left-Right case
+                if self.balance_factor(left[node]) < 0:
+                    child = left[node]
+                    self._left_rotate(child)
+                    self._update_height(child)
+                self._right_rotate(node)
+                self._update_height(node)
+                node = parent[node]
+                self._update_height(node)
+            # Right heavy
+            elif balance < -1:
+                # Right-Left case
+                if self.balance_factor(right[node]) > 0:
+                    child = right[node]
+                    self._right_rotate(child)
+                    self._update_height(child)
+                self._left_rotate(node)
+                self._update_height(node)
+                node = parent[node]
+                self._update_height(node)
+            node = parent[node]
+
+    def _after_insert(self, node: int) -> None:
+        """
+        Restore the AVL balance after insertion.
+
+        Parameters
+        ----------
+        node: int
+            The inserted node.
+
+        Returns
+        -------
+        None
+
+        """
+        self._height[node] = 1
+        self._rebalance(self._parent[node])
+
+    def _after_delete(self, node: int) -> None:
+        """
+        Restore the AVL balance after deletion.
+
+        Parameters
+        ----------
+        node: int
+            The lowest node whose subtree changed.
+
+        Returns
+        -------
+        None
+
+        """
+        self._parent[NIL] = NIL
+        self._rebalance(node)
@@ -47,6 +47,8 @@ class AVLNode(TreeNode):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, data: int | float) -> None:
         """
         Initialize an AVLNode object with data.
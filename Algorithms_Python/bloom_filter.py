@@ -7,6 +7,21 @@ data structure used to check whether an item is a member of a set with a
 certain probability of false positives. The Bloom filter is used
 for efficient membership testing.
 
+The k bit positions of an item are derived from two hashes h1 and h2 by
+Kirsch-Mitzenmacher double hashing, g_i = h1 + i * h2 modulo the size,
+which keeps the false positive rate of k independent hash
+functions. With the default family both hashes are the halves of one
+128-bit MurmurHash3 call, `mmh3.hash64`, so an item is hashed once
+instead of k times. `add_many` and `check_many` compute the positions of
+many items at once with numpy, when it is installed, and set or read
+the bits through bitarray index lists.
+
+A Bloom filter is sized for a number of items, past it the false
+positive rate grows. `ScalableBloomFilter` needs no such number: it
+chains filters whose capacities grow geometrically and whose false
+positive probabilities shrink geometrically, so their sum stays below
+the requested one however many items arrive.
+
 Functions
 ---------
 rot(x) -> int
@@ -26,13 +41,30 @@ Classes
 Bloom_filter(items_count=1000000, fp_prob=0.05, hashfunc='mmh3')
     Implements a Bloom filter data structure for efficient membership testing.
 
+ScalableBloomFilter(initial_capacity=1000, fp_prob=0.01, growth=2,
+                    tightening=0.9, hashfunc='mmh3')
+    Implements a Bloom filter growing with the items passed through it.
+
 '''
 
 
+import logging
 import math
+from itertools import chain
+from typing import Any, Iterable
+
 import mmh3
 from bitarray import bitarray
 
+from Algorithms_Python.hash_functions import hash64, hash_array, splitmix64
+
+try:
+    import numpy as np
+except ImportError:
+    logging.info('numpy cannot be imported, Bloom_filter.add_many and ' +
+                 'check_many will hash the items one by one')
+    np = None
+
 
 '''
 For functions from hashlittle2 to hashlittle:
@@ -283,8 +315,10 @@ class Bloom_filter():
 
     hashfunc: string
         Family of algorithms for generating hash functions.
-        Default value = 'mmh3' (murmur3 hash), possible value = 'jenkins'
-        for Jenkins hash
+        Default value = 'mmh3' (murmur3 hash), possible values = 'jenkins'
+        for Jenkins hash and 'fast64' for the 64-bit hash64 of
+        hash_functions. Items are hashed as str, except bytes with
+        'mmh3' and any item with 'fast64', which hashes ints directly.
 
     Methods
     -------
@@ -298,6 +332,12 @@ class Bloom_filter():
     check(self, item: any) -> Bloom_filter
         Checks whether the item was passed through Bloom filter.
 
+    add_many(self, items: Iterable) -> None
+        Passes through the Bloom filter all given items.
+
+    check_many(self, items: Iterable) -> numpy.ndarray or list[bool]
+        Checks whether every item was passed through Bloom filter.
+
     get_size(self, items_count: int, fp_prob: float) -> int
         Calculates full size of the Bloom filter.
 
@@ -323,7 +363,7 @@ class Bloom_filter():
             Expected false positive outcome probability.
             Default value = 0.05
 
-        hashfunc: 'mmh3' or 'jenkins'
+        hashfunc: 'mmh3', 'jenkins' or 'fast64'
             Name of the family of functions to use for hash functions
             generation.
             Default value = 'mmh3'
@@ -339,12 +379,128 @@ class Bloom_filter():
         self.bit_array = bitarray(self.size)
         self.bit_array.setall(0)
         if hashfunc == 'mmh3':
-            self.hashfunc = mmh3.hash
+            self.hashfunc = mmh3.hash64
         elif hashfunc == 'jenkins':
             self.hashfunc = hashlittle
+        elif hashfunc == 'fast64':
+            self.hashfunc = hash64
         else:
             raise ValueError(
-                'available are only murmur (mmh3) and jenkins hashes')
+                'available are only murmur (mmh3), jenkins and fast64 hashes')
+
+    def _double_hash(self, item: Any) -> tuple[int, int]:
+        '''
+        Calculates the two hashes the bit positions are derived from.
+
+        Parameters
+        ----------
+        item: Any
+
+        Returns
+        -------
+        tuple[int, int]
+            The hashes h1 and h2.
+        '''
+        if self.hashfunc is hash64:
+            if np is not None and isinstance(item, (np.integer, np.bool_)):
+                # as the ints of the arrays hashed by hash_array
+                item = int(item)
+            first = hash64(item)
+            # a bijection, unlike a second seed it costs no second hash
+            return first, splitmix64(first)
+        if self.hashfunc is hashlittle:
+            item = item if isinstance(item, str) else str(item)
+            return hashlittle(item, 0), hashlittle(item, 1)
+        if not isinstance(item, (str, bytes)):
+            item = str(item)
+        return mmh3.hash64(item, signed=False)
+
+    def _indices(self, item: Any) -> list[int]:
+        '''
+        Calculates the bit positions of an item by double hashing.
+
+        Parameters
+        ----------
+        item: Any
+
+        Returns
+        -------
+        list[int]
+            hash_count positions, (h1 + i * h2) mod size.
+        '''
+        first, step = self._first_and_step(item)
+        return [(first + i * step) % self.size
+                for i in range(self.hash_count)]
+
+    def _first_and_step(self, item: Any) -> tuple[int, int]:
+        '''
+        Calculates the first bit position of an item and the step.
+
+        Parameters
+        ----------
+        item: Any
+
+        Returns
+        -------
+        tuple[int, int]
+            h1 mod size and h2 mod size.
+        '''
+        # the default family and str items first, they are the common case
+        if type(item) is str and self.hashfunc is mmh3.hash64:
+            first, second = mmh3.hash64(item, signed=False)
+        else:
+            first, second = self._double_hash(item)
+        # small operands, the products of 64-bit hashes are slow big ints
+        return first % self.size, second % self.size
+
+    def _indices_many(self, items: Iterable) -> list[int]:
+        '''
+        Calculates the bit positions of many items at once.
+
+        With numpy the positions are computed on arrays, and ints are
+        hashed by hash_array with 'fast64'.
+
+        Parameters
+        ----------
+        items: Iterable
+            Items or a numpy array of them.
+
+        Returns
+        -------
+        list[int]
+            hash_count positions per item, item after item.
+        '''
+        if np is None:
+            return [index for item in items for index in self._indices(item)]
+        first = None
+        if self.hashfunc is hash64:
+            values = items if isinstance(items, np.ndarray) else None
+            if values is None:
+                items = list(items)
+                if all(type(item) is int for item in items):
+                    try:
+                        values = np.array(items)
+                    except OverflowError:
+                        pass
+            if values is not None and values.dtype.kind in 'iu':
+                first = hash_array(values)
+                second = splitmix64(first)
+        if first is None:
+            if isinstance(items, np.ndarray):
+                items = items.tolist()
+            murmur = mmh3.hash64 if self.hashfunc is mmh3.hash64 else None
+            pairs = [murmur(item, signed=False)
+                     if murmur and type(item) is str
+                     else self._double_hash(item) for item in items]
+            pairs = np.fromiter(chain.from_iterable(pairs), dtype=np.uint64,
+                                count=2 * len(pairs)).reshape(-1, 2)
+            first, second = pairs[:, 0], pairs[:, 1]
+        size = np.uint64(self.size)
+        steps = np.arange(self.hash_count, dtype=np.uint64)
+        # no overflow for sizes below 2^57
+        indices = (first[:, None] % size
+                   + steps * (second[:, None] % size)) % size
+        return indices.ravel().tolist()
 
     def add(self, item: str) -> None:
         '''
@@ -358,9 +514,26 @@ class Bloom_filter():
         -------
         None
         '''
-        for i in range(self.hash_count):
-            hashed_index = self.hashfunc(str(item), i) % self.size
-            self.bit_array[hashed_index] = 1
+        index, step = self._first_and_step(item)
+        size, bits = self.size, self.bit_array
+        for _ in range(self.hash_count):
+            bits[index] = 1
+            index = (index + step) % size
+
+    def add_many(self, items: Iterable) -> None:
+        '''
+        Passes all given items through Bloom filter.
+
+        Parameters
+        ----------
+        items: Iterable
+            Items or a numpy array of them.
+
+        Returns
+        -------
+        None
+        '''
+        self.bit_array[self._indices_many(items)] = 1
 
     def check(self, item: str) -> bool:
         '''
@@ -375,12 +548,36 @@ class Bloom_filter():
         bool
             True if the item was passed through, False if it was not.
         '''
-        for i in range(self.hash_count):
-            hashed_index = self.hashfunc(str(item), i) % self.size
-            if self.bit_array[hashed_index] == 0:
+        index, step = self._first_and_step(item)
+        size, bits = self.size, self.bit_array
+        for _ in range(self.hash_count):
+            if not bits[index]:
                 return False
+            index = (index + step) % size
         return True
 
+    def check_many(self, items: Iterable) -> Any:
+        '''
+        Checks whether every item was passed through the Bloom filter.
+
+        Parameters
+        ----------
+        items: Iterable
+            Items or a numpy array of them.
+
+        Returns
+        -------
+        numpy.ndarray or list[bool]
+            True for the items passed through, as a numpy array of bools
+            if numpy is installed.
+        '''
+        bits = self.bit_array[self._indices_many(items)]
+        k = self.hash_count
+        if np is None:
+            return [bits[i:i + k].all() for i in range(0, len(bits), k)]
+        return np.frombuffer(bits.unpack(), dtype=bool) \
+            .reshape(-1, k).all(axis=1)
+
     def get_size(self, items_count: int, fp_prob: float) -> int:
         '''
         Calculates the size of bloom filter for its initialization.
@@ -421,3 +618,285 @@ class Bloom_filter():
         '''
         k = (size / items_count) * math.log(2)
         return int(k)
+
+
+class ScalableBloomFilter():
+
+    '''
+    This is an implementation of the scalable Bloom filter.
+
+    The filter starts as one Bloom_filter of initial_capacity items.
+    When the last filter of the chain is full, a filter growth times
+    larger is appended, so the memory grows with the items passed
+    through. The i-th filter is built for the false positive probability
+    fp_prob * (1 - tightening) * tightening ^ i, and a check is positive
+    if any filter is, so the false positive probability of the chain is
+    at most fp_prob.
+
+    Attributes
+    ----------
+    fp_prob: float
+        The bound on the false positives probability.
+
+    filters: list[Bloom_filter]
+        The chain of filters, items are added to the last one.
+
+    Methods
+    -------
+    __init__(self, initial_capacity: int = 1000, fp_prob: float = 0.01,
+             growth: float = 2, tightening: float = 0.9,
+             hashfunc: str = 'mmh3') -> None
+        Creates an instance of scalable Bloom filter.
+
+    add(self, item: any) -> None
+        Passes through the filter given item.
+
+    check(self, item: any) -> bool
+        Checks whether the item was passed through the filter.
+
+    add_many(self, items: Iterable) -> None
+        Passes through the filter all given items.
+
+    check_many(self, items: Iterable) -> numpy.ndarray or list[bool]
+        Checks whether every item was passed through the filter.
+
+    __len__(self) -> int
+        Returns the number of items passed through.
+
+    capacity(self) -> int
+        Returns the number of items the filters are built for.
+
+    fill_ratio(self) -> float
+        Returns the share of set bits.
+
+    estimated_fp_rate(self) -> float
+        Estimates the current false positives probability.
+
+    '''
+
+    def __init__(self, initial_capacity: int = 1000, fp_prob: float = 0.01,
+                 growth: float = 2, tightening: float = 0.9,
+                 hashfunc: str = 'mmh3') -> None:
+        '''
+        Creates an instance of scalable Bloom filter.
+
+        Parameters
+        ----------
+        initial_capacity: int
+            Amount of items the first filter is built for.
+            Default value = 1000
+
+        fp_prob: float
+            The bound on the false positive outcome probability.
+            Default value = 0.01
+
+        growth: float
+            The ratio of the capacities of consecutive filters.
+            Default value = 2
+
+        tightening: float
+            The ratio of the false positive probabilities of consecutive
+            filters. Default value = 0.9
+
+        hashfunc: 'mmh3', 'jenkins' or 'fast64'
+            Name of the family of hash functions of the filters.
+            Default value = 'mmh3'
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if initial_capacity is not positive, growth is below 1
+            or fp_prob or tightening is not between 0 and 1.
+
+        '''
+        if initial_capacity < 1 or growth < 1 or not 0 < fp_prob < 1 \
+                or not 0 < tightening < 1:
+            raise ValueError('initial_capacity should be positive, growth ' +
+                             'at least 1, fp_prob and tightening between ' +
+                             '0 and 1')
+        self.fp_prob = fp_prob
+        self._initial_capacity = initial_capacity
+        self._growth = growth
+        self._tightening = tightening
+        self._hashfunc = hashfunc
+        self.filters = []
+        # the items passed through every filter and their capacities
+        self._counts = []
+        self._capacities = []
+        self._append_filter()
+
+    def _append_filter(self) -> None:
+        '''
+        Appends an empty filter to the chain.
+
+        Returns
+        -------
+        None
+        '''
+        i = len(self.filters)
+        capacity = math.ceil(self._initial_capacity * self._growth ** i)
+        fp_prob = (self.fp_prob * (1 - self._tightening)
+                   * self._tightening ** i)
+        self.filters.append(Bloom_filter(capacity, fp_prob, self._hashfunc))
+        self._counts.append(0)
+        self._capacities.append(capacity)
+
+    def add(self, item: Any) -> None:
+        '''
+        Passes given item through the filter.
+
+        An item the filter already reports is not added again, so
+        repeated items do not fill the filters.
+
+        Parameters
+        ----------
+        item: Any
+
+        Returns
+        -------
+        None
+        '''
+        if self.check(item):
+            return
+        if self._counts[-1] >= self._capacities[-1]:
+            self._append_filter()
+        self.filters[-1].add(item)
+        self._counts[-1] += 1
+
+    def check(self, item: Any) -> bool:
+        '''
+        Checks whether the item was passed through the filter.
+
+        Parameters
+        ----------
+        item: Any
+
+        Returns
+        -------
+        bool
+            True if the item was passed through, False if it was not.
+        '''
+        # the newest filter holds the most items
+        return any(bloom.check(item) for bloom in reversed(self.filters))
+
+    def add_many(self, items: Iterable) -> None:
+        '''
+        Passes all given items through the filter.
+
+        The items the filter already reports are skipped, the others are
+        added in chunks filling the last filter.
+
+        Parameters
+        ----------
+        items: Iterable
+            Items or a numpy array of them.
+
+        Returns
+        -------
+        None
+        '''
+        if np is None or not isinstance(items, np.ndarray):
+            items = list(items)
+        seen = self.check_many(items)
+        if np is None:
+            items = [item for item, known in zip(items, seen) if not known]
+        elif isinstance(items, np.ndarray):
+            items = items[~seen]
+        else:
+            items = [item for item, known in zip(items, seen.tolist())
+                     if not known]
+        start = 0
+        while start < len(items):
+            if self._counts[-1] >= self._capacities[-1]:
+                self._append_filter()
+            end = start + self._capacities[-1] - self._counts[-1]
+            chunk = items[start:end]
+            self.filters[-1].add_many(chunk)
+            self._counts[-1] += len(chunk)
+            start = end
+
+    def check_many(self, items: Iterable) -> Any:
+        '''
+        Checks whether every item was passed through the filter.
+
+        Parameters
+        ----------
+        items: Iterable
+            Items or a numpy array of them.
+
+        Returns
+        -------
+        numpy.ndarray or list[bool]
+            True for the items passed through, as a numpy array of bools
+            if numpy is installed.
+        '''
+        if np is None or not isinstance(items, np.ndarray):
+            items = list(items)
+        found = self.filters[0].check_many(items)
+        for bloom in self.filters[1:]:
+            if np is None:
+                found = [old or new for old, new in
+                         zip(found, bloom.check_many(items))]
+            else:
+                found |= bloom.check_many(items)
+        return found
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of items passed through the filter.
+
+        Returns
+        -------
+        int
+            The number of items added, without the ones the filter
+            already reported. Repeats within one add_many call are
+            counted every time.
+        '''
+        return sum(self._counts)
+
+    def capacity(self) -> int:
+        '''
+        Returns the number of items the filters are built for.
+
+        Returns
+        -------
+        int
+            The sum of the capacities of the filters.
+        '''
+        return sum(self._capacities)
+
+    def fill_ratio(self) -> float:
+        '''
+        Returns the share of set bits in all filters.
+
+        Returns
+        -------
+        float
+            The set bits divided by all bits, about 0.5 in a full
+            filter.
+        '''
+        return (sum(bloom.bit_array.count() for bloom in self.filters)
+                / sum(bloom.size for bloom in self.filters))
+
+    def estimated_fp_rate(self) -> float:
+        '''
+        Estimates the current false positives probability.
+
+        A filter whose bits are set with the share f reports an absent
+        item with the probability f ^ k, and the chain does when any of
+        its filters does.
+
+        Returns
+        -------
+        float
+            The estimate, at most about fp_prob.
+        '''
+        passed = 1.0
+        for bloom in self.filters:
+            passed *= 1 - (bloom.bit_array.count()
+                           / bloom.size) ** bloom.hash_count
+        return 1 - passed
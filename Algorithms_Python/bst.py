@@ -34,8 +34,16 @@ class TreeNode(Node):
     right: TreeNode | None
         The right child of the node if present, else - None. Default is None.
 
+    children: list[TreeNode | None]
+        The left (index 0) and the right (index 1) children of the node.
+
+    parent: TreeNode | None
+        The parent of the node, None for the root.
+
     """
 
+    __slots__ = ('children', 'parent')
+
     def __init__(self, data: int | float) -> None:
         """
         Initializes a new instance of the TreeNode class with the specified
@@ -54,7 +62,7 @@ class TreeNode(Node):
         super().__init__(data=data)
         # left is 0, right is 1
         self.children = [None, None]
-        self.parent = self.next_node
+        self.parent = None
 
 
 class BinarySearchTree:
@@ -0,0 +1,1308 @@
+"""
+Caches with Eviction Policies
+=============================
+
+This module provides bounded key-value caches which evict entries by
+a policy when they are full. An index `HashTable_closed` maps a key to
+its entry, and the entries are `DoubleNode`s linked into circular lists
+with a sentinel, so that touching, inserting and evicting an entry are
+O(1) pointer updates:
+
+- `LRUCache` keeps one list in the order of use and evicts the least
+  recently used entry;
+- `LFUCache` keeps a list of frequency buckets, each holding the entries
+  used that many times in the order of use, and evicts the least
+  recently used of the least frequently used entries;
+- `TinyLFUCache` implements W-TinyLFU: new entries enter a small LRU
+  window, and an entry leaving the window is admitted to the main
+  segmented LRU only if it was used more often than the entry it
+  would evict there. The frequencies of all keys, including the keys
+  not in the cache, are estimated by an aging `CountMinSketch`, so the
+  cache resists scans and one-hit wonders.
+
+All caches share the features of `Cache`:
+
+- a capacity in entries and an optional budget in bytes, with the size
+  of an entry given by a callback (`sys.getsizeof` of the value by
+  default);
+- an optional time to live, the expired entries are dropped lazily when
+  they are looked up, or all at once by `expire`;
+- hit, miss, eviction and expiration counters;
+- a read-through `get_or_load`.
+
+The `memoize` decorator caches the results of a function in any of
+the caches. The caches are not thread-safe.
+
+Classes
+-------
+Cache
+    The base of the caches: the index, the budgets, the expiry and
+    the counters.
+
+LRUCache
+    A cache evicting the least recently used entry.
+
+LFUCache
+    A cache evicting the least frequently used entry.
+
+TinyLFUCache
+    A W-TinyLFU cache with frequency-based admission.
+
+Functions
+---------
+memoize(cache=None, capacity=128) -> Callable
+    Cache the results of a function.
+
+"""
+
+
+import functools
+import sys
+import time
+from typing import Any, Callable, Hashable
+
+from Algorithms_Python.count_min_sketch import CountMinSketch
+from Algorithms_Python.DoubleNode import DoubleNode
+from Algorithms_Python.hashtable import HashTable_closed
+
+
+# the default of get telling a miss from a cached None
+_MISSING = object()
+# separates the positional and the keyword arguments in memoize keys
+_KWARGS = object()
+
+
+class _Entry(DoubleNode):
+    """
+    Cache entry, a node of a circular list.
+
+    Attributes
+    ----------
+    key: Hashable
+        The key.
+
+    value: Any
+        The value.
+
+    size: int
+        The size in bytes, 0 without a budget in bytes.
+
+    expires: float or None
+        The time the entry expires at, None if it does not.
+
+    owner: Any
+        The list or the bucket holding the entry.
+
+    """
+
+    __slots__ = ('key', 'value', 'size', 'expires', 'owner')
+
+    def __init__(self, key: Hashable = None, value: Any = None,
+                 size: int = 0, expires: float | None = None) -> None:
+        """
+        Create an unlinked entry.
+
+        Parameters
+        ----------
+        key: Hashable, optional
+            The key, by default None.
+
+        value: Any, optional
+            The value, by default None.
+
+        size: int, optional
+            The size in bytes, by default 0.
+
+        expires: float or None, optional
+            The expiry time, by default None.
+
+        Returns
+        -------
+        None
+
+        """
+        # the links are set directly, the entries are always linked
+        # with each other
+        self._data = None
+        self._prev_node = self._next_node = None
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.owner = None
+
+
+class _EntryList:
+    """
+    Circular doubly linked list of entries with a sentinel.
+
+    The front holds the most recently added or moved entry.
+
+    Attributes
+    ----------
+    size: int
+        The number of entries.
+
+    """
+
+    __slots__ = ('_root', 'size')
+
+    def __init__(self) -> None:
+        """
+        Create an empty list.
+
+        Returns
+        -------
+        None
+
+        """
+        root = self._root = _Entry()
+        root._prev_node = root._next_node = root
+        self.size = 0
+
+    def push_front(self, entry: _Entry) -> None:
+        """
+        Link an entry at the front.
+
+        Parameters
+        ----------
+        entry: _Entry
+            An unlinked entry.
+
+        Returns
+        -------
+        None
+
+        """
+        root = self._root
+        first = root._next_node
+        entry._prev_node = root
+        entry._next_node = first
+        first._prev_node = root._next_node = entry
+        self.size += 1
+
+    def remove(self, entry: _Entry) -> None:
+        """
+        Unlink an entry of the list.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        entry._prev_node._next_node = entry._next_node
+        entry._next_node._prev_node = entry._prev_node
+        entry._prev_node = entry._next_node = None
+        self.size -= 1
+
+    def move_to_front(self, entry: _Entry) -> None:
+        """
+        Move an entry of the list to the front.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        root = self._root
+        if root._next_node is entry:
+            return
+        entry._prev_node._next_node = entry._next_node
+        entry._next_node._prev_node = entry._prev_node
+        first = root._next_node
+        entry._prev_node = root
+        entry._next_node = first
+        first._prev_node = root._next_node = entry
+
+    def back(self) -> _Entry | None:
+        """
+        Return the entry at the back, the least recently moved one.
+
+        Returns
+        -------
+        _Entry or None
+            The entry, None if the list is empty.
+
+        """
+        last = self._root._prev_node
+        return None if last is self._root else last
+
+
+class _Bucket(DoubleNode):
+    """
+    Bucket of the entries used the same number of times, a node of
+    the circular list of buckets of LFUCache.
+
+    Attributes
+    ----------
+    frequency: int
+        The number of uses of the entries.
+
+    entries: _EntryList
+        The entries in the order of use.
+
+    """
+
+    __slots__ = ('frequency', 'entries')
+
+    def __init__(self, frequency: int = 0) -> None:
+        """
+        Create an empty unlinked bucket.
+
+        Parameters
+        ----------
+        frequency: int, optional
+            The number of uses, by default 0.
+
+        Returns
+        -------
+        None
+
+        """
+        self._data = None
+        self._prev_node = self._next_node = None
+        self.frequency = frequency
+        self.entries = _EntryList()
+
+
+def _default_sizeof(key: Hashable, value: Any) -> int:
+    """
+    Return the size of an entry as the size of its value object.
+
+    Parameters
+    ----------
+    key: Hashable
+        The key, ignored.
+
+    value: Any
+        The value.
+
+    Returns
+    -------
+    int
+        `sys.getsizeof` of the value.
+
+    """
+    return sys.getsizeof(value)
+
+
+class Cache:
+    """
+    Base of the caches: the index, the budgets, the expiry and
+    the counters.
+
+    A subclass defines the policy by the hooks `_reset`, `_on_insert`,
+    `_on_hit`, `_unlink` and `_victim`, and optionally `_on_access`.
+
+    Attributes
+    ----------
+    capacity: int
+        The maximum number of entries.
+
+    max_bytes: int or None
+        The maximum total size of the entries, None for no budget.
+
+    ttl: float or None
+        The time to live of an entry in seconds, None if entries
+        do not expire.
+
+    bytes: int
+        The total size of the entries, 0 without a budget.
+
+    hits: int
+        The number of lookups which found a live entry.
+
+    misses: int
+        The number of lookups which did not.
+
+    evictions: int
+        The number of entries evicted to make room.
+
+    expirations: int
+        The number of entries dropped because they expired.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 128, max_bytes: int | None = None,
+             sizeof: Callable | None = None, ttl: float | None = None,
+             clock: Callable = time.monotonic) -> None
+        Create an empty cache.
+
+    get(self, key, default=None) -> Any
+        Retrieve the value of a key or a default.
+
+    put(self, key, value, ttl=None) -> None
+        Add or update an entry, evicting others if needed.
+
+    get_or_load(self, key, loader) -> Any
+        Retrieve the value of a key, loading and adding it on a miss.
+
+    pop(self, key, default=None) -> Any
+        Remove an entry and return its value.
+
+    expire(self) -> int
+        Drop all expired entries.
+
+    clear(self) -> None
+        Remove all entries.
+
+    """
+
+    def __init__(self, capacity: int = 128, max_bytes: int | None = None,
+                 sizeof: Callable[[Hashable, Any], int] | None = None,
+                 ttl: float | None = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Create an empty cache.
+
+        Parameters
+        ----------
+        capacity: int, optional
+            The maximum number of entries, by default 128.
+
+        max_bytes: int or None, optional
+            The maximum total size of the entries, by default None
+            (no budget).
+
+        sizeof: Callable[[Hashable, Any], int] or None, optional
+            The function of a key and a value returning the size of
+            the entry, by default None (`sys.getsizeof` of the value).
+            Called only with a budget in bytes.
+
+        ttl: float or None, optional
+            The time to live of an entry in seconds, by default None
+            (entries do not expire).
+
+        clock: Callable[[], float], optional
+            The function returning the current time in seconds,
+            by default `time.monotonic`.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if capacity, max_bytes or ttl is not positive.
+
+        """
+        if capacity <= 0:
+            raise ValueError('capacity should be positive')
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError('max_bytes should be positive')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl should be positive')
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof or _default_sizeof
+        self._clock = clock
+        self._index = HashTable_closed(hashfunc=hash)
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Create the empty structures of the policy.
+
+        Returns
+        -------
+        None
+
+        """
+        raise NotImplementedError
+
+    def _on_access(self, key: Hashable) -> None:
+        """
+        Record a lookup of a key, present or not.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        None
+
+        """
+
+    def _on_insert(self, entry: _Entry) -> None:
+        """
+        Link a new entry into the structures of the policy.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        raise NotImplementedError
+
+    def _on_hit(self, entry: _Entry) -> None:
+        """
+        Record a use of an entry.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        raise NotImplementedError
+
+    def _unlink(self, entry: _Entry) -> None:
+        """
+        Unlink an entry from the structures of the policy.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        raise NotImplementedError
+
+    def _victim(self) -> _Entry:
+        """
+        Choose the entry to evict, the cache is not empty.
+
+        Returns
+        -------
+        _Entry
+            The entry.
+
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries, the expired ones included.
+
+        Returns
+        -------
+        int
+            The number of entries.
+
+        """
+        return self._index.size
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the share of the lookups which found a live entry.
+
+        Returns
+        -------
+        float
+            The hit rate, 0.0 before the first lookup.
+
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _lookup(self, key: Hashable) -> _Entry | None:
+        """
+        Find the live entry of a key, dropping it if it expired.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        _Entry or None
+            The entry, None if there is no live one.
+
+        """
+        try:
+            entry = self._index[key]
+        except KeyError:
+            return None
+        if entry.expires is not None and entry.expires <= self._clock():
+            self._remove(entry)
+            self.expirations += 1
+            return None
+        return entry
+
+    def _remove(self, entry: _Entry) -> None:
+        """
+        Remove an entry from the index and the policy.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        del self._index[entry.key]
+        self.bytes -= entry.size
+        self._unlink(entry)
+
+    def _make_room(self, count: int, size: int) -> None:
+        """
+        Evict entries until count more entries of size bytes fit.
+
+        Parameters
+        ----------
+        count: int
+            The number of entries to be added.
+
+        size: int
+            Their size in bytes.
+
+        Returns
+        -------
+        None
+
+        """
+        index = self._index
+        while index.size and (
+                index.size + count > self.capacity
+                or self.max_bytes is not None
+                and self.bytes + size > self.max_bytes):
+            self._remove(self._victim())
+            self.evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieve the value of a key or a default.
+
+        A found entry counts as used.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        default: Any, optional
+            The value for a missing or expired key, by default None.
+
+        Returns
+        -------
+        Any
+            The value or the default.
+
+        """
+        self._on_access(key)
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._on_hit(entry)
+        return entry.value
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieve the value of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        Any
+            The value.
+
+        Raises
+        ------
+        KeyError
+            Raised if the key is missing or expired.
+
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if a key has a live entry, without using it.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        bool
+            True if the key is present and not expired.
+
+        """
+        return self._lookup(key) is not None
+
+    def put(self, key: Hashable, value: Any,
+            ttl: float | None = None) -> None:
+        """
+        Add or update an entry, evicting others if needed.
+
+        An entry larger than the whole budget in bytes is not stored,
+        and the old entry of its key is removed.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        value: Any
+            The value.
+
+        ttl: float or None, optional
+            The time to live of this entry in seconds, by default None
+            (the ttl of the cache).
+
+        Returns
+        -------
+        None
+
+        """
+        size = 0 if self.max_bytes is None else self._sizeof(key, value)
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else self._clock() + ttl
+        try:
+            entry = self._index[key]
+        except KeyError:
+            entry = None
+        if self.max_bytes is not None and size > self.max_bytes:
+            if entry is not None:
+                self._remove(entry)
+            return
+        if entry is not None:
+            self.bytes += size - entry.size
+            entry.value, entry.size, entry.expires = value, size, expires
+            self._on_hit(entry)
+            self._make_room(0, 0)
+            return
+        self._make_room(1, size)
+        entry = _Entry(key, value, size, expires)
+        self._index[key] = entry
+        self.bytes += size
+        self._on_insert(entry)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """
+        Add or update an entry with the ttl of the cache.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        value: Any
+            The value.
+
+        Returns
+        -------
+        None
+
+        """
+        self.put(key, value)
+
+    def get_or_load(self, key: Hashable,
+                    loader: Callable[[Hashable], Any]) -> Any:
+        """
+        Retrieve the value of a key, loading and adding it on a miss.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        loader: Callable[[Hashable], Any]
+            The function of a key loading its value.
+
+        Returns
+        -------
+        Any
+            The cached or the loaded value.
+
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader(key)
+            self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove an entry and return its value.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        default: Any, optional
+            The value for a missing or expired key, by default None.
+
+        Returns
+        -------
+        Any
+            The value or the default.
+
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            return default
+        self._remove(entry)
+        return entry.value
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Remove an entry.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            Raised if the key is missing or expired.
+
+        """
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def expire(self) -> int:
+        """
+        Drop all expired entries, in time linear in the size.
+
+        Returns
+        -------
+        int
+            The number of entries dropped.
+
+        """
+        now = self._clock()
+        expired = [entry for entry in self._index.to_dict().values()
+                   if entry.expires is not None and entry.expires <= now]
+        for entry in expired:
+            self._remove(entry)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Remove all entries, the counters are kept.
+
+        Returns
+        -------
+        None
+
+        """
+        self._index = HashTable_closed(hashfunc=hash)
+        self.bytes = 0
+        self._reset()
+
+
+class LRUCache(Cache):
+    """
+    Cache evicting the least recently used entry.
+
+    The entries are kept in one list: a used entry moves to the front,
+    the entry at the back is evicted.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 128, **kwargs) -> None
+        Create an empty cache, see `Cache` for the other arguments.
+
+    """
+
+    def _reset(self) -> None:
+        """
+        Create the empty list of entries.
+
+        Returns
+        -------
+        None
+
+        """
+        self._order = _EntryList()
+
+    def _on_insert(self, entry: _Entry) -> None:
+        """
+        Link a new entry at the front.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        self._order.push_front(entry)
+
+    def _on_hit(self, entry: _Entry) -> None:
+        """
+        Move a used entry to the front.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        self._order.move_to_front(entry)
+
+    def _unlink(self, entry: _Entry) -> None:
+        """
+        Unlink an entry from the list.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        self._order.remove(entry)
+
+    def _victim(self) -> _Entry:
+        """
+        Choose the entry at the back.
+
+        Returns
+        -------
+        _Entry
+            The least recently used entry.
+
+        """
+        return self._order.back()
+
+
+class LFUCache(Cache):
+    """
+    Cache evicting the least frequently used entry.
+
+    The entries are kept in buckets by the number of their uses, and
+    the buckets in a list in increasing order of frequency. A used entry
+    moves to the front of the next bucket, which is created if needed,
+    and an emptied bucket is unlinked, so every operation takes O(1)
+    time. The least recently used entry of the first bucket is evicted.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 128, **kwargs) -> None
+        Create an empty cache, see `Cache` for the other arguments.
+
+    frequency(self, key) -> int
+        Return the number of uses of a cached key.
+
+    """
+
+    def _reset(self) -> None:
+        """
+        Create the empty list of buckets.
+
+        Returns
+        -------
+        None
+
+        """
+        root = self._buckets = _Bucket()
+        root._prev_node = root._next_node = root
+
+    def _bucket_after(self, bucket: _Bucket, frequency: int) -> _Bucket:
+        """
+        Return the bucket of a frequency following a bucket, creating it
+        if needed.
+
+        Parameters
+        ----------
+        bucket: _Bucket
+            The bucket or the sentinel.
+
+        frequency: int
+            The frequency.
+
+        Returns
+        -------
+        _Bucket
+            The bucket of the frequency.
+
+        """
+        following = bucket._next_node
+        if following is not self._buckets \
+                and following.frequency == frequency:
+            return following
+        new = _Bucket(frequency)
+        new._prev_node = bucket
+        new._next_node = following
+        following._prev_node = bucket._next_node = new
+        return new
+
+    def _drop_if_empty(self, bucket: _Bucket) -> None:
+        """
+        Unlink a bucket with no entries.
+
+        Parameters
+        ----------
+        bucket: _Bucket
+            The bucket.
+
+        Returns
+        -------
+        None
+
+        """
+        if not bucket.entries.size:
+            bucket._prev_node._next_node = bucket._next_node
+            bucket._next_node._prev_node = bucket._prev_node
+
+    def _on_insert(self, entry: _Entry) -> None:
+        """
+        Put a new entry into the bucket of a single use.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        bucket = self._bucket_after(self._buckets, 1)
+        bucket.entries.push_front(entry)
+        entry.owner = bucket
+
+    def _on_hit(self, entry: _Entry) -> None:
+        """
+        Move a used entry into the bucket of one more use.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        bucket = entry.owner
+        following = self._bucket_after(bucket, bucket.frequency + 1)
+        bucket.entries.remove(entry)
+        following.entries.push_front(entry)
+        entry.owner = following
+        self._drop_if_empty(bucket)
+
+    def _unlink(self, entry: _Entry) -> None:
+        """
+        Unlink an entry from its bucket.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        bucket = entry.owner
+        bucket.entries.remove(entry)
+        self._drop_if_empty(bucket)
+
+    def _victim(self) -> _Entry:
+        """
+        Choose the least recently used entry of the first bucket.
+
+        Returns
+        -------
+        _Entry
+            The entry.
+
+        """
+        return self._buckets._next_node.entries.back()
+
+    def frequency(self, key: Hashable) -> int:
+        """
+        Return the number of uses of a cached key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        int
+            The number of uses since the key was added, 0 if it is
+            not cached.
+
+        """
+        entry = self._lookup(key)
+        return 0 if entry is None else entry.owner.frequency
+
+
+class TinyLFUCache(Cache):
+    """
+    W-TinyLFU cache with frequency-based admission.
+
+    About 1% of the capacity is an LRU window, the rest is a segmented
+    LRU of a probation and a protected segment (80% of it). New entries
+    enter the window. When the cache is full and the window too,
+    the entry at the back of the window (the candidate) competes with
+    the entry at the back of the probation segment (the victim): the one
+    whose key was used less often according to the frequency sketch is
+    evicted. An entry used in probation moves to the protected segment,
+    whose overflow goes back to probation.
+
+    The sketch counts every lookup of every key, a read-through miss
+    followed by a put counts once. Its counters hold up to 15 and are
+    halved after 10 * capacity additions, so the frequencies follow
+    the recent history.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 128, **kwargs) -> None
+        Create an empty cache, see `Cache` for the other arguments.
+
+    """
+
+    def _reset(self) -> None:
+        """
+        Create the empty segments and the sketch.
+
+        Returns
+        -------
+        None
+
+        """
+        self._window = _EntryList()
+        self._probation = _EntryList()
+        self._protected = _EntryList()
+        self._window_capacity = max(1, self.capacity // 100)
+        self._protected_capacity = \
+            (self.capacity - self._window_capacity) * 4 // 5
+        # 8 one-byte counters per row and entry keep the collisions
+        # of the sampled keys rare
+        self._sketch = CountMinSketch(width=max(16, 8 * self.capacity),
+                                      max_count=15)
+        self._sample_size = 10 * self.capacity
+
+    def _on_access(self, key: Hashable) -> None:
+        """
+        Count a key in the sketch, aging it after a sample.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        None
+
+        """
+        sketch = self._sketch
+        sketch.add(key)
+        if sketch.total >= self._sample_size:
+            sketch.halve()
+
+    def _on_insert(self, entry: _Entry) -> None:
+        """
+        Put a new entry into the window, moving the overflow of
+        the window to probation.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        window = self._window
+        window.push_front(entry)
+        entry.owner = window
+        if window.size > self._window_capacity:
+            candidate = window.back()
+            window.remove(candidate)
+            self._probation.push_front(candidate)
+            candidate.owner = self._probation
+
+    def _on_hit(self, entry: _Entry) -> None:
+        """
+        Move a used entry to the front of its segment, promoting it
+        from probation to the protected segment.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        owner = entry.owner
+        if owner is not self._probation:
+            owner.move_to_front(entry)
+            return
+        protected = self._protected
+        owner.remove(entry)
+        protected.push_front(entry)
+        entry.owner = protected
+        if protected.size > self._protected_capacity:
+            demoted = protected.back()
+            protected.remove(demoted)
+            owner.push_front(demoted)
+            demoted.owner = owner
+
+    def _unlink(self, entry: _Entry) -> None:
+        """
+        Unlink an entry from its segment.
+
+        Parameters
+        ----------
+        entry: _Entry
+            The entry.
+
+        Returns
+        -------
+        None
+
+        """
+        entry.owner.remove(entry)
+
+    def _victim(self) -> _Entry:
+        """
+        Choose between the candidate leaving the window and the victim
+        of the main segments by their frequencies.
+
+        Returns
+        -------
+        _Entry
+            The entry to evict.
+
+        """
+        victim = self._probation.back() or self._protected.back()
+        if self._window.size < self._window_capacity:
+            # the window keeps the next entry, the main segments shrink
+            return victim or self._window.back()
+        candidate = self._window.back()
+        if victim is None:
+            return candidate
+        estimate = self._sketch.estimate
+        if estimate(candidate.key) > estimate(victim.key):
+            return victim
+        return candidate
+
+
+def memoize(cache: Cache | Callable | None = None,
+            capacity: int = 128) -> Callable:
+    """
+    Cache the results of a function.
+
+    Used as `@memoize`, `@memoize(capacity=1000)` or with a cache of
+    any policy, as `@memoize(TinyLFUCache(1000, ttl=60))`. The arguments
+    of a call form the key, so they have to be hashable. The cache is
+    available as the `cache` attribute of the decorated function.
+
+    Parameters
+    ----------
+    cache: Cache, Callable or None, optional
+        The cache, by default None (an LRUCache of the capacity given).
+        A function is decorated right away.
+
+    capacity: int, optional
+        The capacity of the default cache, by default 128.
+
+    Returns
+    -------
+    Callable
+        The decorator, or the decorated function.
+
+    """
+    def decorate(function: Callable) -> Callable:
+        """
+        Wrap a function so its results are cached.
+
+        Parameters
+        ----------
+        function: Callable
+            The function.
+
+        Returns
+        -------
+        Callable
+            The wrapper.
+
+        """
+        store = LRUCache(capacity) if cache is None else cache
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS,) + tuple(sorted(kwargs.items())) \
+                if kwargs else args
+            value = store.get(key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                store.put(key, value)
+            return value
+
+        wrapper.cache = store
+        return wrapper
+
+    if callable(cache) and not isinstance(cache, Cache):
+        function, cache = cache, None
+        return decorate(function)
+    return decorate
@@ -0,0 +1,704 @@
+"""
+Concurrent Hash Table
+=====================
+
+This module provides a hash table which can be shared between threads.
+`HashTable_closed` has no synchronization, and one lock around a whole
+table makes every thread wait for every other one, even for a resize
+that moves all the pairs.
+
+`ConcurrentHashTable` partitions the keys between independent
+`HashTable_closed` shards by the built-in `hash` of a key. Every shard
+has its own lock and grows or shrinks by itself, so threads working with
+different shards do not wait for each other, and resizing one shard does
+not block the rest.
+
+A shard is guarded either by a `threading.Lock` (the default, the
+cheapest lock to take) or by a `RWLock`, which lets any number of
+readers into a shard at once and a writer alone.
+
+`setdefault`, `compute_if_absent` and `update_many` are atomic: no other
+thread sees or changes the keys involved half way through.
+
+Classes
+-------
+RWLock
+    A readers-writer lock preferring writers.
+
+ConcurrentHashTable
+    A thread-safe hash table sharded over HashTable_closed tables.
+
+"""
+
+
+import threading
+from typing import Any, Callable, Generator, Hashable, Iterable, Mapping
+
+from Algorithms_Python.hashtable import HashTable_closed, Mappable
+
+
+class _LockSide:
+    """
+    One side of a readers-writer lock with the interface of a lock.
+
+    Attributes
+    ----------
+    acquire: Callable[[], None]
+        Take the side of the lock.
+
+    release: Callable[[], None]
+        Give the side of the lock back.
+
+    """
+
+    __slots__ = ('acquire', 'release')
+
+    def __init__(self, acquire: Callable, release: Callable) -> None:
+        """
+        Bind the side to the methods of its lock.
+
+        Parameters
+        ----------
+        acquire: Callable[[], None]
+            The method taking the side.
+
+        release: Callable[[], None]
+            The method giving it back.
+
+        Returns
+        -------
+        None
+
+        """
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self) -> None:
+        """
+        Take the side of the lock when entering the context.
+
+        Returns
+        -------
+        None
+
+        """
+        self.acquire()
+
+    def __exit__(self, *args) -> None:
+        """
+        Give the side of the lock back when leaving the context.
+
+        Parameters
+        ----------
+        args: tuple
+            The exception details, ignored.
+
+        Returns
+        -------
+        None
+
+        """
+        self.release()
+
+
+class RWLock:
+    """
+    Readers-writer lock preferring writers.
+
+    Any number of threads may hold the read side at once, the write side
+    is held by one thread and excludes the readers. A waiting writer stops
+    new readers from coming in, so a stream of readers can not starve it.
+    Neither side is reentrant.
+
+    Attributes
+    ----------
+    read: _LockSide
+        The shared side, used as `with lock.read:`.
+
+    write: _LockSide
+        The exclusive side, used as `with lock.write:`.
+
+    Methods
+    -------
+    __init__(self) -> None
+        Create a free lock.
+
+    acquire_read(self) -> None
+        Wait until there is no writer and take the read side.
+
+    release_read(self) -> None
+        Give the read side back.
+
+    acquire_write(self) -> None
+        Wait until there are no readers and writers, take the write side.
+
+    release_write(self) -> None
+        Give the write side back.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a free lock.
+
+        Returns
+        -------
+        None
+
+        """
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        self.read = _LockSide(self.acquire_read, self.release_read)
+        self.write = _LockSide(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        """
+        Wait until there is no writer and take the read side.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """
+        Give the read side back, waking a writer after the last reader.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Wait until there are no readers and writers, take the write side.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """
+        Give the write side back, waking the waiting threads.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+
+class ConcurrentHashTable(Mappable):
+    """
+    Thread-safe hash table sharded over HashTable_closed tables.
+
+    Single-key operations lock only the shard of the key. The size and
+    the capacity are summed over the shards without locking, so they may
+    be outdated as soon as they are returned, `to_dict` locks all shards
+    and gives a consistent snapshot.
+
+    The shards resize all at once, not incrementally: an incremental
+    rehash moves pairs on lookups, and lookups have to leave a shard
+    untouched to run side by side under the read side of a `RWLock`.
+
+    Attributes
+    ----------
+    shards: int
+        The number of shards.
+
+    size: int
+        The number of key-value pairs.
+
+    capacity: int
+        The total capacity of the shards.
+
+    Methods
+    -------
+    __init__(self, shards: int = 16, capacity: int = 30,
+             hashfunc: str | Callable = hash,
+             load_factor_threshold: float = 0.75,
+             readers_writer: bool = False) -> None
+        Create an empty table.
+
+    __setitem__(self, key, value) -> None
+        Add or update a key-value pair.
+
+    __getitem__(self, key) -> Any
+        Retrieve the value of a key.
+
+    __delitem__(self, key) -> None
+        Remove a key-value pair if the key is present.
+
+    __contains__(self, key) -> bool
+        Check if a key is present.
+
+    get(self, key, default=None) -> Any
+        Retrieve the value of a key or a default.
+
+    setdefault(self, key, default=None) -> Any
+        Atomically retrieve the value of a key, adding it if absent.
+
+    compute_if_absent(self, key, function) -> Any
+        Atomically retrieve the value of a key, computing it if absent.
+
+    update_many(self, items) -> None
+        Atomically add or update many key-value pairs.
+
+    to_dict(self) -> dict
+        Return a consistent snapshot of the table as a dictionary.
+
+    from_dict(cls, dictionary) -> ConcurrentHashTable
+        Create a table from a dictionary.
+
+    """
+
+    def __init__(self, shards: int = 16, capacity: int = 30,
+                 hashfunc: str | Callable = hash,
+                 load_factor_threshold: float = 0.75,
+                 readers_writer: bool = False) -> None:
+        """
+        Create an empty table.
+
+        Parameters
+        ----------
+        shards: int, optional
+            The number of shards, by default 16. More shards mean less
+            contention and more memory for the empty tables.
+
+        capacity: int, optional
+            The initial capacity, split evenly between the shards,
+            by default 30.
+
+        hashfunc: str or Callable, optional
+            The hash function of the shards, see `HashTable_closed`,
+            by default the built-in `hash`.
+
+        load_factor_threshold: float, optional
+            The load factor growing a shard, by default 0.75.
+
+        readers_writer: bool, optional
+            If True, a shard is guarded by a `RWLock` and lookups of one
+            shard run side by side, otherwise by a `threading.Lock`.
+            False by default.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if shards is not positive.
+
+        TypeError
+            Raised if the hash function is neither acceptable nor
+            a callable.
+
+        """
+        super().__init__()
+        if shards <= 0:
+            raise ValueError('the number of shards should be positive')
+        self._tables = [
+            HashTable_closed(capacity=max(capacity // shards, 1),
+                             hashfunc=hashfunc,
+                             load_factor_threshold=load_factor_threshold)
+            for _ in range(shards)]
+        if readers_writer:
+            locks = [RWLock() for _ in range(shards)]
+            self._read_locks = [lock.read for lock in locks]
+            self._write_locks = [lock.write for lock in locks]
+        else:
+            # one mutex serves both readers and writers
+            self._read_locks = self._write_locks = [
+                threading.Lock() for _ in range(shards)]
+
+    @property
+    def shards(self) -> int:
+        """
+        Return the number of shards.
+
+        Returns
+        -------
+        int
+            The number of shards.
+
+        """
+        return len(self._tables)
+
+    @property
+    def size(self) -> int:
+        """
+        Return the number of key-value pairs.
+
+        Returns
+        -------
+        int
+            The number of key-value pairs.
+
+        """
+        return sum(table.size for table in self._tables)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the total capacity of the shards.
+
+        Returns
+        -------
+        int
+            The sum of the capacities.
+
+        """
+        return sum(table.capacity for table in self._tables)
+
+    def __len__(self) -> int:
+        """
+        Return the number of key-value pairs.
+
+        Returns
+        -------
+        int
+            The number of key-value pairs.
+
+        """
+        return self.size
+
+    def _shard(self, key: Hashable) -> int:
+        """
+        Return the index of the shard of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        int
+            The index of the shard.
+
+        """
+        return hash(key) % len(self._tables)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """
+        Add or update a key-value pair.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        value: Any
+            The value.
+
+        Returns
+        -------
+        None
+
+        """
+        shard = self._shard(key)
+        with self._write_locks[shard]:
+            self._tables[shard][key] = value
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieve the value of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        Any
+            The value.
+
+        Raises
+        ------
+        KeyError
+            Raised if the key is not present.
+
+        """
+        shard = self._shard(key)
+        with self._read_locks[shard]:
+            return self._tables[shard][key]
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Remove a key-value pair if the key is present.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        None
+
+        """
+        shard = self._shard(key)
+        with self._write_locks[shard]:
+            del self._tables[shard][key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if a key is present.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        bool
+            True if the key is present.
+
+        """
+        shard = self._shard(key)
+        with self._read_locks[shard]:
+            return key in self._tables[shard]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieve the value of a key or a default.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        default: Any, optional
+            The value for an absent key, by default None.
+
+        Returns
+        -------
+        Any
+            The value of the key or the default.
+
+        """
+        shard = self._shard(key)
+        with self._read_locks[shard]:
+            try:
+                return self._tables[shard][key]
+            except KeyError:
+                return default
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Atomically retrieve the value of a key, adding it if absent.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        default: Any, optional
+            The value added for an absent key, by default None.
+
+        Returns
+        -------
+        Any
+            The value of the key after the call.
+
+        """
+        shard = self._shard(key)
+        with self._write_locks[shard]:
+            table = self._tables[shard]
+            try:
+                return table[key]
+            except KeyError:
+                table[key] = default
+                return default
+
+    def compute_if_absent(self, key: Hashable,
+                          function: Callable[[Hashable], Any]) -> Any:
+        """
+        Atomically retrieve the value of a key, computing it if absent.
+
+        The function is called at most once per absent key, even if
+        several threads ask for the key at once: the others wait for
+        the value. It is called with the shard locked, so it should be
+        short and must not use the table itself.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        function: Callable[[Hashable], Any]
+            The function of the key computing its value.
+
+        Returns
+        -------
+        Any
+            The value of the key after the call.
+
+        """
+        shard = self._shard(key)
+        with self._write_locks[shard]:
+            table = self._tables[shard]
+            try:
+                return table[key]
+            except KeyError:
+                value = table[key] = function(key)
+                return value
+
+    def update_many(self, items: Mapping | Iterable[tuple]) -> None:
+        """
+        Atomically add or update many key-value pairs.
+
+        The pairs are grouped by shard and the shards involved are
+        locked in the order of their indices, so two concurrent calls
+        can not deadlock. Readers see either none or all of the pairs,
+        and every shard is locked once, not once per pair.
+
+        Parameters
+        ----------
+        items: Mapping or Iterable[tuple]
+            A mapping or key-value pairs. Of repeated keys the last
+            value is kept.
+
+        Returns
+        -------
+        None
+
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        groups = {}
+        for key, value in items:
+            groups.setdefault(self._shard(key), []).append((key, value))
+        shards = sorted(groups)
+        for shard in shards:
+            self._write_locks[shard].acquire()
+        try:
+            for shard in shards:
+                table = self._tables[shard]
+                for key, value in groups[shard]:
+                    table[key] = value
+        finally:
+            for shard in shards:
+                self._write_locks[shard].release()
+
+    def to_dict(self) -> dict[Hashable, Any]:
+        """
+        Return a consistent snapshot of the table as a dictionary.
+
+        All shards are read locked while the snapshot is taken.
+
+        Returns
+        -------
+        dict[Hashable, Any]
+            The key-value pairs.
+
+        """
+        for lock in self._read_locks:
+            lock.acquire()
+        try:
+            result = {}
+            for table in self._tables:
+                result.update(table.to_dict())
+            return result
+        finally:
+            for lock in self._read_locks:
+                lock.release()
+
+    def __iter__(self) -> Generator:
+        """
+        Iterate over the keys of a snapshot of the table.
+
+        Yields
+        ------
+        Hashable
+            The keys.
+
+        """
+        yield from self.to_dict()
+
+    @classmethod
+    def from_dict(cls, dictionary: dict) -> 'ConcurrentHashTable':
+        """
+        Create a table from a dictionary.
+
+        Parameters
+        ----------
+        dictionary: dict
+            The key-value pairs.
+
+        Returns
+        -------
+        ConcurrentHashTable
+            A new table holding the pairs.
+
+        """
+        result = cls(capacity=len(dictionary))
+        result.update_many(dictionary)
+        return result
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the table.
+
+        Returns
+        -------
+        str
+            The table as a dictionary.
+
+        """
+        return dict.__str__(self.to_dict())
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the table used for printing.
+
+        Returns
+        -------
+        str
+            The table as a dictionary.
+
+        """
+        return dict.__repr__(self.to_dict())
+
+    def __eq__(self, other: Mappable) -> bool:
+        """
+        Check if two tables hold the same key-value pairs.
+
+        Parameters
+        ----------
+        other: Mappable
+            Another table.
+
+        Returns
+        -------
+        bool
+            True if the dictionaries of the tables are equal.
+
+        """
+        return dict.__eq__(self.to_dict(), other.to_dict())
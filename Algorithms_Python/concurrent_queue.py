@@ -0,0 +1,885 @@
+"""
+Concurrent Queues
+=================
+
+This module provides queues which can be shared between threads and
+between threads and asyncio coroutines. The elements are kept in
+the package's `UnrolledDeque`, which does not allocate per element.
+
+`ConcurrentQueue` guards the deque with one lock and two conditions
+(not empty and not full): `put` and `get` block, optionally with
+a timeout. `put_many` and `get_many` move a whole batch under one
+acquisition of the lock and wake the other side once, which amortizes
+the cost of locking and context switches over the batch.
+
+`AsyncQueue` and `AsyncDeque` have awaitable `put` and `get` for
+coroutines of one event loop, like `asyncio.Queue`. Producer threads
+hand elements to the loop with `put_threadsafe` and `put_many_threadsafe`.
+
+The exceptions are the standard ones: `queue.Empty` and `queue.Full`
+for the threaded queue, `asyncio.QueueEmpty` and `asyncio.QueueFull`
+for the asyncio ones.
+
+Classes
+-------
+ConcurrentQueue
+    A thread-safe FIFO queue with blocking put and get.
+
+AsyncQueue
+    An asyncio FIFO queue which accepts elements from other threads.
+
+AsyncDeque
+    An asyncio double-ended queue which accepts elements from
+    other threads.
+
+"""
+
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+from typing import Any, Iterable
+
+from Algorithms_Python.unrolled import UnrolledDeque
+
+
+class ConcurrentQueue:
+    """
+    Thread-safe FIFO queue with blocking put and get.
+
+    Attributes
+    ----------
+    maxsize: int
+        The maximum number of elements, 0 for an unbounded queue.
+
+    Methods
+    -------
+    __init__(self, maxsize: int = 0) -> None
+        Create an empty queue.
+
+    __len__(self) -> int
+        Return the number of elements.
+
+    empty(self) -> bool
+        Check if the queue is empty.
+
+    full(self) -> bool
+        Check if the queue is full.
+
+    put(self, item, block=True, timeout=None) -> None
+        Add an element to the back, waiting for room if needed.
+
+    put_nowait(self, item) -> None
+        Add an element to the back without waiting.
+
+    put_many(self, items, timeout=None) -> None
+        Add elements to the back, waiting for room if needed.
+
+    get(self, block=True, timeout=None) -> Any
+        Remove and return the front element, waiting for one if needed.
+
+    get_nowait(self) -> Any
+        Remove and return the front element without waiting.
+
+    get_many(self, n, timeout=None) -> list
+        Wait for at least one element and remove and return up to n.
+
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """
+        Create an empty queue.
+
+        Parameters
+        ----------
+        maxsize: int, optional
+            The maximum number of elements, by default 0 (unbounded).
+
+        Returns
+        -------
+        None
+
+        """
+        self.maxsize = maxsize
+        self._items = UnrolledDeque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements.
+
+        The value may be outdated as soon as it is returned.
+
+        Returns
+        -------
+        int
+            The number of elements.
+
+        """
+        return self._items.size
+
+    def empty(self) -> bool:
+        """
+        Check if the queue is empty.
+
+        Returns
+        -------
+        bool
+            True if there are no elements.
+
+        """
+        return self._items.size == 0
+
+    def full(self) -> bool:
+        """
+        Check if the queue is full.
+
+        Returns
+        -------
+        bool
+            True if the queue is bounded and has maxsize elements.
+
+        """
+        return 0 < self.maxsize <= self._items.size
+
+    def _wait(self, condition: threading.Condition, ready,
+              block: bool, timeout: float | None, error: type) -> None:
+        """
+        Wait on the condition until ready() is true, the lock is held.
+
+        Parameters
+        ----------
+        condition: threading.Condition
+            The condition to wait on.
+
+        ready: Callable[[], bool]
+            The predicate to wait for.
+
+        block: bool
+            If False, do not wait at all.
+
+        timeout: float or None
+            The maximum time to wait in seconds, None to wait forever.
+
+        error: type
+            The exception raised if ready() is still false.
+
+        Returns
+        -------
+        None
+
+        """
+        if ready():
+            return
+        if not block:
+            raise error
+        if timeout is not None and timeout < 0:
+            raise ValueError('timeout should be a non-negative number')
+        if not condition.wait_for(ready, timeout):
+            raise error
+
+    def put(self, item: Any, block: bool = True,
+            timeout: float | None = None) -> None:
+        """
+        Add an element to the back of the queue.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        block: bool, optional
+            Whether to wait for room in the full queue, by default True.
+
+        timeout: float or None, optional
+            The maximum time to wait in seconds, by default None (forever).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        queue.Full
+            Raised if there is no room after waiting (or without waiting
+            if block is False).
+
+        """
+        with self._lock:
+            if self.maxsize > 0:
+                self._wait(self._not_full,
+                           lambda: self._items.size < self.maxsize,
+                           block, timeout, queue.Full)
+            self._items.push_back(item)
+            self._not_empty.notify()
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Add an element to the back of the queue without waiting.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        queue.Full
+            Raised if the queue is full.
+
+        """
+        self.put(item, block=False)
+
+    def put_many(self, items: Iterable, timeout: float | None = None) -> None:
+        """
+        Add elements to the back of the queue.
+
+        An unbounded queue takes all of them under one acquisition of
+        the lock, a bounded one takes them in portions as the room
+        becomes free. The timeout limits every wait for room.
+
+        Parameters
+        ----------
+        items: Iterable
+            The elements to be added, in order.
+
+        timeout: float or None, optional
+            The maximum time to wait for room in seconds, by default None.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        queue.Full
+            Raised if there is no room after waiting, the elements added
+            before stay in the queue.
+
+        """
+        items = iter(items)
+        with self._lock:
+            push = self._items.push_back
+            if self.maxsize <= 0:
+                for item in items:
+                    push(item)
+                self._not_empty.notify_all()
+                return
+            for item in items:
+                if self._items.size >= self.maxsize:
+                    self._not_empty.notify_all()
+                    self._wait(self._not_full,
+                               lambda: self._items.size < self.maxsize,
+                               True, timeout, queue.Full)
+                push(item)
+            self._not_empty.notify_all()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """
+        Remove and return the element from the front of the queue.
+
+        Parameters
+        ----------
+        block: bool, optional
+            Whether to wait for an element in the empty queue,
+            by default True.
+
+        timeout: float or None, optional
+            The maximum time to wait in seconds, by default None (forever).
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        queue.Empty
+            Raised if there are no elements after waiting (or without
+            waiting if block is False).
+
+        """
+        with self._lock:
+            self._wait(self._not_empty, lambda: self._items.size > 0,
+                       block, timeout, queue.Empty)
+            item = self._items.pop_front()
+            if self.maxsize > 0:
+                self._not_full.notify()
+            return item
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the element from the front without waiting.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        queue.Empty
+            Raised if the queue is empty.
+
+        """
+        return self.get(block=False)
+
+    def get_many(self, n: int, timeout: float | None = None) -> list:
+        """
+        Wait for at least one element and remove and return up to n.
+
+        Parameters
+        ----------
+        n: int
+            The maximum number of elements to return.
+
+        timeout: float or None, optional
+            The maximum time to wait in seconds, by default None (forever).
+
+        Returns
+        -------
+        list
+            The removed elements in order, at least one of them.
+
+        Raises
+        ------
+        ValueError
+            Raised if n is less than 1.
+
+        queue.Empty
+            Raised if there are no elements after waiting.
+
+        """
+        if n < 1:
+            raise ValueError('n should be at least 1')
+        with self._lock:
+            self._wait(self._not_empty, lambda: self._items.size > 0,
+                       True, timeout, queue.Empty)
+            pop = self._items.pop_front
+            batch = [pop() for _ in range(min(n, self._items.size))]
+            if self.maxsize > 0:
+                self._not_full.notify_all()
+            return batch
+
+
+class AsyncQueue:
+    """
+    Asyncio FIFO queue which accepts elements from other threads.
+
+    All methods except `put_threadsafe` and `put_many_threadsafe` have to
+    be called from the event loop the queue is bound to. The queue binds
+    to the running loop on first use or to the loop given on creation.
+
+    Attributes
+    ----------
+    maxsize: int
+        The maximum number of elements, 0 for an unbounded queue.
+
+    Methods
+    -------
+    __init__(self, maxsize: int = 0,
+             loop: asyncio.AbstractEventLoop | None = None) -> None
+        Create an empty queue.
+
+    __len__(self) -> int
+        Return the number of elements.
+
+    empty(self) -> bool
+        Check if the queue is empty.
+
+    full(self) -> bool
+        Check if the queue is full.
+
+    put(self, item) -> None
+        Add an element to the back, waiting for room if needed.
+
+    put_nowait(self, item) -> None
+        Add an element to the back without waiting.
+
+    get(self) -> Any
+        Remove and return the front element, waiting for one if needed.
+
+    get_nowait(self) -> Any
+        Remove and return the front element without waiting.
+
+    get_many(self, n) -> list
+        Wait for at least one element and remove and return up to n.
+
+    put_threadsafe(self, item) -> concurrent.futures.Future
+        Add an element from another thread.
+
+    put_many_threadsafe(self, items) -> concurrent.futures.Future
+        Add elements from another thread.
+
+    """
+
+    def __init__(self, maxsize: int = 0,
+                 loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        Create an empty queue.
+
+        Parameters
+        ----------
+        maxsize: int, optional
+            The maximum number of elements, by default 0 (unbounded).
+
+        loop: asyncio.AbstractEventLoop or None, optional
+            The event loop of the consumers, by default None (bind to
+            the running loop on first use).
+
+        Returns
+        -------
+        None
+
+        """
+        self.maxsize = maxsize
+        self._loop = loop
+        self._items = UnrolledDeque()
+        self._getters = UnrolledDeque()
+        self._putters = UnrolledDeque()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the loop of the queue, binding it to the running one.
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop
+            The event loop.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the queue is used from a different loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError(f'{self.__class__.__name__} is bound to ' +
+                               'a different event loop')
+        return loop
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements.
+
+        Returns
+        -------
+        int
+            The number of elements.
+
+        """
+        return self._items.size
+
+    def empty(self) -> bool:
+        """
+        Check if the queue is empty.
+
+        Returns
+        -------
+        bool
+            True if there are no elements.
+
+        """
+        return self._items.size == 0
+
+    def full(self) -> bool:
+        """
+        Check if the queue is full.
+
+        Returns
+        -------
+        bool
+            True if the queue is bounded and has maxsize elements.
+
+        """
+        return 0 < self.maxsize <= self._items.size
+
+    @staticmethod
+    def _wakeup_next(waiters: UnrolledDeque) -> None:
+        """
+        Wake up the first waiter which is still waiting.
+
+        Parameters
+        ----------
+        waiters: UnrolledDeque
+            The futures of the waiting coroutines.
+
+        Returns
+        -------
+        None
+
+        """
+        while waiters.size:
+            waiter = waiters.pop_front()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters: UnrolledDeque, ready) -> None:
+        """
+        Wait until ready() is true, queueing up in waiters.
+
+        Parameters
+        ----------
+        waiters: UnrolledDeque
+            The futures of the coroutines waiting for the same event.
+
+        ready: Callable[[], bool]
+            The predicate to wait for.
+
+        Returns
+        -------
+        None
+
+        """
+        loop = self._get_loop()
+        while not ready():
+            waiter = loop.create_future()
+            waiters.push_back(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                # pass the wakeup on if it was meant for this waiter
+                if ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def _put_item(self, item: Any) -> None:
+        """
+        Add an element where the queue puts elements.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        self._items.push_back(item)
+
+    def _get_item(self) -> Any:
+        """
+        Remove and return an element from where the queue takes them.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        """
+        return self._items.pop_front()
+
+    def _has_room(self) -> bool:
+        """
+        Check if there is room for one more element.
+
+        Returns
+        -------
+        bool
+            True if an element can be added.
+
+        """
+        return self.maxsize <= 0 or self._items.size < self.maxsize
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Add an element to the back of the queue without waiting.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        asyncio.QueueFull
+            Raised if the queue is full.
+
+        """
+        if not self._has_room():
+            raise asyncio.QueueFull
+        self._put_item(item)
+        self._wakeup_next(self._getters)
+
+    async def put(self, item: Any) -> None:
+        """
+        Add an element to the back of the queue, waiting for room.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        await self._wait(self._putters, self._has_room)
+        self.put_nowait(item)
+
+    async def _put_many(self, items: Iterable) -> None:
+        """
+        Add elements to the back of the queue, waiting for room.
+
+        Parameters
+        ----------
+        items: Iterable
+            The elements to be added, in order.
+
+        Returns
+        -------
+        None
+
+        """
+        for item in items:
+            if not self._has_room():
+                await self._wait(self._putters, self._has_room)
+            self._put_item(item)
+            self._wakeup_next(self._getters)
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the element from the front without waiting.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            Raised if the queue is empty.
+
+        """
+        if self._items.size == 0:
+            raise asyncio.QueueEmpty
+        item = self._get_item()
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> Any:
+        """
+        Remove and return the element from the front, waiting for one.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        """
+        await self._wait(self._getters, lambda: self._items.size > 0)
+        return self.get_nowait()
+
+    async def get_many(self, n: int) -> list:
+        """
+        Wait for at least one element and remove and return up to n.
+
+        Parameters
+        ----------
+        n: int
+            The maximum number of elements to return.
+
+        Returns
+        -------
+        list
+            The removed elements in order, at least one of them.
+
+        Raises
+        ------
+        ValueError
+            Raised if n is less than 1.
+
+        """
+        if n < 1:
+            raise ValueError('n should be at least 1')
+        await self._wait(self._getters, lambda: self._items.size > 0)
+        batch = [self._get_item() for _ in range(min(n, self._items.size))]
+        for _ in batch:
+            if self._putters.size == 0:
+                break
+            self._wakeup_next(self._putters)
+        return batch
+
+    def _run_threadsafe(self, coroutine) -> concurrent.futures.Future:
+        """
+        Run the coroutine in the loop of the queue from another thread.
+
+        Parameters
+        ----------
+        coroutine: Coroutine
+            The coroutine to be run.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of the coroutine result.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the queue is not bound to a loop yet.
+
+        """
+        if self._loop is None:
+            coroutine.close()
+            raise RuntimeError(f'{self.__class__.__name__} is not bound ' +
+                               'to an event loop, pass the loop on creation')
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def put_threadsafe(self, item: Any) -> concurrent.futures.Future:
+        """
+        Add an element to the back of the queue from another thread.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Done when the element is in the queue, waiting for its
+            result gives backpressure for a bounded queue.
+
+        """
+        return self._run_threadsafe(self.put(item))
+
+    def put_many_threadsafe(self, items: Iterable) -> \
+            concurrent.futures.Future:
+        """
+        Add elements to the back of the queue from another thread.
+
+        The whole batch is handed to the loop at once, so the cost of
+        waking the loop is paid once per batch.
+
+        Parameters
+        ----------
+        items: Iterable
+            The elements to be added, in order.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Done when all elements are in the queue.
+
+        """
+        return self._run_threadsafe(self._put_many(list(items)))
+
+
+class AsyncDeque(AsyncQueue):
+    """
+    Asyncio double-ended queue which accepts elements from other threads.
+
+    `put` and `get` work at the back and the front, as in AsyncQueue,
+    `put_front` and `get_back` work at the opposite ends.
+
+    Methods
+    -------
+    put_front_nowait(self, item) -> None
+        Add an element to the front without waiting.
+
+    put_front(self, item) -> None
+        Add an element to the front, waiting for room if needed.
+
+    get_back_nowait(self) -> Any
+        Remove and return the back element without waiting.
+
+    get_back(self) -> Any
+        Remove and return the back element, waiting for one if needed.
+
+    """
+
+    def put_front_nowait(self, item: Any) -> None:
+        """
+        Add an element to the front of the deque without waiting.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        asyncio.QueueFull
+            Raised if the deque is full.
+
+        """
+        if not self._has_room():
+            raise asyncio.QueueFull
+        self._items.push_front(item)
+        self._wakeup_next(self._getters)
+
+    async def put_front(self, item: Any) -> None:
+        """
+        Add an element to the front of the deque, waiting for room.
+
+        Parameters
+        ----------
+        item: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        await self._wait(self._putters, self._has_room)
+        self.put_front_nowait(item)
+
+    def get_back_nowait(self) -> Any:
+        """
+        Remove and return the element from the back without waiting.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            Raised if the deque is empty.
+
+        """
+        if self._items.size == 0:
+            raise asyncio.QueueEmpty
+        item = self._items.pop_back()
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get_back(self) -> Any:
+        """
+        Remove and return the element from the back, waiting for one.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        """
+        await self._wait(self._getters, lambda: self._items.size > 0)
+        return self.get_back_nowait()
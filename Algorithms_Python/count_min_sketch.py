@@ -0,0 +1,291 @@
+"""
+Count-Min Sketch
+================
+
+This module implements the count-min sketch, a probabilistic structure
+estimating how many times every item was added to it in a fixed amount
+of memory. The sketch is a table of depth rows of width counters. An item
+increments one counter in every row, chosen by a hash function of
+the row, and its estimate is the smallest of these counters: other items
+sharing a counter can only inflate it, so the estimate is never below
+the true count and exceeds it by more than epsilon * total with
+a probability of at most delta for width = e / epsilon and
+depth = ln(1 / delta).
+
+The rows are indexed by double hashing, h1 + i * h2, from one 64-bit
+`hash64` of the item, so an update hashes the item once. With
+a `max_count` the counters saturate (TinyLFU counts only up to 15), and
+`halve` ages the sketch, so old popularity fades away.
+
+Classes
+-------
+CountMinSketch
+    Estimates the frequencies of items in fixed memory.
+
+"""
+
+
+import math
+from array import array
+from typing import Any
+
+from Algorithms_Python.hash_functions import hash64
+
+
+class CountMinSketch:
+    """
+    Count-min sketch estimating the frequencies of items.
+
+    Attributes
+    ----------
+    width: int
+        The number of counters in a row, a power of two.
+
+    depth: int
+        The number of rows.
+
+    max_count: int
+        The value the counters saturate at.
+
+    total: int
+        The number of additions since the last halving.
+
+    Methods
+    -------
+    __init__(self, width: int = 1024, depth: int = 4,
+             max_count: int = 2 ** 32 - 1, seed: int = 0,
+             conservative: bool = False) -> None
+        Create an empty sketch.
+
+    from_error(cls, epsilon, delta, **kwargs) -> CountMinSketch
+        Create a sketch with the error bounds given.
+
+    add(self, item, count=1) -> None
+        Count an item.
+
+    estimate(self, item) -> int
+        Estimate how many times an item was added.
+
+    halve(self) -> None
+        Halve all counters.
+
+    clear(self) -> None
+        Reset all counters to zero.
+
+    """
+
+    def __init__(self, width: int = 1024, depth: int = 4,
+                 max_count: int = 2 ** 32 - 1, seed: int = 0,
+                 conservative: bool = False) -> None:
+        """
+        Create an empty sketch.
+
+        Parameters
+        ----------
+        width: int, optional
+            The number of counters in a row, rounded up to a power of
+            two, by default 1024.
+
+        depth: int, optional
+            The number of rows, by default 4.
+
+        max_count: int, optional
+            The value the counters saturate at, below 2^64, by default
+            2^32 - 1. The counters take 1, 2, 4 or 8 bytes, the fewest
+            holding it.
+
+        seed: int, optional
+            The seed of the hash function, by default 0.
+
+        conservative: bool, optional
+            If True, an addition raises only the counters equal to the
+            current estimate (conservative update), which lowers the
+            overestimation. False by default.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if width, depth or max_count is not positive or
+            max_count does not fit into 64 bits.
+
+        """
+        if width <= 0 or depth <= 0 or not 0 < max_count < 1 << 64:
+            raise ValueError('width, depth and max_count should be ' +
+                             'positive, max_count below 2^64')
+        self.width = 1 << (width - 1).bit_length()
+        self.depth = depth
+        self.max_count = max_count
+        self.total = 0
+        self._mask = self.width - 1
+        self._seed = seed
+        self._conservative = conservative
+        # the smallest counters holding max_count
+        self._typecode = next(code for code in 'BHIQ'
+                              if max_count < 1 << 8 * array(code).itemsize)
+        self._counters = array(self._typecode,
+                               bytes(self.width * depth
+                                     * array(self._typecode).itemsize))
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float,
+                   **kwargs) -> 'CountMinSketch':
+        """
+        Create a sketch with the error bounds given.
+
+        Parameters
+        ----------
+        epsilon: float
+            The overestimation bound as a share of the total count.
+
+        delta: float
+            The probability of exceeding the bound.
+
+        kwargs: dict
+            The other arguments of the constructor.
+
+        Returns
+        -------
+        CountMinSketch
+            A sketch of width e / epsilon and depth ln(1 / delta).
+
+        Raises
+        ------
+        ValueError
+            Raised if epsilon or delta is not between 0 and 1.
+
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError('epsilon and delta should be between 0 and 1')
+        return cls(width=math.ceil(math.e / epsilon),
+                   depth=math.ceil(math.log(1 / delta)), **kwargs)
+
+    def _indices(self, item: Any) -> list[int]:
+        """
+        Return the positions of the counters of an item, one per row.
+
+        Parameters
+        ----------
+        item: Any
+            The item.
+
+        Returns
+        -------
+        list[int]
+            The positions in the flat array of counters.
+
+        """
+        hashed = hash64(item, self._seed)
+        first, second = hashed & 0xFFFFFFFF, hashed >> 32 | 1
+        mask, width = self._mask, self.width
+        return [(first + row * second & mask) + row * width
+                for row in range(self.depth)]
+
+    def add(self, item: Any, count: int = 1) -> None:
+        """
+        Count an item.
+
+        Parameters
+        ----------
+        item: Any
+            The item.
+
+        count: int, optional
+            The number of occurrences, by default 1.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if count is negative.
+
+        """
+        if count < 0:
+            raise ValueError('count should not be negative')
+        self.total += count
+        counters, limit = self._counters, self.max_count
+        if self._conservative:
+            indices = self._indices(item)
+            target = min(min(counters[i] for i in indices) + count, limit)
+            for i in indices:
+                if counters[i] < target:
+                    counters[i] = target
+            return
+        # the positions of _indices, computed inline on the hot path
+        hashed = hash64(item, self._seed)
+        first, second = hashed & 0xFFFFFFFF, hashed >> 32 | 1
+        mask, width = self._mask, self.width
+        for offset in range(0, width * self.depth, width):
+            i = (first & mask) + offset
+            value = counters[i] + count
+            counters[i] = value if value < limit else limit
+            first += second
+
+    def estimate(self, item: Any) -> int:
+        """
+        Estimate how many times an item was added.
+
+        Parameters
+        ----------
+        item: Any
+            The item.
+
+        Returns
+        -------
+        int
+            The estimate, never below the true count unless the counters
+            saturated or were halved.
+
+        """
+        counters = self._counters
+        return min(counters[i] for i in self._indices(item))
+
+    def __getitem__(self, item: Any) -> int:
+        """
+        Estimate how many times an item was added.
+
+        Parameters
+        ----------
+        item: Any
+            The item.
+
+        Returns
+        -------
+        int
+            The estimate.
+
+        """
+        return self.estimate(item)
+
+    def halve(self) -> None:
+        """
+        Halve all counters and the total, aging the counts.
+
+        Returns
+        -------
+        None
+
+        """
+        self._counters = array(self._typecode,
+                               (c >> 1 for c in self._counters))
+        self.total >>= 1
+
+    def clear(self) -> None:
+        """
+        Reset all counters to zero.
+
+        Returns
+        -------
+        None
+
+        """
+        self._counters = array(self._typecode,
+                               bytes(len(self._counters)
+                                     * self._counters.itemsize))
+        self.total = 0
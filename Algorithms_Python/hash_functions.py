@@ -0,0 +1,243 @@
+"""
+Hash Function Family
+====================
+
+This module provides fast non-cryptographic 64-bit hash functions for
+the hash tables and the Bloom filter. The `'md5'` and `'sha1'` options of
+`hashtable` hash the repr of a key with a cryptographic digest and parse
+a hexdigest, `'poly'` raises every character code to a power and
+`simple_hash` sums character codes, so anagrams collide. The functions
+here skip the repr for the common key types:
+
+- an int of the signed 64-bit range is mixed by the SplitMix64
+  finalizer, a few multiplications and shifts of Python integers, so no
+  two of them collide; larger ints are hashed by their bytes;
+- a str or a bytes-like object is hashed by MurmurHash3 x64 (the
+  `mmh3` package, a dependency of the Bloom filter), which runs in C over
+  the bytes, a str over its UTF-8 encoding (lone surrogates included);
+- other keys fall back to hashing their repr with MurmurHash3.
+
+Every function takes a seed, so one function gives a family of
+independent ones, as needed by Bloom filters and cuckoo hashing. With
+numpy installed, `hash_array` hashes an array of integers at once.
+
+Functions
+---------
+splitmix64(x: int) -> int
+    Mix a 64-bit integer with the SplitMix64 finalizer.
+
+hash64(x: Any, seed: int = 0) -> int
+    Calculate the 64-bit hash of a key.
+
+hash_family(count: int, seed: int = 0) -> list[Callable]
+    Make independent seeded hash functions.
+
+hash_array(values: Iterable[int], seed: int = 0) -> Any
+    Calculate the 64-bit hashes of many integers at once.
+
+"""
+
+
+import logging
+import struct
+
+from array import array
+from functools import partial
+from typing import Any, Callable, Iterable
+
+import mmh3
+
+try:
+    import numpy as np
+except ImportError:
+    logging.info('numpy cannot be imported, hash_array will hash ' +
+                 'the values one by one')
+    np = None
+
+
+_MASK64 = (1 << 64) - 1
+# the constants of SplitMix64
+_GAMMA = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+# ints in this range are hashed by SplitMix64, the others by their bytes,
+# one 64-bit range so no two of them share their lower 64 bits
+_INT_MIN = -(1 << 63)
+_INT_END = 1 << 63
+
+
+def splitmix64(x: int) -> int:
+    """
+    Mix a 64-bit integer with the SplitMix64 finalizer.
+
+    Every output bit depends on every input bit, consecutive inputs give
+    unrelated outputs, and the mixing is a bijection of 64-bit integers,
+    so different inputs never collide.
+
+    Parameters
+    ----------
+    x : int or numpy.ndarray
+        The integer, only its lower 64 bits are used, or an array of
+        uint64 mixed element by element.
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The mixed 64-bit integer, or an array of them.
+
+    """
+    if np is not None and isinstance(x, np.ndarray):
+        with np.errstate(over='ignore'):
+            z = x + np.uint64(_GAMMA)
+            z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+            z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+            return z ^ (z >> np.uint64(31))
+    z = (x + _GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _seed_key(seed: int) -> int:
+    """
+    Turn a seed into the 64-bit key xored into integer keys.
+
+    Parameters
+    ----------
+    seed : int
+        The seed.
+
+    Returns
+    -------
+    int
+        0 for the seed 0, a mixed value otherwise.
+
+    """
+    return splitmix64(seed ^ _MIX2) if seed else 0
+
+
+def hash64(x: Any, seed: int = 0) -> int:
+    """
+    Calculate the 64-bit hash of a key.
+
+    Keys equal in Python get equal hashes across int, bool and float
+    (as 1, True and 1.0). Unlike the built-in `hash` of strings, the hash
+    does not change between runs of the interpreter.
+
+    Parameters
+    ----------
+    x : Any
+        The key. Ints, floats, str and bytes-like keys are hashed
+        directly, other keys by their repr.
+
+    seed : int, optional
+        The seed choosing a function of the family, by default 0.
+        Only its lower 32 bits are used for non-integer keys.
+
+    Returns
+    -------
+    int
+        The hash, an integer from 0 to 2^64 - 1.
+
+    """
+    # the exact types first, they are the common keys
+    kind = type(x)
+    if kind is bytes:
+        return mmh3.hash64(x, seed & 0xFFFFFFFF, signed=False)[0]
+    if kind is str:
+        # mmh3 crashes on the lone surrogates it encodes itself
+        return mmh3.hash64(x.encode('utf-8', 'surrogatepass'),
+                           seed & 0xFFFFFFFF, signed=False)[0]
+    if (kind is int or kind is bool) and _INT_MIN <= x < _INT_END:
+        # splitmix64 inlined, this path is taken for most int keys
+        if seed:
+            x ^= _seed_key(seed)
+        z = ((x & _MASK64) + _GAMMA) & _MASK64
+        z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+        z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+        return z ^ (z >> 31)
+    if isinstance(x, float) and x.is_integer():
+        x = int(x)
+    if isinstance(x, int):
+        if _INT_MIN <= x < _INT_END:
+            return splitmix64((x & _MASK64) ^ _seed_key(seed))
+        data = x.to_bytes((x.bit_length() + 8) // 8, 'little', signed=True)
+    elif isinstance(x, str):
+        data = x.encode('utf-8', 'surrogatepass')
+    elif isinstance(x, bytes):
+        data = x
+    elif isinstance(x, (bytearray, memoryview)):
+        data = bytes(x)
+    elif isinstance(x, float):
+        data = struct.pack('<d', x)
+    else:
+        data = repr(x).encode('utf-8', 'surrogatepass')
+    return mmh3.hash64(data, seed & 0xFFFFFFFF, signed=False)[0]
+
+
+def hash_family(count: int, seed: int = 0) -> list[Callable]:
+    """
+    Make independent seeded hash functions.
+
+    Parameters
+    ----------
+    count : int
+        The number of functions.
+
+    seed : int, optional
+        The seed of the first function, the others get the following
+        seeds, by default 0.
+
+    Returns
+    -------
+    list[Callable]
+        The functions of one argument returning 64-bit hashes.
+
+    """
+    return [partial(hash64, seed=seed + i) for i in range(count)]
+
+
+def hash_array(values: Iterable[int], seed: int = 0) -> Any:
+    """
+    Calculate the 64-bit hashes of many integers at once.
+
+    The result equals `hash64` of every value. With numpy, the SplitMix64
+    steps are done on whole arrays of unsigned 64-bit integers, whose
+    multiplication wraps around as the algorithm needs. The values beyond
+    the signed 64-bit range are hashed one by one, as by `hash64`.
+
+    Parameters
+    ----------
+    values : Iterable[int]
+        The integers.
+
+    seed : int, optional
+        The seed, by default 0.
+
+    Returns
+    -------
+    numpy.ndarray or array.array
+        The hashes as an array of uint64, a numpy array if numpy is
+        installed.
+
+    """
+    if np is None:
+        return array('Q', (hash64(value, seed) for value in values))
+    values = np.asarray(values)
+    if values.dtype.kind not in 'biu':
+        # ints too large for any integer dtype
+        return np.fromiter((hash64(int(value), seed)
+                            for value in values.ravel()),
+                           dtype=np.uint64, count=values.size)
+    if values.dtype == np.uint64:
+        z = values
+    else:
+        # negative values wrap around to their two's complement
+        z = values.astype(np.int64).view(np.uint64)
+    hashes = splitmix64(z ^ np.uint64(_seed_key(seed)))
+    if values.dtype == np.uint64:
+        large = values >= np.uint64(_INT_END)
+        if large.any():
+            hashes[large] = [hash64(int(value), seed)
+                             for value in values[large]]
+    return hashes
@@ -17,6 +17,19 @@ HashTable_open
     A hash table implementation using open addressing (multiple and cuckoo
     hashing) to handle collisions with multiple hash functions.
 
+HashTable_compact
+    A compact ordered hash table in the style of CPython's dict: a sparse
+    index of small integers pointing into dense arrays of hashes, keys
+    and values.
+
+HashTable_robinhood
+    An open addressing hash table with Robin Hood linear probing and
+    backward-shift deletion over flat arrays of hashes, keys and values.
+
+HashTable_cuckoo
+    A bucketized cuckoo hash table with four-slot buckets, breadth-first
+    search of insertion paths and a small overflow stash.
+
 PairsVector
     A specialized vector for storing key-value pairs in hash tables using
     closed addressing.
@@ -40,15 +53,23 @@ gen_prime(stop: int = 30) -> int
 poly_hash(x: Any) -> int
     Calculate a polynomial hash value for a given input.
 
+resolve_hash(hashfunc: str | Callable) -> Callable
+    Turn a hash function name or a callable into a function returning
+    the full 64-bit hash of a key.
+
 """
 
 
 import hashlib
 import logging
 
+from array import array
 from collections import deque
-from typing import Any, Callable, Generator, NamedTuple, Hashable
+from math import isqrt
+from typing import Any, Callable, Generator, Hashable, Iterable, Mapping, \
+    NamedTuple
 
+from Algorithms_Python.hash_functions import hash64, hash_array
 from Algorithms_Python.vector import Vector
 
 
@@ -57,6 +78,14 @@ class Pair(NamedTuple):
     value: Any
 
 
+class _HashedPair(NamedTuple):
+    key: Any
+    value: Any
+    # the full hash of the key, stored to compare and rehash without
+    # calling the hash function again
+    hashed: int
+
+
 # generate list of prime numbers
 
 # Sieve of Eratosthenes
@@ -99,12 +128,14 @@ def gen_primes() -> Generator[int, None, None]:
 
 
 def gen_prime(stop: int = 30) -> int:  # 31 is a nice start as a capacity
-    gen = gen_primes()
-    i = next(gen)
-    while i <= stop:
-        i = next(gen)
-        continue
-    return i
+    # the least prime greater than stop, found by trial division,
+    # which takes O(sqrt(stop)) per candidate instead of sieving
+    # everything below stop
+    i = max(stop + 1, 2)
+    while True:
+        if i == 2 or i % 2 and all(i % d for d in range(3, isqrt(i) + 1, 2)):
+            return i
+        i += 1
 
 
 def poly_hash(x: Any) -> int:
@@ -117,6 +148,59 @@ def simple_hash(x) -> int:
     return sum(ord(c) for c in str(x))
 
 
+_MASK64 = (1 << 64) - 1
+
+# chains moved from the old table to the new one per operation
+# of an incremental rehash
+_REHASH_STEP = 4
+# int keys in this range are hashed in batches by hash_array
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def resolve_hash(hashfunc: str | Callable) -> Callable:
+    """
+    Turn a hash function name or a callable into a function returning
+    the full hash of a key, reduced to 64 bits.
+
+    The choice is made once, so that the hash table does not compare
+    the name of the hash function on every call.
+
+    Parameters
+    ----------
+    hashfunc : str or callable
+        'poly' (polynomial hash), 'md5', 'sha1', 'fast64' (`hash64` of
+        `hash_functions`) or a callable returning an int.
+
+    Returns
+    -------
+    Callable
+        A function of a key returning an int from 0 to 2 ** 64 - 1.
+
+    Raises
+    ------
+    TypeError
+        If the hash function is neither a known name nor a callable.
+
+    """
+    if hashfunc == 'fast64':
+        return hash64
+    if hashfunc == 'poly':
+        return lambda x: poly_hash(x) & _MASK64
+    if hashfunc in ('md5', 'sha1'):
+        digest = getattr(hashlib, hashfunc)
+
+        def hash_digest(x: Any) -> int:
+            return int.from_bytes(digest(x.__repr__().encode(),
+                                         usedforsecurity=False).digest()[:8],
+                                  'little')
+        return hash_digest
+    if callable(hashfunc):
+        return lambda x: hashfunc(x) & _MASK64
+    raise TypeError('hash function provided neither is acceptable ' +
+                    'nor is a callable')
+
+
 class PairsVector(Vector):
 
     def __setitem__(self, key: Any, value: Any) -> None:
@@ -163,13 +247,18 @@ class HashTable_closed(Mappable):
     hashfunc : str or callable
         The hashing function family used to determine the index
         for storing keys. Supported values: 'poly' (polynomial hash),
-        'md5', 'sha1', or a custom callable function.
+        'md5', 'sha1', 'fast64' (see `hash_functions`), or a custom
+        callable function.
+
+    rehashing : bool
+        Whether an incremental rehash is in progress.
 
     Methods
     -------
     __init__(self, capacity: int = 30,
             hashfunc: str or callable = simple_hash,
-            load_factor_threshold: float = 0.75) -> None
+            load_factor_threshold: float = 0.75,
+            incremental: bool = False) -> None
         Initializes a HashTable_closed object with specified capacity
         and hash function.
 
@@ -182,6 +271,18 @@ class HashTable_closed(Mappable):
     __delitem__(self, key: Hashable) -> None
         Removes a key-value pair from the hash table.
 
+    set_many(self, items: Mapping | Iterable[tuple]) -> None
+        Adds or updates many key-value pairs with at most one resize.
+
+    get_many(self, keys: Iterable[Hashable], default: Any = None) -> list
+        Retrieves the values of many keys.
+
+    delete_many(self, keys: Iterable[Hashable]) -> int
+        Removes the pairs of many keys with at most one resize.
+
+    reserve(self, count: int) -> None
+        Grows the hash table once to fit count more pairs.
+
     to_dict(self) -> dict
         Returns a dictionary representation of the hash table.
 
@@ -191,6 +292,11 @@ class HashTable_closed(Mappable):
     from_dict(cls, dictionary: dict) -> HashTable_closed
         Creates a new hash table from a dictionary.
 
+    from_items(cls, items: Iterable[tuple],
+               expected_size: int | None = None,
+               **kwargs) -> HashTable_closed
+        Creates a new hash table sized for the pairs given.
+
     __str__(self) -> str
         Returns a string representation of the hash table.
 
@@ -202,9 +308,13 @@ class HashTable_closed(Mappable):
 
     """
 
+    # chains of the old table while an incremental rehash is in progress
+    _old_chains = None
+
     def __init__(self, capacity: int = 30,
                  hashfunc: str | Callable = simple_hash,
-                 load_factor_threshold: float = 0.75) -> None:
+                 load_factor_threshold: float = 0.75,
+                 incremental: bool = False) -> None:
         """
         Initializes a HashTable_closed object with specified capacity
         and hash function.
@@ -217,7 +327,8 @@ class HashTable_closed(Mappable):
         hashfunc : str or callable
             The hashing function family used to determine the index
             for storing keys. Supported values: 'poly' (polynomial hash),
-            'md5', 'sha1', or a custom callable function.
+            'md5', 'sha1', 'fast64' (see `hash_functions`), or a custom
+            callable function.
 
         load_factor_threshold : float
             The maximum size / capacity ratio. When the actual value
@@ -226,9 +337,20 @@ class HashTable_closed(Mappable):
             size. Can be set to any between 0 and 1, but is recommended to be
             set around 0.7 - 0.9.
 
+        incremental : bool
+            If True, a resize does not move all the pairs at once. The old
+            and the new tables are kept side by side and every operation
+            moves a few chains, so no single operation takes O(n) time.
+            False by default.
+
         Returns
         -------
         None
+
+        Raises
+        ------
+        TypeError
+            If the hash function is neither acceptable nor a callable.
         """
         super().__init__()
         self._capacity = gen_prime(capacity)
@@ -241,10 +363,116 @@ class HashTable_closed(Mappable):
         self._size = 0
         self._load_factor_threshold = load_factor_threshold
         self._hashfunc = hashfunc
+        self._full_hash = resolve_hash(hashfunc)
+        self._incremental = incremental
+        self._rehash_index = 0
+
+    def _probe(self, key: Hashable,
+               hashed: int | None = None) -> tuple[deque | None, int, int]:
+        """
+        Find the chain of a key and the position of the key in it.
+
+        The key is hashed once, a pair is compared by the key only if
+        their full hashes match.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to find.
+
+        hashed : int or None
+            The full hash of the key if it is already known, by default
+            None (the key is hashed).
+
+        Returns
+        -------
+        tuple[deque | None, int, int]
+            The chain (None if it was never used), the full hash of the key
+            and its position in the chain, -1 if the key is absent.
+
+        """
+        if hashed is None:
+            hashed = self._full_hash(key)
+        if self._old_chains is not None:
+            # the key may still be in the old table, move its chain first
+            self._move_chain(hashed % len(self._old_chains), self._capacity)
+            self._migrate(_REHASH_STEP, self._capacity)
+        chain = self._pairs.elements[hashed % self._capacity]
+        if chain is not None:
+            for index, pair in enumerate(chain):
+                if pair.hashed == hashed and pair.key == key:
+                    return chain, hashed, index
+        return chain, hashed, -1
+
+    def _move_chain(self, index: int, capacity: int) -> None:
+        """
+        Move the pairs of a chain of the old table into the current table.
+
+        Parameters
+        ----------
+        index : int
+            The index of the chain in the old table, the chain is dropped.
+
+        capacity : int
+            The capacity of the current table.
+
+        Returns
+        -------
+        None
+
+        """
+        old = self._old_chains[index]
+        if old is None:
+            return
+        chains = self._pairs.elements
+        for pair in old:
+            position = pair.hashed % capacity
+            if chains[position] is None:
+                chains[position] = deque()
+            chains[position].append(pair)
+        self._old_chains[index] = None
+
+    def _migrate(self, count: int, capacity: int) -> None:
+        """
+        Move the next count chains of the old table into the current one.
+
+        The old table is dropped when all its chains are moved.
+
+        Parameters
+        ----------
+        count : int
+            The number of chains to move.
+
+        capacity : int
+            The capacity of the current table.
+
+        Returns
+        -------
+        None
+
+        """
+        stop = min(self._rehash_index + count, len(self._old_chains))
+        for index in range(self._rehash_index, stop):
+            self._move_chain(index, capacity)
+        self._rehash_index = stop
+        if stop == len(self._old_chains):
+            self._old_chains = None
+
+    @property
+    def rehashing(self) -> bool:
+        """
+        Whether an incremental rehash is in progress.
+
+        Returns
+        -------
+        bool
+            True if some pairs are still in the old table.
+        """
+        return self._old_chains is not None
 
     def get_hash(self, x: Hashable) -> int:
         """
-        Calculates the hash value for a given key
+        Calculates the index of the chain of a given key
         using the selected hash function.
 
         Parameters
@@ -255,30 +483,10 @@ class HashTable_closed(Mappable):
         Returns
         -------
         int
-            The calculated hash value.
+            The index of the chain the key is stored in.
 
-        Raises
-        ------
-        TypeError
-            If hash function provided during init is not acceptable.
-
-        """
-        if self._hashfunc == 'poly':
-            # polynomial hash
-            return poly_hash(x) % self._capacity
-        elif self._hashfunc == 'md5':
-            return int(hashlib.md5(x.__repr__().encode(),
-                                   usedforsecurity=False).hexdigest(), 16) \
-                % self._capacity
-        elif self._hashfunc == 'sha1':
-            return int(hashlib.sha1(x.__repr__().encode(),
-                                    usedforsecurity=False).hexdigest(), 16) \
-                % self._capacity
-        elif callable(self._hashfunc):
-            return self._hashfunc(x) % self._capacity
-        else:
-            raise TypeError('hash function provided neither is acceptable ' +
-                            'nor is a callable')
+        """
+        return self._full_hash(x) % self._capacity
 
     @property
     def pairs(self):
@@ -289,10 +497,13 @@ class HashTable_closed(Mappable):
         Returns
         -------
         list
-            A copy of the internal list of pairs in the hash table.
+            A copy of the internal list of chains of pairs in the hash
+            table, an empty deque stands for each chain not allocated yet.
         """
-        ret = self._pairs.elements.copy()
-        return ret
+        if self._old_chains is not None:
+            self._migrate(len(self._old_chains), self._capacity)
+        return [deque(Pair(pair.key, pair.value) for pair in chain or ())
+                for chain in self._pairs.elements]
 
     @pairs.setter
     def pairs(self, value: Any) -> None:
@@ -421,16 +632,17 @@ class HashTable_closed(Mappable):
         -------
         None
         """
-        # update by delete and reset
-        hashed_key = self.get_hash(key)
-        index = self.search(key)
-        if not (str(index) == 'False'):
-            del self._pairs[hashed_key][index]
-            self._size -= 1
-        self._pairs[hashed_key].append(Pair(key, x))
+        chain, hashed, index = self._probe(key)
+        if index >= 0:
+            chain[index] = _HashedPair(key, x, hashed)
+            return
+        if chain is None:
+            chain = self._pairs.elements[hashed % self._capacity] = deque()
+        chain.append(_HashedPair(key, x, hashed))
         self._size += 1
-        if len(self._pairs[hashed_key]) / self.capacity > \
-                self._load_factor_threshold:
+        # a new resize waits until the previous incremental one is done
+        if self._size / self._capacity > self._load_factor_threshold \
+                and self._old_chains is None:
             self.increase_capacity()
 
     def __getitem__(self, i: int) -> Any:
@@ -451,13 +663,10 @@ class HashTable_closed(Mappable):
         ------
             KeyError: If the key is not found in the hash table.
         """
-        hashed_key = self.get_hash(i)
-        for pair in [pair for pair in self._pairs[hashed_key]]:
-            key = pair[0]
-            value = pair[1]
-            if key == i:
-                return value
-        raise KeyError('no value for corresponding key present')
+        chain, _, index = self._probe(i)
+        if index < 0:
+            raise KeyError('no value for corresponding key present')
+        return chain[index].value
 
     def increase_capacity(self) -> None:
         """
@@ -482,7 +691,10 @@ class HashTable_closed(Mappable):
 
     def recapacitate_and_rehash(self, old_capacity: int) -> None:
         """
-        Recalculates the hash values and rehashes the key-value pairs.
+        Redistributes the key-value pairs by their stored full hashes,
+        the hash function is not called. In the incremental mode only
+        the new table is created, the pairs are moved by the operations
+        that follow.
 
         Parameters
         ----------
@@ -493,19 +705,17 @@ class HashTable_closed(Mappable):
         -------
         None
         """
-        newVector = PairsVector(
-            capacity=self._capacity, elements=[
-                deque() for _ in range(
-                    self._capacity)])
-        for i in range(old_capacity):
-            for pair in self._pairs[i]:
-                key = pair[0]
-                value = pair[1]
-                newVector[self.get_hash(key)].append(
-                    Pair(key=key, value=value))
-        del self._pairs
-        self._pairs = newVector
-        del newVector
+        if self._old_chains is not None:
+            # finish the previous incremental rehash first
+            self._migrate(len(self._old_chains), old_capacity)
+        # the chains of the new table are created on first use, so
+        # a big table is allocated in one cheap step
+        self._old_chains = self._pairs.elements[:old_capacity]
+        self._rehash_index = 0
+        self._pairs = PairsVector(capacity=self._capacity,
+                                  size=self._capacity)
+        if not self._incremental:
+            self._migrate(old_capacity, self._capacity)
 
     def decrease_capacity(self) -> None:
         """
@@ -535,13 +745,8 @@ class HashTable_closed(Mappable):
             The index of the key in the hash table if found,
             or False if not found.
         """
-        hashed_key = self.get_hash(key)
-        for index, pair in enumerate(
-                [pair for pair in self._pairs[hashed_key]]):
-            key_of_pair = pair[0]
-            if key == key_of_pair:
-                return index
-        return False
+        index = self._probe(key)[2]
+        return index if index >= 0 else False
 
     def __delitem__(self, key: Hashable) -> None:
         """
@@ -556,15 +761,150 @@ class HashTable_closed(Mappable):
         -------
         None
         """
-        hashed_key = self.get_hash(key)
-        index = self.search(key)
-        if str(index) != 'False':
-            del self._pairs[hashed_key][index]
+        chain, _, index = self._probe(key)
+        if index >= 0:
+            del chain[index]
             self._size -= 1
-            if len(self._pairs[hashed_key]) / self.capacity < \
-                    self._load_factor_threshold / 4 and self.capacity > 31:
+            if self._size / self._capacity < \
+                    self._load_factor_threshold / 4 and self._capacity > 31 \
+                    and self._old_chains is None:
                 self.decrease_capacity()
 
+    def reserve(self, count: int) -> None:
+        """
+        Grows the hash table once so that count more pairs fit without
+        a resize.
+
+        Parameters
+        ----------
+        count: int
+            The number of pairs to be added.
+
+        Returns
+        -------
+        None
+        """
+        needed = (self._size + count) / self._load_factor_threshold
+        if needed >= self._capacity:
+            old_capacity = self._capacity
+            self._capacity = gen_prime(int(needed))
+            self.recapacitate_and_rehash(old_capacity)
+
+    def _hash_many(self, keys: list) -> list[int]:
+        """
+        Calculates the full hashes of many keys.
+
+        Int keys of the 'fast64' function are hashed by `hash_array`
+        all at once.
+
+        Parameters
+        ----------
+        keys: list
+            The keys.
+
+        Returns
+        -------
+        list[int]
+            The full hashes in the order of the keys.
+        """
+        if self._hashfunc == 'fast64' and keys \
+                and all(type(key) is int for key in keys) \
+                and _INT64_MIN <= min(keys) and max(keys) <= _INT64_MAX:
+            return hash_array(keys).tolist()
+        return list(map(self._full_hash, keys))
+
+    def set_many(self, items: Mapping | Iterable[tuple]) -> None:
+        """
+        Adds or updates many key-value pairs.
+
+        The table grows at most once, before the pairs are added, and
+        the keys are hashed in one batch.
+
+        Parameters
+        ----------
+        items: Mapping or Iterable[tuple]
+            A mapping or key-value pairs. Of repeated keys the last
+            value is kept.
+
+        Returns
+        -------
+        None
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        self.reserve(len(items))
+        hashes = self._hash_many([pair[0] for pair in items])
+        for (key, x), hashed in zip(items, hashes):
+            chain, hashed, index = self._probe(key, hashed)
+            if index >= 0:
+                chain[index] = _HashedPair(key, x, hashed)
+                continue
+            if chain is None:
+                chain = self._pairs.elements[hashed % self._capacity] = \
+                    deque()
+            chain.append(_HashedPair(key, x, hashed))
+            self._size += 1
+
+    def get_many(self, keys: Iterable[Hashable],
+                 default: Any = None) -> list:
+        """
+        Retrieves the values of many keys.
+
+        Parameters
+        ----------
+        keys: Iterable[Hashable]
+            The keys.
+
+        default: Any
+            The value for absent keys, by default None.
+
+        Returns
+        -------
+        list
+            The values in the order of the keys.
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        result = []
+        for key, hashed in zip(keys, self._hash_many(keys)):
+            chain, _, index = self._probe(key, hashed)
+            result.append(chain[index].value if index >= 0 else default)
+        return result
+
+    def delete_many(self, keys: Iterable[Hashable]) -> int:
+        """
+        Removes the pairs of many keys, absent keys are skipped.
+
+        The table shrinks at most once, after the pairs are removed.
+
+        Parameters
+        ----------
+        keys: Iterable[Hashable]
+            The keys.
+
+        Returns
+        -------
+        int
+            The number of pairs removed.
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        removed = 0
+        for key, hashed in zip(keys, self._hash_many(keys)):
+            chain, _, index = self._probe(key, hashed)
+            if index >= 0:
+                del chain[index]
+                removed += 1
+        self._size -= removed
+        if self._size / self._capacity < self._load_factor_threshold / 4 \
+                and self._capacity > 31 and self._old_chains is None:
+            # shrink right to the half of the threshold
+            old_capacity = self._capacity
+            self._capacity = gen_prime(
+                max(int(2 * self._size / self._load_factor_threshold), 30))
+            self.recapacitate_and_rehash(old_capacity)
+        return removed
+
     def to_dict(self) -> dict[Hashable, Any]:
         """
         Returns a dictionary representation of the hash table.
@@ -576,7 +916,10 @@ class HashTable_closed(Mappable):
         """
         result = dict()
         for i in self._pairs:
-            for j in i:
+            for j in i or ():
+                result[j.key] = j.value
+        for i in self._old_chains or ():
+            for j in i or ():
                 result[j.key] = j.value
         return result
 
@@ -594,10 +937,7 @@ class HashTable_closed(Mappable):
         bool
             True if the key exists in the hash table, False otherwise.
         """
-        if str(self.search(key)) == 'False':
-            return False
-        else:
-            return True
+        return self.search(key) is not False
 
     @classmethod
     def from_dict(cls, dictionary: dict) -> 'HashTable_closed':
@@ -615,9 +955,41 @@ class HashTable_closed(Mappable):
             A new HashTable_closed object initialized with
             the contents of the dictionary.
         """
-        result = HashTable_closed(capacity=len(dictionary))
-        for key, value in dictionary.items():
-            result[key] = value
+        return cls.from_items(dictionary.items(),
+                              expected_size=len(dictionary))
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple],
+                   expected_size: int | None = None,
+                   **kwargs) -> 'HashTable_closed':
+        """
+        Creates a new hash table sized for the pairs given from the start,
+        so it is never resized while they are added.
+
+        Parameters
+        ----------
+        items: Iterable[tuple]
+            The key-value pairs.
+
+        expected_size: int or None
+            The number of pairs, by default None (the pairs are counted,
+            which needs them in a list).
+
+        kwargs: dict
+            The other arguments of the constructor, as hashfunc.
+
+        Returns
+        -------
+        HashTable_closed
+            A new hash table with the pairs.
+        """
+        if expected_size is None:
+            items = items if isinstance(items, (list, tuple)) \
+                else list(items)
+            expected_size = len(items)
+        threshold = kwargs.get('load_factor_threshold', 0.75)
+        result = cls(capacity=int(expected_size / threshold), **kwargs)
+        result.set_many(items)
         return result
 
     def __str__(self) -> str:
@@ -679,7 +1051,7 @@ class HashTable_open(HashTable_closed):
     it looks for alternative positions within the table using multiple
     hash functions.
     Supported hash functions include 'md5', 'sha1', 'poly' (polynomial hash),
-    and custom callable functions.
+    'fast64' and custom callable functions.
 
     Attributes
     ----------
@@ -688,7 +1060,7 @@ class HashTable_open(HashTable_closed):
 
     hashfuncs : list[str | Callable]
         A list of hash functions used to determine the index for storing keys.
-        Supported values: 'md5', 'sha1', 'poly' (polynomial hash),
+        Supported values: 'md5', 'sha1', 'poly' (polynomial hash), 'fast64',
         or custom callable functions.
 
     Methods
@@ -714,6 +1086,23 @@ class HashTable_open(HashTable_closed):
     update(self, key: Hashable, value: Any) -> None
         Updates the value associated with a given key in the hash table.
 
+    reserve(self, count: int) -> None
+        Grows the hash table once to fit count more pairs.
+
+    set_many(self, items: Mapping | Iterable[tuple]) -> None
+        Adds or updates many key-value pairs.
+
+    get_many(self, keys: Iterable[Hashable], default: Any = None) -> list
+        Retrieves the values of many keys.
+
+    delete_many(self, keys: Iterable[Hashable]) -> int
+        Removes the pairs of many keys.
+
+    from_items(cls, items: Iterable[tuple],
+               expected_size: int | None = None,
+               **kwargs) -> HashTable_open
+        Creates a new hash table sized for the pairs given.
+
     search(self, key: Hashable) -> tuple[int, int] | bool
         Searches for a key in the hash table and returns
         the table index and hashed key index if found, or False if not found.
@@ -759,6 +1148,11 @@ class HashTable_open(HashTable_closed):
         Returns
         -------
         None
+
+        Raises
+        ------
+        TypeError
+            If a hash function is neither acceptable nor a callable.
         """
         # full capacity - capacity of all tables
         self._capacity = gen_prime(capacity)
@@ -767,6 +1161,7 @@ class HashTable_open(HashTable_closed):
         # number of such tables equals to the number of hashfunctions
         # hence capacity of one table can be calculated by the following:
         self._hashfuncs = hashfuncs
+        self._full_hashes = [resolve_hash(hashfunc) for hashfunc in hashfuncs]
         self._one_table_capacity = self.one_table_capacity()
         # create those tables
         self._elements = ElementsList()
@@ -804,9 +1199,9 @@ class HashTable_open(HashTable_closed):
             A hash value for the key.
 
         """
-        for i in self._hashfuncs:
-            self._hashfunc = i
-            yield super().get_hash(key) % self.one_table_capacity()
+        width = self.one_table_capacity()
+        for full_hash in self._full_hashes:
+            yield full_hash(key) % width
 
     def current_hashed_key(self, key: Hashable, table_index: int) -> int:
         """
@@ -1011,34 +1406,1992 @@ class HashTable_open(HashTable_closed):
         """
         Recapacitates the hash table and rehashes its contents.
 
+        The new tables are allocated once, the places of all the pairs
+        are calculated in one batch and the pairs are placed directly,
+        not through `__setitem__`. Only if the displacements of a pair
+        run out is the table grown again and the placing repeated.
+
         Returns
         -------
         None
 
         """
-        old_elements = self._elements
-        self._elements = ElementsList()
-        self._size = 0
-        for _ in self._hashfuncs:
-            self._elements.append([
-                    None for _ in range(self.one_table_capacity())])
-        old_elements[0].extend(old_elements[1])
-        for pair in [pair for pair in old_elements[0] if pair is not None]:
-            self[pair[0]] = pair[1]
+        pairs = [pair for table in self._elements
+                 for pair in table if pair is not None]
+        while True:
+            self._elements = ElementsList()
+            for _ in self._hashfuncs:
+                self._elements.append([
+                        None for _ in range(self.one_table_capacity())])
+            if self._place_all(pairs):
+                break
+            self._capacity = gen_prime(self._capacity * 2)
+        self._size = len(pairs)
 
-    def to_dict(self) -> dict[Hashable, Any]:
+    def _place_all(self, pairs: list[Pair]) -> bool:
         """
-        Returns a dictionary representation of the hash table.
+        Places pairs of distinct keys into the empty tables by cuckoo
+        displacements, with their places calculated in one batch.
+
+        Parameters
+        ----------
+        pairs : list[Pair]
+            The pairs.
 
         Returns
         -------
-        dict
-            A dictionary containing key-value pairs from the hash table.
+        bool
+            False if the displacements of a pair ran out.
+
+        """
+        tables = self._elements
+        keys = [pair.key for pair in pairs]
+        slots = self._slots_many(keys)
+        # a displaced pair is placed by its own places
+        places_of = dict(zip(keys, slots))
+        for pair, places in zip(pairs, slots):
+            table_index = 0
+            for _ in range(self._max_displacements):
+                free = next((index for index, place in enumerate(places)
+                             if tables[index][place] is None), None)
+                if free is not None:
+                    tables[free][places[free]] = pair
+                    break
+                place = places[table_index]
+                displaced = tables[table_index][place]
+                tables[table_index][place] = pair
+                pair, places = displaced, places_of[displaced.key]
+                table_index = (table_index + 1) % len(tables)
+            else:
+                return False
+        return True
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the hash table once so that the tables stay at most half
+        full with count more pairs.
+
+        Parameters
+        ----------
+        count : int
+            The number of pairs to be added.
+
+        Returns
+        -------
+        None
 
         """
-        dict_res = dict()
-        for pair in [pair for pair in self._elements[0] if pair is not None]:
-            dict_res[pair[0]] = pair[1]
-        for pair in [pair for pair in self._elements[1] if pair is not None]:
-            dict_res[pair[0]] = pair[1]
-        return dict_res
+        needed = 2 * (self._size + count)
+        if needed > self._capacity:
+            self._capacity = gen_prime(needed)
+            self.recapacitate_and_rehash()
+
+    def _slots_many(self, keys: list) -> list[tuple[int, ...]]:
+        """
+        Calculates the places of many keys in every table.
+
+        Int keys of the 'fast64' function are hashed by `hash_array`
+        all at once.
+
+        Parameters
+        ----------
+        keys : list
+            The keys.
+
+        Returns
+        -------
+        list[tuple[int, ...]]
+            The places of each key, one per table, in the order of the keys.
+
+        """
+        width = self.one_table_capacity()
+        ints = keys and all(type(key) is int for key in keys) \
+            and _INT64_MIN <= min(keys) and max(keys) <= _INT64_MAX
+        columns = []
+        for full_hash in self._full_hashes:
+            if full_hash is hash64 and ints:
+                columns.append([hashed % width
+                                for hashed in hash_array(keys).tolist()])
+            else:
+                columns.append([full_hash(key) % width for key in keys])
+        return list(zip(*columns))
+
+    def _find(self, key: Hashable,
+              slots: tuple[int, ...]) -> tuple[int, int] | bool:
+        """
+        Searches for a key at its places calculated beforehand.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be searched for.
+
+        slots : tuple[int, ...]
+            The places of the key, one per table.
+
+        Returns
+        -------
+        tuple[int, int] or False
+            The table index and the place of the key if found, or False.
+
+        """
+        for table_index, hashed_key in enumerate(slots):
+            pair = self._elements[table_index][hashed_key]
+            if pair is not None and pair.key == key:
+                return table_index, hashed_key
+        return False
+
+    def set_many(self, items: Mapping | Iterable[tuple]) -> None:
+        """
+        Adds or updates many key-value pairs, the table grows at most once
+        before they are added and the keys are hashed in one batch.
+
+        New keys are still placed one by one, a cuckoo displacement
+        that grows the table makes the rest of the keys be searched
+        one by one too.
+
+        Parameters
+        ----------
+        items : Mapping or Iterable[tuple]
+            A mapping or key-value pairs.
+
+        Returns
+        -------
+        None
+
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        self.reserve(len(items))
+        capacity = self._capacity
+        slots = self._slots_many([pair[0] for pair in items])
+        for (key, value), places in zip(items, slots):
+            found = self._find(key, places) if self._capacity == capacity \
+                else self.search(key)
+            if found is False:
+                self[key] = value
+            else:
+                self._elements[found[0]][found[1]] = Pair(key, value)
+
+    def get_many(self, keys: Iterable[Hashable],
+                 default: Any = None) -> list:
+        """
+        Retrieves the values of many keys, hashed in one batch.
+
+        Parameters
+        ----------
+        keys : Iterable[Hashable]
+            The keys.
+
+        default : Any
+            The value for absent keys, by default None.
+
+        Returns
+        -------
+        list
+            The values in the order of the keys.
+
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        result = []
+        for key, places in zip(keys, self._slots_many(keys)):
+            found = self._find(key, places)
+            result.append(default if found is False
+                          else self._elements[found[0]][found[1]].value)
+        return result
+
+    def delete_many(self, keys: Iterable[Hashable]) -> int:
+        """
+        Removes the pairs of many keys, hashed in one batch, absent keys
+        are skipped.
+
+        Parameters
+        ----------
+        keys : Iterable[Hashable]
+            The keys.
+
+        Returns
+        -------
+        int
+            The number of pairs removed.
+
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        removed = 0
+        for key, places in zip(keys, self._slots_many(keys)):
+            found = self._find(key, places)
+            if found is not False:
+                self._elements[found[0]][found[1]] = None
+                removed += 1
+        self._size -= removed
+        return removed
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple],
+                   expected_size: int | None = None,
+                   **kwargs) -> 'HashTable_open':
+        """
+        Creates a new hash table with the tables filled at most by half
+        with the pairs given, which keeps displacement chains short.
+
+        Parameters
+        ----------
+        items : Iterable[tuple]
+            The key-value pairs.
+
+        expected_size : int or None
+            The number of pairs, by default None (the pairs are counted).
+
+        kwargs : dict
+            The other arguments of the constructor, as hashfuncs.
+
+        Returns
+        -------
+        HashTable_open
+            A new hash table with the pairs.
+
+        """
+        if expected_size is None:
+            items = items if isinstance(items, (list, tuple)) \
+                else list(items)
+            expected_size = len(items)
+        result = cls(capacity=2 * expected_size, **kwargs)
+        result.set_many(items)
+        return result
+
+    def to_dict(self) -> dict[Hashable, Any]:
+        """
+        Returns a dictionary representation of the hash table.
+
+        Returns
+        -------
+        dict
+            A dictionary containing key-value pairs from the hash table.
+
+        """
+        dict_res = dict()
+        for pair in [pair for pair in self._elements[0] if pair is not None]:
+            dict_res[pair[0]] = pair[1]
+        for pair in [pair for pair in self._elements[1] if pair is not None]:
+            dict_res[pair[0]] = pair[1]
+        return dict_res
+
+
+# the index slot was never used
+_EMPTY = -1
+# the index slot held a deleted entry, probing continues past it
+_DUMMY = -2
+# the key of a deleted dense entry
+_DELETED = object()
+
+
+class HashTable_compact(Mappable):
+    """
+    A compact hash table with ordered iteration.
+
+    The layout follows CPython's dict. The entries are appended to dense
+    parallel arrays: an `array('Q')` of full hashes and lists of keys and
+    values, so iteration is in the insertion order. A sparse index, a power
+    of two long, maps a hash to the position of the entry in the dense
+    arrays. The index is an `array.array` of the smallest integer type
+    able to hold the positions ('b' up to 128 slots, then 'h', 'i', 'q'),
+    so an empty slot costs 1-8 bytes instead of a bucket object.
+    Collisions are resolved by probing the index with the perturbation
+    scheme of CPython, which mixes all bits of the hash into the probe
+    sequence.
+
+    Deleted entries leave tombstones: the dense entry gets a marker key
+    and the index slot is marked as dummy, so probing continues past it.
+    When the dense arrays are full, or tombstones outnumber the live
+    entries, the arrays are compacted and the index is rebuilt from the
+    cached hashes, without calling the hash function again. The index is
+    sized for three times the live entries, so it grows and shrinks with
+    the table.
+
+    Attributes
+    ----------
+    capacity : int
+        The number of slots in the index.
+
+    size : int
+        The number of key-value pairs.
+
+    hashfunc : str or callable
+        The hash function: 'poly', 'md5', 'sha1', 'fast64' or a callable,
+        by default the built-in hash.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 8,
+             hashfunc: str | Callable = hash) -> None
+        Initializes an empty table with room for capacity pairs.
+
+    __setitem__(self, key: Hashable, value: Any) -> None
+        Adds or updates a key-value pair.
+
+    __getitem__(self, key: Hashable) -> Any
+        Retrieves the value associated with a given key.
+
+    __delitem__(self, key: Hashable) -> None
+        Removes a key-value pair if the key is present.
+
+    search(self, key: Hashable) -> int | bool
+        Returns the position of the key in the dense arrays or False.
+
+    __contains__(self, key: Hashable) -> bool
+        Checks if a key exists in the hash table.
+
+    __len__(self) -> int
+        The number of key-value pairs.
+
+    __iter__(self) -> Generator
+        Iterates through the keys in the insertion order.
+
+    items(self) -> Generator
+        Iterates through the key-value pairs in the insertion order.
+
+    to_dict(self) -> dict
+        Returns a dictionary representation of the hash table.
+
+    from_dict(cls, dictionary: dict) -> HashTable_compact
+        Creates a new hash table from a dictionary.
+
+    __str__(self) -> str
+        Returns a string representation of the hash table.
+
+    __repr__(self) -> str
+        Used for printing the contents of the hash table.
+
+    __eq__(self, other: Mappable) -> bool
+        Checks if two hash tables are equal.
+
+    """
+
+    def __init__(self, capacity: int = 8,
+                 hashfunc: str | Callable = hash) -> None:
+        """
+        Initializes an empty table with room for capacity pairs.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of pairs the table takes without resizing,
+            by default 8.
+
+        hashfunc : str or callable
+            The hash function: 'poly', 'md5', 'sha1', 'fast64' or a callable,
+            by default the built-in hash.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__()
+        self._hashfunc = hashfunc
+        self._hash = resolve_hash(hashfunc)
+        self._hashes = array('Q')
+        self._keys = []
+        self._values = []
+        self._size = 0
+        index_size = 8
+        while index_size * 2 // 3 < capacity:
+            index_size *= 2
+        self._make_index(index_size)
+
+    def _make_index(self, index_size: int) -> None:
+        """
+        Creates an empty index of the given size.
+
+        Parameters
+        ----------
+        index_size : int
+            The number of slots, a power of two.
+
+        Returns
+        -------
+        None
+        """
+        if index_size <= 1 << 7:
+            typecode = 'b'
+        elif index_size <= 1 << 15:
+            typecode = 'h'
+        elif index_size <= 1 << 31:
+            typecode = 'i'
+        else:
+            typecode = 'q'
+        self._index = array(typecode, [_EMPTY]) * index_size
+        self._mask = index_size - 1
+        # the dense arrays may hold up to 2/3 of the index size entries,
+        # so probing always meets an empty slot quickly
+        self._usable = index_size * 2 // 3
+
+    @property
+    def size(self) -> int:
+        """
+        Property getter method for retrieving the size attribute of the
+        hash table.
+
+        Returns
+        -------
+        int
+            The number of key-value pairs currently stored in the hash table.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Property getter method for retrieving the capacity attribute
+        of the hash table.
+
+        Returns
+        -------
+        int
+            The number of slots in the index.
+        """
+        return self._mask + 1
+
+    def __len__(self) -> int:
+        """
+        The number of key-value pairs currently stored in the hash table.
+
+        Returns
+        -------
+        int
+            The size of the hash table.
+        """
+        return self._size
+
+    def _lookup(self, key: Hashable, hashed: int) -> tuple[int, int]:
+        """
+        Probes the index for a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look for.
+
+        hashed : int
+            The full hash of the key.
+
+        Returns
+        -------
+        tuple[int, int]
+            The index slot and the dense position of the key if it is
+            present. Otherwise the slot to put the key into (the first
+            dummy or the empty slot met) and -1.
+        """
+        index, mask = self._index, self._mask
+        keys, hashes = self._keys, self._hashes
+        perturb = hashed
+        i = hashed & mask
+        free = -1
+        while True:
+            position = index[i]
+            if position == _EMPTY:
+                return (i if free < 0 else free), -1
+            if position == _DUMMY:
+                if free < 0:
+                    free = i
+            else:
+                found = keys[position]
+                if found is key or (hashes[position] == hashed
+                                    and found == key):
+                    return i, position
+            perturb >>= 5
+            i = (i * 5 + perturb + 1) & mask
+
+    def _resize(self) -> None:
+        """
+        Drops the tombstones and rebuilds the index for the live entries.
+
+        The index gets at least three slots per live entry. The cached
+        hashes are reused, so the hash function is not called.
+
+        Returns
+        -------
+        None
+        """
+        if len(self._keys) != self._size:
+            live = [position for position, key in enumerate(self._keys)
+                    if key is not _DELETED]
+            self._hashes = array('Q', [self._hashes[i] for i in live])
+            self._keys = [self._keys[i] for i in live]
+            self._values = [self._values[i] for i in live]
+        index_size = 8
+        while index_size < 3 * self._size:
+            index_size *= 2
+        self._make_index(index_size)
+        index, mask = self._index, self._mask
+        for position, hashed in enumerate(self._hashes):
+            perturb = hashed
+            i = hashed & mask
+            while index[i] != _EMPTY:
+                perturb >>= 5
+                i = (i * 5 + perturb + 1) & mask
+            index[i] = position
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """
+        Adds or updates (if already taken)
+        a key-value pair to the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be added.
+
+        value : Any
+            The value associated with the key.
+
+        Returns
+        -------
+        None
+        """
+        hashed = self._hash(key)
+        slot, position = self._lookup(key, hashed)
+        if position >= 0:
+            self._values[position] = value
+            return
+        if len(self._keys) >= self._usable:
+            self._resize()
+            slot, _ = self._lookup(key, hashed)
+        self._index[slot] = len(self._keys)
+        self._hashes.append(hashed)
+        self._keys.append(key)
+        self._values.append(value)
+        self._size += 1
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieves the value associated with a given key from the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for which to retrieve the value.
+
+        Returns
+        -------
+        Any
+            The value associated with the key.
+
+        Raises
+        ------
+            KeyError: If the key is not found in the hash table.
+        """
+        position = self._lookup(key, self._hash(key))[1]
+        if position < 0:
+            raise KeyError('no value for corresponding key present')
+        return self._values[position]
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Removes a key-value pair from the hash table, leaving a tombstone.
+
+        Nothing happens if the key is absent, as in HashTable_closed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be removed.
+
+        Returns
+        -------
+        None
+        """
+        slot, position = self._lookup(key, self._hash(key))
+        if position < 0:
+            return
+        self._index[slot] = _DUMMY
+        self._keys[position] = _DELETED
+        self._values[position] = None
+        self._size -= 1
+        # compact when the tombstones outnumber the live entries
+        if len(self._keys) - self._size > max(self._size, 8):
+            self._resize()
+
+    def search(self, key: Hashable) -> int | bool:
+        """
+        Searches for a key in the hash table and returns its position
+        in the dense arrays if found, or False if not found.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to search for.
+
+        Returns
+        -------
+        int or False
+            The position of the key if found, or False if not found.
+        """
+        position = self._lookup(key, self._hash(key))[1]
+        return position if position >= 0 else False
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks if a key exists in the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to check for existence.
+
+        Returns
+        -------
+        bool
+            True if the key exists in the hash table, False otherwise.
+        """
+        return self._lookup(key, self._hash(key))[1] >= 0
+
+    def __iter__(self) -> Generator:
+        """
+        Iterates through the keys in the insertion order.
+
+        Returns
+        -------
+        Generator
+            A generator of the keys.
+        """
+        for key in self._keys:
+            if key is not _DELETED:
+                yield key
+
+    def items(self) -> Generator:
+        """
+        Iterates through the key-value pairs in the insertion order.
+
+        Returns
+        -------
+        Generator
+            A generator of the (key, value) tuples.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield key, value
+
+    def to_dict(self) -> dict[Hashable, Any]:
+        """
+        Returns a dictionary representation of the hash table.
+
+        Returns
+        -------
+        dict[Hashable, Any]
+            A dictionary containing the key-value pairs in the insertion
+            order.
+        """
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, dictionary: dict) -> 'HashTable_compact':
+        """
+        Creates a new HashTable_compact object from a dictionary.
+
+        Parameters
+        ----------
+        dictionary : dict
+            The dictionary to create the hash table from.
+
+        Returns
+        -------
+        HashTable_compact
+            A new hash table with the contents of the dictionary.
+        """
+        result = cls(capacity=len(dictionary))
+        for key, value in dictionary.items():
+            result[key] = value
+        return result
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the hash table.
+
+        Returns
+        -------
+        str
+            A string representation of the hash table as a dictionary.
+        """
+        return dict.__str__(self.to_dict())
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the hash table used for printing.
+
+        Returns
+        -------
+        str
+            A string representation of the hash table as a dictionary.
+        """
+        return dict.__repr__(self.to_dict())
+
+    def __eq__(self, other: Mappable) -> bool:
+        """
+        Checks if two hash tables are equal by comparing their
+        dictionary representations.
+
+        Parameters
+        ----------
+        other : Mappable
+            Another object to compare.
+
+        Returns
+        -------
+        bool
+            True if the hash tables are equal, False otherwise.
+        """
+        return dict.__eq__(self.to_dict(), other.to_dict())
+
+
+# the key of an empty slot of HashTable_robinhood
+_FREE = object()
+# 2^64 / golden ratio, spreads the bits of a hash over the high bits
+_FIBONACCI = 0x9E3779B97F4A7C15
+
+
+class HashTable_robinhood(Mappable):
+    """
+    An open addressing hash table with Robin Hood linear probing.
+
+    The slots are flat parallel arrays: an `array('Q')` of hashes and
+    lists of keys and values, with a marker key for the empty slots.
+    A key is placed at the first free slot after its home slot. On the way
+    it takes the place of any pair that is closer to its own home
+    ("robs the rich"), and the displaced pair continues probing. Thus the
+    distances from home are evened out, and a lookup stops as soon as it
+    meets a pair closer to its home than the key would be. Together this
+    keeps probes short at load factors up to 0.9.
+
+    A deleted pair leaves no tombstone. The pairs after it that are not in
+    their home slot are shifted one slot back (backward-shift deletion),
+    so the table stays as if the pair had never been inserted.
+
+    The stored hash is the full hash multiplied by a Fibonacci constant,
+    its high bits select the home slot, which spreads even poorly mixed
+    hashes (as the hashes of consecutive integers) over the table.
+    The capacity is a power of two. A resize places the pairs by their
+    stored hashes, so the hash function is not called again.
+
+    Attributes
+    ----------
+    capacity : int
+        The number of slots.
+
+    size : int
+        The number of key-value pairs.
+
+    hashfunc : str or callable
+        The hash function: 'poly', 'md5', 'sha1', 'fast64' or a callable,
+        by default the built-in hash.
+
+    load_factor_threshold : float
+        The maximum size / capacity ratio, by default 0.9.
+
+    max_probe_length : int
+        The largest distance of a pair from its home slot.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 8, hashfunc: str | Callable = hash,
+             load_factor_threshold: float = 0.9) -> None
+        Initializes an empty table with room for capacity pairs.
+
+    __setitem__(self, key: Hashable, value: Any) -> None
+        Adds or updates a key-value pair.
+
+    __getitem__(self, key: Hashable) -> Any
+        Retrieves the value associated with a given key.
+
+    __delitem__(self, key: Hashable) -> None
+        Removes a key-value pair if the key is present.
+
+    search(self, key: Hashable) -> int | bool
+        Returns the slot of the key or False.
+
+    __contains__(self, key: Hashable) -> bool
+        Checks if a key exists in the hash table.
+
+    __len__(self) -> int
+        The number of key-value pairs.
+
+    __iter__(self) -> Generator
+        Iterates through the keys in the slot order.
+
+    items(self) -> Generator
+        Iterates through the key-value pairs in the slot order.
+
+    to_dict(self) -> dict
+        Returns a dictionary representation of the hash table.
+
+    from_dict(cls, dictionary: dict) -> HashTable_robinhood
+        Creates a new hash table from a dictionary.
+
+    __str__(self) -> str
+        Returns a string representation of the hash table.
+
+    __repr__(self) -> str
+        Used for printing the contents of the hash table.
+
+    __eq__(self, other: Mappable) -> bool
+        Checks if two hash tables are equal.
+
+    """
+
+    def __init__(self, capacity: int = 8, hashfunc: str | Callable = hash,
+                 load_factor_threshold: float = 0.9) -> None:
+        """
+        Initializes an empty table with room for capacity pairs.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of pairs the table takes without resizing,
+            by default 8.
+
+        hashfunc : str or callable
+            The hash function: 'poly', 'md5', 'sha1', 'fast64' or a callable,
+            by default the built-in hash.
+
+        load_factor_threshold : float
+            The maximum size / capacity ratio, by default 0.9. When it is
+            exceeded the table doubles, when the ratio falls below a quarter
+            of it the table halves.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the load factor threshold is not between 0 and 1.
+
+        TypeError
+            If the hash function is neither acceptable nor a callable.
+        """
+        if not 0 < load_factor_threshold < 1:
+            raise ValueError('load factor threshold should be '
+                             + 'between 0 and 1')
+        super().__init__()
+        self._hashfunc = hashfunc
+        self._hash = resolve_hash(hashfunc)
+        self._load_factor_threshold = load_factor_threshold
+        self._size = 0
+        slots = 8
+        while int(slots * load_factor_threshold) < capacity:
+            slots *= 2
+        self._make_slots(slots)
+
+    def _make_slots(self, slots: int) -> None:
+        """
+        Creates empty slots.
+
+        Parameters
+        ----------
+        slots : int
+            The number of slots, a power of two.
+
+        Returns
+        -------
+        None
+        """
+        self._hashes = array('Q', [0]) * slots
+        self._keys = [_FREE] * slots
+        self._values = [None] * slots
+        self._mask = slots - 1
+        # the high bits of a stored hash give the home slot
+        self._shift = 65 - slots.bit_length()
+        # at least one slot stays free, so probing always stops
+        self._usable = min(int(slots * self._load_factor_threshold),
+                           slots - 1)
+
+    @property
+    def size(self) -> int:
+        """
+        Property getter method for retrieving the size attribute of the
+        hash table.
+
+        Returns
+        -------
+        int
+            The number of key-value pairs currently stored in the hash table.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Property getter method for retrieving the capacity attribute
+        of the hash table.
+
+        Returns
+        -------
+        int
+            The number of slots.
+        """
+        return self._mask + 1
+
+    @property
+    def max_probe_length(self) -> int:
+        """
+        The largest distance of a pair from its home slot, in slots.
+
+        A lookup of a present key reads at most this many slots plus one.
+
+        Returns
+        -------
+        int
+            The largest distance, 0 for an empty table.
+        """
+        mask, shift = self._mask, self._shift
+        return max((i - (hashed >> shift)) & mask
+                   for i, (hashed, key) in enumerate(zip(self._hashes,
+                                                         self._keys))
+                   if key is not _FREE) if self._size else 0
+
+    def __len__(self) -> int:
+        """
+        The number of key-value pairs currently stored in the hash table.
+
+        Returns
+        -------
+        int
+            The size of the hash table.
+        """
+        return self._size
+
+    def _mix(self, key: Hashable) -> int:
+        """
+        Calculates the stored hash of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be hashed.
+
+        Returns
+        -------
+        int
+            The 64-bit full hash multiplied by the Fibonacci constant.
+        """
+        return (self._hash(key) * _FIBONACCI) & _MASK64
+
+    def _find(self, key: Hashable, hashed: int) -> int:
+        """
+        Probes the slots for a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look for.
+
+        hashed : int
+            The stored hash of the key.
+
+        Returns
+        -------
+        int
+            The slot of the key, -1 if the key is absent.
+        """
+        hashes, keys = self._hashes, self._keys
+        mask, shift = self._mask, self._shift
+        i = hashed >> shift
+        distance = 0
+        while True:
+            found = keys[i]
+            if found is _FREE:
+                return -1
+            stored = hashes[i]
+            if stored == hashed and (found is key or found == key):
+                return i
+            # the key would have robbed this slot, it is not further
+            if (i - (stored >> shift)) & mask < distance:
+                return -1
+            i = (i + 1) & mask
+            distance += 1
+
+    def _place(self, i: int, distance: int,
+               hashed: int, key: Hashable, value: Any) -> None:
+        """
+        Puts an absent key into the slots, starting from slot i,
+        displacing the pairs closer to their home slots.
+
+        Parameters
+        ----------
+        i : int
+            The slot to start from.
+
+        distance : int
+            The distance of slot i from the home slot of the key.
+
+        hashed : int
+            The stored hash of the key.
+
+        key : Hashable
+            The key.
+
+        value : Any
+            The value.
+
+        Returns
+        -------
+        None
+        """
+        hashes, keys, values = self._hashes, self._keys, self._values
+        mask, shift = self._mask, self._shift
+        while True:
+            if keys[i] is _FREE:
+                hashes[i], keys[i], values[i] = hashed, key, value
+                return
+            own = (i - (hashes[i] >> shift)) & mask
+            if own < distance:
+                # the resident is closer to its home, it yields the slot
+                # and continues probing instead of the placed pair
+                hashes[i], hashed = hashed, hashes[i]
+                keys[i], key = key, keys[i]
+                values[i], value = value, values[i]
+                distance = own
+            i = (i + 1) & mask
+            distance += 1
+
+    def _shift_right(self, i: int) -> None:
+        """
+        Frees slot i by moving the pairs from it up to the next free slot
+        one slot forward.
+
+        The pairs of a run are ordered by their home slots, so this is what
+        the Robin Hood swaps of an insertion would do, but the moves are
+        done with slice assignments.
+
+        Parameters
+        ----------
+        i : int
+            The slot to free.
+
+        Returns
+        -------
+        None
+        """
+        hashes, keys, values = self._hashes, self._keys, self._values
+        mask = self._mask
+        j = i
+        while keys[j] is not _FREE:
+            j = (j + 1) & mask
+        if j < i:
+            # the run wraps around the end of the table
+            hashes[1:j + 1] = hashes[:j]
+            keys[1:j + 1] = keys[:j]
+            values[1:j + 1] = values[:j]
+            hashes[0], keys[0], values[0] = \
+                hashes[mask], keys[mask], values[mask]
+            j = mask
+        hashes[i + 1:j + 1] = hashes[i:j]
+        keys[i + 1:j + 1] = keys[i:j]
+        values[i + 1:j + 1] = values[i:j]
+
+    def _resize(self, slots: int) -> None:
+        """
+        Moves the pairs into the given number of slots.
+
+        The pairs are placed in the order of their home slots, so each one
+        goes to the first free slot and none is displaced. The stored
+        hashes are reused, so the hash function is not called.
+
+        Parameters
+        ----------
+        slots : int
+            The new number of slots, a power of two.
+
+        Returns
+        -------
+        None
+        """
+        pairs = sorted(
+            ((hashed, key, value) for hashed, key, value
+             in zip(self._hashes, self._keys, self._values)
+             if key is not _FREE), key=lambda pair: pair[0])
+        self._make_slots(slots)
+        hashes, keys, values = self._hashes, self._keys, self._values
+        shift, last = self._shift, self._mask
+        i = 0
+        for count, (hashed, key, value) in enumerate(pairs):
+            i = max(i, hashed >> shift)
+            if i > last:
+                # the rest wraps around to the start of the table
+                for hashed, key, value in pairs[count:]:
+                    home = hashed >> shift
+                    self._place(home, 0, hashed, key, value)
+                return
+            hashes[i], keys[i], values[i] = hashed, key, value
+            i += 1
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """
+        Adds or updates (if already taken)
+        a key-value pair to the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be added.
+
+        value : Any
+            The value associated with the key.
+
+        Returns
+        -------
+        None
+        """
+        hashed = self._mix(key)
+        if self._size >= self._usable:
+            i = self._find(key, hashed)
+            if i >= 0:
+                self._values[i] = value
+                return
+            self._resize(2 * (self._mask + 1))
+        hashes, keys, values = self._hashes, self._keys, self._values
+        mask, shift = self._mask, self._shift
+        i = hashed >> shift
+        distance = 0
+        # one pass: look for the key until the place where it would be,
+        # then put it there
+        while True:
+            found = keys[i]
+            if found is _FREE:
+                hashes[i], keys[i], values[i] = hashed, key, value
+                break
+            stored = hashes[i]
+            if stored == hashed and (found is key or found == key):
+                values[i] = value
+                return
+            if (i - (stored >> shift)) & mask < distance:
+                # the key is absent, it takes this slot
+                self._shift_right(i)
+                hashes[i], keys[i], values[i] = hashed, key, value
+                break
+            i = (i + 1) & mask
+            distance += 1
+        self._size += 1
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieves the value associated with a given key from the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for which to retrieve the value.
+
+        Returns
+        -------
+        Any
+            The value associated with the key.
+
+        Raises
+        ------
+            KeyError: If the key is not found in the hash table.
+        """
+        i = self._find(key, self._mix(key))
+        if i < 0:
+            raise KeyError('no value for corresponding key present')
+        return self._values[i]
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Removes a key-value pair from the hash table with backward shift.
+
+        Nothing happens if the key is absent, as in HashTable_closed.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be removed.
+
+        Returns
+        -------
+        None
+        """
+        i = self._find(key, self._mix(key))
+        if i < 0:
+            return
+        hashes, keys, values = self._hashes, self._keys, self._values
+        mask, shift = self._mask, self._shift
+        j = (i + 1) & mask
+        # shift back the following pairs until a free slot or a pair
+        # in its home slot
+        while keys[j] is not _FREE and (j - (hashes[j] >> shift)) & mask:
+            hashes[i], keys[i], values[i] = hashes[j], keys[j], values[j]
+            i = j
+            j = (j + 1) & mask
+        hashes[i], keys[i], values[i] = 0, _FREE, None
+        self._size -= 1
+        if self._size < self._usable // 4 and self._mask >= 8:
+            self._resize((self._mask + 1) // 2)
+
+    def search(self, key: Hashable) -> int | bool:
+        """
+        Searches for a key in the hash table and returns its slot
+        if found, or False if not found.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to search for.
+
+        Returns
+        -------
+        int or False
+            The slot of the key if found, or False if not found.
+        """
+        i = self._find(key, self._mix(key))
+        return i if i >= 0 else False
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks if a key exists in the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to check for existence.
+
+        Returns
+        -------
+        bool
+            True if the key exists in the hash table, False otherwise.
+        """
+        return self._find(key, self._mix(key)) >= 0
+
+    def __iter__(self) -> Generator:
+        """
+        Iterates through the keys in the slot order.
+
+        Returns
+        -------
+        Generator
+            A generator of the keys.
+        """
+        for key in self._keys:
+            if key is not _FREE:
+                yield key
+
+    def items(self) -> Generator:
+        """
+        Iterates through the key-value pairs in the slot order.
+
+        Returns
+        -------
+        Generator
+            A generator of the (key, value) tuples.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _FREE:
+                yield key, value
+
+    def to_dict(self) -> dict[Hashable, Any]:
+        """
+        Returns a dictionary representation of the hash table.
+
+        Returns
+        -------
+        dict[Hashable, Any]
+            A dictionary containing the key-value pairs.
+        """
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, dictionary: dict) -> 'HashTable_robinhood':
+        """
+        Creates a new HashTable_robinhood object from a dictionary.
+
+        Parameters
+        ----------
+        dictionary : dict
+            The dictionary to create the hash table from.
+
+        Returns
+        -------
+        HashTable_robinhood
+            A new hash table with the contents of the dictionary.
+        """
+        result = cls(capacity=len(dictionary))
+        for key, value in dictionary.items():
+            result[key] = value
+        return result
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the hash table.
+
+        Returns
+        -------
+        str
+            A string representation of the hash table as a dictionary.
+        """
+        return dict.__str__(self.to_dict())
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the hash table used for printing.
+
+        Returns
+        -------
+        str
+            A string representation of the hash table as a dictionary.
+        """
+        return dict.__repr__(self.to_dict())
+
+    def __eq__(self, other: Mappable) -> bool:
+        """
+        Checks if two hash tables are equal by comparing their
+        dictionary representations.
+
+        Parameters
+        ----------
+        other : Mappable
+            Another object to compare.
+
+        Returns
+        -------
+        bool
+            True if the hash tables are equal, False otherwise.
+        """
+        return dict.__eq__(self.to_dict(), other.to_dict())
+
+
+# slots in a bucket of HashTable_cuckoo
+_BUCKET_SIZE = 4
+# buckets visited by the search of a free slot before giving up
+_BFS_LIMIT = 256
+
+
+class HashTable_cuckoo(Mappable):
+    """
+    A bucketized cuckoo hash table with a stash.
+
+    Every key has two candidate buckets of four slots each, chosen by two
+    hashes derived from its full hash. A key is always in one of its two
+    buckets or in a small stash, so a lookup reads at most eight slots and
+    the stash. The slots are flat parallel arrays: an `array('Q')` of
+    hashes and lists of keys and values, with a marker key for the empty
+    slots. The pairs of a bucket are kept in its first slots, and the number
+    of pairs in each bucket is kept in a `bytearray`, so the free slot of a
+    bucket is found without scanning it.
+
+    When both buckets of a new key are full, a breadth-first search over
+    the buckets looks for the shortest chain of keys, each movable to its
+    other bucket, that ends at a free slot. The keys are moved back along
+    the chain and the new key takes the freed slot. Four slots per bucket
+    and the search make load factors above 0.95 reachable. If no chain is
+    found, the key goes to the stash; only when the stash is full the table
+    doubles. The stored hashes are reused to place the pairs again, so the
+    hash function is not called. If the table is less than half full, or
+    the key finds no room even after doubling, more keys share its two
+    buckets than any table size helps with (the hash function is
+    degenerate), and the stash grows beyond its size instead.
+
+    Attributes
+    ----------
+    capacity : int
+        The number of slots in the buckets.
+
+    size : int
+        The number of key-value pairs.
+
+    hashfunc : str or callable
+        The hash function: 'poly', 'md5', 'sha1', 'fast64' or a callable,
+        by default the built-in hash.
+
+    stash_size : int
+        The maximum number of pairs in the stash, by default 4.
+
+    Methods
+    -------
+    __init__(self, capacity: int = 8, hashfunc: str | Callable = hash,
+             stash_size: int = 4) -> None
+        Initializes an empty table with room for capacity pairs.
+
+    __setitem__(self, key: Hashable, value: Any) -> None
+        Adds or updates a key-value pair.
+
+    __getitem__(self, key: Hashable) -> Any
+        Retrieves the value associated with a given key.
+
+    __delitem__(self, key: Hashable) -> None
+        Removes a key-value pair if the key is present.
+
+    search(self, key: Hashable) -> tuple[int, int] | bool
+        Returns the bucket and the slot of the key or False.
+
+    __contains__(self, key: Hashable) -> bool
+        Checks if a key exists in the hash table.
+
+    __len__(self) -> int
+        The number of key-value pairs.
+
+    __iter__(self) -> Generator
+        Iterates through the keys.
+
+    items(self) -> Generator
+        Iterates through the key-value pairs.
+
+    to_dict(self) -> dict
+        Returns a dictionary representation of the hash table.
+
+    from_dict(cls, dictionary: dict) -> HashTable_cuckoo
+        Creates a new hash table from a dictionary.
+
+    __str__(self) -> str
+        Returns a string representation of the hash table.
+
+    __repr__(self) -> str
+        Used for printing the contents of the hash table.
+
+    __eq__(self, other: Mappable) -> bool
+        Checks if two hash tables are equal.
+
+    """
+
+    def __init__(self, capacity: int = 8, hashfunc: str | Callable = hash,
+                 stash_size: int = 4) -> None:
+        """
+        Initializes an empty table with room for capacity pairs.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of pairs the table should take without resizing,
+            by default 8. The table gets enough buckets to hold them
+            at the load factor 0.9.
+
+        hashfunc : str or callable
+            The hash function: 'poly', 'md5', 'sha1', 'fast64' or a callable,
+            by default the built-in hash.
+
+        stash_size : int
+            The maximum number of pairs in the stash, by default 4.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        TypeError
+            If the hash function is neither acceptable nor a callable.
+        """
+        super().__init__()
+        self._hashfunc = hashfunc
+        self._hash = resolve_hash(hashfunc)
+        self._stash_size = stash_size
+        self._size = 0
+        buckets = 2
+        while buckets * _BUCKET_SIZE * 0.9 < capacity:
+            buckets *= 2
+        self._make_buckets(buckets)
+
+    def _make_buckets(self, buckets: int) -> None:
+        """
+        Creates empty buckets and an empty stash.
+
+        Parameters
+        ----------
+        buckets : int
+            The number of buckets, a power of two, at least 2.
+
+        Returns
+        -------
+        None
+        """
+        slots = buckets * _BUCKET_SIZE
+        self._hashes = array('Q', [0]) * slots
+        self._keys = [_FREE] * slots
+        self._values = [None] * slots
+        self._buckets = buckets
+        # the pairs of a bucket fill its first slots, a count per bucket
+        # tells where its free slots start
+        self._counts = bytearray(buckets)
+        # the high bits of a hash give a bucket
+        self._shift = 65 - buckets.bit_length()
+        # the pairs that found no place in their buckets,
+        # as [hash, key, value] lists
+        self._stash = []
+
+    @property
+    def size(self) -> int:
+        """
+        Property getter method for retrieving the size attribute of the
+        hash table.
+
+        Returns
+        -------
+        int
+            The number of key-value pairs currently stored in the hash table.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Property getter method for retrieving the capacity attribute
+        of the hash table.
+
+        Returns
+        -------
+        int
+            The number of slots in the buckets.
+        """
+        return self._buckets * _BUCKET_SIZE
+
+    def __len__(self) -> int:
+        """
+        The number of key-value pairs currently stored in the hash table.
+
+        Returns
+        -------
+        int
+            The size of the hash table.
+        """
+        return self._size
+
+    def _mix(self, key: Hashable) -> int:
+        """
+        Calculates the stored hash of a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be hashed.
+
+        Returns
+        -------
+        int
+            The 64-bit full hash multiplied by the Fibonacci constant.
+        """
+        return (self._hash(key) * _FIBONACCI) & _MASK64
+
+    def _candidates(self, hashed: int) -> tuple[int, int]:
+        """
+        Calculates the two buckets of a stored hash.
+
+        Parameters
+        ----------
+        hashed : int
+            The stored hash.
+
+        Returns
+        -------
+        tuple[int, int]
+            Two different buckets.
+        """
+        first = hashed >> self._shift
+        # the low bits mixed once more give the other bucket
+        second = (((hashed ^ (hashed >> 29)) * _FIBONACCI)
+                  & _MASK64) >> self._shift
+        if second == first:
+            second = first ^ 1
+        return first, second
+
+    def _find(self, key: Hashable, hashed: int) -> int:
+        """
+        Looks for a key in its two buckets.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look for.
+
+        hashed : int
+            The stored hash of the key.
+
+        Returns
+        -------
+        int
+            The slot of the key, -1 if it is not in the buckets.
+        """
+        hashes, keys, counts = self._hashes, self._keys, self._counts
+        for bucket in self._candidates(hashed):
+            start = bucket * _BUCKET_SIZE
+            for i in range(start, start + counts[bucket]):
+                if hashes[i] == hashed:
+                    found = keys[i]
+                    if found is key or found == key:
+                        return i
+        return -1
+
+    def _find_in_stash(self, key: Hashable, hashed: int) -> int:
+        """
+        Looks for a key in the stash.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look for.
+
+        hashed : int
+            The stored hash of the key.
+
+        Returns
+        -------
+        int
+            The position of the key in the stash, -1 if it is absent.
+        """
+        for position, (stored, found, _) in enumerate(self._stash):
+            if stored == hashed and (found is key or found == key):
+                return position
+        return -1
+
+    def _make_room(self, hashed: int) -> int:
+        """
+        Frees a slot in one of the buckets of a hash, moving other pairs
+        to their other buckets along the shortest chain.
+
+        Parameters
+        ----------
+        hashed : int
+            The stored hash of the key to be put.
+
+        Returns
+        -------
+        int
+            The free slot, -1 if no chain was found within the search
+            limit.
+        """
+        hashes, keys, values = self._hashes, self._keys, self._values
+        counts, candidates = self._counts, self._candidates
+        # the slot whose pair moves into a bucket, None for the roots
+        parent = dict.fromkeys(candidates(hashed))
+        queue = deque(parent)
+        while queue and len(parent) < _BFS_LIMIT:
+            bucket = queue.popleft()
+            start = bucket * _BUCKET_SIZE
+            for i in range(start, start + _BUCKET_SIZE):
+                first, second = candidates(hashes[i])
+                other = second if first == bucket else first
+                if other in parent:
+                    continue
+                if counts[other] == _BUCKET_SIZE:
+                    parent[other] = i
+                    queue.append(other)
+                    continue
+                free = other * _BUCKET_SIZE + counts[other]
+                counts[other] += 1
+                # move the pairs along the chain, from its end, every
+                # bucket but the last keeps its count
+                while i is not None:
+                    hashes[free], keys[free], values[free] = \
+                        hashes[i], keys[i], values[i]
+                    free = i
+                    i = parent[i // _BUCKET_SIZE]
+                return free
+        return -1
+
+    def _put(self, hashed: int, key: Hashable, value: Any) -> bool:
+        """
+        Puts an absent key into its buckets or the stash.
+
+        Parameters
+        ----------
+        hashed : int
+            The stored hash of the key.
+
+        key : Hashable
+            The key.
+
+        value : Any
+            The value.
+
+        Returns
+        -------
+        bool
+            False if there was no room, even in the stash.
+        """
+        counts = self._counts
+        for bucket in self._candidates(hashed):
+            if counts[bucket] < _BUCKET_SIZE:
+                i = bucket * _BUCKET_SIZE + counts[bucket]
+                counts[bucket] += 1
+                break
+        else:
+            i = self._make_room(hashed)
+        if i >= 0:
+            self._hashes[i], self._keys[i], self._values[i] = \
+                hashed, key, value
+            return True
+        if len(self._stash) < self._stash_size:
+            self._stash.append([hashed, key, value])
+            return True
+        return False
+
+    def _resize(self, buckets: int) -> None:
+        """
+        Moves the pairs into the given number of buckets.
+
+        The stored hashes are reused, so the hash function is not called.
+        A pair without room goes to the stash even if the stash is full.
+
+        Parameters
+        ----------
+        buckets : int
+            The new number of buckets, a power of two, at least 2.
+
+        Returns
+        -------
+        None
+        """
+        pairs = [(hashed, key, value) for hashed, key, value
+                 in zip(self._hashes, self._keys, self._values)
+                 if key is not _FREE]
+        pairs.extend(tuple(pair) for pair in self._stash)
+        self._make_buckets(buckets)
+        for hashed, key, value in pairs:
+            if not self._put(hashed, key, value):
+                self._stash.append([hashed, key, value])
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """
+        Adds or updates (if already taken)
+        a key-value pair to the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be added.
+
+        value : Any
+            The value associated with the key.
+
+        Returns
+        -------
+        None
+        """
+        hashed = self._mix(key)
+        i = self._find(key, hashed)
+        if i >= 0:
+            self._values[i] = value
+            return
+        if self._stash:
+            position = self._find_in_stash(key, hashed)
+            if position >= 0:
+                self._stash[position][2] = value
+                return
+        if not self._put(hashed, key, value):
+            placed = False
+            if 2 * self._size >= self.capacity:
+                self._resize(self._buckets * 2)
+                placed = self._put(hashed, key, value)
+            if not placed:
+                # more keys share their two buckets than a bigger table
+                # would help with, the stash outgrows its size
+                self._stash.append([hashed, key, value])
+        self._size += 1
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieves the value associated with a given key from the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for which to retrieve the value.
+
+        Returns
+        -------
+        Any
+            The value associated with the key.
+
+        Raises
+        ------
+            KeyError: If the key is not found in the hash table.
+        """
+        hashed = self._mix(key)
+        i = self._find(key, hashed)
+        if i >= 0:
+            return self._values[i]
+        if self._stash:
+            position = self._find_in_stash(key, hashed)
+            if position >= 0:
+                return self._stash[position][2]
+        raise KeyError('no value for corresponding key present')
+
+    def __delitem__(self, key: Hashable) -> None:
+        """
+        Removes a key-value pair from the hash table.
+
+        Nothing happens if the key is absent, as in HashTable_closed.
+        The freed slot is offered to the pairs of the stash.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to be removed.
+
+        Returns
+        -------
+        None
+        """
+        hashed = self._mix(key)
+        i = self._find(key, hashed)
+        if i >= 0:
+            hashes, keys, values = self._hashes, self._keys, self._values
+            # the last pair of the bucket fills the hole
+            bucket = i // _BUCKET_SIZE
+            self._counts[bucket] -= 1
+            last = bucket * _BUCKET_SIZE + self._counts[bucket]
+            hashes[i], keys[i], values[i] = hashes[last], keys[last], \
+                values[last]
+            hashes[last], keys[last], values[last] = 0, _FREE, None
+            # a stashed pair of this bucket can take the freed slot
+            for position, pair in enumerate(self._stash):
+                if bucket in self._candidates(pair[0]):
+                    hashes[last], keys[last], values[last] = pair
+                    self._counts[bucket] += 1
+                    del self._stash[position]
+                    break
+        else:
+            position = self._find_in_stash(key, hashed) if self._stash \
+                else -1
+            if position < 0:
+                return
+            del self._stash[position]
+        self._size -= 1
+        if self._size < self.capacity // 8 and self._buckets > 2:
+            self._resize(self._buckets // 2)
+
+    def search(self, key: Hashable) -> tuple[int, int] | bool:
+        """
+        Searches for a key in the hash table and returns its bucket and
+        slot in the bucket if found, or False if not found.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to search for.
+
+        Returns
+        -------
+        tuple[int, int] or False
+            The bucket and the slot of the key, (-1, position in the stash)
+            for a stashed key, or False if not found.
+        """
+        hashed = self._mix(key)
+        i = self._find(key, hashed)
+        if i >= 0:
+            return divmod(i, _BUCKET_SIZE)
+        position = self._find_in_stash(key, hashed)
+        return (-1, position) if position >= 0 else False
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks if a key exists in the hash table.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to check for existence.
+
+        Returns
+        -------
+        bool
+            True if the key exists in the hash table, False otherwise.
+        """
+        return self.search(key) is not False
+
+    def __iter__(self) -> Generator:
+        """
+        Iterates through the keys, the stashed ones last.
+
+        Returns
+        -------
+        Generator
+            A generator of the keys.
+        """
+        for key, _ in self.items():
+            yield key
+
+    def items(self) -> Generator:
+        """
+        Iterates through the key-value pairs, the stashed ones last.
+
+        Returns
+        -------
+        Generator
+            A generator of the (key, value) tuples.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _FREE:
+                yield key, value
+        for _, key, value in self._stash:
+            yield key, value
+
+    def to_dict(self) -> dict[Hashable, Any]:
+        """
+        Returns a dictionary representation of the hash table.
+
+        Returns
+        -------
+        dict[Hashable, Any]
+            A dictionary containing the key-value pairs.
+        """
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, dictionary: dict) -> 'HashTable_cuckoo':
+        """
+        Creates a new HashTable_cuckoo object from a dictionary.
+
+        Parameters
+        ----------
+        dictionary : dict
+            The dictionary to create the hash table from.
+
+        Returns
+        -------
+        HashTable_cuckoo
+            A new hash table with the contents of the dictionary.
+        """
+        result = cls(capacity=len(dictionary))
+        for key, value in dictionary.items():
+            result[key] = value
+        return result
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the hash table.
+
+        Returns
+        -------
+        str
+            A string representation of the hash table as a dictionary.
+        """
+        return dict.__str__(self.to_dict())
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the hash table used for printing.
+
+        Returns
+        -------
+        str
+            A string representation of the hash table as a dictionary.
+        """
+        return dict.__repr__(self.to_dict())
+
+    def __eq__(self, other: Mappable) -> bool:
+        """
+        Checks if two hash tables are equal by comparing their
+        dictionary representations.
+
+        Parameters
+        ----------
+        other : Mappable
+            Another object to compare.
+
+        Returns
+        -------
+        bool
+            True if the hash tables are equal, False otherwise.
+        """
+        return dict.__eq__(self.to_dict(), other.to_dict())
@@ -16,6 +16,10 @@ Heap
     the heap. It provides methods for insertion, removal of the minimum
     element, and other heap-related operations.
 
+BoundedHeap
+    A fixed-capacity min-heap keeping the k largest elements of a stream,
+    also available as `TopK`.
+
 Functions
 ---------
 heap_sort(array: list[float]) -> list[float]
@@ -32,9 +36,19 @@ sift_down(array: list[float], element_index: int) -> None
 """
 
 
+import logging
+
 from Algorithms_Python.vector import Vector
 
 
+try:
+    import numpy as np
+except ImportError:
+    logging.info('numpy cannot be imported, BoundedHeap.offer_many ' +
+                 'will check batches element by element')
+    np = None
+
+
 class Heap(Vector):
     """
     A binary tree-based min-heap data structure.
@@ -279,6 +293,202 @@ class Heap(Vector):
         return self.remove_min()
 
 
+class BoundedHeap(Heap):
+    """
+    A fixed-capacity min-heap keeping the k largest elements of a stream.
+
+    The root of the full heap is the smallest of the kept elements, so it
+    is the threshold a new element has to exceed to get in. Elements not
+    exceeding the threshold are rejected in O(1), others replace the root
+    in O(log k). Memory stays O(k) whatever the stream length.
+
+    Attributes
+    ----------
+    k : int
+        The maximum number of elements kept.
+
+    Methods
+    -------
+    __init__(self, k: int, elements: list[float] | None = None) -> None
+        Initialize the bounded heap.
+
+    threshold(self) -> float | None
+        Property. The smallest kept element if the heap is full,
+        None otherwise.
+
+    offer(self, x: float) -> bool
+        Offer an element to the heap.
+
+    offer_many(self, elements: Iterable[float] | numpy.ndarray) -> int
+        Offer a batch of elements to the heap.
+
+    top(self) -> list[float]
+        Return the kept elements sorted in descending order.
+
+    """
+
+    def __init__(self, k: int, elements: list[float] | None = None) -> None:
+        """
+        Initialize a new BoundedHeap instance.
+
+        Parameters
+        ----------
+        k : int
+            The maximum number of elements kept.
+
+        elements : list or None, optional
+            An optional list of initial elements to be offered,
+            by default None.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if k is not positive.
+
+        """
+        if k <= 0:
+            raise ValueError('k has to be positive')
+        super().__init__()
+        self.k = k
+        if elements is not None:
+            self.offer_many(elements)
+
+    @property
+    def threshold(self) -> float | None:
+        """
+        The smallest kept element if the heap is full, None otherwise.
+
+        Returns
+        -------
+        float | None
+            The value a new element has to exceed to be kept.
+
+        """
+        return self.elements[0] if self.size >= self.k else None
+
+    def offer(self, x: float) -> bool:
+        """
+        Offer an element to the heap.
+
+        The element is inserted while the heap is not full. Afterwards it
+        replaces the root only if it exceeds the threshold.
+
+        Parameters
+        ----------
+        x : float
+            The element to offer.
+
+        Returns
+        -------
+        bool
+            True if the element was kept, False if it was rejected.
+
+        """
+        if self.size < self.k:
+            self.insert(x)
+            return True
+        if x <= self.elements[0]:
+            return False
+        self.elements[0] = x
+        sift_down(self.elements, 0, self.size)
+        return True
+
+    def offer_many(self, elements) -> int:
+        """
+        Offer a batch of elements to the heap.
+
+        For NumPy arrays the batch is prefiltered in a vectorized way:
+        only the elements exceeding the current threshold are left, and
+        of those only the k largest are offered one by one. Since the
+        threshold never decreases, the prefilter rejects nothing that
+        would have been kept.
+
+        Parameters
+        ----------
+        elements : Iterable[float] or numpy.ndarray
+            The elements to offer.
+
+        Returns
+        -------
+        int
+            The number of elements of the batch in the heap after the call,
+            the same for both ways. Of equal elements the ones kept before
+            the call are counted first.
+
+        """
+        # the kept batch elements by value, an evicted root is taken
+        # from them first
+        batch = {}
+        if np is not None and isinstance(elements, np.ndarray):
+            elements = elements.ravel()
+            # fill the heap up to k first - everything gets in anyway
+            free = min(self.k - self.size, elements.size)
+            self._offer_counted(elements[:free].tolist(), batch)
+            rest = elements[free:]
+            if rest.size:
+                rest = rest[rest > self.elements[0]]
+            if rest.size > self.k:
+                cut = rest.size - self.k
+                rest = np.partition(rest, cut)[cut:]
+            elements = rest.tolist()
+        self._offer_counted(elements, batch)
+        return sum(batch.values())
+
+    def _offer_counted(self, elements, batch: dict) -> None:
+        """
+        Offer elements one by one and count the kept ones by value.
+
+        Parameters
+        ----------
+        elements : Iterable[float]
+            The elements to offer.
+
+        batch : dict
+            The counts of the kept elements of the batch by value,
+            updated in place.
+
+        Returns
+        -------
+        None
+
+        """
+        heap = self.elements
+        for x in elements:
+            if self.size < self.k:
+                self.insert(x)
+                heap = self.elements
+            elif x > heap[0]:
+                if batch.get(heap[0]):
+                    batch[heap[0]] -= 1
+                heap[0] = x
+                sift_down(heap, 0, self.size)
+            else:
+                continue
+            batch[x] = batch.get(x, 0) + 1
+
+    def top(self) -> list[float]:
+        """
+        Return the kept elements sorted in descending order.
+
+        The elements are copied and sorted with `heap_sort`,
+        the heap itself is not changed.
+
+        Returns
+        -------
+        list[float]
+            The kept elements, the largest first.
+
+        """
+        return heap_sort(self.elements[:self.size])[::-1]
+
+
+TopK = BoundedHeap
+
+
 def sift_up(a: list[float], i: int) -> None:
     """
     Perform the sift-up operation to maintain heap property.
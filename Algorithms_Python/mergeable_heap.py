@@ -0,0 +1,559 @@
+"""
+Mergeable Heaps
+===============
+
+A module implementing pointer-based min-heaps which can be melded together
+cheaply. Unlike the array-based `Heap` (where merging two heaps means
+popping from one and inserting into another, O(n log n) in total),
+these heaps merge by relinking roots.
+Both heaps share the public interface of `Heap` (`insert`, `append`,
+`remove_min`, `erase`, `size`, `__len__`), so they can replace it where
+it is used today.
+
+Classes
+-------
+MergeableHeap
+    Base class holding the interface shared by the mergeable heaps.
+
+PairingHeap
+    A pairing heap with O(1) `insert`, `meld` and `find_min` and
+    O(log n) amortized `remove_min`.
+
+LeftistHeap
+    A leftist heap with O(log n) worst-case `insert`, `meld` and
+    `remove_min` and O(1) `find_min`.
+
+PairingNode
+    A node of the pairing heap, extending Node with a link to the
+    leftmost child.
+
+LeftistNode
+    A node of the leftist heap, extending TreeNode with its rank.
+
+"""
+
+
+from typing import Any
+
+from Algorithms_Python.Node import Node
+from Algorithms_Python.bst import TreeNode
+
+
+class PairingNode(Node):
+    """
+    Node of the pairing heap.
+
+    The node keeps its siblings in a one-way chain through the inherited
+    `next_node` and points to the leftmost of its own children through
+    `child`.
+
+    Attributes
+    ----------
+    child: PairingNode or None
+        The leftmost child of the node, None if the node is a leaf.
+
+    """
+
+    __slots__ = ('child',)
+
+    def __init__(self, data: Any = None) -> None:
+        """
+        Initialize a PairingNode with data and no children or siblings.
+
+        Parameters
+        ----------
+        data: Any
+            The data to be stored in the node.
+
+        Returns
+        -------
+        None
+
+        """
+        super().__init__(data=data)
+        self.child = None
+
+
+class LeftistNode(TreeNode):
+    """
+    Node of the leftist heap.
+
+    Attributes
+    ----------
+    rank: int
+        Length of the rightmost path from the node down to a missing child
+        (the s-value). The leftist property keeps the rank of the left
+        child not less than the rank of the right one.
+
+    """
+
+    __slots__ = ('rank',)
+
+    def __init__(self, data: int | float) -> None:
+        """
+        Initialize a LeftistNode with data and rank 1.
+
+        Parameters
+        ----------
+        data: int | float
+            The data to be stored in the node.
+
+        Returns
+        -------
+        None
+
+        """
+        super().__init__(data)
+        self.rank = 1
+
+
+class MergeableHeap:
+    """
+    Base class for the pointer-based min-heaps supporting `meld`.
+
+    Subclasses define how a node is created (`_new_node`), how two heaps
+    are merged (`_merge`) and how the children of a removed root are
+    merged back into one heap (`_merge_children`).
+
+    Attributes
+    ----------
+    root: node or None
+        The node holding the minimum element, None if the heap is empty.
+
+    size: int
+        The number of elements in the heap.
+
+    Methods
+    -------
+    __init__(self, elements: list[float] | None = None) -> None
+        Initialize the heap, optionally inserting the elements given.
+
+    __len__(self) -> int
+        Return the number of elements in the heap.
+
+    insert(self, x: float) -> None
+        Insert an element into the heap.
+
+    append(self, x: float) -> None
+        Alias for `insert`.
+
+    find_min(self) -> float | None
+        Return the minimum element without removing it.
+
+    remove_min(self) -> float
+        Remove and return the minimum element.
+
+    erase(self) -> float
+        Alias for `remove_min`.
+
+    meld(self, other: MergeableHeap) -> None
+        Move all elements of other heap of the same kind into this one.
+
+    """
+
+    def __init__(self, elements: list[float] | None = None) -> None:
+        """
+        Initialize the heap.
+
+        Parameters
+        ----------
+        elements: list or None, optional
+            An optional list of initial elements for the heap,
+            by default None.
+
+        Returns
+        -------
+        None
+
+        """
+        self.root = None
+        self.size = 0
+        if elements is not None:
+            for i in elements:
+                self.insert(i)
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the heap.
+
+        Returns
+        -------
+        int
+            The number of elements in the heap.
+
+        """
+        return self.size
+
+    def _new_node(self, x: Any):
+        """
+        Create a node holding x. Defined by subclasses.
+
+        Parameters
+        ----------
+        x: Any
+            The data for the node.
+
+        Raises
+        ------
+        NotImplementedError
+            Always, the base class has no node type.
+
+        """
+        raise NotImplementedError('node type is defined by subclasses')
+
+    def _merge(self, first, second):
+        """
+        Merge two heaps given by their roots. Defined by subclasses.
+
+        Parameters
+        ----------
+        first: node or None
+            The root of the first heap.
+
+        second: node or None
+            The root of the second heap.
+
+        Raises
+        ------
+        NotImplementedError
+            Always, the base class has no merge strategy.
+
+        """
+        raise NotImplementedError('merging is defined by subclasses')
+
+    def _merge_children(self, node):
+        """
+        Merge the children of a removed root. Defined by subclasses.
+
+        Parameters
+        ----------
+        node: node
+            The removed root.
+
+        Raises
+        ------
+        NotImplementedError
+            Always, the base class has no merge strategy.
+
+        """
+        raise NotImplementedError('merging is defined by subclasses')
+
+    def insert(self, x: float) -> None:
+        """
+        Insert an element into the heap by melding it as a one-node heap.
+
+        Parameters
+        ----------
+        x: float
+            The element to insert into the heap.
+
+        Returns
+        -------
+        None
+
+        """
+        self.root = self._merge(self.root, self._new_node(x))
+        self.size += 1
+
+    def append(self, x: float) -> None:
+        """
+        Append an element to the heap.
+
+        This method is an alias for `insert`.
+
+        Parameters
+        ----------
+        x: float
+            The element to append to the heap.
+
+        Returns
+        -------
+        None
+
+        """
+        self.insert(x)
+
+    def find_min(self) -> float | None:
+        """
+        Return the minimum element without removing it.
+
+        Returns
+        -------
+        float | None
+            The minimum element, None if the heap is empty.
+
+        """
+        return self.root.data if self.root is not None else None
+
+    def remove_min(self) -> float:
+        """
+        Remove and return the minimum element from the heap.
+
+        Returns
+        -------
+        float
+            The minimum element in the heap.
+
+        Raises
+        ------
+        IndexError
+            Raised if the heap is empty.
+
+        """
+        if self.root is None:
+            raise IndexError('remove_min from empty heap')
+        _return = self.root.data
+        self.root = self._merge_children(self.root)
+        self.size -= 1
+        return _return
+
+    def erase(self) -> float:
+        """
+        Alias for `remove_min`.
+
+        Returns
+        -------
+        float
+            The minimum element in the heap.
+
+        """
+        return self.remove_min()
+
+    def meld(self, other: 'MergeableHeap') -> None:
+        """
+        Move all elements of other heap into this one.
+
+        The nodes of other heap are relinked, not copied, so after
+        the call other heap is empty.
+
+        Parameters
+        ----------
+        other: MergeableHeap
+            The heap of the same class to be melded into this one.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        TypeError
+            Raised if other heap is of a different class, since nodes
+            of different heaps keep different bookkeeping.
+
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError(f'cannot meld {other.__class__.__name__} ' +
+                            f'into {self.__class__.__name__}')
+        if other is self:
+            return
+        self.root = self._merge(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+
+class PairingHeap(MergeableHeap):
+    """
+    Pairing heap.
+
+    A heap-ordered multiway tree where two heaps are linked by making
+    the root with the larger element the leftmost child of the other root.
+    The children of a removed root are merged in two passes: first
+    neighbouring pairs are linked left to right, then the results are
+    linked right to left. This gives O(1) `insert` and `meld` and
+    O(log n) amortized `remove_min`.
+
+    Methods
+    -------
+    _new_node(self, x: Any) -> PairingNode
+        Create a node for the pairing heap.
+
+    _merge(self, first: PairingNode | None, second: PairingNode | None)
+        -> PairingNode | None
+        Link two heaps in O(1).
+
+    _merge_children(self, node: PairingNode) -> PairingNode | None
+        Merge the children of a removed root with the two-pass pairing.
+
+    """
+
+    def _new_node(self, x: Any) -> PairingNode:
+        """
+        Create a node for the pairing heap.
+
+        Parameters
+        ----------
+        x: Any
+            The data for the node.
+
+        Returns
+        -------
+        PairingNode
+            The new node.
+
+        """
+        return PairingNode(x)
+
+    def _merge(self, first: PairingNode | None,
+               second: PairingNode | None) -> PairingNode | None:
+        """
+        Link two heaps, making the larger root the leftmost child of
+        the smaller one.
+
+        Parameters
+        ----------
+        first: PairingNode or None
+            The root of the first heap.
+
+        second: PairingNode or None
+            The root of the second heap.
+
+        Returns
+        -------
+        PairingNode or None
+            The root of the linked heap.
+
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second.data < first.data:
+            first, second = second, first
+        second._next_node = first.child
+        first.child = second
+        return first
+
+    def _merge_children(self, node: PairingNode) -> PairingNode | None:
+        """
+        Merge the children of a removed root with the two-pass pairing.
+
+        Parameters
+        ----------
+        node: PairingNode
+            The removed root.
+
+        Returns
+        -------
+        PairingNode or None
+            The root of the heap made of the children.
+
+        """
+        # first pass - link siblings pairwise from left to right
+        pairs = []
+        current = node.child
+        while current is not None:
+            second = current._next_node
+            if second is None:
+                current._next_node = None
+                pairs.append(current)
+                break
+            following = second._next_node
+            current._next_node = None
+            second._next_node = None
+            pairs.append(self._merge(current, second))
+            current = following
+
+        # second pass - link the results from right to left
+        result = None
+        for pair in reversed(pairs):
+            result = self._merge(pair, result)
+        return result
+
+
+class LeftistHeap(MergeableHeap):
+    """
+    Leftist heap.
+
+    A heap-ordered binary tree where the rank of every left child is not
+    less than the rank of its right sibling, so the rightmost path has
+    at most log2(n + 1) nodes. Merging walks only the rightmost paths,
+    which gives O(log n) worst-case `insert`, `meld` and `remove_min`.
+
+    Methods
+    -------
+    _new_node(self, x: Any) -> LeftistNode
+        Create a node for the leftist heap.
+
+    _merge(self, first: LeftistNode | None, second: LeftistNode | None)
+        -> LeftistNode | None
+        Merge two heaps along their rightmost paths.
+
+    _merge_children(self, node: LeftistNode) -> LeftistNode | None
+        Merge the subtrees of a removed root.
+
+    """
+
+    def _new_node(self, x: Any) -> LeftistNode:
+        """
+        Create a node for the leftist heap.
+
+        Parameters
+        ----------
+        x: Any
+            The data for the node.
+
+        Returns
+        -------
+        LeftistNode
+            The new node.
+
+        """
+        return LeftistNode(x)
+
+    def _merge(self, first: LeftistNode | None,
+               second: LeftistNode | None) -> LeftistNode | None:
+        """
+        Merge two heaps along their rightmost paths.
+
+        The recursion depth is bounded by the sum of the rightmost path
+        lengths, that is O(log n).
+
+        Parameters
+        ----------
+        first: LeftistNode or None
+            The root of the first heap.
+
+        second: LeftistNode or None
+            The root of the second heap.
+
+        Returns
+        -------
+        LeftistNode or None
+            The root of the merged heap.
+
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second.data < first.data:
+            first, second = second, first
+        first.children[1] = self._merge(first.children[1], second)
+        left, right = first.children
+        left_rank = left.rank if left is not None else 0
+        right_rank = right.rank if right is not None else 0
+        # restore the leftist property
+        if left_rank < right_rank:
+            first.children[0], first.children[1] = right, left
+            left_rank, right_rank = right_rank, left_rank
+        first.rank = right_rank + 1
+        return first
+
+    def _merge_children(self, node: LeftistNode) -> LeftistNode | None:
+        """
+        Merge the subtrees of a removed root.
+
+        Parameters
+        ----------
+        node: LeftistNode
+            The removed root.
+
+        Returns
+        -------
+        LeftistNode or None
+            The root of the heap made of the subtrees.
+
+        """
+        return self._merge(node.children[0], node.children[1])
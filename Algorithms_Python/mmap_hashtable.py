@@ -0,0 +1,948 @@
+"""
+Memory-Mapped Hash Table
+========================
+
+This module implements a persistent hash table kept in a file and
+accessed through `mmap`. Opening a table maps the file and reads a fixed
+header, so it takes O(1) time whatever the size of the table: nothing is
+deserialized, the pages are read by the operating system when they are
+touched.
+
+The table uses open addressing with linear probing. A slot holds the
+64-bit `hash64` of the key (0 marks an empty slot and 1 a deleted one)
+followed by either
+
+- the key and the value themselves, when both have a fixed width given
+  at creation, or
+- the offset of a length-prefixed record of the key and the value in
+  a heap after the slots, for keys and values of any length.
+
+Keys and values are bytes, str keys and values are encoded in UTF-8.
+
+Any number of processes may read a table while one process writes to it.
+The writer locks the file (with `fcntl.flock` where available) and wraps
+every change in a sequence number: it is made odd before the change and
+even after it, and a reader retries a lookup which saw an odd or changed
+number. When the table is full, the writer builds a table with twice as
+many slots (or twice the heap) in a new file, moves it over the old one
+with `os.replace` and marks the old file stale. Readers notice the mark
+and reopen the path. A new empty table replaces an existing file the same
+way, once the lock of its writer is taken.
+
+Classes
+-------
+MmapHashTable
+    A persistent open addressing hash table in a memory-mapped file.
+
+"""
+
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Generator
+
+from Algorithms_Python.hash_functions import hash64
+
+try:
+    import fcntl
+except ImportError:
+    logging.info('fcntl cannot be imported, MmapHashTable will not ' +
+                 'lock out a second writer')
+    fcntl = None
+
+
+_MAGIC = b'APYHASH1'
+# header layout, the data starts on its own cache line
+_SLOTS = 8
+_SIZE = 16
+_USED = 24
+_KEY_SIZE = 32
+_VALUE_SIZE = 40
+_HEAP_END = 48
+_SEQUENCE = 56
+_STALE = 64
+_DATA = 128
+
+_WORD = struct.Struct('<Q')
+# the lengths of the key and the value of a heap record
+_RECORD = struct.Struct('<II')
+# the hashes of the empty and the deleted slots
+_EMPTY = 0
+_DELETED = 1
+# the maximum share of used (live or deleted) slots
+_MAX_LOAD = 0.75
+
+
+def _create(path: str, slots: int, key_size: int, value_size: int,
+            heap: int) -> None:
+    """
+    Create the file of an empty table.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file, an existing file is overwritten.
+
+    slots: int
+        The number of slots, a power of two.
+
+    key_size: int
+        The width of the keys, 0 for keys of any length.
+
+    value_size: int
+        The width of the values, 0 for values of any length.
+
+    heap: int
+        The size of the heap of records in bytes.
+
+    Returns
+    -------
+    None
+
+    """
+    slot_size = 8 + (key_size + value_size if key_size else 8)
+    heap_start = _DATA + slots * slot_size
+    with open(path, 'wb') as file:
+        file.truncate(heap_start + heap)
+        file.write(_MAGIC)
+        for value in (slots, 0, 0, key_size, value_size, heap_start):
+            file.write(_WORD.pack(value))
+
+
+class MmapHashTable:
+    """
+    Persistent open addressing hash table in a memory-mapped file.
+
+    The table is opened with one of the flags of `dbm`: 'r' to read an
+    existing table, 'w' to read and write it, 'c' to create it if it
+    does not exist and 'n' to always create a new empty one.
+
+    Attributes
+    ----------
+    path: str
+        The path of the file.
+
+    key_size: int
+        The width of the keys, 0 for keys of any length.
+
+    value_size: int
+        The width of the values, 0 for values of any length.
+
+    capacity: int
+        The number of slots.
+
+    Methods
+    -------
+    __init__(self, path, flag: str = 'r', key_size: int = 0,
+             value_size: int = 0, capacity: int = 1024) -> None
+        Open or create a table.
+
+    __len__(self) -> int
+        Return the number of key-value pairs.
+
+    __getitem__(self, key) -> bytes
+        Retrieve the value of a key.
+
+    get(self, key, default=None) -> Any
+        Retrieve the value of a key or a default.
+
+    __contains__(self, key) -> bool
+        Check if a key is present.
+
+    __setitem__(self, key, value) -> None
+        Add or update a key-value pair.
+
+    __delitem__(self, key) -> None
+        Remove a key-value pair.
+
+    items(self) -> list[tuple[bytes, bytes]]
+        Return all key-value pairs.
+
+    flush(self) -> None
+        Write the changes to the file.
+
+    close(self) -> None
+        Unmap and close the file.
+
+    """
+
+    def __init__(self, path: str | os.PathLike, flag: str = 'r',
+                 key_size: int = 0, value_size: int = 0,
+                 capacity: int = 1024) -> None:
+        """
+        Open or create a table.
+
+        Parameters
+        ----------
+        path: str or os.PathLike
+            The path of the file.
+
+        flag: str, optional
+            'r' (default) to read an existing table, 'w' to read and
+            write it, 'c' to create it if it does not exist, 'n' to
+            create a new empty one.
+
+        key_size: int, optional
+            The width of the keys of a new table, by default 0 (keys of
+            any length). Ignored when opening a table.
+
+        value_size: int, optional
+            The width of the values of a new table, by default 0 (values
+            of any length). Both sizes are fixed or neither.
+
+        capacity: int, optional
+            The number of pairs a new table holds before it grows,
+            by default 1024.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the flag is unknown, only one of the sizes is
+            fixed or the file does not hold a table.
+
+        BlockingIOError
+            Raised if another process has the table open for writing.
+
+        """
+        if flag not in ('r', 'w', 'c', 'n'):
+            raise ValueError("flag should be one of 'r', 'w', 'c' and 'n'")
+        self.path = os.fspath(path)
+        self._writable = flag != 'r'
+        self._mm = self._file = None
+        if flag == 'n' or flag == 'c' and not os.path.exists(self.path):
+            if key_size < 0 or value_size < 0 \
+                    or (key_size == 0) != (value_size == 0):
+                raise ValueError('key_size and value_size should be both ' +
+                                 'positive or both 0')
+            slots = 8
+            while slots * _MAX_LOAD < capacity:
+                slots *= 2
+            self._open_new(slots, key_size, value_size,
+                           0 if key_size else max(4096, 64 * capacity))
+        else:
+            self._open()
+
+    def _open_new(self, slots: int, key_size: int, value_size: int,
+                  heap: int) -> None:
+        """
+        Create an empty table aside, open it and move it to the path.
+
+        The file at the path is locked first and never truncated, so a
+        writer of it is not cut short and its readers reopen the path
+        like after a growth.
+
+        Parameters
+        ----------
+        slots: int
+            The number of slots, a power of two.
+
+        key_size: int
+            The width of the keys, 0 for keys of any length.
+
+        value_size: int
+            The width of the values, 0 for values of any length.
+
+        heap: int
+            The size of the heap of records in bytes.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        BlockingIOError
+            Raised if another process has the table open for writing.
+
+        """
+        old = None
+        if os.path.exists(self.path):
+            old = open(self.path, 'r+b')
+        try:
+            if old is not None and fcntl is not None:
+                fcntl.flock(old.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # a name of its own for every thread creating the table
+            path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.new'
+            try:
+                _create(path, slots, key_size, value_size, heap)
+                self._open(path)
+                os.replace(path, self.path)
+            except BaseException:
+                self.close()
+                os.unlink(path)
+                raise
+            if old is not None and old.read(8) == _MAGIC \
+                    and os.fstat(old.fileno()).st_size >= _DATA:
+                # the readers of the old file reopen the path
+                old.seek(_STALE)
+                old.write(_WORD.pack(1))
+        finally:
+            if old is not None:
+                old.close()
+
+    def _open(self, path: str | None = None) -> None:
+        """
+        Open and map the file at the path.
+
+        Parameters
+        ----------
+        path: str or None, optional
+            The file to open, by default None (the path of the table).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the file does not hold a table.
+
+        BlockingIOError
+            Raised if another process has the table open for writing.
+
+        """
+        path = self.path if path is None else path
+        file = open(path, 'r+b' if self._writable else 'rb')
+        try:
+            if self._writable and fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE
+                           if self._writable else mmap.ACCESS_READ)
+        except BaseException:
+            file.close()
+            raise
+        if mm[:8] != _MAGIC:
+            mm.close()
+            file.close()
+            raise ValueError(f'{path} does not hold a hash table')
+        self._file, self._mm = file, mm
+        if self._writable and self._get(_SEQUENCE) & 1:
+            # the previous writer died in the middle of a change
+            self._set(_SEQUENCE, self._get(_SEQUENCE) + 1)
+        self._load_layout()
+
+    def _load_layout(self) -> None:
+        """
+        Read the layout of the mapped table from its header.
+
+        Returns
+        -------
+        None
+
+        """
+        self._slots = self._get(_SLOTS)
+        self._mask = self._slots - 1
+        self.key_size = self._get(_KEY_SIZE)
+        self.value_size = self._get(_VALUE_SIZE)
+        self._fixed = self.key_size > 0
+        self._slot_size = 8 + (self.key_size + self.value_size
+                               if self._fixed else 8)
+        self._heap_start = _DATA + self._slots * self._slot_size
+        self._max_used = int(self._slots * _MAX_LOAD)
+
+    def _get(self, offset: int) -> int:
+        """
+        Read a 64-bit word of the mapping.
+
+        Parameters
+        ----------
+        offset: int
+            The offset of the word.
+
+        Returns
+        -------
+        int
+            The word.
+
+        """
+        return _WORD.unpack_from(self._mm, offset)[0]
+
+    def _set(self, offset: int, value: int) -> None:
+        """
+        Write a 64-bit word of the mapping.
+
+        Parameters
+        ----------
+        offset: int
+            The offset of the word.
+
+        value: int
+            The word.
+
+        Returns
+        -------
+        None
+
+        """
+        _WORD.pack_into(self._mm, offset, value)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the number of slots.
+
+        Returns
+        -------
+        int
+            The number of slots.
+
+        """
+        return self._slots
+
+    def _refresh(self) -> None:
+        """
+        Reopen the path if the writer moved a grown table over the file.
+
+        Returns
+        -------
+        None
+
+        """
+        while self._get(_STALE):
+            self._mm.close()
+            self._file.close()
+            self._open()
+
+    def _consistent(self, read) -> Any:
+        """
+        Run a read of the table which no change of the writer overlaps.
+
+        Parameters
+        ----------
+        read: Callable[[], Any]
+            The read.
+
+        Returns
+        -------
+        Any
+            The result of the read.
+
+        """
+        if self._writable:
+            return read()
+        self._refresh()
+        while True:
+            sequence = self._get(_SEQUENCE)
+            if sequence & 1:
+                # a change is in progress, let the writer finish
+                time.sleep(0)
+                continue
+            try:
+                result = read()
+            except (struct.error, ValueError, IndexError):
+                # a torn read of a changing slot, unless nothing changed
+                if self._get(_SEQUENCE) == sequence:
+                    raise
+                continue
+            if self._get(_SEQUENCE) == sequence:
+                return result
+
+    def _encode(self, data: Any, width: int, name: str) -> bytes:
+        """
+        Turn a key or a value into bytes of the width required.
+
+        Parameters
+        ----------
+        data: str or bytes-like
+            The key or the value.
+
+        width: int
+            The required length, 0 for any.
+
+        name: str
+            'key' or 'value', for the error messages.
+
+        Returns
+        -------
+        bytes
+            The bytes.
+
+        Raises
+        ------
+        TypeError
+            Raised if data is neither a str nor bytes-like.
+
+        ValueError
+            Raised if the length is not the width required.
+
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        else:
+            raise TypeError(f'{name} should be str or bytes-like')
+        if width and len(data) != width:
+            raise ValueError(f'{name} should be {width} bytes long')
+        return data
+
+    def _key(self, offset: int) -> bytes:
+        """
+        Return the key of a used slot.
+
+        Parameters
+        ----------
+        offset: int
+            The offset of the slot.
+
+        Returns
+        -------
+        bytes
+            The key.
+
+        """
+        if self._fixed:
+            return self._mm[offset + 8:offset + 8 + self.key_size]
+        record = self._get(offset + 8)
+        length = _RECORD.unpack_from(self._mm, record)[0]
+        return self._mm[record + 8:record + 8 + length]
+
+    def _value(self, offset: int) -> bytes:
+        """
+        Return the value of a used slot.
+
+        Parameters
+        ----------
+        offset: int
+            The offset of the slot.
+
+        Returns
+        -------
+        bytes
+            The value.
+
+        """
+        if self._fixed:
+            start = offset + 8 + self.key_size
+            return self._mm[start:start + self.value_size]
+        record = self._get(offset + 8)
+        key_length, length = _RECORD.unpack_from(self._mm, record)
+        start = record + 8 + key_length
+        return self._mm[start:start + length]
+
+    def _find(self, key: bytes, hashed: int) -> tuple[int, int]:
+        """
+        Find the slot of a key and the slot a new key would take.
+
+        Parameters
+        ----------
+        key: bytes
+            The key.
+
+        hashed: int
+            Its hash.
+
+        Returns
+        -------
+        tuple[int, int]
+            The offset of the slot of the key (-1 if it is absent) and
+            the offset of the first free or deleted slot on its path.
+
+        """
+        mm, get = self._mm, _WORD.unpack_from
+        i = hashed & self._mask
+        free = -1
+        while True:
+            offset = _DATA + i * self._slot_size
+            stored = get(mm, offset)[0]
+            if stored == _EMPTY:
+                return -1, free if free >= 0 else offset
+            if stored == _DELETED:
+                if free < 0:
+                    free = offset
+            elif stored == hashed and self._key(offset) == key:
+                return offset, offset
+            i = (i + 1) & self._mask
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        """
+        Return the hash of a key, never the hash of a free slot.
+
+        Parameters
+        ----------
+        key: bytes
+            The key.
+
+        Returns
+        -------
+        int
+            The 64-bit hash, at least 2.
+
+        """
+        hashed = hash64(key)
+        return hashed + 2 if hashed < 2 else hashed
+
+    def __len__(self) -> int:
+        """
+        Return the number of key-value pairs.
+
+        Returns
+        -------
+        int
+            The number of pairs.
+
+        """
+        return self._consistent(lambda: self._get(_SIZE))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Retrieve the value of a key or a default.
+
+        Parameters
+        ----------
+        key: str or bytes-like
+            The key.
+
+        default: Any, optional
+            The value for an absent key, by default None.
+
+        Returns
+        -------
+        bytes or Any
+            The value or the default.
+
+        """
+        key = self._encode(key, 0, 'key')
+        hashed = self._hash(key)
+
+        def read():
+            offset = self._find(key, hashed)[0]
+            return default if offset < 0 else self._value(offset)
+
+        return self._consistent(read)
+
+    def __getitem__(self, key: Any) -> bytes:
+        """
+        Retrieve the value of a key.
+
+        Parameters
+        ----------
+        key: str or bytes-like
+            The key.
+
+        Returns
+        -------
+        bytes
+            The value.
+
+        Raises
+        ------
+        KeyError
+            Raised if the key is absent.
+
+        """
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check if a key is present.
+
+        Parameters
+        ----------
+        key: str or bytes-like
+            The key.
+
+        Returns
+        -------
+        bool
+            True if the key is present.
+
+        """
+        return self.get(key) is not None
+
+    def _check_writable(self) -> None:
+        """
+        Make sure the table was opened for writing.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the table was opened with the flag 'r'.
+
+        """
+        if not self._writable:
+            raise ValueError('the table is opened for reading only')
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Add or update a key-value pair.
+
+        The table grows into a new file first if it has no free slot
+        or, for records of any length, no room in the heap.
+
+        Parameters
+        ----------
+        key: str or bytes-like
+            The key.
+
+        value: str or bytes-like
+            The value.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the table is opened for reading only or a fixed
+            width is not met.
+
+        """
+        self._check_writable()
+        key = self._encode(key, self.key_size, 'key')
+        value = self._encode(value, self.value_size, 'value')
+        hashed = self._hash(key)
+        offset, free = self._find(key, hashed)
+        record = 0 if self._fixed else 8 + len(key) + len(value)
+        if offset < 0 and self._get(_USED) >= self._max_used \
+                or self._get(_HEAP_END) + record > len(self._mm):
+            self._grow(record)
+            offset, free = self._find(key, hashed)
+        if self._fixed:
+            start = free + 8 + self.key_size
+            self._begin()
+            self._mm[start:start + self.value_size] = value
+        else:
+            # the record is written to free space, nothing refers to it yet
+            end = self._get(_HEAP_END)
+            _RECORD.pack_into(self._mm, end, len(key), len(value))
+            self._mm[end + 8:end + record] = key + value
+            self._set(_HEAP_END, end + record)
+            self._begin()
+            self._set(free + 8, end)
+        if offset < 0:
+            if self._fixed:
+                self._mm[free + 8:free + 8 + self.key_size] = key
+            if self._get(free) == _EMPTY:
+                self._set(_USED, self._get(_USED) + 1)
+            # the hash goes last, it makes the slot used
+            self._set(free, hashed)
+            self._set(_SIZE, self._get(_SIZE) + 1)
+        self._end()
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Remove a key-value pair.
+
+        Parameters
+        ----------
+        key: str or bytes-like
+            The key.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            Raised if the key is absent.
+
+        ValueError
+            Raised if the table is opened for reading only.
+
+        """
+        self._check_writable()
+        key = self._encode(key, 0, 'key')
+        offset = self._find(key, self._hash(key))[0]
+        if offset < 0:
+            raise KeyError(key)
+        self._begin()
+        self._set(offset, _DELETED)
+        self._set(_SIZE, self._get(_SIZE) - 1)
+        self._end()
+
+    def _begin(self) -> None:
+        """
+        Make the sequence number odd before a change.
+
+        Returns
+        -------
+        None
+
+        """
+        self._set(_SEQUENCE, self._get(_SEQUENCE) + 1)
+
+    def _end(self) -> None:
+        """
+        Make the sequence number even after a change.
+
+        Returns
+        -------
+        None
+
+        """
+        self._set(_SEQUENCE, self._get(_SEQUENCE) + 1)
+
+    def _used_slots(self) -> Generator[int, None, None]:
+        """
+        Iterate over the offsets of the slots holding pairs.
+
+        Yields
+        ------
+        int
+            The offset of a slot.
+
+        """
+        mm, get = self._mm, _WORD.unpack_from
+        for offset in range(_DATA, self._heap_start, self._slot_size):
+            if get(mm, offset)[0] > _DELETED:
+                yield offset
+
+    def items(self) -> list[tuple[bytes, bytes]]:
+        """
+        Return all key-value pairs.
+
+        Returns
+        -------
+        list[tuple[bytes, bytes]]
+            The pairs in the order of the slots.
+
+        """
+        return self._consistent(lambda: [
+            (self._key(offset), self._value(offset))
+            for offset in self._used_slots()])
+
+    def keys(self) -> list[bytes]:
+        """
+        Return all keys.
+
+        Returns
+        -------
+        list[bytes]
+            The keys in the order of the slots.
+
+        """
+        return [key for key, _ in self.items()]
+
+    def __iter__(self) -> Generator[bytes, None, None]:
+        """
+        Iterate over a snapshot of the keys.
+
+        Yields
+        ------
+        bytes
+            The keys.
+
+        """
+        yield from self.keys()
+
+    def _grow(self, record: int) -> None:
+        """
+        Move the table into a new file with room for one more pair.
+
+        The slots are doubled if more than half of them would be live,
+        otherwise the deleted slots are just dropped. The heap is
+        doubled until the live records and the new one fit.
+
+        Parameters
+        ----------
+        record: int
+            The size of the new record in the heap.
+
+        Returns
+        -------
+        None
+
+        """
+        size = self._get(_SIZE)
+        slots = self._slots
+        while size + 1 > slots * _MAX_LOAD / 2:
+            slots *= 2
+        heap = len(self._mm) - self._heap_start
+        if not self._fixed:
+            live = sum(8 + len(self._key(offset)) + len(self._value(offset))
+                       for offset in self._used_slots())
+            while live + record > heap:
+                heap *= 2
+        path = self.path + '.grow'
+        _create(path, slots, self.key_size, self.value_size, heap)
+        grown = MmapHashTable(path, 'w')
+        for offset in self._used_slots():
+            grown[self._key(offset)] = self._value(offset)
+        grown.flush()
+        os.replace(path, self.path)
+        # the readers of the old file reopen the path
+        self._set(_STALE, 1)
+        self._mm.close()
+        self._file.close()
+        # the new table keeps its lock, it is the same file now
+        self._file, self._mm = grown._file, grown._mm
+        grown._file = grown._mm = None
+        self._load_layout()
+
+    def flush(self) -> None:
+        """
+        Write the changes to the file.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._writable:
+            self._mm.flush()
+
+    def close(self) -> None:
+        """
+        Unmap and close the file, flushing the changes.
+
+        The table can not be used afterwards.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._mm is None:
+            return
+        self.flush()
+        self._mm.close()
+        self._file.close()
+        self._mm = self._file = None
+
+    def __enter__(self) -> 'MmapHashTable':
+        """
+        Enter the context, returning the table itself.
+
+        Returns
+        -------
+        MmapHashTable
+            The table.
+
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Leave the context, closing the table.
+
+        Parameters
+        ----------
+        args: tuple
+            The exception details, ignored.
+
+        Returns
+        -------
+        None
+
+        """
+        self.close()
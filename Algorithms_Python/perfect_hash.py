@@ -0,0 +1,541 @@
+"""
+Perfect Hashing
+===============
+
+This module builds minimal perfect hash functions for static key sets
+with the CHD (compress, hash and displace) algorithm. A minimal perfect
+hash function maps the n keys of a set known in advance to distinct
+slots from 0 to n - 1, so a lookup takes one hash and one probe, without
+the free slots and collision handling of `HashTable_closed` and
+`HashTable_open`.
+
+The keys are hashed once by the seeded `hash64` of `hash_functions`,
+which gives each key a bucket out of about n / 5 and two values f1 and
+f2. The keys are placed into m = n / 0.99 slots bucket by bucket, from
+the largest bucket to the smallest: the displacements d = 0, 1, ... are
+tried until the slots (f1 + (d >> 8) * f2 + (d & 255)) mod m of all keys
+of the bucket are free, and d is stored for the bucket. If some bucket
+can not be placed with a d below 2^16, everything is built again with
+the next seed. The few keys placed beyond n are then remapped to the free
+slots below n, as in PTHash, which makes the function minimal at the
+cost of a second probe for about 1% of the keys.
+
+Only the displacements and the remapped slots are kept, in arrays of
+the smallest types holding them, so the function takes about 2 to 4 bits
+per key and is serialized by `to_bytes`. The function maps a key outside
+the set to some slot as well; `StaticMap` stores the keys next to the
+values to tell them apart.
+
+Classes
+-------
+PerfectHash
+    A minimal perfect hash function of a static key set.
+
+StaticMap
+    A read-only mapping over a perfect hash function.
+
+"""
+
+
+import math
+import struct
+import sys
+from array import array
+from typing import Any, Generator, Hashable, Iterable, Mapping
+
+from Algorithms_Python.hash_functions import hash64, splitmix64
+
+
+_MAGIC = b'APYPHF01'
+# magic, number of keys, slots, buckets, seed and the typecodes of
+# the displacements and of the remapped slots
+_HEADER = struct.Struct('<8sQQQQcc')
+# the displacements tried for a bucket before a new seed is taken
+_MAX_DISPLACEMENT = 1 << 16
+_MAX_ATTEMPTS = 64
+
+
+def _compact(values: list[int]) -> array:
+    """
+    Store non-negative integers in an array of the smallest type.
+
+    Parameters
+    ----------
+    values: list[int]
+        The integers, below 2^64.
+
+    Returns
+    -------
+    array
+        The array of 1, 2, 4 or 8-byte unsigned integers.
+
+    """
+    largest = max(values, default=0)
+    return array(next(code for code in 'BHIQ'
+                      if largest < 1 << 8 * array(code).itemsize), values)
+
+
+class PerfectHash:
+    """
+    Minimal perfect hash function of a static key set built with CHD.
+
+    Attributes
+    ----------
+    size: int
+        The number of keys and of the slots they are mapped to.
+
+    seed: int
+        The seed of the hash function the build succeeded with.
+
+    Methods
+    -------
+    __init__(self, keys, load_factor: float = 0.99, bucket_size: float = 5,
+             seed: int = 0) -> None
+        Build the function of the keys.
+
+    __len__(self) -> int
+        Return the number of keys.
+
+    index(self, key) -> int
+        Return the slot of a key.
+
+    __call__(self, key) -> int
+        Return the slot of a key.
+
+    bits_per_key(self) -> float
+        Return the size of the function in bits per key.
+
+    to_bytes(self) -> bytes
+        Serialize the function.
+
+    from_bytes(cls, data) -> PerfectHash
+        Restore a serialized function.
+
+    """
+
+    def __init__(self, keys: Iterable[Hashable], load_factor: float = 0.99,
+                 bucket_size: float = 5, seed: int = 0) -> None:
+        """
+        Build the function of the keys.
+
+        Parameters
+        ----------
+        keys: Iterable[Hashable]
+            The distinct keys.
+
+        load_factor: float, optional
+            The share of the slots taken by the keys while they are
+            placed, below 1, by default 0.99. A lower one makes the build
+            faster and the remapped part larger.
+
+        bucket_size: float, optional
+            The average number of keys in a bucket, by default 5.
+            Larger buckets make the function smaller and slower to build,
+            above 5 the build tends to fail at the load factor 0.99.
+
+        seed: int, optional
+            The first seed to try, by default 0.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the keys repeat, two keys have the same hash under
+            every seed (as 'a' and b'a'), load_factor is not in (0, 1) or
+            bucket_size is below 1.
+
+        RuntimeError
+            Raised if no seed out of many gives a function.
+
+        """
+        keys = list(keys)
+        if len(set(keys)) != len(keys):
+            raise ValueError('the keys should be distinct')
+        # hash64 hashes str as its utf-8 bytes, no seed tells them apart
+        hashes = {}
+        for key in keys:
+            other = hashes.setdefault(hash64(key, seed), key)
+            if other is not key:
+                raise ValueError(f'the keys {other!r} and {key!r} ' +
+                                 'have the same hash')
+        if not 0 < load_factor < 1 or bucket_size < 1:
+            raise ValueError('load_factor should be in (0, 1) and ' +
+                             'bucket_size at least 1')
+        self.size = len(keys)
+        self._slots = math.ceil(self.size / load_factor) + 1
+        self._buckets = max(1, math.ceil(self.size / bucket_size))
+        for attempt in range(_MAX_ATTEMPTS):
+            self.seed = seed + attempt
+            taken = self._displace(keys)
+            if taken is not None:
+                break
+        else:
+            raise RuntimeError('no perfect hash function was found')
+        # the free slots below n take the keys placed beyond it
+        free = (slot for slot in range(self.size) if not taken[slot])
+        self._remap = _compact([next(free) if taken[slot] else 0
+                                for slot in range(self.size, self._slots)])
+
+    def _displace(self, keys: list) -> bytearray | None:
+        """
+        Find the displacement of every bucket with the current seed.
+
+        Parameters
+        ----------
+        keys: list
+            The keys.
+
+        Returns
+        -------
+        bytearray or None
+            The marks of the taken slots, None if some bucket could not
+            be placed. The displacements are stored in the function.
+
+        """
+        buckets = [[] for _ in range(self._buckets)]
+        for key in keys:
+            hashed = hash64(key, self.seed)
+            mixed = splitmix64(hashed)
+            buckets[hashed % self._buckets].append(
+                (mixed & 0xFFFFFFFF, mixed >> 32))
+        slots = self._slots
+        taken = bytearray(slots)
+        displacements = [0] * self._buckets
+        for number in sorted(range(self._buckets),
+                             key=lambda b: len(buckets[b]), reverse=True):
+            bucket = buckets[number]
+            if not bucket:
+                break
+            head, step = bucket[0]
+            for shift in range(_MAX_DISPLACEMENT):
+                d0, d1 = shift >> 8, shift & 255
+                # most tries fail on the first key
+                if taken[(head + d0 * step + d1) % slots]:
+                    continue
+                placed = {(first + d0 * second + d1) % slots
+                          for first, second in bucket}
+                if len(placed) == len(bucket) \
+                        and not any(taken[slot] for slot in placed):
+                    break
+            else:
+                return None
+            for slot in placed:
+                taken[slot] = 1
+            displacements[number] = shift
+        self._displacements = _compact(displacements)
+        return taken
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys.
+
+        Returns
+        -------
+        int
+            The number of keys the function was built of.
+
+        """
+        return self.size
+
+    def index(self, key: Hashable) -> int:
+        """
+        Return the slot of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key. For a key outside the set the slot is arbitrary.
+
+        Returns
+        -------
+        int
+            The slot, from 0 to size - 1, different for different keys
+            of the set.
+
+        """
+        hashed = hash64(key, self.seed)
+        mixed = splitmix64(hashed)
+        shift = self._displacements[hashed % self._buckets]
+        slot = ((mixed & 0xFFFFFFFF) + (shift >> 8) * (mixed >> 32)
+                + (shift & 255)) % self._slots
+        if slot < self.size:
+            return slot
+        return self._remap[slot - self.size]
+
+    def __call__(self, key: Hashable) -> int:
+        """
+        Return the slot of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        int
+            The slot.
+
+        """
+        return self.index(key)
+
+    def bits_per_key(self) -> float:
+        """
+        Return the size of the function in bits per key.
+
+        Returns
+        -------
+        float
+            The bits of the displacement and remapping arrays divided by
+            the number of keys.
+
+        """
+        return 8 * sum(part.itemsize * len(part) for part in
+                       (self._displacements, self._remap)) / max(self.size, 1)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the function.
+
+        Returns
+        -------
+        bytes
+            A header and the little-endian displacement and remapping
+            arrays.
+
+        """
+        parts = [self._displacements, self._remap]
+        if sys.byteorder == 'big':
+            parts = [array(part.typecode, part) for part in parts]
+            for part in parts:
+                part.byteswap()
+        return _HEADER.pack(_MAGIC, self.size, self._slots, self._buckets,
+                            self.seed, *(part.typecode.encode()
+                                         for part in parts)) \
+            + b''.join(part.tobytes() for part in parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PerfectHash':
+        """
+        Restore a serialized function without building it again.
+
+        Parameters
+        ----------
+        data: bytes
+            The result of `to_bytes`.
+
+        Returns
+        -------
+        PerfectHash
+            The function.
+
+        Raises
+        ------
+        ValueError
+            Raised if data does not hold a function.
+
+        """
+        if len(data) < _HEADER.size or data[:8] != _MAGIC:
+            raise ValueError('data does not hold a perfect hash function')
+        _, size, slots, buckets, seed, first, second = \
+            _HEADER.unpack_from(data)
+        function = cls.__new__(cls)
+        function.size, function._slots = size, slots
+        function._buckets, function.seed = buckets, seed
+        function._displacements = array(first.decode())
+        function._remap = array(second.decode())
+        start = _HEADER.size
+        for part, count in ((function._displacements, buckets),
+                            (function._remap, slots - size)):
+            end = start + count * part.itemsize
+            part.frombytes(data[start:end])
+            if sys.byteorder == 'big':
+                part.byteswap()
+            start = end
+        if start != len(data) or len(function._remap) != slots - size:
+            raise ValueError('data does not hold a perfect hash function')
+        return function
+
+
+class StaticMap:
+    """
+    Read-only mapping over a minimal perfect hash function.
+
+    The keys and the values are stored in the slots the function gives
+    them, so a lookup is a hash, one probe and one comparison of keys.
+
+    Attributes
+    ----------
+    function: PerfectHash
+        The perfect hash function of the keys.
+
+    Methods
+    -------
+    __init__(self, items, **kwargs) -> None
+        Build the mapping.
+
+    __len__(self) -> int
+        Return the number of keys.
+
+    __getitem__(self, key) -> Any
+        Retrieve the value of a key.
+
+    get(self, key, default=None) -> Any
+        Retrieve the value of a key or a default.
+
+    __contains__(self, key) -> bool
+        Check if a key is present.
+
+    __iter__(self) -> Generator
+        Iterate over the keys.
+
+    items(self) -> Generator
+        Iterate over the key-value pairs.
+
+    """
+
+    def __init__(self, items: Mapping | Iterable[tuple[Hashable, Any]],
+                 **kwargs) -> None:
+        """
+        Build the mapping.
+
+        Parameters
+        ----------
+        items: Mapping or Iterable[tuple[Hashable, Any]]
+            The key-value pairs, the keys distinct.
+
+        kwargs: dict
+            The arguments of `PerfectHash`.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the keys repeat.
+
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        keys, values = [], []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+        self.function = PerfectHash(keys, **kwargs)
+        # one slot even without keys, a lookup lands somewhere
+        self._keys = [None] * max(len(keys), 1)
+        self._values = [None] * max(len(keys), 1)
+        self._used = bytearray(max(len(keys), 1))
+        for key, value in zip(keys, values):
+            slot = self.function.index(key)
+            self._keys[slot], self._values[slot] = key, value
+            self._used[slot] = 1
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys.
+
+        Returns
+        -------
+        int
+            The number of keys.
+
+        """
+        return self.function.size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieve the value of a key or a default.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        default: Any, optional
+            The value for an absent key, by default None.
+
+        Returns
+        -------
+        Any
+            The value or the default.
+
+        """
+        slot = self.function.index(key)
+        if self._used[slot] and self._keys[slot] == key:
+            return self._values[slot]
+        return default
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """
+        Retrieve the value of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        Any
+            The value.
+
+        Raises
+        ------
+        KeyError
+            Raised if the key is absent.
+
+        """
+        slot = self.function.index(key)
+        if self._used[slot] and self._keys[slot] == key:
+            return self._values[slot]
+        raise KeyError(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if a key is present.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key.
+
+        Returns
+        -------
+        bool
+            True if the key is present.
+
+        """
+        slot = self.function.index(key)
+        return bool(self._used[slot]) and self._keys[slot] == key
+
+    def __iter__(self) -> Generator[Hashable, None, None]:
+        """
+        Iterate over the keys in the order of the slots.
+
+        Yields
+        ------
+        Hashable
+            The keys.
+
+        """
+        for key, _ in self.items():
+            yield key
+
+    def items(self) -> Generator[tuple[Hashable, Any], None, None]:
+        """
+        Iterate over the key-value pairs in the order of the slots.
+
+        Yields
+        ------
+        tuple[Hashable, Any]
+            The pairs.
+
+        """
+        for slot in range(len(self)):
+            yield self._keys[slot], self._values[slot]
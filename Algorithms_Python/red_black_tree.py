@@ -34,6 +34,9 @@ class RBTreeNode(TreeNode):
         The color of the node, either 'red' or 'black'.
 
     """
+
+    __slots__ = ('color',)
+
     def __init__(self, data, color):
         """
         Initialize a Red-Black Tree Node.
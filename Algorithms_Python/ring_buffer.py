@@ -0,0 +1,533 @@
+"""
+Ring Buffer Queue and Deque
+===========================
+
+This module implements fixed-capacity FIFO buffers over a preallocated
+list (or `array.array` for numeric data). The buffer length is a power
+of two, so a position wraps around with a bit mask instead of a modulo.
+Unlike Queue and Deque, which allocate a node per element and grow without
+bound, the bounded containers never allocate after creation and report
+when they are full, which gives backpressure to the producer. Optionally
+they overwrite the oldest elements instead.
+
+Batch operations `push_many` and `pop_many` move contiguous slices of
+the buffer, at most two slice copies per call (before and after the wrap).
+
+Classes
+-------
+BoundedQueue
+    A fixed-capacity FIFO queue over a ring buffer.
+
+BoundedDeque
+    A fixed-capacity double-ended queue over a ring buffer.
+
+"""
+
+
+from array import array
+from itertools import islice
+from typing import Any, Generator, Iterable
+
+
+class BoundedQueue:  # (FIFO) -(in)> Queue -(out)>
+    """
+    Fixed-capacity queue over a ring buffer.
+
+    Attributes
+    ----------
+    capacity: int
+        The maximum number of elements.
+
+    size: int
+        The number of elements in the queue.
+
+    overwrite: bool
+        Whether pushing into the full queue drops the oldest element
+        instead of failing.
+
+    Methods
+    -------
+    __init__(self, capacity: int, typecode: str | None = None,
+             overwrite: bool = False) -> None
+        Create an empty queue.
+
+    __len__(self) -> int
+        Return the number of elements.
+
+    __iter__(self) -> Generator
+        Iterate from the front to the back.
+
+    is_empty(self) -> bool
+        Check if the queue is empty.
+
+    is_full(self) -> bool
+        Check if the queue is full.
+
+    push(self, value) -> None
+        Add an element to the back.
+
+    try_push(self, value) -> bool
+        Add an element to the back if there is room.
+
+    push_many(self, elements) -> int
+        Add elements to the back, as many as fit.
+
+    pop(self) -> Any
+        Remove and return the front element.
+
+    pop_many(self, n) -> list | array
+        Remove and return up to n elements from the front.
+
+    front(self) -> Any | None
+        Return the front element.
+
+    back(self) -> Any | None
+        Return the back element.
+
+    clear(self) -> None
+        Remove all elements.
+
+    """
+
+    def __init__(self, capacity: int, typecode: str | None = None,
+                 overwrite: bool = False) -> None:
+        """
+        Create an empty queue.
+
+        Parameters
+        ----------
+        capacity: int
+            The maximum number of elements, the buffer is rounded up
+            to the next power of two.
+
+        typecode: str or None, optional
+            Typecode of an `array.array` buffer for numeric data,
+            None (default) for a list of any objects.
+
+        overwrite: bool, optional
+            If True, pushing into the full queue drops the oldest element,
+            by default False (the push fails).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if capacity is not positive.
+
+        """
+        if capacity <= 0:
+            raise ValueError('capacity should be positive')
+        self.capacity = capacity
+        self.overwrite = overwrite
+        self._typecode = typecode
+        length = 1 << (capacity - 1).bit_length()
+        self._mask = length - 1
+        if typecode is None:
+            self._buffer = [None] * length
+        else:
+            self._buffer = array(typecode,
+                                 bytes(array(typecode).itemsize * length))
+        # the position of the front element in the buffer
+        self._head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements.
+
+        Returns
+        -------
+        int
+            The number of elements.
+
+        """
+        return self.size
+
+    def __iter__(self) -> Generator:
+        """
+        Iterate through the elements from the front to the back.
+
+        Returns
+        -------
+        Generator
+            A generator of the elements.
+
+        """
+        buffer, mask, head = self._buffer, self._mask, self._head
+        for i in range(self.size):
+            yield buffer[(head + i) & mask]
+
+    def is_empty(self) -> bool:
+        """
+        Check if the queue is empty.
+
+        Returns
+        -------
+        bool
+            True if there are no elements.
+
+        """
+        return self.size == 0
+
+    def is_full(self) -> bool:
+        """
+        Check if the queue is full.
+
+        Returns
+        -------
+        bool
+            True if the number of elements reached the capacity.
+
+        """
+        return self.size == self.capacity
+
+    def _clear_slots(self, start: int, stop: int) -> None:
+        """
+        Drop the references kept in buffer[start:stop] of a list buffer.
+
+        Parameters
+        ----------
+        start: int
+            The first slot.
+
+        stop: int
+            The slot after the last one.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._typecode is None:
+            self._buffer[start:stop] = [None] * (stop - start)
+
+    def push(self, value: Any) -> None:
+        """
+        Add an element to the back of the queue.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the queue is full and overwrite is off.
+
+        """
+        if not self.try_push(value):
+            raise ValueError(f'{self.__class__.__name__} is full')
+
+    def try_push(self, value: Any) -> bool:
+        """
+        Add an element to the back of the queue if there is room.
+
+        In the overwrite mode the oldest element is dropped to make room,
+        so the push always succeeds.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        bool
+            True if the element was added, False if the queue is full.
+
+        """
+        if self.size == self.capacity:
+            if not self.overwrite:
+                return False
+            # drop the oldest element
+            self.pop()
+        self._buffer[(self._head + self.size) & self._mask] = value
+        self.size += 1
+        return True
+
+    def push_many(self, elements: Iterable) -> int:
+        """
+        Add elements to the back of the queue.
+
+        Without overwrite as many elements as fit are added and the number
+        of them is returned. Of a sequence the rest, `elements[count:]`,
+        can be pushed again later; an iterator is advanced only past the
+        elements added, so it keeps the rest. In the overwrite mode all
+        elements are added, dropping the oldest ones, so only the last
+        `capacity` of them may remain.
+
+        Parameters
+        ----------
+        elements: Iterable
+            The elements to be added, in order.
+
+        Returns
+        -------
+        int
+            The number of elements added.
+
+        """
+        if not self.overwrite and not hasattr(elements, '__len__'):
+            # leave the elements which do not fit in the iterator
+            elements = islice(elements, self.capacity - self.size)
+        if self._typecode is None:
+            if not isinstance(elements, list):
+                elements = list(elements)
+        elif not isinstance(elements, array) or \
+                elements.typecode != self._typecode:
+            elements = array(self._typecode, elements)
+        n = len(elements)
+        if self.overwrite:
+            if n > self.capacity:
+                elements = elements[n - self.capacity:]
+            dropped = max(0, self.size + len(elements) - self.capacity)
+            if dropped:
+                self.pop_many(dropped)
+        else:
+            elements = elements[:self.capacity - self.size]
+        count = len(elements)
+        start = (self._head + self.size) & self._mask
+        first = min(count, self._mask + 1 - start)
+        self._buffer[start:start + first] = elements[:first]
+        if first < count:
+            self._buffer[:count - first] = elements[first:]
+        self.size += count
+        return count if not self.overwrite else n
+
+    def pop(self) -> Any:
+        """
+        Remove and return the element from the front of the queue.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the queue is empty.
+
+        """
+        if self.size == 0:
+            raise ValueError('nothing to pop')
+        head = self._head
+        _return = self._buffer[head]
+        if self._typecode is None:
+            self._buffer[head] = None
+        self._head = (head + 1) & self._mask
+        self.size -= 1
+        return _return
+
+    def pop_many(self, n: int) -> list | array:
+        """
+        Remove and return up to n elements from the front of the queue.
+
+        Parameters
+        ----------
+        n: int
+            The maximum number of elements to remove.
+
+        Returns
+        -------
+        list or array
+            The removed elements in order, of the buffer's type.
+
+        """
+        count = max(0, min(n, self.size))
+        head = self._head
+        first = min(count, self._mask + 1 - head)
+        _return = self._buffer[head:head + first]
+        self._clear_slots(head, head + first)
+        if first < count:
+            _return += self._buffer[:count - first]
+            self._clear_slots(0, count - first)
+        self._head = (head + count) & self._mask
+        self.size -= count
+        return _return
+
+    def front(self) -> Any | None:
+        """
+        Retrieve the element at the front of the queue.
+
+        Returns
+        -------
+        Any | None
+            The front element, None if the queue is empty.
+
+        """
+        return self._buffer[self._head] if self.size else None
+
+    def back(self) -> Any | None:
+        """
+        Retrieve the element at the back of the queue.
+
+        Returns
+        -------
+        Any | None
+            The back element, None if the queue is empty.
+
+        """
+        if self.size == 0:
+            return None
+        return self._buffer[(self._head + self.size - 1) & self._mask]
+
+    def clear(self) -> None:
+        """
+        Remove all elements.
+
+        Returns
+        -------
+        None
+
+        """
+        self._clear_slots(0, self._mask + 1)
+        self._head = 0
+        self.size = 0
+
+
+class BoundedDeque(BoundedQueue):
+    """
+    Fixed-capacity double-ended queue over a ring buffer.
+
+    As with Deque, `push` adds to the back and `pop` removes from the
+    front. In the overwrite mode a push to the full deque drops the element
+    at the opposite end.
+
+    Methods
+    -------
+    push_back(self, value) -> None
+        Add an element to the back.
+
+    push_front(self, value) -> None
+        Add an element to the front.
+
+    try_push_front(self, value) -> bool
+        Add an element to the front if there is room.
+
+    pop_front(self) -> Any
+        Remove and return the front element.
+
+    pop_back(self) -> Any
+        Remove and return the back element.
+
+    """
+
+    def push_back(self, value: Any) -> None:
+        """
+        Add an element to the back of the deque.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is full and overwrite is off.
+
+        """
+        self.push(value)
+
+    def try_push_front(self, value: Any) -> bool:
+        """
+        Add an element to the front of the deque if there is room.
+
+        In the overwrite mode the back element is dropped to make room,
+        so the push always succeeds.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        bool
+            True if the element was added, False if the deque is full.
+
+        """
+        if self.size == self.capacity:
+            if not self.overwrite:
+                return False
+            self.pop_back()
+        self._head = (self._head - 1) & self._mask
+        self._buffer[self._head] = value
+        self.size += 1
+        return True
+
+    def push_front(self, value: Any) -> None:
+        """
+        Add an element to the front of the deque.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is full and overwrite is off.
+
+        """
+        if not self.try_push_front(value):
+            raise ValueError(f'{self.__class__.__name__} is full')
+
+    def pop_front(self) -> Any:
+        """
+        Remove and return the element from the front of the deque.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        return self.pop()
+
+    def pop_back(self) -> Any:
+        """
+        Remove and return the element from the back of the deque.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        if self.size == 0:
+            raise ValueError('nothing to pop')
+        tail = (self._head + self.size - 1) & self._mask
+        _return = self._buffer[tail]
+        if self._typecode is None:
+            self._buffer[tail] = None
+        self.size -= 1
+        return _return
@@ -0,0 +1,465 @@
+"""
+Shared Memory Queue
+===================
+
+This module implements a single-producer single-consumer (SPSC) ring buffer
+queue living in `multiprocessing.shared_memory`. It moves fixed-width
+numeric records, described by a `struct` format, between two processes
+without pickling: the producer packs records right into the shared buffer
+and the consumer unpacks them from it.
+
+The queue needs no locks. The block starts with a header holding
+the capacity, the record size and two counters: the number of records ever
+written (advanced only by the producer) and the number of records ever read
+(advanced only by the consumer). A counter is published after the records
+are copied, so the other side never sees a half-written record. Each
+counter sits on its own cache line, so the two processes do not keep
+invalidating each other's cache. The capacity is a power of two, so
+a counter is turned into a slot with a bit mask.
+
+The queue has the `push`/`pop` interface of Queue and `push_many`/
+`pop_many` which copy a batch in at most two slices. Only one process
+may push and only one may pop.
+
+Classes
+-------
+SharedRingQueue
+    An SPSC queue of fixed-width records in shared memory.
+
+"""
+
+
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterable
+
+
+# header layout, each counter on its own 64-byte cache line
+_CAPACITY = 0
+_RECORD_SIZE = 8
+_TRACKER = 16
+_READ = 64
+_WRITTEN = 128
+_DATA = 192
+
+
+def _tracker_pid() -> int:
+    """
+    Return the process id of the resource tracker of this process.
+
+    Returns
+    -------
+    int
+        The process id, 0 if it is unknown (the tracker is not running
+        or was inherited by a spawned process).
+
+    """
+    return getattr(resource_tracker._resource_tracker, '_pid', None) or 0
+
+
+class SharedRingQueue:  # (FIFO) -(in)> Queue -(out)>
+    """
+    Single-producer single-consumer queue of records in shared memory.
+
+    A record is a tuple of values packed with the struct format given.
+    If the format has one field (as 'd' or 'q'), plain values are pushed
+    and popped instead of one-element tuples. Formats without a byte order
+    character are used with '=' (native order, standard sizes, no padding),
+    so consecutive records are packed tightly.
+
+    The queue can be passed to a `multiprocessing.Process` as an argument,
+    the child process attaches to the same block.
+
+    Attributes
+    ----------
+    name: str
+        The name of the shared memory block, used to attach to it.
+
+    format: str
+        The struct format of a record.
+
+    capacity: int
+        The maximum number of records in the queue.
+
+    Methods
+    -------
+    __init__(self, fmt: str, capacity: int = 1024,
+             name: str | None = None, create: bool = True) -> None
+        Create a queue or attach to an existing one.
+
+    __len__(self) -> int
+        Return the number of records in the queue.
+
+    push(self, record) -> None
+        Add a record to the back.
+
+    try_push(self, record) -> bool
+        Add a record to the back if there is room.
+
+    push_many(self, records) -> int
+        Add records to the back, as many as fit.
+
+    pop(self) -> Any
+        Remove and return the front record.
+
+    pop_many(self, n) -> list
+        Remove and return up to n records from the front.
+
+    close(self) -> None
+        Detach from the shared memory block.
+
+    unlink(self) -> None
+        Destroy the shared memory block.
+
+    """
+
+    def __init__(self, fmt: str, capacity: int = 1024,
+                 name: str | None = None, create: bool = True) -> None:
+        """
+        Create a queue or attach to an existing one.
+
+        Parameters
+        ----------
+        fmt: str
+            The struct format of a record.
+
+        capacity: int, optional
+            The maximum number of records, rounded up to a power of two,
+            by default 1024. Ignored when attaching.
+
+        name: str or None, optional
+            The name of the shared memory block, by default None
+            (a unique name is chosen when creating).
+
+        create: bool, optional
+            True (default) to create the block, False to attach to
+            the existing block with the name given.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if capacity is not positive or the block attached to
+            was created for records of another size.
+
+        """
+        if fmt[:1] not in ('@', '=', '<', '>', '!'):
+            fmt = '=' + fmt
+        self.format = fmt
+        self._record = struct.Struct(fmt)
+        record_size = self._record.size
+        self._single = len(self._record.unpack(bytes(record_size))) == 1
+        # with '@' the fields of repeated records get alignment padding
+        self._tight = struct.calcsize(fmt[0] + fmt[1:] * 2) \
+            == 2 * record_size
+        if create:
+            if capacity <= 0:
+                raise ValueError('capacity should be positive')
+            capacity = 1 << (capacity - 1).bit_length()
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=_DATA + capacity * record_size)
+            self._owner = True
+            struct.pack_into('=QQQ', self._shm.buf, _CAPACITY,
+                             capacity, record_size, _tracker_pid())
+            struct.pack_into('=Q', self._shm.buf, _READ, 0)
+            struct.pack_into('=Q', self._shm.buf, _WRITTEN, 0)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+            capacity, stored_size, tracker = struct.unpack_from(
+                '=QQQ', self._shm.buf, _CAPACITY)
+            # the creator is responsible for the block, do not let
+            # the resource tracker of an unrelated process destroy it on
+            # exit (processes started by multiprocessing share the tracker
+            # of their parent, a spawned one does not know its pid)
+            own = _tracker_pid()
+            if own and own != tracker:
+                resource_tracker.unregister(self._shm._name, 'shared_memory')
+            if stored_size != record_size:
+                self._shm.close()
+                raise ValueError(f'the queue holds records of {stored_size}'
+                                 + f' bytes, {fmt!r} takes {record_size}')
+        self.name = self._shm.name
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._size = record_size
+        self._buf = self._shm.buf
+        # the counters as 64-bit integers
+        self._read = self._buf[_READ:_READ + 8].cast('Q')
+        self._written = self._buf[_WRITTEN:_WRITTEN + 8].cast('Q')
+        self._data = self._buf[_DATA:_DATA + capacity * record_size]
+
+    def __reduce__(self):
+        """
+        Pickle the queue as a reference to its shared memory block.
+
+        Returns
+        -------
+        tuple
+            The constructor and the arguments attaching to the block.
+
+        """
+        return (self.__class__, (self.format, self.capacity, self.name,
+                                 False))
+
+    def __len__(self) -> int:
+        """
+        Return the number of records in the queue.
+
+        Returns
+        -------
+        int
+            The number of records.
+
+        """
+        return self._written[0] - self._read[0]
+
+    def __enter__(self) -> 'SharedRingQueue':
+        """
+        Enter the context, returning the queue itself.
+
+        Returns
+        -------
+        SharedRingQueue
+            The queue.
+
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Leave the context, detaching and destroying an owned block.
+
+        Parameters
+        ----------
+        args: tuple
+            The exception details, ignored.
+
+        Returns
+        -------
+        None
+
+        """
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def _pack(self, record: Any) -> bytes:
+        """
+        Pack one record.
+
+        Parameters
+        ----------
+        record: Any
+            A value for single-field formats, a tuple otherwise.
+
+        Returns
+        -------
+        bytes
+            The packed record.
+
+        """
+        if self._single:
+            return self._record.pack(record)
+        return self._record.pack(*record)
+
+    def _batch(self, count: int) -> struct.Struct:
+        """
+        Return the struct of count consecutive records.
+
+        Parameters
+        ----------
+        count: int
+            The number of records.
+
+        Returns
+        -------
+        struct.Struct
+            The struct packing the records. For formats with several
+            fields it matches the record stride only if the records are
+            tight, which '@' formats need not be.
+
+        """
+        order, fields = self.format[0], self.format[1:]
+        if len(fields) == 1 and fields not in 'sp':
+            return struct.Struct(f'{order}{count}{fields}')
+        return struct.Struct(order + fields * count)
+
+    def try_push(self, record: Any) -> bool:
+        """
+        Add a record to the back of the queue if there is room.
+
+        Parameters
+        ----------
+        record: Any
+            A value for single-field formats, a tuple otherwise.
+
+        Returns
+        -------
+        bool
+            True if the record was added, False if the queue is full.
+
+        """
+        written = self._written[0]
+        if written - self._read[0] == self.capacity:
+            return False
+        offset = (written & self._mask) * self._size
+        self._data[offset:offset + self._size] = self._pack(record)
+        # publish the record only after it is copied
+        self._written[0] = written + 1
+        return True
+
+    def push(self, record: Any) -> None:
+        """
+        Add a record to the back of the queue.
+
+        Parameters
+        ----------
+        record: Any
+            A value for single-field formats, a tuple otherwise.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the queue is full.
+
+        """
+        if not self.try_push(record):
+            raise ValueError('queue is full')
+
+    def push_many(self, records: Iterable) -> int:
+        """
+        Add records to the back of the queue, as many as fit.
+
+        The records are packed into one bytes object and copied with
+        at most two slice assignments.
+
+        Parameters
+        ----------
+        records: Iterable
+            Values for single-field formats, tuples otherwise.
+
+        Returns
+        -------
+        int
+            The number of records added.
+
+        """
+        if not isinstance(records, (list, tuple)):
+            records = list(records)
+        written = self._written[0]
+        count = min(len(records), self.capacity - (written - self._read[0]))
+        if count <= 0:
+            return 0
+        if self._single:
+            packed = self._batch(count).pack(*records[:count])
+        elif self._tight:
+            packed = self._batch(count).pack(
+                *[value for record in records[:count] for value in record])
+        else:
+            packed = b''.join(self._record.pack(*record)
+                              for record in records[:count])
+        start = (written & self._mask) * self._size
+        end = self.capacity * self._size
+        first = min(len(packed), end - start)
+        self._data[start:start + first] = packed[:first]
+        if first < len(packed):
+            self._data[:len(packed) - first] = packed[first:]
+        self._written[0] = written + count
+        return count
+
+    def pop(self) -> Any:
+        """
+        Remove and return the record from the front of the queue.
+
+        Returns
+        -------
+        Any
+            A value for single-field formats, a tuple otherwise.
+
+        Raises
+        ------
+        ValueError
+            Raised if the queue is empty.
+
+        """
+        read = self._read[0]
+        if self._written[0] == read:
+            raise ValueError('nothing to pop')
+        record = self._record.unpack_from(self._data,
+                                          (read & self._mask) * self._size)
+        # free the slot only after the record is copied out
+        self._read[0] = read + 1
+        return record[0] if self._single else record
+
+    def pop_many(self, n: int) -> list:
+        """
+        Remove and return up to n records from the front of the queue.
+
+        Parameters
+        ----------
+        n: int
+            The maximum number of records.
+
+        Returns
+        -------
+        list
+            The records in order, possibly none.
+
+        """
+        read = self._read[0]
+        count = min(n, self._written[0] - read)
+        if count <= 0:
+            return []
+        start = (read & self._mask) * self._size
+        stop = start + count * self._size
+        end = self.capacity * self._size
+        if stop <= end:
+            raw = bytes(self._data[start:stop])
+        else:
+            raw = bytes(self._data[start:end]) + \
+                bytes(self._data[:stop - end])
+        self._read[0] = read + count
+        if self._single:
+            return list(self._batch(count).unpack(raw))
+        return list(self._record.iter_unpack(raw))
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block.
+
+        The queue can not be used afterwards.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._buf is None:
+            return
+        self._read.release()
+        self._written.release()
+        self._data.release()
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block.
+
+        Called once, usually by the creator after all processes closed
+        the queue.
+
+        Returns
+        -------
+        None
+
+        """
+        self._shm.unlink()
@@ -0,0 +1,712 @@
+"""
+Skip List Module
+================
+
+This module implements an indexable skip list, an ordered map (or set,
+when no values are given) kept as a tower of sorted linked lists. The
+bottom list holds every key, each list above holds about a quarter of the
+keys of the list below, so a search skips over most keys on the upper
+levels and then drops down. The expected cost of `insert`, `delete`,
+`search`, `find_successor` and `find_predecessor` is O(log n), as for the
+balanced trees, but there are no rotations and every operation is
+a simple iterative walk.
+
+Every link also stores its span - the number of keys it jumps over - so
+the skip list answers rank queries (`rank`, `select`) in O(log n) too.
+A skip list from keys that are already sorted is built in O(n) by
+`from_sorted`.
+
+The skip list keeps the API of BinarySearchTree, AVLTree and RedBlackTree
+(`insert`, `delete`, `search`, `in_order_traversal`, `find_min`,
+`find_max`, `find_successor`, `find_predecessor`, `is_empty`,
+`max_height`, `size`), so they can be used and benchmarked
+interchangeably. Unlike the trees it stores every key once: inserting
+a present key replaces its value.
+
+Constants
+---------
+MAX_LEVEL: int
+    The maximum number of levels, enough for 4 ** 32 keys.
+
+P: float
+    The probability of a node to reach the next level.
+
+Classes
+-------
+SkipNode
+    A node of the skip list.
+
+SkipList
+    An indexable skip list ordered map.
+
+"""
+
+
+import random
+from typing import Any, Generator, Iterable
+
+from Algorithms_Python.Node import Node
+
+
+MAX_LEVEL = 32
+P = 0.25
+
+
+class SkipNode(Node):
+    """
+    A node of the skip list.
+
+    The key is stored as the node's data. The links of the node on every
+    level it reaches are kept in a list, level 0 being the bottom list
+    with all nodes, so the `next_node` link of Node is not used.
+
+    Attributes
+    ----------
+    value: Any
+        The value mapped to the key.
+
+    forward: list[SkipNode | None]
+        The next node on every level of the node.
+
+    span: list[int]
+        The number of bottom-level steps every forward link makes.
+
+    """
+
+    __slots__ = ('value', 'forward', 'span')
+
+    def __init__(self, key: Any, value: Any, level: int) -> None:
+        """
+        Initializes a new node reaching the given number of levels.
+
+        Parameters
+        ----------
+        key: Any
+            The key of the node.
+
+        value: Any
+            The value mapped to the key.
+
+        level: int
+            The number of levels of the node.
+
+        Returns
+        -------
+        None
+
+        """
+        super().__init__(data=key)
+        self.value = value
+        self.forward = [None] * level
+        self.span = [0] * level
+
+
+class SkipList:
+    """
+    Indexable skip list ordered map.
+
+    Attributes
+    ----------
+    head: SkipNode
+        The sentinel node before the first key, reaching all levels.
+
+    level: int
+        The number of levels in use.
+
+    size: int
+        The number of keys.
+
+    Methods
+    -------
+    __init__(self) -> None
+        Initializes an empty skip list.
+
+    from_sorted(cls, keys, values=None) -> SkipList
+        Builds a skip list from sorted keys in O(n).
+
+    __len__(self) -> int
+        Counts the keys.
+
+    __contains__(self, key) -> bool
+        Checks if the key is present.
+
+    __iter__(self) -> Generator
+        Iterates through the keys in increasing order.
+
+    insert(self, key, value=None) -> None
+        Inserts the key or replaces its value.
+
+    delete(self, key) -> None
+        Deletes the key if present.
+
+    search(self, key) -> SkipNode | None
+        Finds the node of the key.
+
+    get(self, key, default=None) -> Any
+        Looks up the value of the key.
+
+    in_order_traversal(self) -> list
+        Lists the keys in increasing order.
+
+    find_min(self) -> Any | None
+        Finds the smallest key.
+
+    find_max(self) -> Any | None
+        Finds the largest key.
+
+    find_successor(self, key) -> Any | None
+        Finds the smallest key greater than the given one.
+
+    find_predecessor(self, key) -> Any | None
+        Finds the largest key smaller than the given one.
+
+    range(self, low=None, high=None) -> Generator
+        Iterates through the keys from low to high, high excluded.
+
+    items(self, low=None, high=None) -> Generator
+        Iterates through the (key, value) pairs from low to high.
+
+    rank(self, key) -> int
+        Counts the keys smaller than the given one.
+
+    select(self, i) -> Any
+        Finds the key with the given rank.
+
+    is_empty(self) -> bool
+        Checks if the skip list is empty.
+
+    max_height(self) -> int
+        Counts the levels in use.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty skip list.
+
+        Returns
+        -------
+        None
+
+        """
+        self.head = SkipNode(None, None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    @staticmethod
+    def _random_level() -> int:
+        """
+        Draws the number of levels of a new node.
+
+        Returns
+        -------
+        int
+            The number of levels, 1 with probability 1 - P, 2 with
+            probability P * (1 - P) and so on.
+
+        """
+        level = 1
+        while level < MAX_LEVEL and random.random() < P:
+            level += 1
+        return level
+
+    @classmethod
+    def from_sorted(cls, keys: Iterable,
+                    values: Iterable | None = None) -> 'SkipList':
+        """
+        Builds a skip list from keys in increasing order in O(n).
+
+        Every node is appended to the end of the lists of its levels,
+        so no searches are made.
+
+        Parameters
+        ----------
+        keys: Iterable
+            The keys, sorted and without duplicates.
+
+        values: Iterable or None, optional
+            The values of the keys, by default None (all values are None).
+
+        Returns
+        -------
+        SkipList
+            The skip list of the keys.
+
+        Raises
+        ------
+        ValueError
+            Raised if the keys are not strictly increasing.
+
+        """
+        skip_list = cls()
+        head = skip_list.head
+        # the last node of every level and its rank
+        last = [head] * MAX_LEVEL
+        last_rank = [0] * MAX_LEVEL
+        if values is None:
+            pairs = ((key, None) for key in keys)
+        else:
+            pairs = zip(keys, values)
+        rank = 0
+        for key, value in pairs:
+            if rank and not last[0].data < key:
+                raise ValueError('keys should be strictly increasing')
+            rank += 1
+            level = cls._random_level()
+            node = SkipNode(key, value, level)
+            for i in range(level):
+                last[i].forward[i] = node
+                last[i].span[i] = rank - last_rank[i]
+                last[i] = node
+                last_rank[i] = rank
+            skip_list.level = max(skip_list.level, level)
+        # the links to the end span the rest of the keys
+        for i in range(skip_list.level):
+            last[i].span[i] = rank - last_rank[i]
+        skip_list.size = rank
+        return skip_list
+
+    def __len__(self) -> int:
+        """
+        Counts the keys.
+
+        Returns
+        -------
+        int
+            The number of keys.
+
+        """
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks if the key is present.
+
+        Parameters
+        ----------
+        key: Any
+            The key to look for.
+
+        Returns
+        -------
+        bool
+            True if the key is present.
+
+        """
+        return self.search(key) is not None
+
+    def __iter__(self) -> Generator:
+        """
+        Iterates through the keys in increasing order.
+
+        Returns
+        -------
+        Generator
+            A generator of the keys.
+
+        """
+        node = self.head.forward[0]
+        while node is not None:
+            yield node.data
+            node = node.forward[0]
+
+    def _find_update(self, key: Any) -> tuple[list, list]:
+        """
+        Finds the last node before the key on every level.
+
+        Parameters
+        ----------
+        key: Any
+            The key to look for.
+
+        Returns
+        -------
+        tuple[list, list]
+            The last node with a smaller key on every level in use and
+            the rank of each of them.
+
+        """
+        update = [self.head] * self.level
+        rank = [0] * self.level
+        node, traversed = self.head, 0
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.data < key:
+                traversed += node.span[i]
+                node = following
+                following = node.forward[i]
+            update[i] = node
+            rank[i] = traversed
+        return update, rank
+
+    def insert(self, key: Any, value: Any = None) -> None:
+        """
+        Inserts the key or replaces its value if it is present.
+
+        Parameters
+        ----------
+        key: Any
+            The key to be inserted.
+
+        value: Any, optional
+            The value mapped to the key, by default None.
+
+        Returns
+        -------
+        None
+
+        """
+        update, rank = self._find_update(key)
+        following = update[0].forward[0]
+        if following is not None and following.data == key:
+            following.value = value
+            return
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                # an unused level of the head spans all the keys
+                self.head.span[i] = self.size
+                update.append(self.head)
+                rank.append(0)
+            self.level = level
+        node = SkipNode(key, value, level)
+        # the rank of the new node is rank[0] + 1
+        for i in range(level):
+            previous = update[i]
+            node.forward[i] = previous.forward[i]
+            previous.forward[i] = node
+            node.span[i] = previous.span[i] - (rank[0] - rank[i])
+            previous.span[i] = rank[0] - rank[i] + 1
+        # the links over the new node became one step longer
+        for i in range(level, self.level):
+            update[i].span[i] += 1
+        self.size += 1
+
+    def delete(self, key: Any) -> None:
+        """
+        Deletes the key if it is present.
+
+        Parameters
+        ----------
+        key: Any
+            The key to be deleted.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IndexError
+            Raised if the skip list is empty.
+
+        """
+        if self.size == 0:
+            raise IndexError('SkipList is empty')
+        update, _ = self._find_update(key)
+        node = update[0].forward[0]
+        if node is None or node.data != key:
+            return
+        for i in range(self.level):
+            previous = update[i]
+            if previous.forward[i] is node:
+                previous.span[i] += node.span[i] - 1
+                previous.forward[i] = node.forward[i]
+            else:
+                previous.span[i] -= 1
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+
+    def search(self, key: Any) -> SkipNode | None:
+        """
+        Finds the node of the key.
+
+        Parameters
+        ----------
+        key: Any
+            The key to look for.
+
+        Returns
+        -------
+        SkipNode | None
+            The node of the key, None if the key is absent.
+
+        """
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.data < key:
+                node = following
+                following = node.forward[i]
+        node = node.forward[0]
+        if node is not None and node.data == key:
+            return node
+        return None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Looks up the value of the key.
+
+        Parameters
+        ----------
+        key: Any
+            The key to look for.
+
+        default: Any, optional
+            The value returned for an absent key, by default None.
+
+        Returns
+        -------
+        Any
+            The value of the key or the default.
+
+        """
+        node = self.search(key)
+        return default if node is None else node.value
+
+    def in_order_traversal(self) -> list:
+        """
+        Lists the keys in increasing order.
+
+        Returns
+        -------
+        list
+            The list of the keys.
+
+        """
+        return list(self)
+
+    def find_min(self) -> Any | None:
+        """
+        Finds the smallest key.
+
+        Returns
+        -------
+        Any | None
+            The smallest key, None if the skip list is empty.
+
+        """
+        node = self.head.forward[0]
+        return None if node is None else node.data
+
+    def find_max(self) -> Any | None:
+        """
+        Finds the largest key.
+
+        Returns
+        -------
+        Any | None
+            The largest key, None if the skip list is empty.
+
+        """
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            while node.forward[i] is not None:
+                node = node.forward[i]
+        return node.data
+
+    def find_successor(self, key: Any) -> Any | None:
+        """
+        Finds the smallest key greater than the given one.
+
+        The given key does not have to be present.
+
+        Parameters
+        ----------
+        key: Any
+            The key, successor to which is to be found.
+
+        Returns
+        -------
+        Any | None
+            The successor, None if there are no greater keys.
+
+        """
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.data <= key:
+                node = following
+                following = node.forward[i]
+        node = node.forward[0]
+        return None if node is None else node.data
+
+    def find_predecessor(self, key: Any) -> Any | None:
+        """
+        Finds the largest key smaller than the given one.
+
+        The given key does not have to be present.
+
+        Parameters
+        ----------
+        key: Any
+            The key, predecessor to which is to be found.
+
+        Returns
+        -------
+        Any | None
+            The predecessor, None if there are no smaller keys.
+
+        """
+        update, _ = self._find_update(key)
+        return update[0].data
+
+    def _first_node(self, low: Any) -> SkipNode | None:
+        """
+        Finds the first node with a key not smaller than low.
+
+        Parameters
+        ----------
+        low: Any
+            The lower bound, None for the first node.
+
+        Returns
+        -------
+        SkipNode | None
+            The node, None if there is no such key.
+
+        """
+        if low is None:
+            return self.head.forward[0]
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.data < low:
+                node = following
+                following = node.forward[i]
+        return node.forward[0]
+
+    def items(self, low: Any = None, high: Any = None) -> Generator:
+        """
+        Iterates through the (key, value) pairs with low <= key < high.
+
+        Finding the first key takes O(log n), every next one O(1).
+
+        Parameters
+        ----------
+        low: Any, optional
+            The lower bound, by default None (from the smallest key).
+
+        high: Any, optional
+            The upper bound, excluded, by default None (to the largest
+            key).
+
+        Returns
+        -------
+        Generator
+            A generator of the (key, value) pairs in increasing order.
+
+        """
+        node = self._first_node(low)
+        while node is not None and (high is None or node.data < high):
+            yield node.data, node.value
+            node = node.forward[0]
+
+    def range(self, low: Any = None, high: Any = None) -> Generator:
+        """
+        Iterates through the keys with low <= key < high.
+
+        Parameters
+        ----------
+        low: Any, optional
+            The lower bound, by default None (from the smallest key).
+
+        high: Any, optional
+            The upper bound, excluded, by default None (to the largest
+            key).
+
+        Returns
+        -------
+        Generator
+            A generator of the keys in increasing order.
+
+        """
+        for key, _ in self.items(low, high):
+            yield key
+
+    def rank(self, key: Any) -> int:
+        """
+        Counts the keys smaller than the given one.
+
+        For a present key it is the index of the key in sorted order.
+
+        Parameters
+        ----------
+        key: Any
+            The key, which does not have to be present.
+
+        Returns
+        -------
+        int
+            The number of smaller keys.
+
+        """
+        node, traversed = self.head, 0
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.data < key:
+                traversed += node.span[i]
+                node = following
+                following = node.forward[i]
+        return traversed
+
+    def select(self, i: int) -> Any:
+        """
+        Finds the key with the given rank (the i-th smallest key).
+
+        Parameters
+        ----------
+        i: int
+            The rank of the key, negative ranks count from the largest key.
+
+        Returns
+        -------
+        Any
+            The key.
+
+        Raises
+        ------
+        IndexError
+            Raised if the rank is out of range.
+
+        """
+        if i < 0:
+            i += self.size
+        if i < 0 or i >= self.size:
+            raise IndexError('SkipList index out of range')
+        # the head has rank 0, the keys have ranks from 1
+        target = i + 1
+        node, traversed = self.head, 0
+        for level in range(self.level - 1, -1, -1):
+            while node.forward[level] is not None and \
+                    traversed + node.span[level] <= target:
+                traversed += node.span[level]
+                node = node.forward[level]
+            if traversed == target:
+                break
+        return node.data
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the skip list is empty.
+
+        Returns
+        -------
+        bool
+            True if there are no keys.
+
+        """
+        return self.size == 0
+
+    def max_height(self) -> int:
+        """
+        Counts the levels in use.
+
+        Returns
+        -------
+        int
+            The number of levels.
+
+        """
+        return self.level
@@ -136,3 +136,163 @@ def test_insert_using_neg_index(cll_with_many_nodes):
     cll_with_many_nodes.insert(-2, None)
     assert cll_with_many_nodes.list_all()[-2] is None, \
         'insertion using negative indexes has gone wrong'
+
+
+def test_getitem_after_edits(cll_with_many_nodes):
+    assert cll_with_many_nodes[3] == cll_with_many_nodes.list_all()[3]
+    cll_with_many_nodes.insert(0, 'new')
+    assert cll_with_many_nodes[4] == cll_with_many_nodes.list_all()[4]
+    cll_with_many_nodes.erase(0)
+    assert cll_with_many_nodes[3] == cll_with_many_nodes.list_all()[3]
+
+
+def make_cll(elements):
+    cll = CyclicLinkedList()
+    for x in elements:
+        cll.insert(cll.size, x)
+    return cll
+
+
+def check_loop(cll):
+    elements = cll.list_all()
+    assert len(elements) == cll.size
+    if cll.size:
+        assert cll.tail.next_node is cll.head
+        assert cll.head.prev_node is cll.tail
+        backward, node = [], cll.tail
+        for _ in range(cll.size):
+            backward.append(node.data)
+            node = node.prev_node
+        assert backward[::-1] == elements
+    return elements
+
+
+def test_inserted_nodes_are_linked_back():
+    cll = make_cll(range(3))
+    cll.insert(1, 'x')
+    cll.insert(3, 'y')
+    assert check_loop(cll) == [0, 'x', 1, 'y', 2]
+
+
+def test_chain_is_linked_back(head):
+    tail = DoubleNode(14)
+    head.next_node = DoubleNode(13)
+    head.next_node.next_node = tail
+    assert check_loop(CyclicLinkedList(head=head, tail=tail)) == [12, 13, 14]
+
+
+@pytest.mark.parametrize('k', [0, 1, 2, 4, 5, -1, -3, 11])
+def test_rotate(k):
+    cll = make_cll(range(5))
+    cll.rotate(k)
+    shift = k % 5
+    assert check_loop(cll) == list(range(shift, 5)) + list(range(shift))
+
+
+def test_round_robin():
+    cll = make_cll('abc')
+    served = []
+    for _ in range(7):
+        served.append(cll.head.data)
+        cll.rotate()
+    assert served == list('abcabca')
+    make_cll([]).rotate(3)
+
+
+def test_cll_extend_splice_split():
+    cll = make_cll(range(3))
+    cll.extend_from_list(make_cll([3, 4]))
+    assert check_loop(cll) == [0, 1, 2, 3, 4]
+    for i, expected in [(0, ['a', 0, 1, 2, 3, 4]),
+                        (3, ['a', 0, 1, 'a', 2, 3, 4]),
+                        (7, ['a', 0, 1, 'a', 2, 3, 4, 'a'])]:
+        other = make_cll(['a'])
+        cll.splice(i, other)
+        assert check_loop(cll) == expected
+        assert other.size == 0
+    left, right = cll.split_at(3)
+    assert check_loop(left) == ['a', 0, 1]
+    assert check_loop(right) == ['a', 2, 3, 4, 'a']
+    assert cll.size == 0
+    right.rotate(-1)
+    left.splice(0, right)
+    assert check_loop(left) == ['a', 'a', 2, 3, 4, 'a', 0, 1]
+    left, right = left.split_at(8)
+    assert check_loop(left) == ['a', 'a', 2, 3, 4, 'a', 0, 1]
+    assert right.size == 0
+
+
+def test_append_keeps_the_loop():
+    cll = make_cll([1, 2, 3])
+    cll.append(4)
+    assert check_loop(cll) == [1, 2, 3, 4]
+    cll.rotate(1)
+    assert check_loop(cll) == [2, 3, 4, 1]
+    cll = CyclicLinkedList()
+    cll.append('a')
+    cll.append('b')
+    cll.rotate(1)
+    assert check_loop(cll) == ['b', 'a']
+
+
+def test_assigned_head_is_linked_back(cll_with_node):
+    cll_with_node.append(13)
+    cll_with_node.rotate(1)
+    assert check_loop(cll_with_node) == [13, 12]
+
+
+def test_cursor_goes_around_the_loop():
+    cll = make_cll(range(4))
+    cursor = cll.cursor(2)
+    seen = []
+    for _ in range(4):
+        seen.append((cursor.index, cursor.data))
+        cursor.data = cursor.data * 10
+        cursor.move_next()
+    assert seen == [(2, 2), (3, 3), (0, 0), (1, 1)]
+    assert cursor.index == 2 and cursor.data == 20 and not cursor.at_end
+    assert check_loop(cll) == [0, 10, 20, 30]
+    assert cll.cursor(4).data == 0
+    with pytest.raises(IndexError):
+        cll.cursor(5)
+    with pytest.raises(IndexError):
+        cll.cursor(-1)
+
+
+def test_cursor_inserts_and_erases():
+    cll = make_cll(range(6))
+    cursor = cll.cursor(1)
+    # drop odd numbers and put a marker before every even one
+    for _ in range(5):
+        if cursor.data % 2:
+            assert cursor.erase() % 2 == 1
+        else:
+            cursor.insert('x')
+            cursor.move_next()
+    # the tail was erased, the cursor went on to the head
+    assert cursor.index == 0 and cursor.data == 0
+    assert check_loop(cll) == [0, 'x', 2, 'x', 4]
+    assert cll.tail.data == 4
+    # inserting before the head makes a new head
+    cursor.insert('x')
+    assert cursor.index == 1 and cursor.data == 0
+    assert check_loop(cll) == ['x', 0, 'x', 2, 'x', 4]
+    assert cll[3] == 2
+
+
+def test_cursor_erases_everything():
+    cll = CyclicLinkedList()
+    cursor = cll.cursor()
+    assert cursor.at_end
+    with pytest.raises(IndexError):
+        cursor.move_next()
+    cursor.insert(7)
+    assert cursor.data == 7 and check_loop(cll) == [7]
+    cursor.insert(6)
+    assert check_loop(cll) == [6, 7]
+    assert cursor.erase() == 7
+    assert cursor.data == 6 and cursor.index == 0
+    assert cursor.erase() == 6
+    assert cll.size == 0 and cll.head is None and cll.tail is None
+    with pytest.raises(IndexError):
+        cursor.erase()
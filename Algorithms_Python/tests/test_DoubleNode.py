@@ -45,3 +45,8 @@ def test_raises_error_when_trying_to_assign_wrong_prev_node():
         node2 = DoubleNode(12)
         node1 = 12
         node2.prev_node = node1
+
+
+def test_double_node_has_no_instance_dict():
+    assert not hasattr(DoubleNode(), '__dict__'), \
+        'DoubleNode is expected to be slotted'
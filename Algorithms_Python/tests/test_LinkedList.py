@@ -1,3 +1,5 @@
+import random
+
 from Algorithms_Python.LinkedList import LinkedList
 from Algorithms_Python.Node import Node
 import pytest
@@ -280,3 +282,215 @@ def test_ll_repr(ll_for_erase):
 def test_indexing_with_neg_numbers_inside_insert(ll_for_erase):
     with pytest.raises(Exception):
         ll_for_erase.insert(-1, -1)
+
+
+def test_getitem_and_update_by_index(ll_for_erase):
+    assert [ll_for_erase[i] for i in range(5)] == [0, 1, 2, 3, 4]
+    assert ll_for_erase[-1] == 4
+    ll_for_erase.update(0, 'first')
+    ll_for_erase.update(4, 'last')
+    assert ll_for_erase.list_all() == ['first', 1, 2, 3, 'last']
+    with pytest.raises(IndexError):
+        ll_for_erase[5]
+    with pytest.raises(IndexError):
+        ll_for_erase.update(5, 0)
+
+
+def test_insert_at_size_moves_tail(ll_for_erase):
+    ll_for_erase.insert(5, 5)
+    ll_for_erase.append(6)
+    assert ll_for_erase.tail.data == 6
+    assert ll_for_erase.list_all() == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_finger_stays_valid_after_edits():
+    ll = LinkedList()
+    reference = []
+    random.seed(30)
+    for _ in range(1000):
+        op = random.randrange(4)
+        if op == 0 or not reference:
+            i = random.randint(0, len(reference))
+            x = random.random()
+            ll.insert(i, x)
+            reference.insert(i, x)
+        elif op == 1:
+            i = random.randrange(len(reference))
+            ll.erase(i)
+            del reference[i]
+        elif op == 2:
+            i = random.randrange(len(reference))
+            ll.update(i, -i)
+            reference[i] = -i
+        else:
+            i = random.randrange(len(reference))
+            assert ll[i] == reference[i]
+        assert ll.size == len(reference)
+    assert ll.list_all() == reference
+    if reference:
+        assert ll.tail.data == reference[-1]
+
+
+def test_sequential_access_walks_from_finger():
+    n = 2000
+    ll = LinkedList()
+    for i in range(n):
+        ll.append(i)
+    assert ll._finger is None
+    for i in range(n - 1):
+        assert ll[i] == i
+        # the finger follows the access, so the next walk is one node long
+        assert ll._finger == (i, ll._finger[1])
+        assert ll._finger[1].data == i
+    # the tail is reached without moving the finger from the start
+    assert ll[0] == 0
+    assert ll[n - 1] == n - 1
+
+
+def test_batch_insert_at_increasing_indexes():
+    ll = LinkedList()
+    for i in range(10):
+        ll.append(2 * i)
+    for i in range(10):
+        ll.insert(2 * i + 1, 2 * i + 1)
+    assert ll.list_all() == list(range(20))
+    assert ll.tail.data == 19
+
+
+def test_cursor_reads_and_updates():
+    ll = LinkedList()
+    for i in range(5):
+        ll.append(i)
+    cursor = ll.cursor()
+    seen = []
+    while not cursor.at_end:
+        seen.append(cursor.data)
+        cursor.data = cursor.data * 10
+        cursor.move_next()
+    assert seen == [0, 1, 2, 3, 4]
+    assert cursor.index == 5
+    assert ll.list_all() == [0, 10, 20, 30, 40]
+    with pytest.raises(IndexError):
+        cursor.data
+    with pytest.raises(IndexError):
+        cursor.data = 1
+    with pytest.raises(IndexError):
+        cursor.move_next()
+
+
+def test_cursor_inserts_and_erases():
+    ll = LinkedList()
+    for i in range(6):
+        ll.append(i)
+    cursor = ll.cursor()
+    # drop odd numbers and put a marker before every even one
+    while not cursor.at_end:
+        if cursor.data % 2:
+            assert cursor.erase() % 2 == 1
+        else:
+            cursor.insert('x')
+            cursor.move_next()
+    cursor.insert('end')
+    assert ll.list_all() == ['x', 0, 'x', 2, 'x', 4, 'end']
+    assert ll.size == 7
+    assert ll.tail.data == 'end'
+    assert ll[3] == 2
+    ll.append('after')
+    assert ll.list_all()[-2:] == ['end', 'after']
+
+
+def test_cursor_erases_everything():
+    ll = LinkedList()
+    for i in range(3):
+        ll.append(i)
+    cursor = ll.cursor(1)
+    assert cursor.data == 1
+    assert cursor.erase() == 1
+    assert cursor.erase() == 2
+    assert ll.tail.data == 0
+    cursor = ll.cursor()
+    cursor.erase()
+    assert ll.size == 0
+    assert ll.head is None and ll.tail is None
+    with pytest.raises(IndexError):
+        cursor.erase()
+    cursor.insert(7)
+    assert ll.list_all() == [7]
+    assert ll.head is ll.tail
+
+
+def test_cursor_out_of_range():
+    ll = LinkedList()
+    ll.append(1)
+    with pytest.raises(IndexError):
+        ll.cursor(2)
+    with pytest.raises(IndexError):
+        ll.cursor(-1)
+    assert ll.cursor(1).at_end
+
+
+def make_ll(elements):
+    ll = LinkedList()
+    for x in elements:
+        ll.append(x)
+    return ll
+
+
+def test_extend_from_list_moves_nodes():
+    ll, other = make_ll([0, 1, 2]), make_ll([3, 4])
+    tail = other.tail
+    assert ll[1] == 1
+    ll.extend_from_list(other)
+    assert ll.list_all() == [0, 1, 2, 3, 4]
+    assert ll.size == 5 and ll.tail is tail
+    assert other.size == 0 and other.head is None and other.tail is None
+    assert ll[2] == 2 and ll[4] == 4
+    ll.append(5)
+    assert ll.list_all() == list(range(6))
+    # empty lists on either side
+    ll.extend_from_list(LinkedList())
+    assert ll.size == 6
+    empty = LinkedList()
+    empty.extend_from_list(ll)
+    assert empty.list_all() == list(range(6)) and ll.list_all() == []
+
+
+def test_extend_from_list_checks_other():
+    ll = make_ll([1])
+    with pytest.raises(ValueError):
+        ll.extend_from_list(ll)
+    from Algorithms_Python.CyclicLinkedList import CyclicLinkedList
+    with pytest.raises(TypeError):
+        ll.extend_from_list(CyclicLinkedList())
+
+
+@pytest.mark.parametrize('i', range(5))
+def test_splice(i):
+    ll, other = make_ll(range(4)), make_ll(['a', 'b'])
+    ll.splice(i, other)
+    assert ll.list_all() == list(range(i)) + ['a', 'b'] + list(range(i, 4))
+    assert ll.size == 6 and ll.tail.data == ll.list_all()[-1]
+    assert other.size == 0
+    assert [ll[j] for j in range(6)] == ll.list_all()
+    ll.splice(i, LinkedList())
+    assert ll.size == 6
+    with pytest.raises(IndexError):
+        ll.splice(7, make_ll([1]))
+
+
+@pytest.mark.parametrize('i', range(6))
+def test_split_at(i):
+    ll = make_ll(range(5))
+    left, right = ll.split_at(i)
+    assert left.list_all() == list(range(i))
+    assert right.list_all() == list(range(i, 5))
+    assert left.size == i and right.size == 5 - i
+    assert ll.size == 0 and ll.head is None
+    if i:
+        assert left.tail.data == i - 1 and left.tail.next_node is None
+    if i < 5:
+        assert right.tail.data == 4
+    left.extend_from_list(right)
+    assert left.list_all() == list(range(5))
+    with pytest.raises(IndexError):
+        left.split_at(6)
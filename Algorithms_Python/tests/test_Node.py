@@ -64,3 +64,9 @@ def test_eq_for_node(node_with_data):
 
 def test_repr_in_node(node_with_data):
     assert node_with_data.__repr__() == '4', '__repr__ for node works wrong'
+
+
+def test_node_has_no_instance_dict(node):
+    assert not hasattr(node, '__dict__'), 'Node is expected to be slotted'
+    with pytest.raises(AttributeError):
+        node.unknown_attribute = 4
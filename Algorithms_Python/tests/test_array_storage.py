@@ -0,0 +1,180 @@
+import pytest
+import random
+
+from Algorithms_Python.array_storage import NIL, NodeArena, \
+    ArrayLinkedList, ArrayDeque
+from Algorithms_Python.LinkedList import LinkedList
+from Algorithms_Python.Deque import Deque
+
+
+def test_arena_allocate_and_release():
+    arena = NodeArena({'next': 'i'}, capacity=2)
+    nodes = [arena.allocate() for _ in range(5)]
+    assert nodes == [1, 2, 3, 4, 5]
+    assert NIL not in nodes
+    assert len(arena) == 5
+    assert arena.capacity == 8
+    arena.columns['next'][3] = 4
+    arena.release(3)
+    arena.release(2)
+    assert len(arena) == 3
+    # released indices are reused, last released first, with zeroed columns
+    assert arena.allocate() == 2
+    assert arena.allocate() == 3
+    assert arena.columns['next'][3] == 0
+    assert arena.allocate() == 6
+
+
+def test_arena_grows_in_place():
+    arena = NodeArena({'next': 'i', 'prev': 'i'}, 'd', capacity=2)
+    column, data = arena.columns['next'], arena.data
+    for _ in range(100):
+        arena.data[arena.allocate()] = 1.5
+    assert arena.columns['next'] is column
+    assert arena.data is data
+    assert len(column) == len(data) == arena.capacity == 128
+    assert arena.memory_usage() == 128 * (4 + 4 + 8)
+
+
+def test_arena_clear():
+    arena = NodeArena({'next': 'i'})
+    for _ in range(20):
+        arena.data[arena.allocate()] = 'x'
+    arena.clear()
+    assert len(arena) == 0
+    assert set(arena.data) == {None}
+    assert arena.allocate() == 1
+
+
+def test_arena_needs_columns():
+    with pytest.raises(ValueError):
+        NodeArena({})
+
+
+def test_linked_list_matches_LinkedList():
+    reference = LinkedList()
+    ll = ArrayLinkedList()
+    for i in range(10):
+        reference.append(i)
+        ll.append(i)
+    for i, x in [(0, 'a'), (5, 'b'), (12, 'c'), (3, 'd'), (13, 'e')]:
+        reference.insert(i, x)
+        ll.insert(i, x)
+        assert ll.list_all() == reference.list_all()
+    for i in [0, 4, 10, 3]:
+        reference.erase(i)
+        ll.erase(i)
+        assert ll.list_all() == reference.list_all()
+    assert len(ll) == ll.size == reference.size
+    assert str(ll) == str(reference)
+
+
+def test_linked_list_head_tail_and_search():
+    ll = ArrayLinkedList([1, 2, 3])
+    assert ll.head != NIL and ll.tail != NIL
+    previous, current = ll.search(1)
+    assert ll._data[previous] == 1
+    assert ll._data[current] == 2
+    ll.erase(-1)
+    assert ll._data[ll.tail] == 2
+    ll.append(4)
+    assert ll.list_all() == [1, 2, 4]
+    ll.erase(0)
+    ll.erase(0)
+    ll.erase(0)
+    assert ll.head == ll.tail == NIL
+    assert ll.list_all() == []
+
+
+def test_linked_list_update_and_contains():
+    ll = ArrayLinkedList(range(5))
+    ll.update(0, 'first')
+    ll.update(2, 'middle')
+    ll.update(4, 'last')
+    assert ll.list_all() == ['first', 1, 'middle', 3, 'last']
+    assert 'middle' in ll
+    assert 2 not in ll
+    assert repr(ll) == str(ll.list_all())
+
+
+def test_linked_list_errors():
+    ll = ArrayLinkedList([1, 2])
+    with pytest.raises(IndexError):
+        ll.insert(-1, 0)
+    with pytest.raises(IndexError):
+        ll.insert(4, 0)
+    with pytest.raises(IndexError):
+        ll.erase(2)
+    with pytest.raises(IndexError):
+        ll.update(2, 0)
+    with pytest.raises(NotImplementedError):
+        ll.size = 5
+
+
+def test_linked_list_typed_data():
+    ll = ArrayLinkedList([1.5, 2.5], typecode='d')
+    ll.insert(1, 2.0)
+    assert ll.list_all() == [1.5, 2.0, 2.5]
+    with pytest.raises(TypeError):
+        ll.append('not a number')
+
+
+def test_linked_list_reuses_released_nodes():
+    ll = ArrayLinkedList(range(8), capacity=16)
+    capacity = ll._arena.capacity
+    for _ in range(1000):
+        ll.erase(0)
+        ll.append(0)
+    assert ll._arena.capacity == capacity
+    assert len(ll) == 8
+
+
+def test_deque_matches_Deque():
+    reference = Deque()
+    dq = ArrayDeque()
+    random.seed(29)
+    for _ in range(2000):
+        op = random.randrange(4)
+        if op == 0:
+            value = random.random()
+            reference.push_back(value)
+            dq.push_back(value)
+        elif op == 1:
+            value = random.random()
+            reference.push_front(value)
+            dq.push_front(value)
+        elif op == 2 and len(reference) > 0:
+            assert dq.pop_front() == reference.front()
+            reference.pop_front()
+        elif op == 3 and len(reference) > 0:
+            assert dq.pop_back() == reference.back()
+            reference.pop_back()
+        assert len(dq) == len(reference)
+        if len(reference) > 0:
+            assert dq.front() == reference.front()
+            assert dq.back() == reference.back()
+
+
+def test_deque_aliases_and_iteration():
+    dq = ArrayDeque([2, 3])
+    dq.push(4)
+    dq.push_front(1)
+    assert list(dq) == [1, 2, 3, 4]
+    assert dq.pop() == 1
+    assert dq.pop_back() == 4
+    assert dq.size == 2
+
+
+def test_deque_empty():
+    dq = ArrayDeque()
+    assert dq.front() is None
+    assert dq.back() is None
+    with pytest.raises(ValueError):
+        dq.pop_front()
+    with pytest.raises(ValueError):
+        dq.pop_back()
+    dq.push(1)
+    dq.pop_back()
+    assert dq.head == dq.tail == NIL
+    with pytest.raises(ValueError):
+        dq.pop()
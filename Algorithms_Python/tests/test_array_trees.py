@@ -0,0 +1,173 @@
+import pytest
+import random
+import math
+
+from Algorithms_Python.array_storage import NIL
+from Algorithms_Python.array_trees import ArrayBinarySearchTree, \
+    ArrayRedBlackTree, ArrayAVLTree
+
+
+TREES = [ArrayBinarySearchTree, ArrayRedBlackTree, ArrayAVLTree]
+
+
+def check_links(tree):
+    # every child points back to its parent, keys are ordered
+    # (rotations may move equal keys to either side)
+    stack = [tree.root] if tree.root != NIL else []
+    count = 0
+    while stack:
+        node = stack.pop()
+        count += 1
+        for child, ordered in ((tree._left[node], lambda a, b: a <= b),
+                               (tree._right[node], lambda a, b: a >= b)):
+            if child != NIL:
+                assert tree._parent[child] == node
+                assert ordered(tree.key(child), tree.key(node))
+                stack.append(child)
+    assert count == len(tree)
+
+
+def check_red_black(tree, node):
+    # returns the black height of the subtree
+    if node == NIL:
+        return 1
+    if tree.color(node) == 'red':
+        assert tree.color(tree._left[node]) == 'black'
+        assert tree.color(tree._right[node]) == 'black'
+    left = check_red_black(tree, tree._left[node])
+    right = check_red_black(tree, tree._right[node])
+    assert left == right
+    return left + (tree.color(node) == 'black')
+
+
+def check_avl(tree, node):
+    # returns the height of the subtree
+    if node == NIL:
+        return 0
+    left = check_avl(tree, tree._left[node])
+    right = check_avl(tree, tree._right[node])
+    assert abs(left - right) <= 1
+    assert tree.height(node) == 1 + max(left, right)
+    return 1 + max(left, right)
+
+
+def check_invariants(tree):
+    check_links(tree)
+    if isinstance(tree, ArrayRedBlackTree):
+        assert tree.color(tree.root) == 'black'
+        check_red_black(tree, tree.root)
+    if isinstance(tree, ArrayAVLTree):
+        check_avl(tree, tree.root)
+
+
+@pytest.fixture(params=TREES)
+def tree(request):
+    tree = request.param()
+    for i in [5, 3, 7, 2, 4, 6, 8]:
+        tree.insert(i)
+    return tree
+
+
+def test_insert(tree):
+    assert tree.in_order_traversal() == [2, 3, 4, 5, 6, 7, 8]
+    assert len(tree) == tree.size == 7
+    check_invariants(tree)
+
+
+def test_delete(tree):
+    tree.delete(4)
+    assert tree.in_order_traversal() == [2, 3, 5, 6, 7, 8]
+    tree.delete(5)
+    assert tree.in_order_traversal() == [2, 3, 6, 7, 8]
+    tree.delete(2)
+    assert tree.in_order_traversal() == [3, 6, 7, 8]
+    tree.delete(8)
+    assert tree.in_order_traversal() == [3, 6, 7]
+    tree.delete(100)
+    assert tree.in_order_traversal() == [3, 6, 7]
+    check_invariants(tree)
+
+
+def test_delete_from_empty(tree):
+    for i in tree.in_order_traversal():
+        tree.delete(i)
+    assert tree.is_empty()
+    with pytest.raises(IndexError):
+        tree.delete(1)
+
+
+def test_search(tree):
+    node = tree.search(6)
+    assert node is not None
+    assert tree.key(node) == 6
+    assert tree.search(10) is None
+
+
+def test_min_max_successor_predecessor(tree):
+    assert tree.find_min() == 2
+    assert tree.find_max() == 8
+    assert tree.find_successor(5) == 6
+    assert tree.find_successor(5.5) == 6
+    assert tree.find_successor(8) is None
+    assert tree.find_predecessor(5) == 4
+    assert tree.find_predecessor(1) is None
+    empty = type(tree)()
+    assert empty.find_min() is None
+    assert empty.find_max() is None
+    assert empty.max_height() == 0
+
+
+@pytest.mark.parametrize('tree_class', TREES)
+def test_random_operations(tree_class):
+    random.seed(29)
+    tree = tree_class(typecode='q')
+    reference = []
+    for _ in range(3000):
+        key = random.randrange(200)
+        if random.random() < 0.6 or not reference:
+            tree.insert(key)
+            reference.append(key)
+        else:
+            key = random.choice(reference)
+            tree.delete(key)
+            reference.remove(key)
+        assert len(tree) == len(reference)
+    assert tree.in_order_traversal() == sorted(reference)
+    check_invariants(tree)
+
+
+@pytest.mark.parametrize('tree_class', [ArrayRedBlackTree, ArrayAVLTree])
+def test_balanced_height(tree_class):
+    tree = tree_class(typecode='d')
+    n = 2 ** 12
+    for i in range(n):
+        tree.insert(float(i))
+    check_invariants(tree)
+    assert tree.max_height() <= 2 * math.log2(n + 1)
+    for i in range(0, n, 2):
+        tree.delete(float(i))
+    check_invariants(tree)
+    assert tree.in_order_traversal() == [float(i) for i in range(1, n, 2)]
+
+
+def test_unbalanced_tree_is_not_recursive():
+    tree = ArrayBinarySearchTree(typecode='q')
+    n = 5000
+    for i in range(n):
+        tree.insert(i)
+    assert tree.max_height() == n
+    assert tree.in_order_traversal() == list(range(n))
+    assert tree.find_max() == n - 1
+
+
+def test_nodes_are_reused():
+    tree = ArrayRedBlackTree(typecode='d', capacity=64)
+    for i in range(32):
+        tree.insert(i)
+    for _ in range(10):
+        for i in range(32):
+            tree.delete(i)
+        for i in range(32):
+            tree.insert(i)
+    assert tree._arena.capacity == 64
+    assert tree.memory_usage() == 64 * (8 + 3 * 4 + 1)
@@ -1,5 +1,8 @@
 import pytest
-from Algorithms_Python.bloom_filter import Bloom_filter
+import numpy as np
+
+from Algorithms_Python import bloom_filter
+from Algorithms_Python.bloom_filter import Bloom_filter, ScalableBloomFilter
 
 
 def test_can_create_bloom_filter():
@@ -75,3 +78,125 @@ def test_long_strings_for_advanced_jenkins(bf_jenkins):
 def test_raises_error_when_unrecognized_hash_passed():
     with pytest.raises(Exception):
         Bloom_filter(hashfunc='34')
+
+
+def test_bloom_filter_fast64():
+    bf = Bloom_filter(items_count=1000, hashfunc='fast64')
+    for i in range(1000):
+        bf.add(i)
+    assert all(bf.check(i) for i in range(1000))
+    false_positives = sum(bf.check(i) for i in range(1000, 11000))
+    assert false_positives < 800
+
+
+@pytest.mark.parametrize('hashfunc', ['mmh3', 'jenkins', 'fast64'])
+def test_add_many_check_many_match_one_by_one(hashfunc):
+    one_by_one = Bloom_filter(items_count=1000, hashfunc=hashfunc)
+    for i in range(1000):
+        one_by_one.add(i)
+    bulk = Bloom_filter(items_count=1000, hashfunc=hashfunc)
+    bulk.add_many(range(1000))
+    assert bulk.bit_array == one_by_one.bit_array
+    checked = bulk.check_many(np.arange(2000))
+    assert list(checked) == [bulk.check(i) for i in range(2000)]
+    assert checked[:1000].all()
+    assert checked[1000:].sum() < 100
+    assert len(bulk.check_many([])) == 0
+
+
+@pytest.mark.parametrize('hashfunc', ['mmh3', 'jenkins', 'fast64'])
+def test_add_many_strings_and_mixed_items(hashfunc):
+    bf = Bloom_filter(items_count=100, hashfunc=hashfunc)
+    bf.add_many(['a', b'b', 3, (4, 5)])
+    assert list(bf.check_many(['a', b'b', 3, (4, 5)])) == [True] * 4
+    assert bf.check((4, 5)) and not bf.check('c')
+
+
+def test_bulk_without_numpy(monkeypatch):
+    monkeypatch.setattr(bloom_filter, 'np', None)
+    bf = Bloom_filter(items_count=1000, hashfunc='fast64')
+    bf.add_many(range(1000))
+    assert bf.check_many(range(1000)) == [True] * 1000
+    assert bf.check_many(range(1000, 3000)).count(True) < 200
+
+
+def test_double_hashing_sets_hash_count_bits():
+    bf = Bloom_filter(items_count=1000, fp_prob=0.01)
+    bf.add('item')
+    assert 1 < bf.bit_array.count() <= bf.hash_count
+
+
+def test_scalable_bloom_filter_grows():
+    sbf = ScalableBloomFilter(initial_capacity=100, fp_prob=0.01)
+    for i in range(3000):
+        sbf.add(i)
+    assert len(sbf.filters) > 1
+    assert sbf.capacity() >= len(sbf) > 2900
+    assert all(sbf.check(i) for i in range(3000))
+    false_positives = sum(sbf.check(i) for i in range(3000, 13000))
+    assert false_positives < 200
+    assert 0 < sbf.estimated_fp_rate() < 0.02
+    assert 0.2 < sbf.fill_ratio() < 0.6
+
+
+def test_scalable_bloom_filter_skips_known_items():
+    sbf = ScalableBloomFilter(initial_capacity=10)
+    for _ in range(5):
+        sbf.add('item')
+    assert len(sbf) == 1 and len(sbf.filters) == 1
+
+
+@pytest.mark.parametrize('hashfunc', ['mmh3', 'fast64'])
+def test_scalable_bloom_filter_bulk(hashfunc):
+    sbf = ScalableBloomFilter(initial_capacity=50, hashfunc=hashfunc)
+    sbf.add_many(np.arange(1000))
+    sbf.add_many(f'item{i}' for i in range(500))
+    assert sbf.check_many(np.arange(1000)).all()
+    assert sbf.check_many([f'item{i}' for i in range(500)]).all()
+    assert all(count <= capacity for count, capacity
+               in zip(sbf._counts, sbf._capacities))
+    assert sbf.check_many(np.arange(1000, 11000)).sum() < 200
+    # a few new items look known already
+    assert 1400 < len(sbf) <= 1500 <= sbf.capacity()
+
+
+def test_scalable_bloom_filter_without_numpy(monkeypatch):
+    monkeypatch.setattr(bloom_filter, 'np', None)
+    sbf = ScalableBloomFilter(initial_capacity=50, hashfunc='fast64')
+    sbf.add_many(range(500))
+    assert sbf.check_many(range(500)) == [True] * 500
+    assert len(sbf) <= 500 and len(sbf.filters) > 1
+
+
+def test_scalable_bloom_filter_invalid_arguments():
+    for kwargs in ({'initial_capacity': 0}, {'fp_prob': 1},
+                   {'growth': 0.5}, {'tightening': 1}):
+        with pytest.raises(ValueError):
+            ScalableBloomFilter(**kwargs)
+
+
+@pytest.mark.parametrize('hashfunc', ['mmh3', 'jenkins', 'fast64'])
+def test_numpy_scalars_match_arrays(hashfunc):
+    values = np.arange(100)
+    bulk = Bloom_filter(items_count=100, hashfunc=hashfunc)
+    bulk.add_many(values)
+    assert all(bulk.check(value) for value in values)
+    assert bulk.check_many(list(values)).all()
+    one_by_one = Bloom_filter(items_count=100, hashfunc=hashfunc)
+    for value in values:
+        one_by_one.add(value)
+    assert one_by_one.check_many(values).all()
+    assert one_by_one.bit_array == bulk.bit_array
+
+
+def test_scalable_bloom_filter_fast64_scalars_and_arrays():
+    values = np.arange(100)
+    bulk = ScalableBloomFilter(initial_capacity=10, hashfunc='fast64')
+    bulk.add_many(values)
+    assert len(bulk.filters) > 1
+    assert sum(bulk.check(value) for value in values) == 100
+    assert bulk.check_many(list(values)).all()
+    one_by_one = ScalableBloomFilter(initial_capacity=10, hashfunc='fast64')
+    for value in values:
+        one_by_one.add(value)
+    assert one_by_one.check_many(values).all()
@@ -0,0 +1,211 @@
+import random
+import pytest
+
+from Algorithms_Python.cache import LRUCache, LFUCache, TinyLFUCache, \
+    memoize
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize('make', [LRUCache, LFUCache, TinyLFUCache])
+def test_caches_agree_with_dict(make):
+    random.seed(46)
+    cache = make(50)
+    reference = {}
+    for _ in range(5000):
+        key = random.randrange(120)
+        if random.random() < 0.5:
+            reference[key] = random.random()
+            cache[key] = reference[key]
+        elif random.random() < 0.9:
+            value = cache.get(key)
+            assert value is None or value == reference[key]
+        else:
+            cache.pop(key)
+            reference.pop(key, None)
+        assert len(cache) <= 50
+    assert len(cache) == 50
+    assert all(cache[key] == reference[key]
+               for key in range(120) if key in cache)
+    assert cache.hits + cache.misses > 0 and cache.evictions > 0
+
+
+@pytest.mark.parametrize('make', [LRUCache, LFUCache, TinyLFUCache])
+def test_cache_interface(make):
+    cache = make(4)
+    cache['a'] = 1
+    cache.put('b', None)
+    assert cache['a'] == 1 and cache.get('b', 5) is None
+    assert cache.get('c') is None and cache.get('c', 5) == 5
+    with pytest.raises(KeyError):
+        cache['c']
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert cache.hit_rate == 0.4
+    assert 'a' in cache and 'c' not in cache
+    del cache['a']
+    with pytest.raises(KeyError):
+        del cache['a']
+    assert cache.pop('b', 7) is None and cache.pop('b', 7) == 7
+    assert len(cache) == 0
+    assert cache.get_or_load('x', str.upper) == 'X'
+    assert cache.get_or_load('x', str.lower) == 'X'
+    cache.clear()
+    assert len(cache) == 0 and 'x' not in cache
+    with pytest.raises(ValueError):
+        make(0)
+    with pytest.raises(ValueError):
+        make(4, max_bytes=0)
+    with pytest.raises(ValueError):
+        make(4, ttl=-1)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache[key] = key
+    cache['a']
+    # contains does not count as a use
+    assert 'b' in cache
+    cache['d'] = 'd'
+    assert 'b' not in cache and cache.evictions == 1
+    cache['c'] = 'C'
+    cache['e'] = 'e'
+    assert 'a' not in cache
+    assert sorted(cache._index.to_dict()) == ['c', 'd', 'e']
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = LFUCache(3)
+    for key in 'abc':
+        cache[key] = key
+    for _ in range(3):
+        cache['a']
+    cache['b']
+    assert [cache.frequency(key) for key in 'abcz'] == [4, 2, 1, 0]
+    cache['d'] = 'd'
+    assert 'c' not in cache
+    # of the entries used once the least recently used goes first
+    cache['e'] = 'e'
+    assert 'd' not in cache and 'b' in cache
+    cache['e']
+    cache['e']
+    cache['f'] = 'f'
+    assert 'b' not in cache
+    # the emptied buckets are unlinked
+    frequencies = []
+    bucket = cache._buckets._next_node
+    while bucket is not cache._buckets:
+        assert bucket.entries.size > 0
+        frequencies.append(bucket.frequency)
+        bucket = bucket._next_node
+    assert frequencies == sorted(frequencies) == [1, 3, 4]
+
+
+def test_tinylfu_admits_by_frequency():
+    cache = TinyLFUCache(100)
+    hot = [f'hot{i}' for i in range(50)]
+    for _ in range(5):
+        for key in hot:
+            cache.get(key) or cache.put(key, key)
+    # a scan of keys seen once does not push the hot keys out
+    for i in range(1000):
+        cache.get(f'scan{i}') or cache.put(f'scan{i}', i)
+    assert all(key in cache for key in hot)
+    lru = LRUCache(100)
+    for _ in range(5):
+        for key in hot:
+            lru.get(key) or lru.put(key, key)
+    for i in range(1000):
+        lru.get(f'scan{i}') or lru.put(f'scan{i}', i)
+    assert not any(key in lru for key in hot)
+
+
+def test_tinylfu_segments_stay_within_capacity():
+    random.seed(2)
+    cache = TinyLFUCache(200)
+    for _ in range(20000):
+        key = int(random.paretovariate(0.8))
+        if cache.get(key) is None:
+            cache[key] = key
+    sizes = (cache._window.size, cache._probation.size,
+             cache._protected.size)
+    assert sum(sizes) == len(cache) == 200
+    assert sizes[0] <= 2 and sizes[2] <= 158
+    assert cache._sketch.total < 2000
+
+
+@pytest.mark.parametrize('make', [LRUCache, LFUCache, TinyLFUCache])
+def test_ttl(make):
+    clock = FakeClock()
+    cache = make(10, ttl=10, clock=clock)
+    cache['a'] = 1
+    cache.put('b', 2, ttl=100)
+    cache.put('c', 3, ttl=5)
+    clock.now = 6
+    assert 'c' not in cache and cache.expirations == 1
+    assert cache['a'] == 1
+    clock.now = 10
+    assert cache.get('a') is None and cache.expirations == 2
+    cache['a'] = 4
+    cache['d'] = 5
+    clock.now = 25
+    assert cache.expire() == 2 and len(cache) == 1
+    assert cache['b'] == 2 and cache.expirations == 4
+
+
+@pytest.mark.parametrize('make', [LRUCache, LFUCache, TinyLFUCache])
+def test_max_bytes(make):
+    cache = make(100, max_bytes=10, sizeof=lambda key, value: len(value))
+    cache['a'] = 'xxxx'
+    cache['b'] = 'xxxx'
+    assert cache.bytes == 8
+    cache['c'] = 'xxxx'
+    assert len(cache) == 2 and cache.bytes == 8 and cache.evictions == 1
+    # an entry larger than the budget is not stored
+    cache['c'] = 'x' * 11
+    assert 'c' not in cache and cache.bytes <= 4
+    cache['d'] = 'x' * 10
+    assert len(cache) == 1 and cache.bytes == 10
+    cache['d'] = 'x'
+    assert cache.bytes == 1
+
+
+def test_memoize():
+    calls = []
+
+    @memoize
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(3), square(3), square(4)] == [9, 9, 16]
+    assert calls == [3, 4] and square.__name__ == 'square'
+    assert isinstance(square.cache, LRUCache)
+    assert square.cache.hits == 1 and square.cache.misses == 2
+
+    @memoize(LFUCache(2))
+    def power(x, exponent=2):
+        calls.append((x, exponent))
+        return x ** exponent
+
+    assert power(2) == 4 and power(2, exponent=3) == 8
+    assert power(2, exponent=3) == 8 and power(2, 3) == 8
+    assert calls[2:] == [(2, 2), (2, 3), (2, 3)]
+    assert isinstance(power.cache, LFUCache)
+
+    @memoize(capacity=1)
+    def identity(x):
+        calls.append(x)
+        return x
+
+    identity(1), identity(2), identity(1)
+    assert calls[-3:] == [1, 2, 1] and len(identity.cache) == 1
+    with pytest.raises(TypeError):
+        identity([1])
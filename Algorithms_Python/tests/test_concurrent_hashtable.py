@@ -0,0 +1,198 @@
+import pytest
+import threading
+import time
+
+from Algorithms_Python.concurrent_hashtable import ConcurrentHashTable, \
+    RWLock
+
+
+@pytest.mark.parametrize('readers_writer', [False, True])
+def test_set_get_delete(readers_writer):
+    table = ConcurrentHashTable(shards=4, readers_writer=readers_writer)
+    for i in range(100):
+        table[f'key{i}'] = i
+    assert len(table) == 100
+    assert table['key42'] == 42
+    assert 'key7' in table and 'nokey' not in table
+    assert table.get('nokey') is None and table.get('nokey', 5) == 5
+    with pytest.raises(KeyError):
+        table['nokey']
+    for i in range(0, 100, 2):
+        del table[f'key{i}']
+    assert table.to_dict() == {f'key{i}': i for i in range(1, 100, 2)}
+    assert sorted(table) == sorted(f'key{i}' for i in range(1, 100, 2))
+
+
+def test_shards_resize_independently():
+    table = ConcurrentHashTable(shards=4, capacity=120)
+    sizes = [t.capacity for t in table._tables]
+    # the keys 0, 4, 8, ... all go to the first shard
+    for i in range(0, 400, 4):
+        table[i] = i
+    assert table._tables[0].capacity > sizes[0]
+    assert [t.capacity for t in table._tables[1:]] == sizes[1:]
+    assert table.size == 100
+    assert table.capacity == sum(t.capacity for t in table._tables)
+
+
+def test_invalid_shards():
+    with pytest.raises(ValueError):
+        ConcurrentHashTable(shards=0)
+
+
+def test_setdefault_and_compute_if_absent():
+    table = ConcurrentHashTable()
+    assert table.setdefault('a', 1) == 1
+    assert table.setdefault('a', 2) == 1
+    calls = []
+
+    def square(key):
+        calls.append(key)
+        return key * key
+
+    assert table.compute_if_absent(3, square) == 9
+    assert table.compute_if_absent(3, square) == 9
+    assert calls == [3]
+
+
+def test_update_many_and_from_dict():
+    table = ConcurrentHashTable(shards=3)
+    table.update_many({i: i for i in range(50)})
+    table.update_many([(0, 'zero'), (0, 'again'), (50, 50)])
+    expected = {i: i for i in range(51)}
+    expected[0] = 'again'
+    assert table.to_dict() == expected
+    assert ConcurrentHashTable.from_dict(expected) == table
+    assert repr(ConcurrentHashTable.from_dict({1: 2})) == '{1: 2}'
+
+
+@pytest.mark.parametrize('readers_writer', [False, True])
+def test_many_threads(readers_writer):
+    table = ConcurrentHashTable(shards=8, readers_writer=readers_writer)
+    threads, per_thread = 4, 1000
+
+    def work(k):
+        for i in range(per_thread):
+            table[(k, i)] = i
+            assert table[(k, i)] == i
+        for i in range(0, per_thread, 2):
+            del table[(k, i)]
+
+    workers = [threading.Thread(target=work, args=(k,), daemon=True)
+               for k in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert table.to_dict() == {(k, i): i for k in range(threads)
+                               for i in range(1, per_thread, 2)}
+
+
+def test_compute_if_absent_computes_once_under_contention():
+    table = ConcurrentHashTable()
+    calls = []
+    results = []
+
+    def slow(key):
+        calls.append(key)
+        time.sleep(0.01)
+        return object()
+
+    def work():
+        results.append(table.compute_if_absent('key', slow))
+
+    workers = [threading.Thread(target=work, daemon=True) for _ in range(8)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_counters_with_setdefault():
+    table = ConcurrentHashTable(shards=2)
+    lock = threading.Lock()
+
+    def work():
+        for i in range(500):
+            # one list per key no matter which thread came first
+            counter = table.setdefault(i % 10, [])
+            with lock:
+                counter.append(i)
+
+    workers = [threading.Thread(target=work, daemon=True) for _ in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert sum(len(table[i]) for i in range(10)) == 2000
+
+
+def test_update_many_is_atomic():
+    table = ConcurrentHashTable(shards=4)
+    keys = list(range(20))
+    table.update_many({key: 0 for key in keys})
+    stop = threading.Event()
+    torn = []
+
+    def write():
+        for version in range(1, 200):
+            table.update_many({key: version for key in keys})
+        stop.set()
+
+    def read():
+        while not stop.is_set():
+            if len(set(table.to_dict().values())) != 1:
+                torn.append(True)
+
+    workers = [threading.Thread(target=write, daemon=True),
+               threading.Thread(target=read, daemon=True)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert not torn
+    assert set(table.to_dict().values()) == {199}
+
+
+def test_rwlock_readers_share_writer_excludes():
+    lock = RWLock()
+    inside = []
+    both_read = threading.Barrier(2, timeout=1)
+
+    def reader():
+        with lock.read:
+            # both readers get here at once, or the barrier breaks
+            both_read.wait()
+
+    readers = [threading.Thread(target=reader, daemon=True)
+               for _ in range(2)]
+    for r in readers:
+        r.start()
+    for r in readers:
+        r.join()
+    assert not both_read.broken
+
+    lock.acquire_read()
+
+    def writer():
+        with lock.write:
+            inside.append('writer')
+
+    w = threading.Thread(target=writer, daemon=True)
+    w.start()
+    time.sleep(0.02)
+    assert inside == []
+    # a waiting writer keeps new readers out
+    late = threading.Thread(target=lambda: (lock.acquire_read(),
+                                            inside.append('reader'),
+                                            lock.release_read()),
+                            daemon=True)
+    late.start()
+    time.sleep(0.02)
+    assert inside == []
+    lock.release_read()
+    w.join(timeout=1)
+    late.join(timeout=1)
+    assert inside == ['writer', 'reader']
@@ -0,0 +1,262 @@
+import pytest
+import asyncio
+import queue
+import threading
+import time
+
+from Algorithms_Python.concurrent_queue import ConcurrentQueue, \
+    AsyncQueue, AsyncDeque
+
+
+def test_put_get_fifo():
+    q = ConcurrentQueue()
+    for i in range(10):
+        q.put(i)
+    assert len(q) == 10
+    assert [q.get() for _ in range(10)] == list(range(10))
+    assert q.empty()
+
+
+def test_get_timeout_and_nowait():
+    q = ConcurrentQueue()
+    start = time.monotonic()
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.05)
+    assert time.monotonic() - start >= 0.04
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+    with pytest.raises(queue.Empty):
+        q.get_many(5, timeout=0.01)
+    with pytest.raises(ValueError):
+        q.get(timeout=-1)
+
+
+def test_bounded_put():
+    q = ConcurrentQueue(maxsize=2)
+    q.put(1)
+    q.put_nowait(2)
+    assert q.full()
+    with pytest.raises(queue.Full):
+        q.put_nowait(3)
+    with pytest.raises(queue.Full):
+        q.put(3, timeout=0.01)
+    # a blocked producer continues when a consumer makes room
+    producer = threading.Thread(target=q.put, args=(3,), daemon=True)
+    producer.start()
+    time.sleep(0.02)
+    assert q.get() == 1
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert [q.get(), q.get()] == [2, 3]
+
+
+def test_get_blocks_until_put():
+    q = ConcurrentQueue()
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(q.get()),
+                                daemon=True)
+    consumer.start()
+    time.sleep(0.02)
+    assert result == []
+    q.put('item')
+    consumer.join(timeout=1)
+    assert result == ['item']
+
+
+def test_get_many_drains_a_batch():
+    q = ConcurrentQueue()
+    q.put_many(range(10))
+    assert q.get_many(4) == [0, 1, 2, 3]
+    assert q.get_many(100) == [4, 5, 6, 7, 8, 9]
+    with pytest.raises(ValueError):
+        q.get_many(0)
+
+
+def test_bounded_put_many_waits_for_room():
+    q = ConcurrentQueue(maxsize=3)
+    producer = threading.Thread(target=q.put_many, args=(range(10),),
+                                daemon=True)
+    producer.start()
+    received = []
+    while len(received) < 10:
+        received += q.get_many(2, timeout=1)
+    producer.join(timeout=1)
+    assert received == list(range(10))
+    with pytest.raises(queue.Full):
+        q.put_many(range(5), timeout=0.01)
+    assert len(q) == 3
+
+
+@pytest.mark.parametrize('batch', [1, 64])
+def test_many_producers_and_consumers(batch):
+    q = ConcurrentQueue(maxsize=100)
+    producers, per_producer = 4, 2000
+    received = []
+    lock = threading.Lock()
+
+    def produce(k):
+        for i in range(per_producer):
+            q.put((k, i))
+
+    def consume():
+        while True:
+            items = q.get_many(batch)
+            if None in items:
+                with lock:
+                    received.extend(x for x in items if x is not None)
+                # a batch may take the stop marks of other consumers
+                for _ in range(items.count(None) - 1):
+                    q.put(None)
+                return
+            with lock:
+                received.extend(items)
+
+    threads = [threading.Thread(target=produce, args=(k,), daemon=True)
+               for k in range(producers)]
+    consumers = [threading.Thread(target=consume, daemon=True)
+                 for _ in range(3)]
+    for t in threads + consumers:
+        t.start()
+    for t in threads:
+        t.join()
+    for _ in consumers:
+        q.put(None)
+    for t in consumers:
+        t.join(timeout=5)
+    assert sorted(received) == sorted((k, i) for k in range(producers)
+                                      for i in range(per_producer))
+
+
+def test_async_queue_put_get():
+    async def main():
+        q = AsyncQueue()
+        await q.put(1)
+        q.put_nowait(2)
+        assert len(q) == 2
+        assert await q.get() == 1
+        assert q.get_nowait() == 2
+        with pytest.raises(asyncio.QueueEmpty):
+            q.get_nowait()
+        assert q.empty()
+
+    asyncio.run(main())
+
+
+def test_async_queue_waits():
+    async def main():
+        q = AsyncQueue(maxsize=1)
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        await q.put('a')
+        assert await getter == 'a'
+        await q.put('b')
+        assert q.full()
+        with pytest.raises(asyncio.QueueFull):
+            q.put_nowait('c')
+        putter = asyncio.create_task(q.put('c'))
+        await asyncio.sleep(0)
+        assert not putter.done()
+        assert await q.get() == 'b'
+        await putter
+        assert q.get_nowait() == 'c'
+
+    asyncio.run(main())
+
+
+def test_async_cancelled_getter_passes_the_item_on():
+    async def main():
+        q = AsyncQueue()
+        first = asyncio.create_task(q.get())
+        second = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        first.cancel()
+        q.put_nowait(1)
+        assert await second == 1
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
+
+
+def test_async_get_many():
+    async def main():
+        q = AsyncQueue(maxsize=4)
+        for i in range(4):
+            q.put_nowait(i)
+        putter = asyncio.create_task(q.put(4))
+        await asyncio.sleep(0)
+        assert await q.get_many(3) == [0, 1, 2]
+        await putter
+        assert await q.get_many(10) == [3, 4]
+        with pytest.raises(ValueError):
+            await q.get_many(0)
+
+    asyncio.run(main())
+
+
+def test_async_queue_from_threads():
+    async def main():
+        q = AsyncQueue(maxsize=50, loop=asyncio.get_running_loop())
+
+        def produce(k):
+            for i in range(0, 300, 30):
+                q.put_many_threadsafe(
+                    [(k, j) for j in range(i, i + 30)]).result()
+            q.put_threadsafe((k, None)).result()
+
+        threads = [threading.Thread(target=produce, args=(k,))
+                   for k in range(4)]
+        for t in threads:
+            t.start()
+        received, finished = [], 0
+        while finished < 4:
+            for item in await q.get_many(16):
+                if item[1] is None:
+                    finished += 1
+                else:
+                    received.append(item)
+        # joining in the loop thread would block the loop
+        # which completes the producers' futures
+        for t in threads:
+            await asyncio.to_thread(t.join)
+        # every producer's items arrive in order
+        for k in range(4):
+            assert [j for kk, j in received if kk == k] == list(range(300))
+
+    asyncio.run(main())
+
+
+def test_async_queue_needs_a_loop_for_threads():
+    q = AsyncQueue()
+    with pytest.raises(RuntimeError):
+        q.put_threadsafe(1)
+
+    async def main():
+        await q.put(1)
+
+    asyncio.run(main())
+    # bound to the finished loop, a new one is rejected
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+
+
+def test_async_deque_both_ends():
+    async def main():
+        dq = AsyncDeque(maxsize=3)
+        await dq.put(2)
+        await dq.put_front(1)
+        dq.put_front_nowait(0)
+        with pytest.raises(asyncio.QueueFull):
+            dq.put_front_nowait(-1)
+        assert await dq.get_back() == 2
+        assert dq.get_back_nowait() == 1
+        assert await dq.get() == 0
+        with pytest.raises(asyncio.QueueEmpty):
+            dq.get_back_nowait()
+        getter = asyncio.create_task(dq.get_back())
+        await asyncio.sleep(0)
+        dq.put_nowait('x')
+        assert await getter == 'x'
+
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+import random
+import pytest
+
+from Algorithms_Python.count_min_sketch import CountMinSketch
+
+
+def test_sketch_never_underestimates():
+    random.seed(46)
+    sketch = CountMinSketch(width=256, depth=4)
+    counts = {}
+    for _ in range(5000):
+        item = f'item{int(random.paretovariate(1.2))}'
+        sketch.add(item)
+        counts[item] = counts.get(item, 0) + 1
+    assert sketch.total == 5000
+    assert all(sketch.estimate(item) >= count
+               for item, count in counts.items())
+    # the error bound e / width * total holds for most items
+    bound = 2.72 / 256 * 5000
+    within = sum(sketch[item] - count <= bound
+                 for item, count in counts.items())
+    assert within / len(counts) > 0.95
+    assert sketch.estimate('never added') <= bound
+
+
+def test_conservative_update_overestimates_less():
+    plain = CountMinSketch(width=64, depth=3)
+    conservative = CountMinSketch(width=64, depth=3, conservative=True)
+    for i in range(2000):
+        for sketch in (plain, conservative):
+            sketch.add(i % 300, count=2)
+    items = range(300)
+    assert all(plain[i] >= conservative[i] >= (2000 // 300) * 2
+               for i in items)
+    assert sum(conservative[i] for i in items) < \
+        sum(plain[i] for i in items)
+
+
+def test_saturation_halving_and_clear():
+    sketch = CountMinSketch(width=16, max_count=15)
+    # the counters take one byte
+    assert sketch._counters.itemsize == 1
+    for _ in range(40):
+        sketch.add('hot')
+    sketch.add(7, count=3)
+    assert sketch['hot'] == 15 and sketch[7] >= 3
+    sketch.halve()
+    assert sketch['hot'] == 7 and sketch.total == 21
+    sketch.clear()
+    assert sketch['hot'] == 0 and sketch.total == 0
+
+
+def test_from_error_and_validation():
+    sketch = CountMinSketch.from_error(0.01, 0.01)
+    assert sketch.width == 512 and sketch.depth == 5
+    assert CountMinSketch(width=100).width == 128
+    with pytest.raises(ValueError):
+        CountMinSketch(width=0)
+    with pytest.raises(ValueError):
+        CountMinSketch.from_error(0, 0.1)
+    with pytest.raises(ValueError):
+        sketch.add('item', count=-1)
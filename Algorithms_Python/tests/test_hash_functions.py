@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from array import array
+
+import Algorithms_Python.hash_functions as hash_functions
+from Algorithms_Python.hash_functions import splitmix64, hash64, \
+    hash_family, hash_array
+from Algorithms_Python.hashtable import HashTable_closed, \
+    HashTable_robinhood, resolve_hash, simple_hash
+
+
+def test_splitmix64_known_values():
+    # the first outputs of the SplitMix64 generator seeded with 0
+    assert splitmix64(0) == 0xE220A8397B1DCDAF
+    assert splitmix64(0x9E3779B97F4A7C15) == 0x6E789E6AA1B965F4
+    assert splitmix64(1 << 64) == splitmix64(0)
+
+
+def test_equal_keys_hash_equal():
+    assert hash64(1) == hash64(True) == hash64(1.0)
+    assert hash64(-1) == hash64(-1.0) and hash64(0.5) != hash64(0)
+    assert hash64('abc') == hash64(b'abc') == hash64(bytearray(b'abc'))
+    assert hash64((1, 'a')) == hash64((1, 'a'))
+    assert hash64(1 << 70) != hash64(1 << 71)
+    assert all(0 <= hash64(x) < 1 << 64
+               for x in [0, -1, 1 << 63, -(1 << 63), 1 << 100, 'x', 2.5])
+
+
+def test_lone_surrogates():
+    # hashed as their bytes instead of crashing mmh3
+    assert hash64('\ud800') == hash64('\ud800'.encode('utf-8', 'surrogatepass'))
+    assert hash64('a\udfff', 5) != hash64('a\ud800', 5)
+
+    class Key(str):
+        pass
+
+    assert hash64(Key('\ud800')) == hash64('\ud800')
+
+
+def test_no_collisions_and_anagrams():
+    words = [f'key{i}' for i in range(100000)]
+    assert len({hash64(w) for w in words}) == len(words)
+    assert len({hash64(i) for i in range(100000)}) == 100000
+    anagrams = ['listen', 'silent', 'enlist', 'tinsel', 'inlets']
+    assert len({simple_hash(w) for w in anagrams}) == 1
+    assert len({hash64(w) for w in anagrams}) == len(anagrams)
+
+
+@pytest.mark.parametrize('keys', [range(64000),
+                                  [f'{i}' for i in range(64000)]])
+def test_buckets_are_uniform(keys):
+    counts = [0] * 64
+    for key in keys:
+        counts[hash64(key) >> 58] += 1
+    expected = len(keys) / 64
+    chi2 = sum((c - expected) ** 2 / expected for c in counts)
+    # 63 degrees of freedom, the 0.999 quantile is about 103
+    assert chi2 < 103
+
+
+def test_avalanche():
+    # flipping one input bit flips about half of the output bits
+    flips = [bin(hash64(x) ^ hash64(x ^ (1 << bit))).count('1')
+             for x in range(200) for bit in range(64)]
+    assert 31 < sum(flips) / len(flips) < 33
+
+
+def test_seeds_give_independent_functions():
+    family = hash_family(4)
+    assert [f('key') for f in family] == \
+        [hash64('key', seed) for seed in range(4)]
+    for key in [5, 'five', (5,)]:
+        assert len({f(key) for f in family}) == 4
+    # the low bits of two functions agree on about 1 key in 256
+    same = sum((family[0](i) ^ family[1](i)) & 0xFF == 0
+               for i in range(25600))
+    assert 50 < same < 150
+
+
+def test_hash_array_matches_hash64():
+    values = [0, 1, -1, 12345, 1 << 62, -(1 << 63)]
+    for seed in [0, 3]:
+        hashes = hash_array(values, seed)
+        assert [int(h) for h in hashes] == [hash64(v, seed) for v in values]
+
+
+def test_one_64_bit_range():
+    # -1 and 2^64 - 1 share their lower 64 bits
+    assert hash64(-1) != hash64((1 << 64) - 1)
+    assert hash64(-(1 << 63), 4) != hash64(1 << 63, 4)
+    values = [1 << 63, (1 << 64) - 1, 5]
+    for array_values in (np.array(values, dtype=np.uint64),
+                         np.array(values, dtype=object),
+                         np.array([1 << 70, -1], dtype=object)):
+        assert hash_array(array_values, 2).tolist() == \
+            [hash64(int(v), 2) for v in array_values]
+    assert splitmix64(np.array([0], dtype=np.uint64)).tolist() == \
+        [splitmix64(0)]
+
+
+def test_hash_array_without_numpy(monkeypatch):
+    monkeypatch.setattr(hash_functions, 'np', None)
+    hashes = hash_array(range(10), 7)
+    assert isinstance(hashes, array)
+    assert list(hashes) == [hash64(v, 7) for v in range(10)]
+
+
+def test_fast64_in_hash_tables():
+    assert resolve_hash('fast64') is hash64
+    for table in [HashTable_closed(hashfunc='fast64'),
+                  HashTable_robinhood(hashfunc='fast64')]:
+        for i in range(100):
+            table[f'key{i}'] = i
+        assert all(table[f'key{i}'] == i for i in range(100))
+    assert HashTable_closed(hashfunc='fast64').get_hash('a') == \
+        hash64('a') % 31
@@ -1,7 +1,10 @@
 from Algorithms_Python.hashtable \
-    import HashTable_closed, gen_primes, HashTable_open, poly_hash
+    import HashTable_closed, gen_primes, HashTable_open, poly_hash, \
+    HashTable_compact, resolve_hash, HashTable_robinhood, HashTable_cuckoo, \
+    simple_hash
 import random
 import pytest
+from collections import deque
 
 
 def test_gen_primes():
@@ -53,8 +56,8 @@ def test_ht_handles_collisions(ht):
         assert ht[2 + 2 * (i + 1)] == chr(i)
     assert ht.size == 240, \
         'size calculates wrong when many collisions happen'
-    assert ht.capacity == 31, \
-        'collisions are handled ineffectively or wrong'
+    assert ht.size / ht.capacity <= 0.75, \
+        'the table should grow by the global load factor'
 
 
 def test_cannot_set_size_and_capacity_for_ht_after_init(ht):
@@ -245,3 +248,523 @@ def test_to_dict_open(ht_open):
     dict_with_samples = ht_open.to_dict()
     assert isinstance(dict_with_samples, dict)
     assert dict_with_samples.items() == dict_compare.items()
+
+
+def test_bulk_methods_open():
+    ht = HashTable_open.from_items([(i, i) for i in range(100)])
+    assert ht.capacity >= 200
+    assert ht.to_dict() == {i: i for i in range(100)}
+    ht.set_many({0: 'zero', 100: 100})
+    assert ht.get_many([0, 100, 101], default=-1) == ['zero', 100, -1]
+    assert ht.delete_many([1, 2, 101]) == 2
+    assert ht.size == 99 and ht.get_many([1, 2]) == [None, None]
+
+
+@pytest.mark.parametrize('keys', [list(range(-300, 300)),
+                                  [str(i) for i in range(600)]])
+def test_bulk_methods_open_batch_hashed(keys):
+    ht = HashTable_open(hashfuncs=['fast64', simple_hash])
+    ht.set_many((key, key) for key in keys)
+    ht.set_many((key, 'new') for key in keys[::3])
+    expected = {key: key for key in keys}
+    expected.update({key: 'new' for key in keys[::3]})
+    assert ht.to_dict() == expected
+    assert ht.get_many(keys) == [ht[key] for key in keys]
+    assert ht.delete_many(keys[::2] + ['absent']) == len(keys[::2])
+    assert ht.to_dict() == {key: expected[key] for key in keys[1::2]}
+
+
+def test_open_rehash_hashes_every_key_once():
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return hash(x) * 7
+
+    ht = HashTable_open(hashfuncs=['fast64', counted])
+    for i in range(200):
+        ht[i] = i
+    assert ht.to_dict() == {i: i for i in range(200)} and ht.size == 200
+    calls.clear()
+    ht.reserve(1000)
+    # one batch for the pairs and no insertions through __setitem__
+    assert sorted(calls) == list(range(200))
+    assert ht.get_many(range(200)) == list(range(200))
+
+
+def test_open_from_dict():
+    ht = HashTable_open.from_dict({1: 2, 3: 4})
+    assert type(ht) is HashTable_open and ht.to_dict() == {1: 2, 3: 4}
+
+
+# HashTable_compact
+
+
+def test_compact_matches_dict():
+    random.seed(38)
+    ht = HashTable_compact()
+    reference = {}
+    for step in range(20000):
+        key = random.randrange(3000)
+        if random.random() < 0.6:
+            ht[key] = step
+            reference[key] = step
+        else:
+            del ht[key]
+            reference.pop(key, None)
+        assert ht.size == len(reference)
+    assert list(ht.items()) == list(reference.items())
+    assert ht.to_dict() == reference
+    for key in range(-1, 3001):
+        assert (key in ht) == (key in reference)
+        if key in reference:
+            assert ht[key] == reference[key]
+
+
+def test_compact_keeps_insertion_order():
+    ht = HashTable_compact()
+    for key in ['b', 'a', 'c', 'd']:
+        ht[key] = key.upper()
+    ht['a'] = 'updated'
+    del ht['c']
+    ht['c'] = 'again'
+    assert list(ht) == ['b', 'a', 'd', 'c']
+    assert str(ht) == str({'b': 'B', 'a': 'updated', 'd': 'D', 'c': 'again'})
+    assert repr(ht) == str(ht)
+    # the position in the dense arrays, the tombstone of 'c' included
+    assert ht.search('d') == 3 and ht.search('x') is False
+
+
+def test_compact_errors():
+    ht = HashTable_compact()
+    with pytest.raises(KeyError):
+        ht['absent']
+    # deleting an absent key does nothing, as in HashTable_closed
+    del ht['absent']
+    assert len(ht) == 0
+    with pytest.raises(TypeError):
+        HashTable_compact(hashfunc='crc')
+
+
+def test_compact_index_grows_and_shrinks():
+    ht = HashTable_compact()
+    assert ht.capacity == 16 and ht._index.typecode == 'b'
+    for i in range(10000):
+        ht[i] = i
+    assert ht.capacity == 16384 and ht._index.typecode == 'h'
+    for i in range(9990):
+        del ht[i]
+    # the tombstones were compacted away and the index shrank
+    assert ht.capacity <= 64
+    assert len(ht._keys) <= 2 * ht.size + 8
+    assert list(ht) == list(range(9990, 10000))
+    assert HashTable_compact(capacity=100).capacity == 256
+
+
+def test_compact_resize_reuses_cached_hashes():
+    calls = []
+
+    def counting_hash(x):
+        calls.append(x)
+        return hash(x)
+
+    ht = HashTable_compact(hashfunc=counting_hash)
+    for i in range(1000):
+        ht[i] = i
+    # one call per insertion, none while resizing
+    assert len(calls) == 1000
+
+
+def test_compact_handles_colliding_hashes():
+    ht = HashTable_compact(hashfunc=lambda x: 7)
+    for i in range(200):
+        ht[str(i)] = i
+    for i in range(0, 200, 2):
+        del ht[str(i)]
+    assert all(ht[str(i)] == i for i in range(1, 200, 2))
+    assert '0' not in ht and ht.size == 100
+
+
+@pytest.mark.parametrize('hashfunc', ['poly', 'sha1', 'md5', poly_hash, hash])
+def test_compact_with_different_hashes(hashfunc):
+    ht = HashTable_compact(hashfunc=hashfunc)
+    for key in [True, 'a', 6, (1, 2), -1]:
+        ht[key] = str(key)
+    assert [ht[key] for key in [True, 'a', 6, (1, 2), -1]] == \
+        ['True', 'a', '6', '(1, 2)', '-1']
+    assert 0 <= resolve_hash(hashfunc)('a') < 2 ** 64
+
+
+def test_compact_from_dict_and_eq():
+    dictionary = {True: 0, 'believe': 1, 32: 18}
+    ht = HashTable_compact.from_dict(dictionary)
+    assert ht.to_dict() == dictionary
+    assert ht == HashTable_closed.from_dict(dictionary)
+
+
+def test_closed_hashes_each_key_once():
+    calls = []
+
+    def counting_hash(x):
+        calls.append(x)
+        return hash(x)
+
+    ht = HashTable_closed(hashfunc=counting_hash, load_factor_threshold=0.1)
+    for i in range(200):
+        ht[i] = i
+    # the table grew, the pairs were moved by their stored hashes
+    assert ht.capacity > 31
+    assert len(calls) == 200
+    ht[5] = 'five'
+    assert ht[5] == 'five' and 5 in ht and ht.search(500) is False
+    del ht[5]
+    assert len(calls) == 205 and len(ht) == 199
+    assert ht.to_dict() == {i: i for i in range(200) if i != 5}
+
+
+@pytest.mark.parametrize('hashfunc', ['md5', 'sha1', 'poly', 'fast64', hash])
+def test_get_hash_is_the_chain_of_the_key(hashfunc):
+    ht = HashTable_closed(hashfunc=hashfunc)
+    for key in ['abc', 1, (2, 'x')]:
+        ht[key] = key
+        assert key in [pair.key for pair in ht.pairs[ht.get_hash(key)]]
+    with pytest.raises(TypeError):
+        HashTable_open(hashfuncs=['md5', 'crc'])
+
+
+def test_closed_compares_full_hashes():
+    # every key falls into the same chain, but the full hashes differ
+    ht = HashTable_closed(hashfunc=lambda x: x * 31)
+    for i in range(20):
+        ht[i] = -i
+    assert all(ht[i] == -i for i in range(20)) and len(ht) == 20
+    assert ht._pairs.elements[0][0].hashed == 0
+    # the public pairs keep their two fields
+    key, value = ht.pairs[0][0]
+    assert key == 0 and value == 0
+    assert all(len(pair) == 2 for chain in ht.pairs for pair in chain)
+    with pytest.raises(TypeError):
+        HashTable_closed(hashfunc='crc')
+
+
+def test_closed_grows_and_shrinks_by_global_load_factor():
+    ht = HashTable_closed()
+    for i in range(23):
+        ht[i] = i
+    assert ht.capacity == 31
+    ht[23] = 23
+    assert ht.capacity > 31 and len(ht) / ht.capacity <= 0.75
+    grown = ht.capacity
+    for i in range(20):
+        del ht[i]
+    assert ht.capacity < grown
+    assert ht.to_dict() == {i: i for i in range(20, 24)}
+
+
+@pytest.mark.parametrize('hashfunc', [hash, 'md5'])
+def test_closed_incremental_rehash_matches_dict(hashfunc):
+    random.seed(40)
+    ht = HashTable_closed(hashfunc=hashfunc, incremental=True)
+    reference = dict()
+    seen_rehashing = False
+    for step in range(3000):
+        key = random.randrange(600)
+        if step < 2000 and random.random() < 0.7:
+            ht[key] = step
+            reference[key] = step
+        else:
+            del ht[key]
+            reference.pop(key, None)
+        seen_rehashing |= ht.rehashing
+        assert len(ht) == len(reference)
+        if step % 100 == 0:
+            assert ht.to_dict() == reference
+            assert all(ht[k] == v for k, v in reference.items())
+    assert seen_rehashing
+    assert ht.to_dict() == reference
+    assert all((k in ht) == (k in reference) for k in range(600))
+
+
+def test_pairs_holds_a_chain_per_slot():
+    ht = HashTable_closed(capacity=100)
+    ht['a'] = 1
+    ht.increase_capacity()
+    pairs = ht.pairs
+    assert len(pairs) == ht.capacity
+    assert all(isinstance(chain, deque) for chain in pairs)
+    assert [pair.key for chain in pairs for pair in chain] == ['a']
+
+
+def test_closed_incremental_rehash_moves_a_few_chains_per_operation():
+    ht = HashTable_closed(incremental=True)
+    for i in range(23):
+        ht[i] = i
+    ht[23] = 23
+    assert ht.rehashing
+    # the old table has 31 chains, each operation moves at least 4
+    for _ in range(8):
+        ht[0]
+    assert not ht.rehashing
+    assert ht.to_dict() == {i: i for i in range(24)}
+    # the pairs getter finishes a rehash in progress
+    for i in range(24, 200):
+        ht[i] = i
+    ht.increase_capacity()
+    assert ht.rehashing
+    pairs = ht.pairs
+    assert not ht.rehashing and \
+        sum(len(chain) for chain in pairs) == 200
+
+
+@pytest.mark.parametrize('hashfunc', [hash, 'fast64', 'md5'])
+def test_closed_bulk_methods_match_dict(hashfunc):
+    ht = HashTable_closed(hashfunc=hashfunc)
+    ht.set_many({i: i for i in range(-50, 500)})
+    ht.set_many([('a', 1), ('a', 2), (3.5, 'x'), (0, 'zero')])
+    reference = {i: i for i in range(-50, 500)}
+    reference.update({'a': 2, 3.5: 'x', 0: 'zero'})
+    assert ht.to_dict() == reference and ht.size == len(reference)
+    assert all(ht[k] == v for k, v in reference.items())
+    assert ht.get_many([0, 'a', 'absent', 499]) == ['zero', 2, None, 499]
+    assert ht.get_many(iter(['absent']), default=-1) == [-1]
+    assert ht.delete_many(range(0, 600, 2)) == 250
+    assert ht.delete_many(['a', 'absent']) == 1
+    for k in list(range(0, 600, 2)) + ['a']:
+        reference.pop(k, None)
+    assert ht.to_dict() == reference and ht.size == len(reference)
+    assert ht.size / ht.capacity <= 0.75
+
+
+def test_closed_bulk_load_resizes_once():
+    resizes = []
+
+    class Counting(HashTable_closed):
+        def recapacitate_and_rehash(self, old_capacity):
+            resizes.append(old_capacity)
+            super().recapacitate_and_rehash(old_capacity)
+
+    ht = Counting.from_items(((i, i) for i in range(10000)),
+                             expected_size=10000, hashfunc='fast64')
+    assert resizes == [] and ht.size == 10000
+    assert ht.size / ht.capacity <= 0.75
+    ht.set_many((i, i) for i in range(10000, 30000))
+    assert len(resizes) == 1 and ht.size / ht.capacity <= 0.75
+    # deleting almost everything shrinks once, to a load of half
+    # the threshold
+    ht.delete_many(range(29900))
+    assert len(resizes) == 2
+    assert 0.25 < ht.size / ht.capacity <= 0.375
+    assert ht.to_dict() == {i: i for i in range(29900, 30000)}
+
+
+def test_closed_bulk_load_with_incremental_rehash():
+    ht = HashTable_closed(hashfunc=hash, incremental=True)
+    for i in range(23):
+        ht[i] = i
+    ht[23] = 23
+    assert ht.rehashing
+    ht.set_many((i, -i) for i in range(10, 1000))
+    ht[1000] = 1000
+    expected = {i: i for i in range(10)}
+    expected.update({i: -i for i in range(10, 1000)})
+    expected[1000] = 1000
+    assert ht.to_dict() == expected
+    assert ht.get_many(range(1001)) == list(expected.values())
+
+
+def test_closed_from_dict_and_from_items():
+    dictionary = {i: str(i) for i in range(100)}
+    ht = HashTable_closed.from_dict(dictionary)
+    assert type(ht) is HashTable_closed and ht.to_dict() == dictionary
+    ht = HashTable_closed.from_items(list(dictionary.items()),
+                                     load_factor_threshold=0.5)
+    assert ht.to_dict() == dictionary and ht.size / ht.capacity <= 0.5
+
+
+def is_free(key):
+    # the empty slots hold a bare object() as the key
+    return type(key) is object
+
+
+def robinhood_invariant_holds(ht):
+    # a pair is never further from its home than its predecessor + 1,
+    # so no free slot lies between a pair and its home
+    mask, shift = ht._mask, ht._shift
+    for i, key in enumerate(ht._keys):
+        if is_free(key):
+            continue
+        distance = (i - (ht._hashes[i] >> shift)) & mask
+        if distance:
+            previous = (i - 1) & mask
+            if is_free(ht._keys[previous]):
+                return False
+            if (previous - (ht._hashes[previous] >> shift)) & mask \
+                    < distance - 1:
+                return False
+    return True
+
+
+@pytest.mark.parametrize('hashfunc', [hash, 'md5', lambda x: x % 7])
+def test_robinhood_matches_dict(hashfunc):
+    random.seed(41)
+    ht = HashTable_robinhood(hashfunc=hashfunc)
+    reference = dict()
+    for step in range(3000):
+        key = random.randrange(500)
+        if step < 2000 and random.random() < 0.7:
+            ht[key] = step
+            reference[key] = step
+        else:
+            del ht[key]
+            reference.pop(key, None)
+        assert len(ht) == len(reference)
+        if step % 100 == 0:
+            assert robinhood_invariant_holds(ht)
+            assert ht.to_dict() == reference
+    assert ht.to_dict() == reference
+    assert all((k in ht) == (k in reference) for k in range(500))
+    assert sorted(ht) == sorted(reference)
+
+
+def test_robinhood_high_load_keeps_probes_short():
+    ht = HashTable_robinhood(capacity=900)
+    assert ht.capacity == 1024
+    for i in range(921):
+        ht[f'key{i}'] = i
+    assert ht.capacity == 1024 and len(ht) / ht.capacity > 0.89
+    assert robinhood_invariant_holds(ht)
+    assert ht.max_probe_length < 64
+    ht['one more'] = 0
+    assert ht.capacity == 2048
+
+
+def test_robinhood_backward_shift_leaves_no_tombstones():
+    # all the keys share one home slot
+    ht = HashTable_robinhood(hashfunc=lambda x: 0)
+    for i in range(6):
+        ht[i] = i
+    assert ht.max_probe_length == 5
+    del ht[0]
+    del ht[3]
+    assert ht.max_probe_length == 3
+    assert sum(is_free(key) for key in ht._keys) == ht.capacity - 4
+    assert ht.to_dict() == {1: 1, 2: 2, 4: 4, 5: 5}
+    assert ht.search(3) is False and isinstance(ht.search(5), int)
+
+
+def test_robinhood_resizes_by_stored_hashes():
+    calls = []
+
+    def counting_hash(x):
+        calls.append(x)
+        return hash(x)
+
+    ht = HashTable_robinhood(hashfunc=counting_hash)
+    for i in range(1000):
+        ht[i] = i
+    assert len(calls) == 1000 and ht.capacity == 2048
+    for i in range(990):
+        del ht[i]
+    assert ht.capacity < 64 and len(calls) == 1990
+    assert ht.to_dict() == {i: i for i in range(990, 1000)}
+
+
+def test_robinhood_dict_interface_and_errors():
+    dictionary = {True: 0, 'believe': 1, 32: 18}
+    ht = HashTable_robinhood.from_dict(dictionary)
+    assert ht == HashTable_closed.from_dict(dictionary)
+    assert str(ht) == str(ht.to_dict()) and repr(ht) == str(ht)
+    assert dict(ht.items()) == dictionary and ht.size == 3
+    ht[32] = 2
+    assert ht[32] == 2 and len(ht) == 3
+    with pytest.raises(KeyError):
+        ht['absent']
+    del ht['absent']
+    assert len(ht) == 3
+    with pytest.raises(ValueError):
+        HashTable_robinhood(load_factor_threshold=1)
+    with pytest.raises(TypeError):
+        HashTable_robinhood(hashfunc='crc')
+
+
+def cuckoo_pairs_are_in_their_buckets(ht):
+    for i, key in enumerate(ht._keys):
+        # the pairs fill the first slots of a bucket
+        if is_free(key) != (i % 4 >= ht._counts[i // 4]):
+            return False
+        if not is_free(key) and \
+                i // 4 not in ht._candidates(ht._hashes[i]):
+            return False
+    return True
+
+
+@pytest.mark.parametrize('hashfunc', [hash, 'md5', lambda x: x % 7])
+def test_cuckoo_matches_dict(hashfunc):
+    random.seed(42)
+    ht = HashTable_cuckoo(hashfunc=hashfunc)
+    reference = dict()
+    for step in range(3000):
+        key = random.randrange(500)
+        if step < 2000 and random.random() < 0.7:
+            ht[key] = step
+            reference[key] = step
+        else:
+            del ht[key]
+            reference.pop(key, None)
+        assert len(ht) == len(reference)
+        if step % 100 == 0:
+            assert cuckoo_pairs_are_in_their_buckets(ht)
+            assert ht.to_dict() == reference
+    assert ht.to_dict() == reference
+    assert all((k in ht) == (k in reference) for k in range(500))
+    assert sorted(ht) == sorted(reference)
+
+
+def test_cuckoo_reaches_high_load_without_rebuilds():
+    # the built-in hash of str changes between runs, fast64 does not
+    ht = HashTable_cuckoo(capacity=3600, hashfunc='fast64')
+    assert ht.capacity == 4096
+    resizes = []
+    resize = ht._resize
+    ht._resize = lambda buckets: resizes.append(buckets) or resize(buckets)
+    for i in range(3950):
+        ht[f'key{i}'] = i
+    assert not resizes and len(ht) / ht.capacity > 0.96
+    assert len(ht._stash) <= 4
+    assert cuckoo_pairs_are_in_their_buckets(ht)
+    assert all(ht[f'key{i}'] == i for i in range(3950))
+
+
+def test_cuckoo_stash_and_growth():
+    # all the keys have the same two buckets of four slots
+    ht = HashTable_cuckoo(hashfunc=lambda x: 0, stash_size=2)
+    for i in range(10):
+        ht[i] = i
+    assert len(ht._stash) == 2 and ht.capacity == 16
+    assert ht.search(9) == (-1, 1) and ht[9] == 9
+    ht[9] = 'nine'
+    assert ht[9] == 'nine' and len(ht) == 10
+    # the stash is full, the table doubles but the keys still collide,
+    # so the stash outgrows its size
+    ht[10] = 10
+    assert len(ht) == 11 and ht.capacity == 32 and len(ht._stash) == 3
+    assert ht.to_dict() == {**{i: i for i in range(11)}, 9: 'nine'}
+    # a freed slot is taken by a stashed pair
+    stashed = len(ht._stash)
+    del ht[ht._keys[next(i for i, key in enumerate(ht._keys)
+                         if not is_free(key))]]
+    assert len(ht._stash) == stashed - 1 and len(ht) == 10
+
+
+def test_cuckoo_dict_interface_and_errors():
+    dictionary = {True: 0, 'believe': 1, 32: 18}
+    ht = HashTable_cuckoo.from_dict(dictionary)
+    assert ht == HashTable_robinhood.from_dict(dictionary)
+    assert str(ht) == str(ht.to_dict()) and repr(ht) == str(ht)
+    assert isinstance(ht.search(32), tuple) and ht.search(33) is False
+    with pytest.raises(KeyError):
+        ht['absent']
+    del ht['absent']
+    assert len(ht) == 3 and ht.size == 3
+    with pytest.raises(TypeError):
+        HashTable_cuckoo(hashfunc='crc')
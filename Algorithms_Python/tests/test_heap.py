@@ -1,8 +1,9 @@
 import random
 import logging
 import pytest
+import numpy as np
 
-from Algorithms_Python.heap import Heap, heap_sort
+from Algorithms_Python.heap import BoundedHeap, Heap, TopK, heap_sort
 
 
 def test_can_create_heap():
@@ -54,3 +55,55 @@ def test_heap_sort():
 def test_repr():
     h = Heap(elements=[random.uniform(-100, 100) for _ in range(40)])
     logging.info(h)
+
+
+def test_bounded_heap_keeps_k_largest():
+    stream = [random.uniform(-100, 100) for _ in range(1000)]
+    h = BoundedHeap(10)
+    for i in stream:
+        h.offer(i)
+    assert h.size == 10
+    assert h.top() == sorted(stream, reverse=True)[:10]
+    assert h.threshold == sorted(stream, reverse=True)[9]
+
+
+def test_bounded_heap_rejects_below_threshold():
+    h = TopK(3, elements=[5, 1, 7, 3])
+    assert h.top() == [7, 5, 3]
+    assert h.offer(2) is False
+    assert h.offer(3) is False
+    assert h.offer(6) is True
+    assert h.top() == [7, 6, 5]
+    assert BoundedHeap(2).threshold is None
+    with pytest.raises(ValueError):
+        BoundedHeap(0)
+
+
+def test_bounded_heap_offer_many():
+    batches = [np.random.uniform(-100, 100, size) for size in (5, 100, 1000)]
+    h, h_plain = BoundedHeap(50), BoundedHeap(50)
+    for batch in batches:
+        h.offer_many(batch)
+        h_plain.offer_many(batch.tolist())
+    expected = sorted(np.concatenate(batches).tolist(), reverse=True)[:50]
+    assert h.top() == expected
+    assert h_plain.top() == expected
+    assert h.size == 50
+
+
+@pytest.mark.parametrize('k', [1, 5, 40])
+def test_bounded_heap_offer_many_counts_alike(k):
+    rng = np.random.default_rng(k)
+    h, h_plain = BoundedHeap(k), BoundedHeap(k)
+    for size in (3, 30, 300, 0, 1000):
+        # few distinct values, so the ties are many
+        batch = rng.integers(0, 50, size).astype(float)
+        kept = h.offer_many(batch)
+        assert kept == h_plain.offer_many(batch.tolist())
+        assert h.top() == h_plain.top()
+        assert 0 <= kept <= min(k, size)
+    # an ascending batch evicts its own elements
+    assert BoundedHeap(2).offer_many([1, 2, 3, 4]) == 2
+    assert BoundedHeap(2).offer_many(np.arange(1.0, 5.0)) == 2
+    assert TopK(2, [5, 5]).offer_many([5, 6, 6]) == 2
+    assert TopK(3, [5, 5]).offer_many([5, 5]) == 1
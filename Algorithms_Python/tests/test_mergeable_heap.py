@@ -0,0 +1,93 @@
+import random
+import pytest
+
+from Algorithms_Python.heap import Heap
+from Algorithms_Python.mergeable_heap import LeftistHeap, PairingHeap
+
+
+heap_classes = [PairingHeap, LeftistHeap]
+
+
+@pytest.mark.parametrize('heap_class', heap_classes)
+def test_can_create_mergeable_heap(heap_class):
+    h = heap_class(elements=[random.uniform(-100, 100) for _ in range(40)])
+    assert len(h) == 40
+    assert h.size == 40
+
+
+@pytest.mark.parametrize('heap_class', heap_classes)
+def test_remove_min_returns_sorted_sequence(heap_class):
+    elements = [random.uniform(-100, 100) for _ in range(500)]
+    h = heap_class(elements=elements)
+    assert h.find_min() == min(elements)
+    assert [h.remove_min() for _ in range(500)] == sorted(elements)
+    assert len(h) == 0
+    assert h.find_min() is None
+    with pytest.raises(IndexError):
+        h.remove_min()
+
+
+@pytest.mark.parametrize('heap_class', heap_classes)
+def test_interface_is_shared_with_heap(heap_class):
+    elements = [random.randint(-100, 100) for _ in range(100)]
+    binary, mergeable = Heap(), heap_class()
+    for i in elements:
+        binary.append(i)
+        mergeable.append(i)
+    for _ in range(50):
+        assert binary.erase() == mergeable.erase()
+    for i in elements[:20]:
+        binary.insert(i)
+        mergeable.insert(i)
+    while len(binary) != 0:
+        assert binary.remove_min() == mergeable.remove_min()
+    assert len(mergeable) == 0
+
+
+@pytest.mark.parametrize('heap_class', heap_classes)
+def test_meld(heap_class):
+    shards = [[random.uniform(-100, 100) for _ in range(random.randint(0, 50))]
+              for _ in range(10)]
+    h = heap_class()
+    others = [heap_class(elements=shard) for shard in shards]
+    for other in others:
+        h.meld(other)
+        assert len(other) == 0
+        assert other.find_min() is None
+    expected = sorted(i for shard in shards for i in shard)
+    assert len(h) == len(expected)
+    assert [h.remove_min() for _ in range(len(expected))] == expected
+
+
+@pytest.mark.parametrize('heap_class', heap_classes)
+def test_meld_with_itself_and_empty(heap_class):
+    h = heap_class(elements=[3, 1, 2])
+    h.meld(h)
+    h.meld(heap_class())
+    assert len(h) == 3
+    assert [h.remove_min() for _ in range(3)] == [1, 2, 3]
+
+
+def test_meld_different_heaps_raises():
+    with pytest.raises(TypeError):
+        PairingHeap(elements=[1]).meld(LeftistHeap(elements=[2]))
+
+
+def test_leftist_property_holds():
+    h = LeftistHeap(elements=[random.randint(0, 1000) for _ in range(300)])
+    for _ in range(100):
+        h.remove_min()
+
+    def check(node):
+        if node is None:
+            return 0
+        left, right = node.children
+        left_rank, right_rank = check(left), check(right)
+        assert left_rank >= right_rank
+        assert node.rank == right_rank + 1
+        for child in node.children:
+            if child is not None:
+                assert node.data <= child.data
+        return node.rank
+
+    check(h.root)
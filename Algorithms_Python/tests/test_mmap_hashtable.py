@@ -0,0 +1,164 @@
+import pytest
+import random
+import multiprocessing
+
+from Algorithms_Python.mmap_hashtable import MmapHashTable
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'table.bin')
+
+
+@pytest.mark.parametrize('sizes', [(0, 0), (8, 4)])
+def test_set_get_delete(path, sizes):
+    with MmapHashTable(path, 'n', *sizes, capacity=4) as table:
+        for i in range(200):
+            table[b'key%05d' % i] = b'%04d' % i
+        assert len(table) == 200
+        assert table.capacity > 8
+        assert table[b'key00042'] == b'0042'
+        assert b'key00007' in table and 'nokey000' not in table
+        assert table.get('nokey000') is None
+        assert table.get('nokey000', b'') == b''
+        with pytest.raises(KeyError):
+            table['nokey000']
+        for i in range(0, 200, 2):
+            del table['key%05d' % i]
+        with pytest.raises(KeyError):
+            del table['key00000']
+        table['key00001'] = 'ffff'
+        expected = {b'key%05d' % i: b'%04d' % i for i in range(3, 200, 2)}
+        expected[b'key00001'] = b'ffff'
+        assert dict(table.items()) == expected
+        assert sorted(table) == sorted(expected)
+
+
+def test_matches_dict(path):
+    random.seed(47)
+    reference = {}
+    with MmapHashTable(path, 'n', capacity=8) as table:
+        for _ in range(3000):
+            key = str(random.randrange(300)).encode()
+            if random.random() < 0.3 and key in reference:
+                del table[key]
+                del reference[key]
+            else:
+                value = bytes(random.randrange(40))
+                table[key] = value
+                reference[key] = value
+            assert len(table) == len(reference)
+        assert dict(table.items()) == reference
+
+
+def test_reopen_without_loading(path):
+    with MmapHashTable(path, 'c', capacity=100) as table:
+        for i in range(100):
+            table[str(i)] = 'value' * i
+    with MmapHashTable(path) as table:
+        assert len(table) == 100
+        assert table['42'] == b'value' * 42
+        # opened for reading only
+        with pytest.raises(ValueError):
+            table['42'] = b''
+        with pytest.raises(ValueError):
+            del table['42']
+    # 'c' keeps an existing table, 'n' empties it
+    with MmapHashTable(path, 'c') as table:
+        assert len(table) == 100
+    with MmapHashTable(path, 'n') as table:
+        assert len(table) == 0
+
+
+def test_invalid_arguments(path, tmp_path):
+    with pytest.raises(ValueError):
+        MmapHashTable(path, 'x')
+    with pytest.raises(ValueError):
+        MmapHashTable(path, 'n', key_size=4)
+    with pytest.raises(FileNotFoundError):
+        MmapHashTable(path)
+    other = tmp_path / 'other.bin'
+    other.write_bytes(bytes(256))
+    with pytest.raises(ValueError):
+        MmapHashTable(other)
+    with MmapHashTable(path, 'n', 2, 2) as table:
+        with pytest.raises(ValueError):
+            table['abc'] = 'ab'
+        with pytest.raises(ValueError):
+            table['ab'] = 'a'
+        with pytest.raises(TypeError):
+            table[1] = 'ab'
+
+
+def test_single_writer(path):
+    with MmapHashTable(path, 'n'):
+        with pytest.raises(BlockingIOError):
+            MmapHashTable(path, 'w')
+        # readers are welcome
+        MmapHashTable(path).close()
+
+
+def test_new_table_keeps_the_open_writer(path, tmp_path):
+    with MmapHashTable(path, 'n') as table:
+        for i in range(100):
+            table[str(i)] = str(i)
+        reader = MmapHashTable(path)
+        for flag in ('n', 'w'):
+            with pytest.raises(BlockingIOError):
+                MmapHashTable(path, flag)
+        assert len(table) == 100 and len(reader) == 100
+        assert MmapHashTable(path)['42'] == b'42'
+        reader.close()
+    # without a writer the new table replaces the old file
+    reader = MmapHashTable(path)
+    with MmapHashTable(path, 'n') as table:
+        table['a'] = 'b'
+        assert len(reader) == 1 and reader['a'] == b'b'
+    reader.close()
+    assert [file.name for file in tmp_path.iterdir()] == ['table.bin']
+
+
+def test_reader_follows_growth(path):
+    with MmapHashTable(path, 'n', capacity=4) as table:
+        reader = MmapHashTable(path)
+        table['a'] = 'b'
+        assert reader['a'] == b'b'
+        slots = reader.capacity
+        for i in range(100):
+            table[str(i)] = str(i)
+        # the writer moved a new file over the old one
+        assert len(reader) == 101
+        assert reader.capacity > slots
+        assert reader['99'] == b'99'
+        reader.close()
+
+
+def writer(path, n):
+    with MmapHashTable(path, 'w') as table:
+        for i in range(n):
+            table[str(i)] = str(i) * 3
+
+
+def reader(path, n):
+    with MmapHashTable(path) as table:
+        while len(table) < n:
+            # a snapshot never holds half-written pairs
+            for key, value in table.items():
+                assert value == key * 3
+        assert all(table[str(i)] == str(i).encode() * 3 for i in range(n))
+
+
+@pytest.mark.parametrize('method', ['fork', 'spawn'])
+def test_between_processes(path, method):
+    n = 3000
+    context = multiprocessing.get_context(method)
+    MmapHashTable(path, 'n', capacity=16).close()
+    readers = [context.Process(target=reader, args=(path, n), daemon=True)
+               for _ in range(2)]
+    for process in readers:
+        process.start()
+    writing = context.Process(target=writer, args=(path, n), daemon=True)
+    writing.start()
+    for process in readers + [writing]:
+        process.join()
+        assert process.exitcode == 0
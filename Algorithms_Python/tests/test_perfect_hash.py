@@ -0,0 +1,80 @@
+import pytest
+import pickle
+
+from Algorithms_Python.perfect_hash import PerfectHash, StaticMap
+
+
+@pytest.mark.parametrize('keys', [
+    [f'key{i}' for i in range(2000)],
+    list(range(-500, 1500)),
+    [(i, str(i)) for i in range(300)] + [b'bytes', 2.5, None],
+    [-1, (1 << 64) - 1, 1 << 63, -(1 << 63)],
+])
+def test_minimal_and_perfect(keys):
+    function = PerfectHash(keys)
+    assert len(function) == function.size == len(keys)
+    assert sorted(function(key) for key in keys) == list(range(len(keys)))
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 3, 10])
+def test_small_sets(n):
+    function = PerfectHash(range(n))
+    assert sorted(map(function.index, range(n))) == list(range(n))
+
+
+def test_compact():
+    function = PerfectHash(str(i) for i in range(20000))
+    assert function.bits_per_key() < 4
+
+
+def test_other_parameters():
+    keys = [f'key{i}' for i in range(1000)]
+    for kwargs in ({'load_factor': 0.9}, {'bucket_size': 2}, {'seed': 7}):
+        function = PerfectHash(keys, **kwargs)
+        assert sorted(map(function, keys)) == list(range(1000))
+    assert PerfectHash(keys, seed=7).seed >= 7
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        PerfectHash([1, 2, 1])
+    with pytest.raises(ValueError):
+        PerfectHash([1, 2], load_factor=1)
+    with pytest.raises(ValueError):
+        PerfectHash([1, 2], bucket_size=0.5)
+    # str and its utf-8 bytes hash the same under every seed
+    with pytest.raises(ValueError, match="'a' and b'a'"):
+        PerfectHash(['a', 1, b'a'])
+
+
+def test_serialization():
+    keys = [f'key{i}' for i in range(3000)]
+    function = PerfectHash(keys)
+    data = function.to_bytes()
+    assert len(data) < 3000
+    restored = PerfectHash.from_bytes(data)
+    assert [restored(key) for key in keys] == [function(key) for key in keys]
+    assert len(restored) == 3000
+    with pytest.raises(ValueError):
+        PerfectHash.from_bytes(b'nothing')
+    with pytest.raises(ValueError):
+        PerfectHash.from_bytes(data[:-1])
+
+
+def test_static_map():
+    mapping = {f'key{i}': i * i for i in range(500)}
+    static = StaticMap(mapping)
+    assert len(static) == 500
+    assert all(static[key] == value for key, value in mapping.items())
+    assert 'key7' in static and 'nokey' not in static
+    assert static.get('nokey') is None and static.get('nokey', -1) == -1
+    with pytest.raises(KeyError):
+        static['nokey']
+    assert dict(static.items()) == mapping
+    assert sorted(static) == sorted(mapping)
+    restored = pickle.loads(pickle.dumps(static))
+    assert restored['key42'] == 42 * 42
+    empty = StaticMap([])
+    assert len(empty) == 0 and None not in empty and empty.get(1, 2) == 2
+    with pytest.raises(ValueError):
+        StaticMap([(1, 'a'), (1, 'b')])
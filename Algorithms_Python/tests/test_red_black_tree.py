@@ -80,3 +80,13 @@ def test_random_length_and_elts():
         assert len(list_rbtree) == rbtree.size
         assert sorted(list_rbtree) == rbtree.in_order_traversal()
     assert len(rbtree.in_order_traversal()) == 0
+
+
+def test_tree_nodes_are_slotted():
+    tree = RedBlackTree()
+    for i in range(10):
+        tree.insert(i)
+    node = tree.search(5)
+    assert not hasattr(node, '__dict__'), 'RBTreeNode is expected to be slotted'
+    assert not hasattr(TreeNode(1), '__dict__'), \
+        'TreeNode is expected to be slotted'
@@ -0,0 +1,165 @@
+import pytest
+import random
+from array import array
+from collections import deque
+
+from Algorithms_Python.ring_buffer import BoundedQueue, BoundedDeque
+
+
+def test_buffer_is_a_power_of_two():
+    for capacity, length in [(1, 1), (2, 2), (5, 8), (8, 8), (100, 128)]:
+        queue = BoundedQueue(capacity)
+        assert len(queue._buffer) == length
+        assert queue._mask == length - 1
+    with pytest.raises(ValueError):
+        BoundedQueue(0)
+
+
+@pytest.mark.parametrize('capacity', [1, 5, 8])
+def test_queue_push_pop_with_wrap(capacity):
+    queue = BoundedQueue(capacity)
+    reference = deque()
+    for i in range(100):
+        if len(reference) < capacity and (i % 3 != 2 or not reference):
+            queue.push(i)
+            reference.append(i)
+        else:
+            assert queue.pop() == reference.popleft()
+        assert list(queue) == list(reference)
+        assert queue.front() == (reference[0] if reference else None)
+        assert queue.back() == (reference[-1] if reference else None)
+
+
+def test_backpressure():
+    queue = BoundedQueue(3)
+    assert queue.try_push(1) and queue.try_push(2) and queue.try_push(3)
+    assert queue.is_full()
+    assert not queue.try_push(4)
+    with pytest.raises(ValueError):
+        queue.push(4)
+    assert list(queue) == [1, 2, 3]
+    assert queue.pop() == 1
+    assert queue.try_push(4)
+    assert list(queue) == [2, 3, 4]
+
+
+def test_pop_from_empty():
+    queue = BoundedQueue(4)
+    assert queue.is_empty()
+    assert queue.front() is None and queue.back() is None
+    with pytest.raises(ValueError):
+        queue.pop()
+    assert queue.pop_many(3) == []
+
+
+@pytest.mark.parametrize('capacity', [3, 4])
+def test_overwrite_oldest(capacity):
+    queue = BoundedQueue(capacity, overwrite=True)
+    for i in range(10):
+        queue.push(i)
+    assert list(queue) == list(range(10 - capacity, 10))
+    assert len(queue) == capacity
+    # only the kept elements are referenced by the buffer
+    assert sorted(x for x in queue._buffer if x is not None) == \
+        list(range(10 - capacity, 10))
+
+
+def test_push_many_pop_many_matches_deque():
+    random.seed(32)
+    queue = BoundedQueue(13)
+    reference = deque()
+    counter = 0
+    for _ in range(500):
+        if random.random() < 0.5:
+            batch = list(range(counter, counter + random.randrange(10)))
+            counter += len(batch)
+            pushed = queue.push_many(batch)
+            assert pushed == min(len(batch), 13 - len(reference))
+            reference.extend(batch[:pushed])
+        else:
+            n = random.randrange(10)
+            popped = queue.pop_many(n)
+            assert popped == [reference.popleft()
+                              for _ in range(min(n, len(reference)))]
+        assert list(queue) == list(reference)
+    queue.clear()
+    assert len(queue) == 0
+    assert set(queue._buffer) == {None}
+
+
+def test_push_many_takes_iterables():
+    queue = BoundedQueue(4)
+    assert queue.push_many(x * x for x in range(3)) == 3
+    assert queue.push_many(range(10)) == 1
+    assert queue.pop_many(10) == [0, 1, 4, 0]
+    # an iterator keeps the elements which do not fit
+    elements = iter(range(10))
+    assert queue.push_many(elements) == 4
+    assert queue.push_many(elements) == 0
+    assert queue.pop_many(2) == [0, 1]
+    assert queue.push_many(elements) == 2
+    assert list(elements) == [6, 7, 8, 9]
+    assert queue.pop_many(10) == [2, 3, 4, 5]
+
+
+def test_push_many_overwrite():
+    queue = BoundedQueue(5, overwrite=True)
+    queue.push_many([1, 2, 3])
+    assert queue.push_many([4, 5, 6, 7]) == 4
+    assert list(queue) == [3, 4, 5, 6, 7]
+    assert queue.push_many(range(100)) == 100
+    assert list(queue) == [95, 96, 97, 98, 99]
+
+
+def test_typed_buffer():
+    queue = BoundedQueue(6, typecode='d')
+    queue.push_many([1.0, 2.0, 3.0, 4.0])
+    assert queue.pop_many(3) == array('d', [1.0, 2.0, 3.0])
+    queue.push_many(array('d', [5.0, 6.0, 7.0, 8.0]))
+    popped = queue.pop_many(10)
+    assert isinstance(popped, array)
+    assert list(popped) == [4.0, 5.0, 6.0, 7.0, 8.0]
+    with pytest.raises(TypeError):
+        queue.push('text')
+
+
+def test_deque_random_operations():
+    random.seed(32)
+    dq = BoundedDeque(7)
+    reference = deque()
+    for i in range(2000):
+        op = random.randrange(4)
+        if op == 0:
+            assert dq.try_push_front(i) == (len(reference) < 7)
+            if len(reference) < 7:
+                reference.appendleft(i)
+        elif op == 1:
+            assert dq.try_push(i) == (len(reference) < 7)
+            if len(reference) < 7:
+                reference.append(i)
+        elif op == 2 and reference:
+            assert dq.pop_front() == reference.popleft()
+        elif op == 3 and reference:
+            assert dq.pop_back() == reference.pop()
+        assert list(dq) == list(reference)
+
+
+def test_deque_full_and_overwrite():
+    dq = BoundedDeque(2)
+    dq.push_back(1)
+    dq.push_front(0)
+    with pytest.raises(ValueError):
+        dq.push_front(-1)
+    with pytest.raises(ValueError):
+        dq.push_back(2)
+    dq = BoundedDeque(3, overwrite=True)
+    for i in range(3):
+        dq.push_back(i)
+    dq.push_front(-1)
+    assert list(dq) == [-1, 0, 1]
+    dq.push_back(2)
+    assert list(dq) == [0, 1, 2]
+    assert dq.pop_back() == 2
+    assert dq.pop() == 0
+    with pytest.raises(ValueError):
+        BoundedDeque(1).pop_back()
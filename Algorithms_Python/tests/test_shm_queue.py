@@ -0,0 +1,120 @@
+import pytest
+import random
+import multiprocessing
+from collections import deque
+
+from Algorithms_Python.shm_queue import SharedRingQueue
+
+
+@pytest.fixture
+def queue():
+    q = SharedRingQueue('d', capacity=8)
+    yield q
+    q.close()
+    q.unlink()
+
+
+def test_push_pop(queue):
+    assert queue.capacity == 8
+    assert len(queue) == 0
+    for i in range(5):
+        queue.push(i / 2)
+    assert len(queue) == 5
+    assert [queue.pop() for _ in range(5)] == [i / 2 for i in range(5)]
+    with pytest.raises(ValueError):
+        queue.pop()
+
+
+def test_full(queue):
+    for i in range(8):
+        assert queue.try_push(float(i))
+    assert not queue.try_push(8.0)
+    with pytest.raises(ValueError):
+        queue.push(8.0)
+    assert queue.pop() == 0.0
+    queue.push(8.0)
+    assert queue.pop_many(100) == [float(i) for i in range(1, 9)]
+
+
+def test_push_many_pop_many_matches_deque(queue):
+    random.seed(34)
+    reference = deque()
+    counter = 0
+    for _ in range(500):
+        if random.random() < 0.5:
+            batch = [float(i) for i in
+                     range(counter, counter + random.randrange(10))]
+            counter += len(batch)
+            pushed = queue.push_many(batch)
+            assert pushed == min(len(batch), 8 - len(reference))
+            reference.extend(batch[:pushed])
+        else:
+            n = random.randrange(10)
+            assert queue.pop_many(n) == \
+                [reference.popleft() for _ in range(min(n, len(reference)))]
+        assert len(queue) == len(reference)
+    assert queue.push_many(x / 2 for x in range(3)) == \
+        min(3, 8 - len(reference))
+
+
+def test_records_with_several_fields():
+    with SharedRingQueue('qd?', capacity=3) as q:
+        assert q.capacity == 4
+        q.push((1, 0.5, True))
+        assert q.push_many((i, i / 4, i % 2 == 0) for i in range(2, 6)) == 3
+        assert q.pop() == (1, 0.5, True)
+        assert q.pop_many(10) == [(2, 0.5, True), (3, 0.75, False),
+                                  (4, 1.0, True)]
+        assert q.format == '=qd?'
+
+
+def test_attach_by_name(queue):
+    other = SharedRingQueue('d', name=queue.name, create=False)
+    assert other.capacity == queue.capacity
+    queue.push_many([1.0, 2.0])
+    assert other.pop() == 1.0
+    assert len(queue) == 1
+    other.close()
+    # 'f' records take 4 bytes, the queue holds 8-byte ones
+    with pytest.raises(ValueError):
+        SharedRingQueue('f', name=queue.name, create=False)
+
+
+def test_wrong_capacity():
+    with pytest.raises(ValueError):
+        SharedRingQueue('d', capacity=0)
+
+
+def producer(q, n):
+    sent = 0
+    while sent < n:
+        sent += q.push_many(range(sent, min(sent + 100, n)))
+    q.close()
+
+
+@pytest.mark.parametrize('method', ['fork', 'spawn'])
+def test_between_processes(method):
+    n = 20000
+    context = multiprocessing.get_context(method)
+    with SharedRingQueue('q', capacity=256) as q:
+        process = context.Process(target=producer, args=(q, n),
+                                  daemon=True)
+        process.start()
+        received = []
+        while len(received) < n:
+            received += q.pop_many(64)
+        process.join()
+        assert process.exitcode == 0
+        assert received == list(range(n))
+
+
+def test_native_alignment_format():
+    records = [(1.0, b'a'), (2.0, b'b'), (3.0, b'c')]
+    with SharedRingQueue('@dc', capacity=8) as q:
+        assert q.push_many(records) == 3
+        assert q.pop_many(3) == records
+        q.push_many(records * 3)
+        assert [q.pop() for _ in range(8)] == (records * 3)[:8]
+    with SharedRingQueue('@d', capacity=4) as q:
+        q.push_many([0.5, 1.5])
+        assert q.pop_many(2) == [0.5, 1.5]
@@ -0,0 +1,130 @@
+import pytest
+import random
+from bisect import bisect_left, bisect_right, insort
+
+from Algorithms_Python.skip_list import SkipList
+
+
+def check_structure(skip_list):
+    # every level is sorted and every span equals the difference of ranks
+    ranks = {id(skip_list.head): 0}
+    node, rank = skip_list.head.forward[0], 0
+    while node is not None:
+        rank += 1
+        ranks[id(node)] = rank
+        node = node.forward[0]
+    assert rank == skip_list.size
+    for i in range(skip_list.level):
+        node = skip_list.head
+        while node.forward[i] is not None:
+            following = node.forward[i]
+            assert node is skip_list.head or node.data < following.data
+            assert node.span[i] == ranks[id(following)] - ranks[id(node)]
+            node = following
+        assert node.span[i] == skip_list.size - ranks[id(node)]
+
+
+def test_empty():
+    skip_list = SkipList()
+    assert skip_list.is_empty() and len(skip_list) == 0
+    assert skip_list.find_min() is None and skip_list.find_max() is None
+    assert skip_list.search(1) is None
+    assert skip_list.find_successor(1) is None
+    assert skip_list.find_predecessor(1) is None
+    assert skip_list.rank(1) == 0
+    assert list(skip_list.range()) == []
+    with pytest.raises(IndexError):
+        skip_list.delete(1)
+    with pytest.raises(IndexError):
+        skip_list.select(0)
+
+
+def test_random_operations_match_sorted_list():
+    random.seed(36)
+    skip_list = SkipList()
+    reference = []
+    for step in range(3000):
+        key = random.randrange(500)
+        if random.random() < 0.6:
+            skip_list.insert(key, -key)
+            if key not in reference:
+                insort(reference, key)
+        elif reference:
+            skip_list.delete(key)
+            if key in reference:
+                reference.remove(key)
+        assert skip_list.size == len(reference)
+        if step % 100 == 0:
+            check_structure(skip_list)
+    check_structure(skip_list)
+    assert skip_list.in_order_traversal() == reference
+    assert skip_list.find_min() == reference[0]
+    assert skip_list.find_max() == reference[-1]
+    for key in range(-1, 502):
+        i = bisect_left(reference, key)
+        j = bisect_right(reference, key)
+        assert skip_list.rank(key) == i
+        assert (key in skip_list) == (i < j)
+        assert skip_list.get(key, 'absent') == (-key if i < j else 'absent')
+        assert skip_list.find_successor(key) == \
+            (reference[j] if j < len(reference) else None)
+        assert skip_list.find_predecessor(key) == \
+            (reference[i - 1] if i else None)
+    for i in range(len(reference)):
+        assert skip_list.select(i) == reference[i]
+    assert skip_list.select(-1) == reference[-1]
+
+
+def test_insert_replaces_value():
+    skip_list = SkipList()
+    skip_list.insert('b', 1)
+    skip_list.insert('a', 2)
+    skip_list.insert('b', 3)
+    assert skip_list.size == 2
+    assert skip_list.search('b').value == 3
+    assert str(skip_list.search('b')) == 'b'
+    assert list(skip_list.items()) == [('a', 2), ('b', 3)]
+
+
+def test_range_and_items():
+    skip_list = SkipList.from_sorted(range(0, 100, 3), range(34))
+    assert list(skip_list.range(10, 30)) == list(range(12, 30, 3))
+    assert list(skip_list.range(high=7)) == [0, 3, 6]
+    assert list(skip_list.range(95)) == [96, 99]
+    assert list(skip_list.items(50, 60)) == [(51, 17), (54, 18), (57, 19)]
+    assert list(skip_list.range(60, 50)) == []
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 1000])
+def test_from_sorted(n):
+    random.seed(n)
+    skip_list = SkipList.from_sorted(range(n))
+    check_structure(skip_list)
+    assert list(skip_list) == list(range(n))
+    assert all(skip_list.select(i) == i for i in range(n))
+    # the built skip list stays correct under edits
+    for key in range(0, n, 7):
+        skip_list.delete(key)
+    skip_list.insert(n + 5)
+    skip_list.insert(-5)
+    check_structure(skip_list)
+    assert list(skip_list) == \
+        [-5] + [k for k in range(n) if k % 7] + [n + 5]
+
+
+def test_from_sorted_rejects_unsorted():
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, 3, 2])
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, 1])
+
+
+def test_height_is_logarithmic():
+    random.seed(36)
+    skip_list = SkipList()
+    for key in random.sample(range(100000), 20000):
+        skip_list.insert(key)
+    assert 5 <= skip_list.max_height() <= 14
+    for key in list(skip_list):
+        skip_list.delete(key)
+    assert skip_list.is_empty() and skip_list.max_height() == 1
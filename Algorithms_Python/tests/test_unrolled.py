@@ -0,0 +1,128 @@
+import pytest
+import random
+from collections import deque
+
+from Algorithms_Python.unrolled import UnrolledStack, UnrolledQueue, \
+    UnrolledDeque
+from Algorithms_Python.Stack import Stack
+from Algorithms_Python.Queue import Queue
+
+
+def test_stack_matches_Stack():
+    reference = Stack()
+    stack = UnrolledStack(block_size=4)
+    for i in range(50):
+        reference.push(i)
+        stack.push(i)
+        assert stack.back() == reference.back()
+        assert stack.front() == reference.front()
+    for _ in range(50):
+        assert stack.pop() == reference.pop()
+    assert len(stack) == 0
+    assert stack.back() is None
+    assert stack.front() is None
+
+
+def test_queue_matches_Queue():
+    reference = Queue()
+    queue = UnrolledQueue(block_size=4)
+    for i in range(50):
+        reference.push(i)
+        queue.push(i)
+    for _ in range(49):
+        assert queue.pop() == reference.pop()
+        assert queue.front() == reference.front()
+        assert queue.back() == reference.back()
+    assert queue.pop() == 49
+    assert queue.size == 0
+
+
+@pytest.mark.parametrize('block_size', [2, 3, 64])
+def test_deque_random_operations(block_size):
+    random.seed(31)
+    reference = deque()
+    dq = UnrolledDeque(block_size=block_size)
+    for _ in range(5000):
+        op = random.randrange(6)
+        if op in (0, 1):
+            value = random.random()
+            dq.push_back(value)
+            reference.append(value)
+        elif op == 2:
+            value = random.random()
+            dq.push_front(value)
+            reference.appendleft(value)
+        elif op == 3 and reference:
+            assert dq.pop_front() == reference.popleft()
+        elif op == 4 and reference:
+            assert dq.pop_back() == reference.pop()
+        elif op == 5 and reference:
+            assert dq.pop() == reference.popleft()
+        assert len(dq) == len(reference)
+        assert dq.front() == (reference[0] if reference else None)
+        assert dq.back() == (reference[-1] if reference else None)
+    assert list(dq) == list(reference)
+
+
+def test_deque_push_aliases():
+    dq = UnrolledDeque()
+    dq.push(2)
+    dq.push_back(3)
+    dq.push_front(1)
+    assert list(dq) == [1, 2, 3]
+    assert dq.pop() == 1
+    assert dq.pop_back() == 3
+
+
+def test_pop_from_empty():
+    for container in (UnrolledStack(), UnrolledQueue(), UnrolledDeque()):
+        with pytest.raises(ValueError):
+            container.pop()
+    dq = UnrolledDeque()
+    with pytest.raises(ValueError):
+        dq.pop_front()
+    with pytest.raises(ValueError):
+        dq.pop_back()
+
+
+def test_blocks_are_not_allocated_per_operation():
+    stack = UnrolledStack(block_size=8)
+    for i in range(8):
+        stack.push(i)
+    # push/pop around the block boundary reuses the spare block
+    stack.push(8)
+    block = stack._tail
+    for _ in range(100):
+        stack.pop()
+        stack.push(8)
+        assert stack._tail is block
+
+
+def test_popped_elements_are_released():
+    dq = UnrolledDeque(block_size=4)
+    for i in range(10):
+        dq.push_back(i)
+    for _ in range(5):
+        dq.pop_front()
+        dq.pop_back()
+    block = dq._head
+    while block is not None:
+        assert block.data == [None] * 4
+        block = block.next_node
+    if dq._spare is not None:
+        assert dq._spare.data == [None] * 4
+
+
+def test_iteration_over_many_blocks():
+    queue = UnrolledQueue(block_size=5)
+    for i in range(23):
+        queue.push(i)
+    for _ in range(7):
+        queue.pop()
+    assert list(queue) == list(range(7, 23))
+    assert list(UnrolledQueue()) == []
+
+
+def test_wrong_block_size():
+    with pytest.raises(ValueError):
+        UnrolledStack(block_size=1)
@@ -0,0 +1,132 @@
+import pytest
+import random
+from collections import deque
+
+from Algorithms_Python.array_storage import NIL, ArrayDeque
+from Algorithms_Python.xor_list import XorCyclicList, XorDeque
+
+
+def check_links(xl):
+    assert list(reversed(xl)) == xl.list_all()[::-1]
+    assert len(xl.list_all()) == xl.size == len(xl)
+    if xl.size == 0:
+        assert xl.head == NIL and xl.tail == NIL
+
+
+def test_list_random_operations_match_list():
+    random.seed(37)
+    xl = XorCyclicList()
+    reference = []
+    for step in range(3000):
+        op = random.randrange(4)
+        if op == 0 or not reference:
+            i = random.randint(-len(reference) - 1, len(reference))
+            x = random.random()
+            xl.insert(i, x)
+            reference.insert(i if i >= 0 else len(reference) + i + 1, x)
+        elif op == 1:
+            i = random.randrange(-len(reference), len(reference))
+            xl.erase(i)
+            del reference[i]
+        elif op == 2:
+            i = random.randrange(len(reference))
+            xl.update(i, -i)
+            reference[i] = -i
+        else:
+            i = random.randrange(-len(reference), len(reference))
+            assert xl[i] == reference[i]
+        if step % 50 == 0:
+            check_links(xl)
+            assert xl.list_all() == reference
+    assert xl.list_all() == reference
+
+
+@pytest.mark.parametrize('k', [0, 1, 2, 3, 5, -1, -4, 12])
+def test_rotate(k):
+    xl = XorCyclicList(range(5))
+    xl.rotate(k)
+    shift = k % 5
+    assert xl.list_all() == list(range(shift, 5)) + list(range(shift))
+    check_links(xl)
+
+
+def test_round_robin():
+    xl = XorCyclicList('abc')
+    served = []
+    for _ in range(7):
+        served.append(xl[0])
+        xl.rotate()
+    assert served == list('abcabca')
+    XorCyclicList().rotate()
+    single = XorCyclicList([1])
+    single.rotate(3)
+    assert single.list_all() == [1]
+
+
+def test_list_errors_and_contains():
+    xl = XorCyclicList([1, 2])
+    assert 2 in xl and 3 not in xl
+    assert str(xl) == '[1, 2]'
+    with pytest.raises(IndexError):
+        xl.insert(3, 0)
+    with pytest.raises(IndexError):
+        xl.erase(2)
+    with pytest.raises(IndexError):
+        XorCyclicList().erase(0)
+    with pytest.raises(IndexError):
+        xl[-3]
+    xl.erase(0)
+    xl.erase(0)
+    check_links(xl)
+    xl.insert(-1, 'x')
+    assert xl.list_all() == ['x']
+
+
+def test_deque_matches_deque():
+    random.seed(37)
+    dq = XorDeque(typecode='q')
+    reference = deque()
+    for i in range(5000):
+        op = random.randrange(5)
+        if op == 0:
+            dq.push_back(i)
+            reference.append(i)
+        elif op == 1:
+            dq.push_front(i)
+            reference.appendleft(i)
+        elif op == 2:
+            dq.push(i)
+            reference.append(i)
+        elif op == 3 and reference:
+            assert dq.pop_front() == reference.popleft()
+        elif op == 4 and reference:
+            assert dq.pop_back() == reference.pop()
+        assert dq.front() == (reference[0] if reference else None)
+        assert dq.back() == (reference[-1] if reference else None)
+    assert list(dq) == list(reference)
+    check_links(dq)
+
+
+def test_deque_empty():
+    dq = XorDeque()
+    with pytest.raises(ValueError):
+        dq.pop()
+    with pytest.raises(ValueError):
+        dq.pop_back()
+    dq.push(1)
+    assert dq.pop_back() == 1
+    assert dq.front() is None and dq.back() is None
+
+
+def test_one_link_column():
+    n = 1000
+    xor = XorDeque(range(n), typecode='q', capacity=n + 1)
+    two_links = ArrayDeque(range(n), typecode='q', capacity=n + 1)
+    assert list(xor) == list(two_links)
+    assert two_links._arena.memory_usage() - xor.memory_usage() == \
+        4 * (n + 1)
+    # released nodes are reused
+    for i in range(n):
+        xor.pop()
+        xor.push(i)
+    assert xor._arena.capacity == n + 1
@@ -0,0 +1,463 @@
+"""
+Unrolled Stack, Queue and Deque
+===============================
+
+This module implements the Stack, Queue and Deque interfaces on top of
+an unrolled (chunked) doubly-linked list, the layout of CPython's
+`collections.deque`. Elements are kept in fixed-size blocks (Python lists
+of `block_size` slots), the blocks are linked with DoubleNodes. A push
+writes into a free slot of the end block and a pop clears a slot, a new
+block is linked only once per `block_size` pushes, and the last emptied
+block is kept as a spare, so pushing and popping around a block boundary
+does not allocate either.
+
+The per-element overhead is one list slot (8 bytes) plus 1 / block_size of
+a block node, against a whole DoubleNode (64 bytes) for Stack, Queue and
+Deque.
+
+Classes
+-------
+UnrolledStack
+    A stack (LIFO) with the API of Stack.
+
+UnrolledQueue
+    A queue (FIFO) with the API of Queue.
+
+UnrolledDeque
+    A double-ended queue with the API of Deque.
+
+"""
+
+
+from typing import Any, Generator
+
+from Algorithms_Python.DoubleNode import DoubleNode
+
+
+class UnrolledStack:  # (LIFO)   <(out)-(in)> Stack |
+    """
+    Stack stored in an unrolled linked list.
+
+    Besides the Stack API, the class implements the operations on both
+    ends of the blocks used by UnrolledQueue and UnrolledDeque.
+
+    Attributes
+    ----------
+    block_size: int
+        The number of slots in a block.
+
+    size: int
+        The number of elements in the stack.
+
+    Methods
+    -------
+    __init__(self, block_size: int = 64) -> None
+        Initializes an empty stack.
+
+    push(self, value) -> None
+        Adds a new element to the back of the stack.
+
+    pop(self) -> Any
+        Removes and returns the back element from the stack.
+
+    back(self) -> Any | None
+        Retrieves the element at the back of the stack
+        without removing it.
+
+    front(self) -> Any | None
+        Retrieves the element at the front of the stack.
+
+    __len__(self) -> int
+        Returns the number of elements currently in the stack.
+
+    __iter__(self) -> Generator
+        Iterates from the front to the back.
+
+    """
+
+    def __init__(self, block_size: int = 64) -> None:
+        """
+        Initializes an empty stack.
+
+        Parameters
+        ----------
+        block_size: int, optional
+            The number of slots in a block, by default 64.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if block_size is less than 2.
+
+        """
+        if block_size < 2:
+            raise ValueError('block_size should be at least 2')
+        self.block_size = block_size
+        self._head = self._tail = DoubleNode([None] * block_size)
+        # the first element is at _left of the head block,
+        # the last one is at _right of the tail block,
+        # start from the middle to leave room on both sides
+        self._left = block_size // 2
+        self._right = self._left - 1
+        self._spare = None
+        self.size = 0
+
+    def _new_block(self) -> DoubleNode:
+        """
+        Return an empty unlinked block, the spare one if there is.
+
+        Returns
+        -------
+        DoubleNode
+            The block.
+
+        """
+        block = self._spare
+        if block is None:
+            return DoubleNode([None] * self.block_size)
+        self._spare = None
+        block._prev_node = None
+        block._next_node = None
+        return block
+
+    def _reset(self) -> None:
+        """
+        Center the indexes in the only block after the last pop.
+
+        Returns
+        -------
+        None
+
+        """
+        self._left = self.block_size // 2
+        self._right = self._left - 1
+
+    def _push_back(self, value: Any) -> None:
+        """
+        Add an element after the last one.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        right = self._right + 1
+        if right == self.block_size:
+            block = self._new_block()
+            block._prev_node = self._tail
+            self._tail._next_node = block
+            self._tail = block
+            right = 0
+        self._tail._data[right] = value
+        self._right = right
+        self.size += 1
+
+    def _push_front(self, value: Any) -> None:
+        """
+        Add an element before the first one.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        left = self._left - 1
+        if left < 0:
+            block = self._new_block()
+            block._next_node = self._head
+            self._head._prev_node = block
+            self._head = block
+            left = self.block_size - 1
+        self._head._data[left] = value
+        self._left = left
+        self.size += 1
+
+    def _pop_back(self) -> Any:
+        """
+        Remove and return the last element.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if there are no elements.
+
+        """
+        if self.size == 0:
+            raise ValueError('nothing to pop')
+        slots = self._tail._data
+        _return = slots[self._right]
+        # drop the reference so that the element can be collected
+        slots[self._right] = None
+        self.size -= 1
+        if self.size == 0:
+            self._reset()
+        elif self._right == 0:
+            block = self._tail
+            self._tail = block._prev_node
+            self._tail._next_node = None
+            self._spare = block
+            self._right = self.block_size - 1
+        else:
+            self._right -= 1
+        return _return
+
+    def _pop_front(self) -> Any:
+        """
+        Remove and return the first element.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if there are no elements.
+
+        """
+        if self.size == 0:
+            raise ValueError('nothing to pop')
+        slots = self._head._data
+        _return = slots[self._left]
+        slots[self._left] = None
+        self.size -= 1
+        if self.size == 0:
+            self._reset()
+        elif self._left == self.block_size - 1:
+            block = self._head
+            self._head = block._next_node
+            self._head._prev_node = None
+            self._spare = block
+            self._left = 0
+        else:
+            self._left += 1
+        return _return
+
+    def push(self, value: Any) -> None:
+        """
+        Adds a new element to the back of the stack.
+
+        Parameters
+        ----------
+        value: Any
+            The value to be added to the stack.
+
+        Returns
+        -------
+        None
+
+        """
+        self._push_back(value)
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the back element from the stack.
+
+        Returns
+        -------
+        Any
+            The removed element from the back of the stack.
+
+        Raises
+        ------
+        ValueError
+            Raised if the stack is empty.
+
+        """
+        return self._pop_back()
+
+    def back(self) -> Any | None:
+        """
+        Retrieves the element at the back without removing it.
+
+        Returns
+        -------
+        Any | None
+            The element at the back, None if there are no elements.
+
+        """
+        return self._tail._data[self._right] if self.size else None
+
+    def front(self) -> Any | None:
+        """
+        Retrieves the element at the front without removing it.
+
+        Returns
+        -------
+        Any | None
+            The element at the front, None if there are no elements.
+
+        """
+        return self._head._data[self._left] if self.size else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements.
+
+        Returns
+        -------
+        int
+            The number of elements.
+
+        """
+        return self.size
+
+    def __iter__(self) -> Generator:
+        """
+        Iterates through the elements from the front to the back.
+
+        Returns
+        -------
+        Generator
+            A generator of the elements.
+
+        """
+        if self.size == 0:
+            return
+        block, start = self._head, self._left
+        while block is not self._tail:
+            yield from block._data[start:]
+            block, start = block._next_node, 0
+        yield from block._data[start:self._right + 1]
+
+
+class UnrolledQueue(UnrolledStack):  # (FIFO) -(in)> Queue -(out)>
+    """
+    Queue stored in an unrolled linked list.
+
+    Elements are pushed to the back and popped from the front.
+
+    Methods
+    -------
+    pop(self) -> Any
+        Dequeue and return the element from the front of the queue.
+
+    """
+
+    def pop(self) -> Any:
+        """
+        Dequeue and return the element from the front of the queue.
+
+        Returns
+        -------
+        Any
+            The element removed from the front of the queue.
+
+        Raises
+        ------
+        ValueError
+            Raised if the queue is empty.
+
+        """
+        return self._pop_front()
+
+
+class UnrolledDeque(UnrolledQueue, UnrolledStack):
+    """
+    Double-ended queue stored in an unrolled linked list.
+
+    As with Deque, `push` adds to the back and `pop` removes from
+    the front. Unlike in Deque, `pop_front` and `pop_back` return
+    the removed element.
+
+    Methods
+    -------
+    push_back(self, value) -> None
+        Add an element to the back of the deque.
+
+    push_front(self, value) -> None
+        Add an element to the front of the deque.
+
+    pop_front(self) -> Any
+        Remove and return the element from the front of the deque.
+
+    pop_back(self) -> Any
+        Remove and return the element from the back of the deque.
+
+    """
+
+    def push_back(self, value: Any) -> None:
+        """
+        Add an element to the back of the deque.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added to the deque.
+
+        Returns
+        -------
+        None
+
+        """
+        self._push_back(value)
+
+    def push_front(self, value: Any) -> None:
+        """
+        Add an element to the front of the deque.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added to the front of the deque.
+
+        Returns
+        -------
+        None
+
+        """
+        self._push_front(value)
+
+    def pop_front(self) -> Any:
+        """
+        Remove and return the element from the front of the deque.
+
+        Returns
+        -------
+        Any
+            The element removed from the front of the deque.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        return self._pop_front()
+
+    def pop_back(self) -> Any:
+        """
+        Remove and return the element from the back of the deque.
+
+        Returns
+        -------
+        Any
+            The element removed from the back of the deque.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        return self._pop_back()
@@ -0,0 +1,704 @@
+"""
+XOR-Linked Lists
+================
+
+This module implements doubly linked lists that keep a single link per
+node: the XOR of the indices of the previous and the next node, stored in
+one `array.array` column of a NodeArena. Knowing one neighbour of a node,
+the other one is found by XOR-ing it out of the link, so the list is
+walked in both directions starting from a pair of adjacent nodes, such as
+the tail and the head.
+
+A node takes 4 bytes for the link plus the data slot (8 bytes for
+a reference or the item size of the typecode), against 8 bytes of links
+in ArrayDeque and about a hundred bytes of a DoubleNode.
+
+The trade-off is that a node can not be unlinked knowing only its index,
+one of its neighbours is needed as well. So the lists support the
+operations at the ends and at positions (walking from the closer end),
+but not removing a node by a handle, as an LRU cache does. For that keep
+using ArrayDeque with its two link columns.
+
+The nodes form a loop (the tail is linked to the head), so rotation only
+moves the head and the tail indices.
+
+Classes
+-------
+XorCyclicList
+    A cyclic doubly linked list with the API of CyclicLinkedList.
+
+XorDeque
+    A double-ended queue with the API of Deque.
+
+"""
+
+
+from typing import Any, Generator, Iterable
+
+from Algorithms_Python.array_storage import NIL, NodeArena
+
+
+class XorCyclicList:
+    """
+    Cyclic doubly linked list with XOR links stored in a NodeArena.
+
+    It has the API of CyclicLinkedList: positions are counted from the
+    head and walked from the closer end, so access near either end is
+    cheap.
+
+    Attributes
+    ----------
+    head: int
+        The index of the first node, NIL if the list is empty.
+
+    tail: int
+        The index of the last node, NIL if the list is empty.
+
+    size: int
+        The number of elements.
+
+    Methods
+    -------
+    __init__(self, elements: Iterable | None = None,
+             typecode: str | None = None, capacity: int = 16) -> None
+        Create the list, optionally appending the elements given.
+
+    __len__(self) -> int
+        Return the number of elements.
+
+    __iter__(self) -> Generator
+        Iterate from the head to the tail.
+
+    __reversed__(self) -> Generator
+        Iterate from the tail to the head.
+
+    __contains__(self, x) -> bool
+        Check if an element is in the list.
+
+    __getitem__(self, i) -> Any
+        Return the element at a specific index.
+
+    list_all(self) -> list
+        Return a list of all elements.
+
+    insert(self, i, x) -> None
+        Insert an element at a specific index.
+
+    erase(self, i) -> None
+        Remove the element at a specific index.
+
+    update(self, i, x) -> None
+        Replace the element at a specific index.
+
+    rotate(self, k=1) -> None
+        Move the head k positions forward.
+
+    memory_usage(self) -> int
+        Return the number of bytes taken by the columns.
+
+    """
+
+    def __init__(self, elements: Iterable | None = None,
+                 typecode: str | None = None, capacity: int = 16) -> None:
+        """
+        Create the list.
+
+        Parameters
+        ----------
+        elements: Iterable or None, optional
+            Elements to be appended, by default None.
+
+        typecode: str or None, optional
+            Typecode of the data column, None (default) to store any
+            Python objects.
+
+        capacity: int, optional
+            Initial number of node slots, by default 16.
+
+        Returns
+        -------
+        None
+
+        """
+        self._arena = NodeArena({'link': 'i'}, typecode, capacity)
+        self._link = self._arena.columns['link']
+        self._data = self._arena.data
+        self.head = NIL
+        self.tail = NIL
+        if elements is not None:
+            for x in elements:
+                self.tail = self._insert_between(self.tail, self.head, x)
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of elements.
+
+        Returns
+        -------
+        int
+            The number of elements.
+
+        """
+        return self._arena.size
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements.
+
+        Returns
+        -------
+        int
+            The number of elements.
+
+        """
+        return self._arena.size
+
+    def _walk(self, start: int, before: int) -> Generator:
+        """
+        Iterate through the nodes starting from start, away from before.
+
+        Parameters
+        ----------
+        start: int
+            The first node.
+
+        before: int
+            The neighbour of start the walk goes away from.
+
+        Returns
+        -------
+        Generator
+            A generator of the node indices, one round of the loop.
+
+        """
+        link = self._link
+        current = start
+        for _ in range(self._arena.size):
+            yield current
+            before, current = current, link[current] ^ before
+
+    def __iter__(self) -> Generator:
+        """
+        Iterate through the elements from the head to the tail.
+
+        Returns
+        -------
+        Generator
+            A generator of the elements.
+
+        """
+        data = self._data
+        for node in self._walk(self.head, self.tail):
+            yield data[node]
+
+    def __reversed__(self) -> Generator:
+        """
+        Iterate through the elements from the tail to the head.
+
+        Returns
+        -------
+        Generator
+            A generator of the elements.
+
+        """
+        data = self._data
+        for node in self._walk(self.tail, self.head):
+            yield data[node]
+
+    def __contains__(self, x: Any) -> bool:
+        """
+        Check if an element is in the list.
+
+        Parameters
+        ----------
+        x: Any
+            The element to look for.
+
+        Returns
+        -------
+        bool
+            True if the element is found.
+
+        """
+        return any(element == x for element in self)
+
+    def list_all(self) -> list:
+        """
+        Return a list of all elements from the head to the tail.
+
+        Returns
+        -------
+        list
+            The elements.
+
+        """
+        return list(self)
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The string representation of the list of the elements.
+
+        """
+        return str(self.list_all())
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the list.
+
+        Returns
+        -------
+        str
+            The string representation of the list of the elements.
+
+        """
+        return str(self)
+
+    def memory_usage(self) -> int:
+        """
+        Return the number of bytes taken by the link and data columns.
+
+        Returns
+        -------
+        int
+            The number of bytes.
+
+        """
+        return self._arena.memory_usage()
+
+    def _insert_between(self, previous: int, following: int,
+                        x: Any) -> int:
+        """
+        Link a new node between two adjacent nodes.
+
+        Parameters
+        ----------
+        previous: int
+            The node before the new one, NIL if the list is empty.
+
+        following: int
+            The node after the new one, NIL if the list is empty.
+
+        x: Any
+            The element of the new node.
+
+        Returns
+        -------
+        int
+            The index of the new node.
+
+        """
+        new = self._arena.allocate()
+        self._data[new] = x
+        if previous == NIL:
+            self.head = self.tail = new
+            return new
+        link = self._link
+        link[new] = previous ^ following
+        # replace following by new in the link of previous and vice versa,
+        # for a single node (previous is following) the changes cancel out
+        link[previous] ^= following ^ new
+        link[following] ^= previous ^ new
+        return new
+
+    def _unlink(self, previous: int, node: int) -> Any:
+        """
+        Unlink a node and release it.
+
+        Parameters
+        ----------
+        previous: int
+            The node before the one to be removed.
+
+        node: int
+            The node to be removed.
+
+        Returns
+        -------
+        Any
+            The element of the removed node.
+
+        """
+        link = self._link
+        following = link[node] ^ previous
+        x = self._data[node]
+        if self._arena.size == 1:
+            self.head = self.tail = NIL
+        else:
+            link[previous] ^= node ^ following
+            link[following] ^= node ^ previous
+            if node == self.head:
+                self.head = following
+            if node == self.tail:
+                self.tail = previous
+        self._arena.release(node)
+        return x
+
+    def _locate(self, i: int) -> tuple[int, int]:
+        """
+        Find the node at an index and the node before it.
+
+        The walk starts from the head or the tail, whichever is closer.
+
+        Parameters
+        ----------
+        i: int
+            The index, from 0 to size - 1.
+
+        Returns
+        -------
+        tuple[int, int]
+            The previous node and the node at the index.
+
+        """
+        link = self._link
+        size = self._arena.size
+        if i <= size // 2:
+            previous, node = self.tail, self.head
+            for _ in range(i):
+                previous, node = node, link[node] ^ previous
+        else:
+            following, node = self.head, self.tail
+            for _ in range(size - 1 - i):
+                following, node = node, link[node] ^ following
+            previous = link[node] ^ following
+        return previous, node
+
+    def _check_index(self, i: int) -> int:
+        """
+        Check an index of an element, turning a negative one to positive.
+
+        Parameters
+        ----------
+        i: int
+            The index, negative indexes count from the end.
+
+        Returns
+        -------
+        int
+            The index from 0 to size - 1.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        """
+        if i < 0:
+            i += self._arena.size
+        if i < 0 or i >= self._arena.size:
+            raise IndexError('XorCyclicList index out of range')
+        return i
+
+    def __getitem__(self, i: int) -> Any:
+        """
+        Return the element at the specified index.
+
+        Parameters
+        ----------
+        i: int
+            The index, negative indexes count from the end.
+
+        Returns
+        -------
+        Any
+            The element.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        """
+        return self._data[self._locate(self._check_index(i))[1]]
+
+    def update(self, i: int, x: Any) -> None:
+        """
+        Replace the element at the specified index.
+
+        Parameters
+        ----------
+        i: int
+            The index, negative indexes count from the end.
+
+        x: Any
+            The new element.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        """
+        self._data[self._locate(self._check_index(i))[1]] = x
+
+    def insert(self, i: int, x: Any) -> None:
+        """
+        Insert an element at the specified index.
+
+        Parameters
+        ----------
+        i: int
+            The index the element gets, from 0 to size. Negative indexes
+            count from the end, -1 appends.
+
+        x: Any
+            The element to insert.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        """
+        size = self._arena.size
+        if i < 0:
+            i += size + 1
+        if i < 0 or i > size:
+            raise IndexError('XorCyclicList index out of range')
+        if i == 0 or i == size:
+            # between the tail and the head
+            new = self._insert_between(self.tail, self.head, x)
+            if i == 0:
+                self.head = new
+            else:
+                self.tail = new
+        else:
+            previous, node = self._locate(i)
+            self._insert_between(previous, node, x)
+
+    def erase(self, i: int) -> None:
+        """
+        Remove the element at the specified index.
+
+        Parameters
+        ----------
+        i: int
+            The index, negative indexes count from the end.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IndexError
+            If the index is out of bounds.
+
+        """
+        self._unlink(*self._locate(self._check_index(i)))
+
+    def rotate(self, k: int = 1) -> None:
+        """
+        Move the head k positions forward, so the element at index k
+        becomes the first one.
+
+        Negative k moves the head backward. Only the head and the tail
+        move, in at most min(k, size - k) steps (k taken modulo size).
+
+        Parameters
+        ----------
+        k: int, optional
+            The number of positions. Default is 1.
+
+        Returns
+        -------
+        None
+
+        """
+        size = self._arena.size
+        if size < 2:
+            return
+        k %= size
+        link = self._link
+        if k <= size // 2:
+            for _ in range(k):
+                self.tail, self.head = \
+                    self.head, link[self.head] ^ self.tail
+        else:
+            for _ in range(size - k):
+                self.head, self.tail = \
+                    self.tail, link[self.tail] ^ self.head
+
+
+class XorDeque(XorCyclicList):
+    """
+    Double-ended queue with XOR links stored in a NodeArena.
+
+    It has the API of Deque (and ArrayDeque): `push` and `push_back` add
+    to the back, `push_front` adds to the front, `pop` and `pop_front`
+    remove from the front, `pop_back` removes from the back, `front` and
+    `back` peek. All pops return the removed element. The positional
+    methods of XorCyclicList are available as well.
+
+    Methods
+    -------
+    push(self, value) -> None
+        Alias for `push_back`.
+
+    push_back(self, value) -> None
+        Add an element to the back.
+
+    push_front(self, value) -> None
+        Add an element to the front.
+
+    pop(self) -> Any
+        Alias for `pop_front`.
+
+    pop_front(self) -> Any
+        Remove and return the front element.
+
+    pop_back(self) -> Any
+        Remove and return the back element.
+
+    front(self) -> Any | None
+        Return the front element.
+
+    back(self) -> Any | None
+        Return the back element.
+
+    """
+
+    def push_back(self, value: Any) -> None:
+        """
+        Add an element to the back of the deque.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        self.tail = self._insert_between(self.tail, self.head, value)
+
+    def push(self, value: Any) -> None:
+        """
+        Add an element to the back of the deque.
+
+        This method is an alias for `push_back`.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        self.push_back(value)
+
+    def push_front(self, value: Any) -> None:
+        """
+        Add an element to the front of the deque.
+
+        Parameters
+        ----------
+        value: Any
+            The element to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        self.head = self._insert_between(self.tail, self.head, value)
+
+    def pop_front(self) -> Any:
+        """
+        Remove and return the element from the front of the deque.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        if self.head == NIL:
+            raise ValueError('nothing to pop')
+        return self._unlink(self.tail, self.head)
+
+    def pop(self) -> Any:
+        """
+        Remove and return the element from the front of the deque.
+
+        This method is an alias for `pop_front`.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        return self.pop_front()
+
+    def pop_back(self) -> Any:
+        """
+        Remove and return the element from the back of the deque.
+
+        Returns
+        -------
+        Any
+            The removed element.
+
+        Raises
+        ------
+        ValueError
+            Raised if the deque is empty.
+
+        """
+        if self.tail == NIL:
+            raise ValueError('nothing to pop')
+        return self._unlink(self._link[self.tail] ^ self.head, self.tail)
+
+    def front(self) -> Any | None:
+        """
+        Retrieve the element at the front of the deque.
+
+        Returns
+        -------
+        Any | None
+            The front element, None if the deque is empty.
+
+        """
+        return self._data[self.head] if self.head != NIL else None
+
+    def back(self) -> Any | None:
+        """
+        Retrieve the element at the back of the deque.
+
+        Returns
+        -------
+        Any | None
+            The back element, None if the deque is empty.
+
+        """
+        return self._data[self.tail] if self.tail != NIL else None